@@ -1,6 +1,16 @@
 import pygame
-from button_template import Button
+import random
+from widgets import Button, InputBar, WidgetIndex
 import Colors
+from node_pool import NodePool, PooledNode, SurfaceCache, NIL
+from linked_list_core import CircularCore
+from list_view import ListView
+from frame_scheduler import FrameScheduler
+from sprites import labels, chrome, blit_polygon, draw_pool, draw_search_stats
+
+MAX_NODES = 5000
+VISIBLE_NODES = 8  # Nodes that fit across the screen at the 125px stride
+LANES_SHOWN = 4  # Express lanes drawn above the list
 
 
 status_msg = "Ready"
@@ -29,7 +39,7 @@ status_color = Colors.LIGHT_GREY
 
 # Text rendering
 title = titleFont.render("Circular Linked List", True, Colors.TEAL)
-cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+cap_value_txt = paraFont.render(f"Capacity (Max {MAX_NODES}): ", True, Colors.LIGHT_GREY)
 value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
 value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
 pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
@@ -38,6 +48,14 @@ del_pos_txt = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
 status_msg = "Ready"
 logic_msg = "Waiting for operation..."
 
+node_texts = SurfaceCache(lambda text: nodeFont.render(text, True, Colors.LIGHT_GREY))
+
+ARROW_HEAD = ((0, 0), (-7, -7), (-7, 7))  # Points relative to the tip
+POINTER_DOWN = ((0, 0), (-10, -15), (10, -15))
+POINTER_UP = ((0, 0), (-10, 15), (10, 15))
+POINTER_ABOVE = ((0, 0), (-10, -16), (10, -16))  # Stacked above another pointer
+
+
 def set_status(message, color, logic_message=""):
     global status_msg, status_color, logic_msg 
     status_msg = message
@@ -55,65 +73,20 @@ def update_status_ui(screen):
     status_surf = nodeFont.render(status_msg, True, status_color)
     screen.blit(status_surf, (500, 50))
 
-class InputBar:
-    def __init__(self, x, y, width, height, bg_color, max_chars=1):
-        self.shape = pygame.Rect(x, y, width, height)
-        self.bg_color = bg_color
-        self.inactive_color = Colors.LIGHT_GREY
-        self.active_color = Colors.TEAL
-        self.color = self.inactive_color
-        self.active = False
-        self.text = ""
-        self.max_chars = max_chars
-        self.input_font = get_font(19)
-        self.text_rendered = self.input_font.render(self.text, True, Colors.LIGHT_GREY)
-
-    def handle_input(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.shape.collidepoint(event.pos)
-            self.color = self.active_color if self.active else self.inactive_color
-
-        if self.active and event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE and len(self.text) > 0:
-                self.text = self.text[:len(self.text) - 1]
-            elif event.key == pygame.K_RETURN:
-                pass
-            elif event.unicode.isprintable():
-                if len(self.text) < self.max_chars:
-                    self.text += event.unicode
-
-        self.text_rendered = self.input_font.render(self.text, True, Colors.LIGHT_GREY)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.bg_color, self.shape, border_radius=5)
-        pygame.draw.rect(screen, self.color, self.shape, 2, border_radius=5)
-        screen.blit(self.text_rendered, (self.shape.x + 2, self.shape.y + 5))
 
 # Helper pointer drawing
 def draw_pointer(node, text, color, screen):
     node_x = node.shape.x + node.shape.width // 2
 
     # Up-pointing triangle (same style as QUEUE FRONT)
+    lbl_head = labels.get((text, color))
     if text != "LAST" and text != "CURR" and text != "PREV":
         node_y = node.shape.y + node.shape.height + 8
-        pygame.draw.polygon(screen, color, [
-            (node_x, node_y),
-            (node_x - 10, node_y + 15),
-            (node_x + 10, node_y + 15)
-        ])
-    else:
-        node_y = node.shape.y - 10
-        pygame.draw.polygon(screen, color, [
-            (node_x, node_y),
-            (node_x - 10, node_y - 15),
-            (node_x + 10, node_y - 15)
-        ])
-
-    # Label
-    lbl_head = subFont.render(f"{text}", True, color)
-    if text != "LAST" and text != "CURR" and text != "PREV":
+        blit_polygon(screen, POINTER_UP, color, node_x, node_y)
         screen.blit(lbl_head, (node_x - lbl_head.get_width() // 2, node_y + 20))
     else:
+        node_y = node.shape.y - 10
+        blit_polygon(screen, POINTER_DOWN, color, node_x, node_y)
         screen.blit(lbl_head, (node_x - lbl_head.get_width() // 2, node_y - 37))
 
 
@@ -152,749 +125,632 @@ def draw_pointer_on_last(node, text, color, screen):
     temp_x = node.shape.x + node.shape.width // 2
     temp_y = node.shape.y - 20
 
-    # Draw TEMP pointer
-    pygame.draw.polygon(screen, color, [
-        (temp_x, temp_y - 29),  # Tip of TEMP pointer (above HEAD)
-        (temp_x - 10, temp_y - 45),  # Left point
-        (temp_x + 10, temp_y - 45)  # Right point
-    ])
+    # Draw the pointer, tip above LAST
+    blit_polygon(screen, POINTER_ABOVE, color, temp_x, temp_y - 29)
 
-    lbl_temp = subFont.render(f"{text}", True, color)
+    lbl_temp = labels.get((text, color))
     screen.blit(lbl_temp, (temp_x - lbl_temp.get_width() // 2, temp_y - 65))
 
-class SCLLNode:
-    def __init__(self, data, pos, next=None):
-        self.data = data
-        self.next = next
-        self.shape = pygame.Rect(pos[0], pos[1], 90, 70)
-        self.text = nodeFont.render(f"{data}", True, Colors.LIGHT_GREY)
+class SCLLNode(PooledNode):
+    __slots__ = ("shape", "text")
+
+    def __init__(self, pool, idx):
+        # data/next live in the pool's arrays; the list view hands out a Rect and label
+        # only while the node is on screen
+        super().__init__(pool, idx)
+        self.shape = None
+        self.text = None
 
     def draw(self, screen, scll, highlight_color=Colors.TEAL, fill=False):
-        # Draw Node Box
+        # Node box, border highlight and "data:" label, one sprite per node size and colors
         if fill:
-            pygame.draw.rect(screen, highlight_color, self.shape, border_radius=2)
+            screen.blit(chrome.get((self.shape.size, highlight_color, None)), self.shape)
         else:
-            pygame.draw.rect(screen, Colors.TEAL, self.shape, border_radius=2)
-            if highlight_color != Colors.TEAL:
-                pygame.draw.rect(screen, highlight_color, self.shape, 2, border_radius=2)
+            border = highlight_color if highlight_color != Colors.TEAL else None
+            screen.blit(chrome.get((self.shape.size, Colors.TEAL, border)), self.shape)
 
-        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (self.shape.x, self.shape.y))
         text_rect = self.text.get_rect(center=self.shape.center)
         screen.blit(self.text, text_rect)
 
-        if scll.last is not None and self == scll.last:
+        last = scll.last
+        if last is not None and self == last:
             draw_pointer(self, "LAST", Colors.LIGHT_GREY, screen)
 
         # next
         start_x = self.shape.x + self.shape.width
         start_y = self.shape.y + 35  # Center Y
         
-        if self.next is not None:
-            # Check if this is the LAST node pointing back to first node (Wrap Around)
-            if scll.last is not None and self == scll.last and self.next == scll.last.next and scll.length > 1:
-                # Draw Wrap-Around Line (UNDERNEATH)
-                head_node = scll.last.next
-                path_points = [
-                    (start_x, start_y),
-                    (start_x + 20, start_y),  # Out Right
-                    (start_x + 20, start_y + 60),  # Down
-                    (head_node.shape.x - 20, start_y + 60),  # All the way Left
-                    (head_node.shape.x - 20, start_y),  # Up
-                    (head_node.shape.x, start_y)  # In to Head
-                ]
-                pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-                # Arrow at first node
-                end_x, end_y = path_points[-1]
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-            
-            # Special case: Single node pointing to itself
-            elif scll.length == 1 and self.next == self:
-                path_points = [
-                    (start_x, start_y),
-                    (start_x + 20, start_y),
-                    (start_x + 20, start_y + 70),
-                    (self.shape.x - 20, start_y + 70),
-                    (self.shape.x - 20, start_y),
-                    (self.shape.x, start_y)
-                ]
-                pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-                end_x, end_y = path_points[-1]
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
+        # The LAST node pointing back to the first node: SCLL.drawList draws that
+        # wrap-around, since it may start or end off screen
+        if self.next is None or (self == last and scll.length > 1):
+            return
 
-            else:
-                # Normal Adjacent Connection
+        # Special case: Single node pointing to itself
+        if scll.length == 1 and self.next == self:
+            path_points = [
+                (start_x, start_y),
+                (start_x + 20, start_y),
+                (start_x + 20, start_y + 70),
+                (self.shape.x - 20, start_y + 70),
+                (self.shape.x - 20, start_y),
+                (self.shape.x, start_y)
+            ]
+            pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
+            blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, *path_points[-1])
+
+        else:
+            # Normal Adjacent Connection
+            if self.next.shape is not None:
                 end_x = self.next.shape.x
                 end_y = self.next.shape.y + 35
-                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                # Arrow-head (triangle)
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
+            else:
+                # Next node is scrolled off screen: point towards where it would be
+                end_x = start_x + 35
+                end_y = start_y
+            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
+            # Arrow-head (triangle)
+            blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+
 
 class SCLL:
     def __init__(self, size):
-        self.last = None  # The ONLY main pointer
-        self.size = size
-        self.length = 0
-        self.nodes = []  # For rendering purposes, to keep order in UI
-        
-        # Approximate start X
-        self.start_x_coord = 120
-        self.currentPos = (self.start_x_coord, 480)
+        # The core owns the pool and the express lanes; each of its operations yields
+        # one event per step, which the methods below animate
+        self.core = CircularCore(size, NodePool(MAX_NODES, SCLLNode, indexed=True))
+        self.pool = self.core.pool
+        self.lanes = self.core.lanes
+        self.nodes = []  # In list order; only the visible ones get drawn
 
-    def drawList(self, screen):
-        for node in self.nodes:
-            node.draw(screen, self)
+        self.search_stats = None  # (value, comparisons, walk pos, index pos) of the last search
+
+        # Scrolling camera over the nodes, starting at approximately x = 120
+        self.view = ListView(120, 480, lambda node: node_texts.get(f"{node.data}"))
+
+    @property
+    def size(self):
+        return self.core.size
+
+    @size.setter
+    def size(self, size):
+        self.core.size = size
+
+    @property
+    def length(self):
+        return self.core.length
 
-    def _recalculate_positions(self):
-        start_x = self.start_x_coord
-        y_pos = 480
+    @property
+    def last(self):
+        # The ONLY main pointer
+        return self.pool.view(self.core.last)
+
+    def showNode(self, pos, slot):
+        # The core's node for slot goes into the drawing order at 0-based pos
+        node = self.pool.views[slot]
+        self.nodes.insert(pos, node)
+        return node
+
+    def hideNode(self, pos):
+        self.view.release(self.nodes.pop(pos))
+
+    def clear(self):
         for node in self.nodes:
-            node.shape.x = start_x
-            node.shape.y = y_pos
-            start_x += 125
-        self.currentPos = (start_x, y_pos)
+            self.view.release(node)
+        self.nodes.clear()
+        self.core.reset()
+        self.search_stats = None
+        self.view.scroll = 0
+        self.view.current = None
+        self.layout()
+
+    def fill(self, values):
+        # Append without animating, for building long lists
+        self.core.extend(values)
+        self.nodes = [self.pool.views[slot] for slot in self.core.slots()]
+        self.layout()
+
+    def layout(self, shift=0):
+        self.view.layout(self.nodes, shift)
+
+    def scroll(self, dx):
+        if self.view.scroll_by(dx, len(self.nodes)):
+            self.layout()
+
+    def follow(self, screen, index):
+        # Keep the node an operation points at on screen, redrawing the list if the camera moves
+        if self.view.follow(index, len(self.nodes)):
+            self.layout()
+            pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
+            self.drawList(screen)
+
+    def pause(self, ms):
+        # Walks over long lists speed up so a full traversal takes about as long as a short one
+        n = len(self.nodes)
+        pygame.time.delay(ms if n <= VISIBLE_NODES else ms * VISIBLE_NODES // n)
+
+    def drawLanes(self, screen):
+        # Express lanes as rows of dots (one per tall enough node) joined by their links, lane 1 lowest
+        if self.lanes.length != len(self.nodes):
+            return  # Mid-operation, before the core has placed or after it has removed a node
+        view = self.view
+        for level in range(1, min(self.lanes.levels(), LANES_SHOWN + 1)):
+            y = 428 - 7 * level
+            xs = [view.world_x(i) + view.node_w // 2 - view.scroll
+                  for i in self.lanes.lane(level, view.first, view.last)]
+            if len(xs) > 1:
+                pygame.draw.lines(screen, Colors.TEAL, False, [(x, y) for x in xs], 1)
+            for x in xs:
+                pygame.draw.circle(screen, Colors.TEAL_BRIGHT, (x, y), 3)
+
+    def drawWrap(self, screen, frm, to, end_dy=0):
+        # Wrap-around arrow under the row from frm (near the end of the list) back to to (near
+        # the front); an end scrolled off screen lies somewhere past that edge, so aim beyond it
+        start_x = frm.shape.x + frm.shape.width if frm.shape is not None else self.view.width + 40
+        start_y = self.view.y + 35
+        head_x = to.shape.x if to.shape is not None else -40
+        path_points = [
+            (start_x, start_y),
+            (start_x + 20, start_y),  # Out Right
+            (start_x + 20, start_y + 60),  # Down
+            (head_x - 20, start_y + 60),  # All the way Left
+            (head_x - 20, start_y + end_dy),  # Up
+            (head_x, start_y + end_dy)  # In to the first node
+        ]
+        pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
+        blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, *path_points[-1])
+
+    def moveCurr(self, screen, curr, event):
+        # Animate an express-lane hop of CURR (a visit event after the first); returns the node there
+        _, name, slot, i, level = event
+        erase_pointer(screen, curr, "CURR")
+        self.drawLanes(screen)
+
+        curr = self.pool.views[slot]
+        self.follow(screen, i)
+        draw_pointer(curr, "CURR", Colors.ORANGE, screen)
+
+        set_status("Traversing...", Colors.ORANGE,
+                   "> p = p.next" if level == 0 else f"> p = p.lane[{level}]")
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(800)
+        return curr
+
+    def drawList(self, screen):
+        self.drawLanes(screen)
+        for node in self.view.visible(self.nodes):
+            node.draw(screen, self)
+        last = self.last
+        if last is not None and self.length > 1:
+            self.drawWrap(screen, last, last.next)
+
+        n = len(self.nodes)
+        self.view.draw_minimap(screen, n, subFont, [
+            (0 if n else None, "FIRST", Colors.LIGHT_GREY),
+            (n - 1 if n else None, "LAST", Colors.LIGHT_GREY),
+            (self.view.current, "CURR", Colors.ORANGE)
+        ])
 
     def _redraw(self, screen):
-        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 340))
         self.drawList(screen)
         update_status_ui(screen)
         pygame.display.update()
 
+    def _draw_without_wrap(self, screen, skip=()):
+        # Nodes, LAST and the straight next arrows, leaving out the wrap-around and the nodes in skip
+        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        for node in self.view.visible(self.nodes):
+            screen.blit(chrome.get((node.shape.size, Colors.TEAL, None)), node.shape)
+            text_rect = node.text.get_rect(center=node.shape.center)
+            screen.blit(node.text, text_rect)
+
+            if node == self.last:
+                draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
+
+            if node.next is not None and node != self.last and node not in skip:
+                start_x = node.shape.x + node.shape.width
+                start_y = node.shape.y + 35
+                if node.next.shape is not None:
+                    end_x = node.next.shape.x
+                    end_y = node.next.shape.y + 35
+                else:
+                    end_x = start_x + 35
+                    end_y = start_y
+                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+
     def insertAtEnd(self, data, screen):
-        if self.length >= self.size:
-            set_status("Limit Reached!", Colors.RED, "> Capacity Full")
-            return
+        for event in self.core.push_back(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "new":
+                newNode = self.showNode(event[2], event[1])
+                self.view.follow(len(self.nodes) - 1, len(self.nodes))
+                self.layout()
+
+                set_status(f"Node Created: {data}", Colors.GREEN, "> newNode = Node(data)")
+                self._redraw(screen)
+                pygame.time.delay(1000)
 
-        newNode = SCLLNode(data, self.currentPos)
-        self.nodes.append(newNode)
-        self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
-        
-        set_status(f"Node Created: {data}", Colors.GREEN, "> newNode = Node(data)")
-        self._redraw(screen)
-        pygame.time.delay(1000)
+            elif kind == "link" and event[1] == event[3]:
+                set_status("List Initialized", Colors.GREEN, "> last = newNode; last.next = last")
 
-        if self.last is None:
-            self.last = newNode
-            self.last.next = self.last
-            set_status("List Initialized", Colors.GREEN, "> last = newNode; last.next = last")
-        else:
-            old_last = self.last
-            first_node = self.last.next  # first node (last.next)
-            
-            # Erase the circular pointer (wrap-around from old_last to first_node)
-            set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            # Draw all nodes without the circular connection
-            for node in self.nodes:
-                # Draw node box
-                pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-                screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-                text_rect = node.text.get_rect(center=node.shape.center)
-                screen.blit(node.text, text_rect)
-                
-                # Draw LAST pointer if applicable
-                if node == old_last:
-                    draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-                
-                # Draw normal connections (not the wrap-around)
-                # Skip drawing if it's the circular connection from last to first
-                if node.next is not None:
-                    if not (node == old_last and node.next == first_node and self.length > 1):
-                        # Also skip if it's a self-loop (single node case)
-                        if not (node == old_last and node.next == old_last):
-                            start_x = node.shape.x + node.shape.width
-                            start_y = node.shape.y + 35
-                            end_x = node.next.shape.x
-                            end_y = node.next.shape.y + 35
-                            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                            arrow_size = 7
-                            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                                (end_x, end_y),
-                                (end_x - arrow_size, end_y - arrow_size),
-                                (end_x - arrow_size, end_y + arrow_size)
-                            ])
-            
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-
-            # Draw simple pointer from old_last to newNode
-            set_status("Linking Last...", Colors.ORANGE, "> last.next = newNode")
-            self.last.next = newNode
-            start_x = old_last.shape.x + old_last.shape.width
-            start_y = old_last.shape.y + 35
-            end_x = newNode.shape.x
-            end_y = newNode.shape.y + 35
-            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-            arrow_size = 7
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_x, end_y),
-                (end_x - arrow_size, end_y - arrow_size),
-                (end_x - arrow_size, end_y + arrow_size)
-            ])
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-
-            # Connect newNode to first_node (circular connection)
-            newNode.next = first_node
-            set_status("Linking Circular...", Colors.ORANGE, "> newNode.next = last.next")
-            # Draw the wrap-around from newNode to first_node
-            start_x = newNode.shape.x + newNode.shape.width
-            start_y = newNode.shape.y + 35
-            first_node_pos = first_node
-            path_points = [
-                (start_x, start_y),
-                (start_x + 20, start_y),  # Out Right
-                (start_x + 20, start_y + 60),  # Down
-                (first_node_pos.shape.x - 20, start_y + 60),  # All the way Left
-                (first_node_pos.shape.x - 20, start_y),  # Up
-                (first_node_pos.shape.x, start_y)  # In to first node
-            ]
-            pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-            # Arrow at first node
-            end_x, end_y = path_points[-1]
-            arrow_size = 7
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_x, end_y),
-                (end_x - arrow_size, end_y - arrow_size),
-                (end_x - arrow_size, end_y + arrow_size)
-            ])
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-
-            # Update Last pointer
-            self.last = newNode
-            set_status("Tail Updated", Colors.GREEN, "> last = newNode")
-            # Erase old LAST pointer and draw new one
-            erase_pointer(screen, old_last, "LAST")
-            draw_pointer(newNode, "LAST", Colors.LIGHT_GREY, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
+            elif kind == "link" and event[1] != newNode.idx:
+                old_last = self.last
+
+                # Erase the circular pointer (wrap-around from old_last to first_node)
+                set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
+                self._draw_without_wrap(screen)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                # Draw simple pointer from old_last to newNode
+                set_status("Linking Last...", Colors.ORANGE, "> last.next = newNode")
+                start_x = old_last.shape.x + old_last.shape.width
+                start_y = old_last.shape.y + 35
+                end_x = newNode.shape.x
+                end_y = newNode.shape.y + 35
+                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                # Connect newNode to first_node (circular connection)
+                set_status("Linking Circular...", Colors.ORANGE, "> newNode.next = last.next")
+                # Draw the wrap-around from newNode to first_node
+                first_node = self.pool.views[event[3]]
+                self.drawWrap(screen, newNode, first_node)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "set" and event[3] != NIL:
+                # Update Last pointer
+                set_status("Tail Updated", Colors.GREEN, "> last = newNode")
+                # Erase old LAST pointer and draw new one
+                erase_pointer(screen, self.pool.views[event[3]], "LAST")
+                draw_pointer(newNode, "LAST", Colors.LIGHT_GREY, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        self.length += 1
         self._redraw(screen)
         pygame.time.delay(500)
 
     def insertAtBeginning(self, data, screen):
-        if self.length >= self.size:
-            set_status("Limit Reached!", Colors.RED, "> Capacity Full")
-            return
+        for event in self.core.push_front(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "new":
+                if self.nodes:
+                    set_status("Shifting Nodes...", Colors.ORANGE, "> UI Shift")
+                    pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 290))
+                    self.view.follow(0, len(self.nodes) + 1)
+                    self.layout(shift=1)
+                    self.drawList(screen)
+                    update_status_ui(screen)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
+
+                newNode = self.showNode(0, event[1])
+                self.view.follow(0, len(self.nodes))
+                self.layout()
+
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
+                self._redraw(screen)
+                pygame.time.delay(1000)
 
-        if self.length > 0:
-            set_status("Shifting Nodes...", Colors.ORANGE, "> UI Shift")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 280))
-            for node in self.nodes:
-                node.shape.x += 125
-            self.drawList(screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
+            elif kind == "link" and event[1] == event[3]:
+                set_status("List Initialized", Colors.GREEN, "> last = newNode; last.next = last")
 
-        start_x = self.start_x_coord
-        start_y = 480
-        newNode = SCLLNode(data, (start_x, start_y))
-        
-        set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
-        self.nodes.insert(0, newNode)
-        self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
-        self._redraw(screen)
-        pygame.time.delay(1000)
+            elif kind == "link" and event[1] == newNode.idx:
+                first_node = self.pool.views[event[3]]
+
+                # Erase the circular pointer
+                set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
+                self._draw_without_wrap(screen, skip=(newNode,))
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                # Connect newNode to first_node
+                set_status("Linking Forward...", Colors.ORANGE, "> newNode.next = last.next")
+                start_x = newNode.shape.x + newNode.shape.width
+                start_y = newNode.shape.y + 35
+                end_x = first_node.shape.x
+                end_y = first_node.shape.y + 35
+                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                # Update last.next to point to newNode (circular connection)
+                old_last = self.last
+                set_status("Linking Circular...", Colors.ORANGE, "> last.next = newNode")
+                # Draw the wrap-around from last to newNode
+                self.drawWrap(screen, old_last, newNode)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(200)
 
-        if self.last is None:
-            self.last = newNode
-            self.last.next = self.last
-            set_status("List Initialized", Colors.GREEN, "> last = newNode; last.next = last")
-        else:
-            old_last = self.last
-            first_node = self.last.next  # first node (last.next)
-            
-            # Erase the circular pointer
-            set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            # Draw all nodes without the circular connection
-            for node in self.nodes:
-                # Draw node box
-                pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-                screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-                text_rect = node.text.get_rect(center=node.shape.center)
-                screen.blit(node.text, text_rect)
-                
-                # Draw LAST pointer if applicable
-                if node == old_last:
-                    draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-                
-                # Draw normal connections (not the wrap-around)
-                if node.next is not None:
-                    if not (node == old_last and node.next == first_node and self.length > 1):
-                        if not (node == old_last and node.next == old_last):
-                            start_x = node.shape.x + node.shape.width
-                            start_y = node.shape.y + 35
-                            end_x = node.next.shape.x
-                            end_y = node.next.shape.y + 35
-                            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                            arrow_size = 7
-                            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                                (end_x, end_y),
-                                (end_x - arrow_size, end_y - arrow_size),
-                                (end_x - arrow_size, end_y + arrow_size)
-                            ])
-            
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-            
-            # Connect newNode to first_node
-            newNode.next = first_node
-            set_status("Linking Forward...", Colors.ORANGE, "> newNode.next = last.next")
-            start_x = newNode.shape.x + newNode.shape.width
-            start_y = newNode.shape.y + 35
-            end_x = first_node.shape.x
-            end_y = first_node.shape.y + 35
-            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-            arrow_size = 7
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_x, end_y),
-                (end_x - arrow_size, end_y - arrow_size),
-                (end_x - arrow_size, end_y + arrow_size)
-            ])
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-            
-            # Update last.next to point to newNode (circular connection)
-            self.last.next = newNode
-            set_status("Linking Circular...", Colors.ORANGE, "> last.next = newNode")
-            # Draw the wrap-around from last to newNode
-            start_x = old_last.shape.x + old_last.shape.width
-            start_y = old_last.shape.y + 35
-            path_points = [
-                (start_x, start_y),
-                (start_x + 20, start_y),  # Out Right
-                (start_x + 20, start_y + 60),  # Down
-                (newNode.shape.x - 20, start_y + 60),  # All the way Left
-                (newNode.shape.x - 20, start_y),  # Up
-                (newNode.shape.x, start_y)  # In to newNode
-            ]
-            pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-            # Arrow at newNode
-            end_x, end_y = path_points[-1]
-            arrow_size = 7
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_x, end_y),
-                (end_x - arrow_size, end_y - arrow_size),
-                (end_x - arrow_size, end_y + arrow_size)
-            ])
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(200)
         set_status("Added!!", Colors.ORANGE, "> Success")
-        self.length += 1
         self._redraw(screen)
         pygame.time.delay(500)
 
     def insertAtPosition(self, data, pos, screen):
-        if pos < 1 or pos > self.length + 1:
-            set_status("Invalid Position", Colors.RED)
-            return
-        if pos == 1: 
+        # Edge cases; the core checks bounds and capacity
+        if pos == 1:
             self.insertAtBeginning(data, screen)
             return
-        if pos == self.length + 1: 
+        if pos == self.length + 1:
             self.insertAtEnd(data, screen)
             return
-        if self.length >= self.size: 
-            set_status("Limit Reached", Colors.RED)
-            return
 
-        set_status("Traversing...", Colors.ORANGE, "> p = last.next; count=1")
-        # Visual traversal starting from first node (last.next)
-        temp = self.last.next 
-        draw_pointer(temp, "CURR", Colors.ORANGE, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(800)
+        temp = newNode = None
+        for event in self.core.insert_at(pos - 1, data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and temp is None:
+                set_status("Traversing...", Colors.ORANGE, "> p = last.next; ride the express lanes to pos - 1")
+                # Visual traversal starting from first node (last.next)
+                temp = self.pool.views[event[2]]
+                self.follow(screen, 0)
+                draw_pointer(temp, "CURR", Colors.ORANGE, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(800)
 
-        # Iterate to pos-1
-        for i in range(pos - 2):
-            erase_pointer(screen, temp, "CURR")
-            temp = temp.next
-            draw_pointer(temp, "CURR", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(800)
+            elif kind == "visit":
+                # Hop to pos-1
+                temp = self.moveCurr(screen, temp, event)
 
-        set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
-        
-        # Position newNode below temp to avoid overlap
-        newNode = SCLLNode(data, (temp.shape.x + 60, temp.shape.y + 150))
-        
-        # Draw floating node
-        pygame.draw.rect(screen, Colors.TEAL, newNode.shape, border_radius=2)
-        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (newNode.shape.x, newNode.shape.y))
-        screen.blit(newNode.text, newNode.text.get_rect(center=newNode.shape.center))
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+            elif kind == "new":
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
 
-        # Check if temp is the last node (circular connection case)
-        is_circular_connection = (temp == self.last and temp.next == self.last.next and self.length > 1)
-        target_node = temp.next
-        
-        # Erase the connection from temp to temp.next (might be circular)
-        if is_circular_connection:
-            set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            # Redraw all nodes without the circular connection
-            for node in self.nodes:
-                pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-                screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-                text_rect = node.text.get_rect(center=node.shape.center)
-                screen.blit(node.text, text_rect)
-                
-                if node == self.last:
-                    draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-                
-                # Draw normal connections (not the circular one we're erasing)
-                if node.next is not None:
-                    if not (node == self.last and node.next == self.last.next and self.length > 1):
-                        if not (node == self.last and node.next == self.last):
-                            start_x = node.shape.x + node.shape.width
-                            start_y = node.shape.y + 35
-                            end_x = node.next.shape.x
-                            end_y = node.next.shape.y + 35
-                            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                            arrow_size = 7
-                            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                                (end_x, end_y),
-                                (end_x - arrow_size, end_y - arrow_size),
-                                (end_x - arrow_size, end_y + arrow_size)
-                            ])
-        else:
-            # Just erase the simple arrow from temp to temp.next
-            erase_x = temp.shape.x + temp.shape.width
-            erase_y = temp.shape.y + (temp.shape.height // 2) - 10
-            pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                # Position newNode below temp to avoid overlap
+                newNode = self.pool.views[event[1]]
+                self.view.attach(newNode, (temp.shape.x + 60, temp.shape.y + 150))
 
-        # Draw pointer from temp to newNode: right -> down -> left -> down -> right
-        set_status("Linking Previous...", Colors.ORANGE, "> temp.next = newNode")
-        temp.next = newNode
-        
-        # Path: right -> down -> left -> down -> right
-        start_x = temp.shape.x + temp.shape.width
-        start_y = temp.shape.y + 35
-        
-        corner1 = (start_x + 20, start_y)  # Right
-        corner2 = (corner1[0], start_y + 40)  # Down
-        corner3 = (newNode.shape.x - 20, corner2[1])  # Left
-        corner4 = (corner3[0], newNode.shape.y + newNode.shape.height // 2)  # Down
-        end_x = newNode.shape.x  # Right into newNode
-        end_y = corner4[1]
-        
-        pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), corner1, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, (end_x, end_y), 2)
-        
-        arrow_size = 7
-        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-            (end_x, end_y),
-            (end_x - arrow_size, end_y - arrow_size),
-            (end_x - arrow_size, end_y + arrow_size)
-        ])
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                # Draw floating node
+                screen.blit(chrome.get((newNode.shape.size, Colors.TEAL, None)), newNode.shape)
+                screen.blit(newNode.text, newNode.text.get_rect(center=newNode.shape.center))
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                # Erase the arrow from temp to temp.next; the core only inserts here before
+                # the last node, so this is never the wrap-around
+                target_node = temp.next
+                erase_x = temp.shape.x + temp.shape.width
+                erase_y = temp.shape.y + (temp.shape.height // 2) - 10
+                pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == temp.idx:
+                # Draw pointer from temp to newNode: right -> down -> left -> down -> right
+                set_status("Linking Previous...", Colors.ORANGE, "> temp.next = newNode")
+
+                # Path: right -> down -> left -> down -> right
+                start_x = temp.shape.x + temp.shape.width
+                start_y = temp.shape.y + 35
+
+                corner1 = (start_x + 20, start_y)  # Right
+                corner2 = (corner1[0], start_y + 40)  # Down
+                corner3 = (newNode.shape.x - 20, corner2[1])  # Left
+                corner4 = (corner3[0], newNode.shape.y + newNode.shape.height // 2)  # Down
+                end_x = newNode.shape.x  # Right into newNode
+                end_y = corner4[1]
+
+                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), corner1, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, (end_x, end_y), 2)
+
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                # Connect newNode to target_node: right -> up -> left -> up -> right
+                set_status("Linking Next...", Colors.ORANGE, "> newNode.next = temp.next")
 
-        # Connect newNode to target_node: right -> down -> left -> down -> right
-        set_status("Linking Next...", Colors.ORANGE, "> newNode.next = temp.next")
-        newNode.next = target_node
-        
-        if target_node:
-            if is_circular_connection:
-                # Draw circular connection from newNode to first node
-                start_x = newNode.shape.x + newNode.shape.width
-                start_y = newNode.shape.y + 35
-                first_node = target_node
-                path_points = [
-                    (start_x, start_y),
-                    (start_x + 20, start_y),  # Out Right
-                    (start_x + 20, start_y + 60),  # Down
-                    (first_node.shape.x - 20, start_y + 60),  # All the way Left
-                    (first_node.shape.x - 20, start_y),  # Up
-                    (first_node.shape.x, start_y)  # In to first node
-                ]
-                pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-                end_x, end_y = path_points[-1]
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-            else:
-                # Draw connection from newNode to target_node: right -> up -> left -> up -> right
                 start_x = newNode.shape.x + newNode.shape.width
                 start_y = newNode.shape.y + 35
-                
+
                 corner1 = (start_x + 20, start_y)  # Right
                 corner2 = (corner1[0], start_y - 40)  # Up
                 corner3 = (target_node.shape.x - 20, corner2[1])  # Left
                 corner4 = (corner3[0], target_node.shape.y + target_node.shape.height // 2)  # Up
                 end_x = target_node.shape.x  # Right into target_node
                 end_y = corner4[1]
-                
+
                 pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), corner1, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, (end_x, end_y), 2)
-                
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
 
-        set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
-        self.nodes.insert(pos - 1, newNode)
-        self.length += 1
-        
-        erase_pointer(screen, temp, "CURR")
-        self._recalculate_positions()
-        self._redraw(screen)
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "placed":
+                set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
+                self.showNode(event[1], newNode.idx)
+
+                erase_pointer(screen, temp, "CURR")
+                self.layout()
+                self._redraw(screen)
+
         set_status("Insertion Complete!", Colors.GREEN, "> Success")
         pygame.time.delay(500)
 
     def deleteFromBeginning(self, screen):
-        if self.last is None: 
-            set_status("List Empty!", Colors.RED, "> return")
-            return
-        
-        first_node = self.last.next
-        set_status("Identifying First Node...", Colors.ORANGE, "> first = last.next")
-        
-        pygame.draw.rect(screen, Colors.RED, first_node.shape, 2)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-
-        if self.last == self.last.next:  # Only 1 Node
-            # Erase circular connection
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            self.last = None
-            set_status("Deleting Single Node...", Colors.ORANGE, "> last = None")
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-        else:
-            # Erase old circular connection from last to first
-            set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            # Redraw nodes without circular connection
-            for node in self.nodes:
-                pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-                screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-                text_rect = node.text.get_rect(center=node.shape.center)
-                screen.blit(node.text, text_rect)
-                if node == self.last:
-                    draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-                # Draw connections except circular and first_node connections
-                if node.next is not None and node != first_node:
-                    if not (node == self.last and node.next == self.last.next):
-                        start_x = node.shape.x + node.shape.width
-                        start_y = node.shape.y + 35
-                        end_x = node.next.shape.x
-                        end_y = node.next.shape.y + 35
-                        pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                        arrow_size = 7
-                        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                            (end_x, end_y), (end_x - arrow_size, end_y - arrow_size),
-                            (end_x - arrow_size, end_y + arrow_size)
-                        ])
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-            
-            # Update last.next and draw new circular connection
-            next_node = first_node.next
-            self.last.next = next_node
-            set_status("Updating Tail Link...", Colors.ORANGE, "> last.next = first.next")
-            
-            # Draw new circular connection from last to next_node
-            if next_node:
-                start_x = self.last.shape.x + self.last.shape.width
-                start_y = self.last.shape.y + 35
-                path_points = [
-                    (start_x, start_y), (start_x + 20, start_y),
-                    (start_x + 20, start_y + 60), (next_node.shape.x - 20, start_y + 60),
-                    (next_node.shape.x - 20, start_y), (next_node.shape.x, start_y)
-                ]
-                pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-                end_x, end_y = path_points[-1]
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y), (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-
-        set_status("Deleting First Node...", Colors.ORANGE, "> del first")
-        update_status_ui(screen)
-        pygame.time.delay(500)
-        self.length -= 1
-        self.nodes.pop(0)
-        
-        self._recalculate_positions()
+        for event in self.core.pop_front():
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit":
+                first_node = self.pool.views[event[2]]
+                self.follow(screen, 0)
+                set_status("Identifying First Node...", Colors.ORANGE, "> first = last.next")
+
+                pygame.draw.rect(screen, Colors.RED, first_node.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "set":  # Only 1 Node
+                # Erase circular connection
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 340))
+                set_status("Deleting Single Node...", Colors.ORANGE, "> last = None")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                # Erase old circular connection from last to first
+                set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
+                self._draw_without_wrap(screen, skip=(first_node,))
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                # last.next = first.next: draw new circular connection from last to next_node
+                next_node = self.pool.views[event[3]]
+                set_status("Updating Tail Link...", Colors.ORANGE, "> last.next = first.next")
+
+                self.drawWrap(screen, self.last, next_node)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "removed":
+                set_status("Deleting First Node...", Colors.ORANGE, "> del first")
+                update_status_ui(screen)
+                pygame.time.delay(500)
+                self.hideNode(event[1])
+
+        self.layout()
         self._redraw(screen)
         set_status("First Node Deleted!", Colors.GREEN, "> Success")
         pygame.time.delay(500)
 
     def deleteFromEnd(self, screen):
-        if self.last is None: 
-            set_status("List Empty!", Colors.RED, "> return")
-            return
-        
         if self.length == 1:
-            pygame.draw.rect(screen, Colors.RED, self.last.shape, 2)
-            set_status("Deleting Single Node...", Colors.ORANGE, "> last = None")
-            pygame.display.update()
-            pygame.time.delay(800)
-            self.last = None
-            self.length -= 1
-            self.nodes.pop()
+            for event in self.core.pop_back():
+                if event[0] == "visit":
+                    self.follow(screen, 0)
+                    pygame.draw.rect(screen, Colors.RED, self.last.shape, 2)
+                    set_status("Deleting Single Node...", Colors.ORANGE, "> last = None")
+                    pygame.display.update()
+                    pygame.time.delay(800)
+                elif event[0] == "removed":
+                    self.hideNode(event[1])
+            self.layout()
             self._redraw(screen)
             set_status("Tail Deleted!", Colors.GREEN, "> Success")
             pygame.time.delay(500)
             return
-        
-        set_status("Traversing...", Colors.ORANGE, "> while curr.next != last")
-        
-        curr = self.last.next  # First node
-        draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-
-        while curr.next != self.last:
-            erase_pointer(screen, curr, "CURR")
-            curr = curr.next
-            draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-        
-        pygame.draw.rect(screen, Colors.RED, self.last.shape, 2)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
-        # Erase old circular connection from last to first
-        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-        # Redraw nodes without circular connection
-        for node in self.nodes:
-            pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-            screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-            text_rect = node.text.get_rect(center=node.shape.center)
-            screen.blit(node.text, text_rect)
-            if node == self.last:
-                draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-            # Draw connections except circular
-            if node.next is not None and node != self.last:
-                start_x = node.shape.x + node.shape.width
-                start_y = node.shape.y + 35
-                end_x = node.next.shape.x
-                end_y = node.next.shape.y + 35
+
+        curr = None
+        for event in self.core.pop_back():
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and curr is None:
+                set_status("Traversing...", Colors.ORANGE, "> while curr.next != last")
+
+                curr = self.pool.views[event[2]]  # First node
+                self.follow(screen, 0)
+                draw_pointer(curr, "CURR", Colors.ORANGE, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "visit":
+                # Hop to the node before last along the express lanes
+                curr = self.moveCurr(screen, curr, event)
+
+            elif kind == "link":
+                pygame.draw.rect(screen, Colors.RED, self.last.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
+                # Erase old circular connection from last to first; curr.next already points
+                # past last, so draw curr's arrow to last by hand
+                self._draw_without_wrap(screen, skip=(curr,))
+                start_x = curr.shape.x + curr.shape.width
+                start_y = curr.shape.y + 35
+                end_x = self.last.shape.x
+                end_y = self.last.shape.y + 35
                 pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y), (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-        erase_pointer(screen, curr, "CURR")
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        set_status("Updating Pointers...", Colors.ORANGE, "> curr.next = last.next")
-        
-        # Store old last before updating
-        old_last = self.last
-        
-        # Erase LAST pointer from old last node
-        erase_pointer(screen, old_last, "LAST")
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
-        
-        # Update pointers
-        curr.next = self.last.next
-        self.last = curr  # Move tail pointer
-
-        erase_x = curr.shape.x + curr.shape.width
-        erase_y = curr.shape.y + (curr.shape.height // 2) - 10
-        pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
-        # Draw new circular connection from curr (new last) to first
-        first_node = curr.next
-        start_x = curr.shape.x + curr.shape.width
-        start_y = curr.shape.y + 35
-        path_points = [
-            (start_x, start_y), (start_x + 20, start_y),
-            (start_x + 20, start_y + 60), (first_node.shape.x - 20, start_y + 60),
-            (first_node.shape.x - 20, start_y + 15), (first_node.shape.x, start_y + 15)
-        ]
-        pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-        end_x, end_y = path_points[-1]
-        arrow_size = 7
-        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-            (end_x, end_y), (end_x - arrow_size, end_y - arrow_size),
-            (end_x - arrow_size, end_y + arrow_size)
-        ])
-        
-        # Draw LAST pointer on new last node (curr)
-        draw_pointer(curr, "LAST", Colors.LIGHT_GREY, screen)
-        set_status("Moving Tail...", Colors.ORANGE, "> last = curr")
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        set_status("Deleting Last Node...", Colors.ORANGE, "> del last")
-        update_status_ui(screen)
-        pygame.time.delay(500)
-        self.nodes.pop()
-        self.length -= 1
-        
-        self._recalculate_positions()
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+                erase_pointer(screen, curr, "CURR")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                set_status("Updating Pointers...", Colors.ORANGE, "> curr.next = last.next")
+
+                # Erase LAST pointer from old last node
+                erase_pointer(screen, self.last, "LAST")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
+
+            elif kind == "set":
+                # Move tail pointer
+                erase_x = curr.shape.x + curr.shape.width
+                erase_y = curr.shape.y + (curr.shape.height // 2) - 10
+                pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
+                # Draw new circular connection from curr (new last) to first
+                self.drawWrap(screen, curr, curr.next, end_dy=15)
+
+                # Draw LAST pointer on new last node (curr)
+                draw_pointer(curr, "LAST", Colors.LIGHT_GREY, screen)
+                set_status("Moving Tail...", Colors.ORANGE, "> last = curr")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "removed":
+                set_status("Deleting Last Node...", Colors.ORANGE, "> del last")
+                update_status_ui(screen)
+                pygame.time.delay(500)
+                self.hideNode(event[1])
+
+        self.layout()
         self._redraw(screen)
         set_status("Tail Deleted!", Colors.GREEN, "> Success")
         pygame.time.delay(500)
@@ -903,294 +759,232 @@ class SCLL:
         if self.last is None:
             set_status("List Empty!", Colors.RED, "> return")
             return
-        
+
         if pos < 1 or pos > self.length:
             set_status("Invalid Position", Colors.RED, "> Position out of bounds")
             return
-        
+
         if pos == 1:
             self.deleteFromBeginning(screen)
             return
-        
+
         if pos == self.length:
             self.deleteFromEnd(screen)
             return
 
-        set_status("Traversing...", Colors.ORANGE, "> while curr != pos")
-        # Visual traversal starting from first node (last.next)
-        curr = self.last.next
-        prev = self.last
-        draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-        # Draw PREV pointer on last node using draw_pointer_on_last
-        draw_pointer_on_last(prev, "PREV", Colors.TEAL_BRIGHT, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-
-        # Iterate to position
-        for i in range(pos - 1):
-            erase_pointer(screen, curr, "CURR")
-            if prev == self.last:
-                y = self.last.shape.y - 80
-                x = self.last.shape.x + self.last.shape.width // 2 - 20
-                pygame.draw.rect(screen, Colors.GREY, (x, y, 75, 35))
-            else:
-                erase_pointer(screen, prev, "PREV")
-            prev = curr
-            curr = curr.next
-            draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-            # Draw PREV pointer - use draw_pointer_on_last if prev is last node
-            if prev == self.last:
-                draw_pointer_on_last(prev, "PREV", Colors.TEAL_BRIGHT, screen)
-            else:
+        curr = prev = None
+        for event in self.core.remove_at(pos - 1):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and curr is None:
+                set_status("Traversing...", Colors.ORANGE, "> while curr != pos")
+                # Visual traversal starting from first node (last.next)
+                curr = self.pool.views[event[2]]
+                self.follow(screen, 0)
+                draw_pointer(curr, "CURR", Colors.ORANGE, screen)
+                # Draw PREV pointer on last node using draw_pointer_on_last, if it is on screen
+                if self.last.shape is not None:
+                    draw_pointer_on_last(self.last, "PREV", Colors.TEAL_BRIGHT, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                # Hop to pos - 1 along the express lanes, then one step for curr
+                if self.last.shape is not None:
+                    y = self.last.shape.y - 80
+                    x = self.last.shape.x + self.last.shape.width // 2 - 20
+                    pygame.draw.rect(screen, Colors.GREY, (x, y, 75, 35))
+
+            elif kind == "visit" and event[1] == "prev":
+                prev = self.pool.views[event[2]]
                 draw_pointer(prev, "PREV", Colors.TEAL_BRIGHT, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
+                set_status("Traversing...", Colors.ORANGE, "> prev = curr; curr = curr.next")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        # Find previous node with visualization
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                # Highlight node to delete
+                pygame.draw.rect(screen, Colors.RED, curr.shape, 2)
+                set_status("Node Found!", Colors.GREEN, "> Node at position found")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        # Highlight node to delete
-        pygame.draw.rect(screen, Colors.RED, curr.shape, 2)
-        set_status("Node Found!", Colors.GREEN, "> Node at position found")
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                # Erase the simple arrow from prev to curr; the core only gets here for a
+                # node before the last, so it is never the wrap-around
+                erase_x = prev.shape.x + prev.shape.width
+                erase_y = prev.shape.y + (prev.shape.height // 2) - 10
+                pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
 
-        # Check if this is a circular connection case
-        is_circular_connection = (prev == self.last and prev.next == self.last.next and self.length > 1)
-        
-        # Erase the connection from prev to curr (might be circular)
-        if is_circular_connection:
-            set_status("Erasing Circular Pointer...", Colors.ORANGE, "> Removing wrap")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            # Redraw all nodes without the circular connection
-            for node in self.nodes:
-                pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-                screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-                text_rect = node.text.get_rect(center=node.shape.center)
-                screen.blit(node.text, text_rect)
-                
-                if node == self.last:
-                    draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-                
-                # Draw normal connections (not the circular one we're erasing)
-                if node.next is not None:
-                    if not (node == self.last and node.next == self.last.next and self.length > 1):
-                        if not (node == self.last and node.next == self.last):
-                            if node != prev or node.next != curr:
-                                start_x = node.shape.x + node.shape.width
-                                start_y = node.shape.y + 35
-                                end_x = node.next.shape.x
-                                end_y = node.next.shape.y + 35
-                                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                                arrow_size = 7
-                                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                                    (end_x, end_y),
-                                    (end_x - arrow_size, end_y - arrow_size),
-                                    (end_x - arrow_size, end_y + arrow_size)
-                                ])
-        else:
-            # Erase the simple arrow from prev to curr
-            erase_x = prev.shape.x + prev.shape.width
-            erase_y = prev.shape.y + (prev.shape.height // 2) - 10
-            pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "visit" and event[3] == pos - 1:
+                erase_pointer(screen, curr, "CURR")
+                curr = self.pool.views[event[2]]
+                self.follow(screen, pos - 1)
+                draw_pointer(curr, "CURR", Colors.ORANGE, screen)
+
+            elif kind == "visit":
+                curr = self.moveCurr(screen, curr, event)
+
+            elif kind == "link":
+                # Update pointer: prev.next = curr.next (bypass curr)
+                set_status("Bypassing Node...", Colors.ORANGE, "> prev.next = curr.next")
 
-        # Update pointer: prev.next = curr.next (bypass curr)
-        set_status("Bypassing Node...", Colors.ORANGE, "> prev.next = curr.next")
-        prev.next = curr.next
-        
-        # Draw bridge connection from prev to curr.next: right -> down -> left -> down -> right
-        if curr.next:
-            if is_circular_connection:
-                # Draw circular connection from prev to first node
-                start_x = prev.shape.x + prev.shape.width
-                start_y = prev.shape.y + 35
-                first_node = curr.next
-                path_points = [
-                    (start_x, start_y),
-                    (start_x + 20, start_y),  # Out Right
-                    (start_x + 20, start_y + 60),  # Down
-                    (first_node.shape.x - 20, start_y + 60),  # All the way Left
-                    (first_node.shape.x - 20, start_y + 15),  # Up
-                    (first_node.shape.x, start_y + 15)  # In to first node
-                ]
-                pygame.draw.lines(screen, Colors.LIGHT_GREY, False, path_points, 2)
-                end_x, end_y = path_points[-1]
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-            else:
                 # Draw bridge connection: right -> down -> left -> down -> right
                 start_x = prev.shape.x + prev.shape.width
                 start_y = prev.shape.y + 35
-                
+
                 corner1 = (start_x + 20, start_y)  # Right
                 corner2 = (corner1[0], start_y + 40)  # Down
                 corner3 = (curr.next.shape.x - 20, corner2[1])  # Left
                 corner4 = (corner3[0], curr.next.shape.y + curr.next.shape.height // 2 + 15)  # Down
                 end_x = curr.next.shape.x  # Right into target
                 end_y = corner4[1]
-                
+
                 pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), corner1, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
                 pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, (end_x, end_y), 2)
-                
-                arrow_size = 7
-                pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                    (end_x, end_y),
-                    (end_x - arrow_size, end_y - arrow_size),
-                    (end_x - arrow_size, end_y + arrow_size)
-                ])
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
 
-        # Remove node from list
-        set_status("Removing Node...", Colors.ORANGE, "> del curr")
-        update_status_ui(screen)
-        index = self.nodes.index(curr)
-        self.nodes.pop(index)
-        self.length -= 1
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
 
-        self._recalculate_positions()
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "removed":
+                # Remove node from list
+                set_status("Removing Node...", Colors.ORANGE, "> del curr")
+                update_status_ui(screen)
+                self.hideNode(event[1])
+
+        self.layout()
         self._redraw(screen)
         set_status("Deletion Complete", Colors.GREEN, "> Success")
         pygame.time.delay(500)
 
     def search(self, value, screen):
-        if self.last is None: 
-            set_status("List Empty!", Colors.RED, "> return")
-            return
-        
-        set_status(f"Searching {value}...", Colors.ORANGE, "> p = last.next; do...while")
-        
-        curr = self.last.next  # First node
-        idx = 1
-        found = False
-        
-        draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(800)
-        
-        while True:
-            if str(curr.data) == str(value):
-                found = True
-                curr.draw(screen, self, highlight_color=Colors.ORANGE, fill=True)
-                set_status(f"Found {value} at Pos {idx}", Colors.GREEN, f"> return {idx}")
+        curr = None
+        for event in self.core.scan(value):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and curr is None:
+                set_status(f"Searching {value}...", Colors.ORANGE, "> p = last.next; do...while")
+
+                curr = self.pool.views[event[2]]  # First node
+                self.follow(screen, 0)
+                draw_pointer(curr, "CURR", Colors.ORANGE, screen)
                 update_status_ui(screen)
                 pygame.display.update()
-                pygame.time.delay(1000)
-                break
-            
-            # Check exit 
-            if curr == self.last:
-                break
-            
-            erase_pointer(screen, curr, "CURR")
-            curr = curr.next
-            idx += 1
-            if curr == self.last:
-                draw_pointer_on_last(self.last, "CURR", Colors.ORANGE, screen)
-            else:
-                draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(800)
-            
-        if not found:
-            set_status("Value Not Found", Colors.RED, "> return -1")
-            
-        self._redraw(screen)
-
-    def destroyList(self, screen):
-        if self.last is None:
-            set_status("List is already Empty!", Colors.RED, "> if last is None: return")
-            return
+                pygame.time.delay(800)
 
-        set_status("Clearing List...", Colors.ORANGE, "> while last is not None:")
-        
-        while self.last is not None:
-            curr = self.last.next  # First node
-            
-            # Show pointer on current node
-            draw_pointer(curr, "CURR", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
-            
-            # Erase circular connection if exists
-            if self.length > 1:
-                pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-                # Redraw remaining nodes
-                for node in self.nodes:
-                    if node != curr:
-                        pygame.draw.rect(screen, Colors.TEAL, node.shape, border_radius=2)
-                        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (node.shape.x, node.shape.y))
-                        text_rect = node.text.get_rect(center=node.shape.center)
-                        screen.blit(node.text, text_rect)
-                        if node == self.last:
-                            draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
-                        # Draw connections
-                        if node.next is not None and node.next != curr:
-                            start_x = node.shape.x + node.shape.width
-                            start_y = node.shape.y + 35
-                            end_x = node.next.shape.x
-                            end_y = node.next.shape.y + 35
-                            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-                            arrow_size = 7
-                            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                                (end_x, end_y), (end_x - arrow_size, end_y - arrow_size),
-                                (end_x - arrow_size, end_y + arrow_size)
-                            ])
-            
-            erase_pointer(screen, curr, "CURR")
-            
-            # Update pointers
-            if self.length == 1:
-                self.last = None
-            else:
-                self.last.next = curr.next
+            elif kind == "visit":
+                erase_pointer(screen, curr, "CURR")
+                curr = self.pool.views[event[2]]
+                self.follow(screen, event[3])
                 if curr == self.last:
-                    self.last = None
-            
-            # Remove node
-            if len(self.nodes) > 0:
-                self.nodes.pop(0)
-            self.length -= 1
-            
-            # Redraw list
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
-            if self.last:
-                self.drawList(screen)
-                if self.last.next == self.last:
                     draw_pointer_on_last(self.last, "CURR", Colors.ORANGE, screen)
                 else:
-                    draw_pointer(self.last.next, "CURR", Colors.ORANGE, screen)
-                
-            
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
+                    draw_pointer(curr, "CURR", Colors.ORANGE, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(800)
+
+            elif kind == "found":
+                _, slot, idx, comparisons = event
+                if slot != NIL:
+                    curr.draw(screen, self, highlight_color=Colors.ORANGE, fill=True)
+                    set_status(f"Found {value} at Pos {idx + 1}", Colors.GREEN, f"> return {idx + 1}")
+                    update_status_ui(screen)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
+
+        # Indexed search: one probe of the pool's value index, then the express lanes rank the slot
+        hash_slot, hash_idx = self.core.lookup(value)
+        hash_pos = hash_idx + 1 if hash_slot != NIL else -1
+        self.search_stats = (value, comparisons, idx + 1 if slot != NIL else -1, hash_pos)
+
+        if slot == NIL:
+            set_status("Value Not Found", Colors.RED, f"> walk: {comparisons} compares; index[data]: 1 probe")
+
+        self._redraw(screen)
+
+    def destroyList(self, screen):
+        set_status("Clearing List...", Colors.ORANGE, "> while last is not None:")
+
+        for event in self.core.clear():
+            kind = event[0]
+            if kind == "error":
+                set_status("List is already Empty!", Colors.RED, "> if last is None: return")
+                return
+
+            if kind == "visit":
+                curr = self.pool.views[event[2]]  # First node
+                self.follow(screen, 0)
+
+                # Show pointer on current node
+                draw_pointer(curr, "CURR", Colors.ORANGE, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(500)
+
+                # Erase circular connection if exists
+                if self.length > 1:
+                    pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+                    # Redraw remaining nodes
+                    for node in self.view.visible(self.nodes):
+                        if node != curr:
+                            screen.blit(chrome.get((node.shape.size, Colors.TEAL, None)), node.shape)
+                            text_rect = node.text.get_rect(center=node.shape.center)
+                            screen.blit(node.text, text_rect)
+                            if node == self.last:
+                                draw_pointer(node, "LAST", Colors.LIGHT_GREY, screen)
+                            # Draw connections
+                            if node.next is not None and node.next != curr:
+                                start_x = node.shape.x + node.shape.width
+                                start_y = node.shape.y + 35
+                                if node.next.shape is not None:
+                                    end_x = node.next.shape.x
+                                    end_y = node.next.shape.y + 35
+                                else:
+                                    end_x = start_x + 35
+                                    end_y = start_y
+                                pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
+                                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+
+                erase_pointer(screen, curr, "CURR")
+
+            elif kind == "removed":
+                # Remove node
+                self.hideNode(event[1])
+                self.layout()
+
+                # Redraw list
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 340))
+                if self.last:
+                    self.drawList(screen)
+                    if self.last.next == self.last:
+                        draw_pointer_on_last(self.last, "CURR", Colors.ORANGE, screen)
+                    else:
+                        draw_pointer(self.last.next, "CURR", Colors.ORANGE, screen)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(500)
+
+        self.view.current = None
+        self.search_stats = None
 
-        self.nodes = []
-        self.length = 0
-        self.currentPos = (self.start_x_coord, 480)
-        
         set_status("List Cleared!", Colors.GREEN, "> Success")
         self._redraw(screen)
         pygame.time.delay(500)
@@ -1212,7 +1006,7 @@ def run(screen):
 
     # Text rendering
     title = titleFont.render("Circular Linked List", True, Colors.TEAL)
-    cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+    cap_value_txt = paraFont.render(f"Capacity (Max {MAX_NODES}): ", True, Colors.LIGHT_GREY)
     value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
     value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
     pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
@@ -1223,10 +1017,10 @@ def run(screen):
 
     scll = SCLL(6)
 
-    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK)
+    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK, 4)
     cap_bar.text = "6"
     node_bar = InputBar(100, 230, 130, 40, Colors.BLACK, 4)
-    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 2)
+    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 4)
     del_val_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 4)
     search_val_bar = InputBar(660, 315, 120, 40, Colors.BLACK, 4)
 
@@ -1240,9 +1034,17 @@ def run(screen):
     delete_pos_button = Button(520, 315, 120, 40, "Delete Pos", None, 18)
     search_button = Button(790, 315, 120, 40, "Search", None, 18)
     back_button = Button(930, 15, 70, 35, "← Back", None, 18)
+    pool_button = Button(370, 145, 105, 40, "Pool: Off", None, 18)
+    show_pool = False
+    fill_button = Button(370, 100, 105, 38, "Fill", None, 18)
+
+    ui = WidgetIndex([set_max_button, insert_tail_button, insert_head_button, insert_at_pos_button,
+                      delete_head_button, delete_tail_button, destroy_button, delete_pos_button,
+                      search_button, back_button, pool_button, fill_button, cap_bar, node_bar,
+                      pos_insert_bar, del_val_bar, search_val_bar])
 
     running = True
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     while running:
         screen.fill(Colors.GREY)
@@ -1264,6 +1066,8 @@ def run(screen):
         delete_pos_button.draw(screen)
         search_button.draw(screen)
         back_button.draw(screen)
+        pool_button.draw(screen)
+        fill_button.draw(screen)
 
         cap_bar.draw(screen)
         node_bar.draw(screen)
@@ -1272,9 +1076,13 @@ def run(screen):
         search_val_bar.draw(screen)
 
         scll.drawList(screen)
+        if show_pool:
+            draw_pool(scll.pool, screen)
+        draw_search_stats(scll.search_stats, screen)
         update_status_ui(screen)
 
-        for event in pygame.event.get():
+        for event in sched.events():
+            ui.dispatch(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
 
@@ -1284,12 +1092,31 @@ def run(screen):
             del_val_bar.handle_input(event)
             search_val_bar.handle_input(event)
 
+            # Scrolling the list view: wheel, arrow keys, or a click on the minimap
+            if event.type == pygame.MOUSEWHEEL:
+                scll.scroll((event.x - event.y) * scll.view.stride)
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                scll.scroll(scll.view.stride if event.key == pygame.K_RIGHT else -scll.view.stride)
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and \
+                    scll.view.minimap.inflate(0, 16).collidepoint(event.pos):
+                scll.view.jump(event.pos[0], len(scll.nodes))
+                scll.layout()
+
+            if fill_button.is_clicked(event):
+                if scll.length >= scll.size:
+                    set_status("Limit Reached!", Colors.RED, "> Capacity Full")
+                else:
+                    count = scll.size - scll.length
+                    scll.fill(str(random.randint(1, 999)) for _ in range(count))
+                    set_status(f"Filled {count} Nodes", Colors.GREEN, f"> last.next = newNode (x{count})")
+
             if set_max_button.is_clicked(event):
-                if cap_bar.text.isdigit() and 0 < int(cap_bar.text) <= 6:
-                    scll = SCLL(int(cap_bar.text))
+                if cap_bar.text.isdigit() and 0 < int(cap_bar.text) <= MAX_NODES:
+                    scll.size = int(cap_bar.text)
+                    scll.clear()
                     set_status(f"Max Set to {cap_bar.text}", Colors.GREEN)
                 else:
-                    set_status("Invalid Max (1-6)", Colors.RED)
+                    set_status(f"Invalid Max (1-{MAX_NODES})", Colors.RED)
 
             if insert_tail_button.is_clicked(event):
                 if node_bar.text:
@@ -1342,12 +1169,16 @@ def run(screen):
                 else:
                     set_status("Input Value", Colors.RED)
 
+            if pool_button.is_clicked(event):
+                show_pool = not show_pool
+                pool_button.text = "Pool: On" if show_pool else "Pool: Off"
+
             if back_button.is_clicked(event):
                 return "back"
 
         update_status_ui(screen)
         pygame.display.update()
-        clock.tick(60)
+        sched.sleep()
 
     return "back"
 
@@ -1,6 +1,16 @@
 import pygame
-from button_template import Button
+import random
+from widgets import Button, InputBar, WidgetIndex
 import Colors
+from node_pool import NodePool, PooledNode, SurfaceCache, NIL
+from linked_list_core import DoublyCore
+from list_view import ListView
+from frame_scheduler import FrameScheduler
+from sprites import labels, null_labels, chrome, blit_polygon, draw_pool, draw_search_stats
+
+MAX_NODES = 5000
+VISIBLE_NODES = 8  # Nodes that fit across the screen at the 125px stride
+LANES_SHOWN = 4  # Express lanes drawn above the list
 
 
 # Font config and sizes
@@ -20,7 +30,7 @@ statFont = get_font(19)
 
 # Text rendering
 title = titleFont.render("Doubly Linked List", True, Colors.TEAL)
-cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+cap_value_txt = paraFont.render(f"Capacity (Max {MAX_NODES}): ", True, Colors.LIGHT_GREY)
 value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
 value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
 pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
@@ -30,6 +40,17 @@ status_msg = "Ready"
 logic_msg = "Waiting for operation..."
 status_color = Colors.LIGHT_GREY
 
+node_texts = SurfaceCache(lambda text: nodeFont.render(text, True, Colors.LIGHT_GREY))
+
+NEXT_HEAD = ((0, 0), (-7, -5), (-7, 5))  # Points relative to the tip
+PREV_HEAD = ((0, 0), (7, -5), (7, 5))
+SMALL_NEXT_HEAD = ((0, 0), (-5, -5), (-5, 5))  # Links drawn while inserting
+SMALL_PREV_HEAD = ((0, 0), (5, -5), (5, 5))
+POINTER_DOWN = ((0, 0), (-10, -15), (10, -15))
+POINTER_UP = ((0, 0), (-10, 15), (10, 15))
+POINTER_ABOVE = ((0, 0), (-10, -16), (10, -16))  # Stacked above another pointer
+
+
 def set_status(message, color, logic_message=""):
     global status_msg, status_color, logic_msg 
     status_msg = message
@@ -47,51 +68,18 @@ def update_status_ui(screen):
     status_surf = nodeFont.render(status_msg, True, status_color)
     screen.blit(status_surf, (500, 50))
 
-class InputBar:
-    def __init__(self, x, y, width, height, bg_color, max_chars=1):
-        self.shape = pygame.Rect(x, y, width, height)
-        self.bg_color = bg_color
-        self.inactive_color = Colors.LIGHT_GREY
-        self.active_color = Colors.TEAL
-        self.color = self.inactive_color
-        self.active = False
-        self.text = ""
-        self.max_chars = max_chars
-        self.input_font = get_font(19)
-        self.text_rendered = self.input_font.render(self.text, True, Colors.LIGHT_GREY)
-
-    def handle_input(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.shape.collidepoint(event.pos)
-            self.color = self.active_color if self.active else self.inactive_color
-
-        if self.active and event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE and len(self.text) > 0:
-                self.text = self.text[:len(self.text) - 1]
-            elif event.key == pygame.K_RETURN:
-                pass
-            elif event.unicode.isprintable():
-                if len(self.text) < self.max_chars:
-                    self.text += event.unicode
-
-        self.text_rendered = self.input_font.render(self.text, True, Colors.LIGHT_GREY)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.bg_color, self.shape, border_radius=5)
-        pygame.draw.rect(screen, self.color, self.shape, 2, border_radius=5)
-        screen.blit(self.text_rendered, (self.shape.x + 2, self.shape.y + 5))
 
 def draw_pointer(node, text, color, screen):
     node_x = node.shape.x + node.shape.width // 2
     if text == "TAIL":
         node_y = node.shape.y + node.shape.height + 8
-        pygame.draw.polygon(screen, color, [(node_x, node_y), (node_x-10, node_y+15), (node_x+10, node_y+15)])
-        lbl = subFont.render(f"{text}", True, color)
+        blit_polygon(screen, POINTER_UP, color, node_x, node_y)
+        lbl = labels.get((text, color))
         screen.blit(lbl, (node_x - lbl.get_width() // 2, node_y + 20))
     elif text == "HEAD" or text == "TEMP" or text == "NEXT" or text == "PREV":
         node_y = node.shape.y - 10
-        pygame.draw.polygon(screen, color, [(node_x, node_y), (node_x-10, node_y-15), (node_x+10, node_y-15)])
-        lbl = subFont.render(f"{text}", True, color)
+        blit_polygon(screen, POINTER_DOWN, color, node_x, node_y)
+        lbl = labels.get((text, color))
         screen.blit(lbl, (node_x - lbl.get_width() // 2, node_y - 37))
 
 def erase_pointer(screen, node, pointer_type="HEAD"):
@@ -128,35 +116,30 @@ def draw_pointer_on_head(node, text, color, screen):
     temp_x = node.shape.x + node.shape.width // 2
     temp_y = node.shape.y - 20
 
-    # Draw TEMP pointer
-    pygame.draw.polygon(screen, color, [
-        (temp_x, temp_y - 29),  # Tip of TEMP pointer (above HEAD)
-        (temp_x - 10, temp_y - 45),  # Left point
-        (temp_x + 10, temp_y - 45)  # Right point
-    ])
+    # Draw TEMP pointer, tip above HEAD
+    blit_polygon(screen, POINTER_ABOVE, color, temp_x, temp_y - 29)
 
-    lbl_temp = subFont.render(f"{text}", True, color)
+    lbl_temp = labels.get((text, color))
     screen.blit(lbl_temp, (temp_x - lbl_temp.get_width() // 2, temp_y - 65))
 
-class DLLNode:
-    def __init__(self, data, pos, next=None, prev=None):
-        self.data = data
-        self.next = next
-        self.prev = prev
-        self.shape = pygame.Rect(pos[0], pos[1], 90, 70)
-        self.text = nodeFont.render(f"{data}", True, Colors.LIGHT_GREY)
+class DLLNode(PooledNode):
+    __slots__ = ("shape", "text")
+
+    def __init__(self, pool, idx):
+        # data/next/prev live in the pool's arrays; the list view hands out a Rect and
+        # label only while the node is on screen
+        super().__init__(pool, idx)
+        self.shape = None
+        self.text = None
 
     def draw(self, screen, dll, highlight_color=Colors.TEAL, fill=False, drawNULL= True):
-        # Draw node box
+        # Node box, border highlight and "data:" label, one sprite per node size and colors
         if fill:
-             pygame.draw.rect(screen, highlight_color, self.shape, border_radius=2)
+            screen.blit(chrome.get((self.shape.size, highlight_color, None)), self.shape)
         else:
-            pygame.draw.rect(screen, Colors.TEAL, self.shape, border_radius=2)
-            if highlight_color != Colors.TEAL: # Border highlight
-                 pygame.draw.rect(screen, highlight_color, self.shape, 2, border_radius=2)
+            border = highlight_color if highlight_color != Colors.TEAL else None
+            screen.blit(chrome.get((self.shape.size, Colors.TEAL, border)), self.shape)
 
-        # Labels
-        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (self.shape.x, self.shape.y))
         text_rect = self.text.get_rect(center=self.shape.center)
         screen.blit(self.text, text_rect)
 
@@ -170,354 +153,460 @@ class DLLNode:
         start_y = self.shape.y + 20
         
         if self.next is not None:
-            end_x = self.next.shape.x
-            end_y = self.next.shape.y + 20
+            if self.next.shape is not None:
+                end_x = self.next.shape.x
+                end_y = self.next.shape.y + 20
+            else:
+                # Next node is scrolled off screen: point towards where it would be
+                end_x = start_x + 35
+                end_y = start_y
             pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [(end_x, end_y), (end_x-7, end_y-5), (end_x-7, end_y+5)])
+            blit_polygon(screen, NEXT_HEAD, Colors.LIGHT_GREY, end_x, end_y)
         elif self == dll.tail:
             # NULL Next (always show for tail, or if drawNULL=True)
             null_x = start_x + 30
             pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (null_x, start_y), 2)
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [(null_x, start_y), (null_x-7, start_y-5), (null_x-7, start_y+5)])
-            null_txt = paraFont.render("NULL", True, Colors.LIGHT_GREY)
-            screen.blit(null_txt, (null_x + 5, start_y - 10))
+            blit_polygon(screen, NEXT_HEAD, Colors.LIGHT_GREY, null_x, start_y)
+            screen.blit(null_labels.get(Colors.LIGHT_GREY), (null_x + 5, start_y - 10))
 
         # prev arrow
         start_x_prev = self.shape.x
         start_y_prev = self.shape.y + 50
         
         if self.prev is not None:
-            end_x_prev = self.prev.shape.x + self.prev.shape.width
-            end_y_prev = self.prev.shape.y + 50
+            if self.prev.shape is not None:
+                end_x_prev = self.prev.shape.x + self.prev.shape.width
+                end_y_prev = self.prev.shape.y + 50
+            else:
+                # Same for a previous node scrolled off to the left
+                end_x_prev = start_x_prev - 35
+                end_y_prev = start_y_prev
             pygame.draw.line(screen, Colors.ORANGE, (start_x_prev, start_y_prev), (end_x_prev, end_y_prev), 2)
-            pygame.draw.polygon(screen, Colors.ORANGE, [(end_x_prev, end_y_prev), (end_x_prev+7, end_y_prev-5), (end_x_prev+7, end_y_prev+5)])
+            blit_polygon(screen, PREV_HEAD, Colors.ORANGE, end_x_prev, end_y_prev)
         elif self == dll.head:
             # NULL Prev (always show for head, or if drawNULL=True)
             null_x_prev = start_x_prev - 30
             pygame.draw.line(screen, Colors.ORANGE, (start_x_prev, start_y_prev), (null_x_prev, start_y_prev), 2)
-            pygame.draw.polygon(screen, Colors.ORANGE, [(null_x_prev, start_y_prev), (null_x_prev+7, start_y_prev-5), (null_x_prev+7, start_y_prev+5)])
+            blit_polygon(screen, PREV_HEAD, Colors.ORANGE, null_x_prev, start_y_prev)
             if drawNULL and self == dll.head:
-                null_txt = paraFont.render("NULL", True, Colors.ORANGE)
                 text_x = max(5, null_x_prev - 55)
-                screen.blit(null_txt, (text_x, start_y_prev - 10))
+                screen.blit(null_labels.get(Colors.ORANGE), (text_x, start_y_prev - 10))
 
 
 class DLL:
     def __init__(self, size):
-        self.head = None
-        self.tail = None
-        self.size = size
-        self.length = 0
-        self.nodes = [] 
-        
+        # The core owns the pool and the express lanes; each of its operations yields
+        # one event per step, which the methods below animate
+        self.core = DoublyCore(size, NodePool(MAX_NODES, DLLNode, indexed=True))
+        self.pool = self.core.pool
+        self.lanes = self.core.lanes
+        self.nodes = []  # In list order; only the visible ones get drawn
+
+        self.search_stats = None  # (value, comparisons, walk pos, index pos) of the last search
+
+        # Scrolling camera over the nodes; long lists start at the left edge
+        self.view = ListView(self.originX(), 480, lambda node: node_texts.get(f"{node.data}"))
+
+    @property
+    def size(self):
+        return self.core.size
+
+    @size.setter
+    def size(self, size):
+        self.core.size = size
+
+    @property
+    def length(self):
+        return self.core.length
+
+    @property
+    def head(self):
+        return self.pool.view(self.core.head)
+
+    @property
+    def tail(self):
+        return self.pool.view(self.core.tail)
+
+    def originX(self):
+        # Centre a short list (with room for both NULL arrows); longer ones start like six nodes
         node_width = 90
         gap_between_nodes = 35
         null_space = 30
         left_margin = 30
-        
-        total_width_needed = (size * node_width) + ((size - 1) * gap_between_nodes) + null_space + left_margin
-        self.start_x_coord = max(30, (1000 - total_width_needed) // 2 + left_margin)
-        self.currentPos = (self.start_x_coord, 480)
 
-    def drawList(self, screen, drawNULL=True):
+        shown = min(self.size, 6)
+        total_width_needed = (shown * node_width) + ((shown - 1) * gap_between_nodes) + null_space + left_margin
+        return max(30, (1000 - total_width_needed) // 2 + left_margin)
+
+    def showNode(self, pos, slot):
+        # The core's node for slot goes into the drawing order at 0-based pos
+        node = self.pool.views[slot]
+        self.nodes.insert(pos, node)
+        return node
+
+    def hideNode(self, pos):
+        self.view.release(self.nodes.pop(pos))
+
+    def clear(self):
         for node in self.nodes:
+            self.view.release(node)
+        self.nodes.clear()
+        self.core.reset()
+        self.search_stats = None
+        self.view.origin_x = self.originX()
+        self.view.scroll = 0
+        self.view.current = None
+        self.layout()
+
+    def fill(self, values):
+        # Append without animating, for building long lists
+        self.core.extend(values)
+        self.nodes = [self.pool.views[slot] for slot in self.core.slots()]
+        self.layout()
+
+    def layout(self, shift=0):
+        self.view.layout(self.nodes, shift)
+
+    def scroll(self, dx):
+        if self.view.scroll_by(dx, len(self.nodes)):
+            self.layout()
+
+    def follow(self, screen, index):
+        # Keep the node an operation points at on screen, redrawing the list if the camera moves
+        if self.view.follow(index, len(self.nodes)):
+            self.layout()
+            pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
+            self.drawList(screen)
+
+    def pause(self, ms):
+        # Walks over long lists speed up so a full traversal takes about as long as a short one
+        n = len(self.nodes)
+        pygame.time.delay(ms if n <= VISIBLE_NODES else ms * VISIBLE_NODES // n)
+
+    def drawLanes(self, screen):
+        # Express lanes as rows of dots (one per tall enough node) joined by their links, lane 1 lowest
+        if self.lanes.length != len(self.nodes):
+            return  # Mid-operation, before the core has placed or after it has removed a node
+        view = self.view
+        for level in range(1, min(self.lanes.levels(), LANES_SHOWN + 1)):
+            y = 428 - 7 * level
+            xs = [view.world_x(i) + view.node_w // 2 - view.scroll
+                  for i in self.lanes.lane(level, view.first, view.last)]
+            if len(xs) > 1:
+                pygame.draw.lines(screen, Colors.TEAL, False, [(x, y) for x in xs], 1)
+            for x in xs:
+                pygame.draw.circle(screen, Colors.TEAL_BRIGHT, (x, y), 3)
+
+    def moveTemp(self, screen, temp, event, target):
+        # Animate a visit event on the way to 0-based target: the core starts TEMP at whichever
+        # end is fewer steps away, then hops along the express lanes or steps back along prev
+        _, name, slot, i, level = event
+        node = self.pool.views[slot]
+        if temp is None:
+            if level < 0:
+                set_status("Traversing...", Colors.ORANGE, f"> temp = tail ({i - target} steps from the end)")
+            else:
+                set_status("Traversing...", Colors.ORANGE, "> temp = head; ride the express lanes")
+        else:
+            if temp == self.head:
+                erase_pointer(screen, temp, "TEMP_ABOVE")
+            else:
+                erase_pointer(screen, temp, "TEMP")
+            if level >= 0:
+                self.drawLanes(screen)
+            if level < 0:
+                set_status("Traversing...", Colors.ORANGE, "> temp = temp.prev")
+            else:
+                set_status("Traversing...", Colors.ORANGE,
+                           "> temp = temp.next" if level == 0 else f"> temp = temp.lane[{level}]")
+
+        self.follow(screen, i)
+        if node == self.head:
+            draw_pointer_on_head(node, "TEMP", Colors.ORANGE, screen)
+        else:
+            draw_pointer(node, "TEMP", Colors.ORANGE, screen)
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(1000)
+        return node
+
+    def drawList(self, screen, drawNULL=True):
+        self.drawLanes(screen)
+        for node in self.view.visible(self.nodes):
             node.draw(screen, self, drawNULL=drawNULL)
 
-    def _recalculate_positions(self):
-        start_x = self.start_x_coord
-        y_pos = 480
-        for node in self.nodes:
-            node.shape.x = start_x
-            node.shape.y = y_pos
-            start_x += 125
-        self.currentPos = (start_x, y_pos)
+        n = len(self.nodes)
+        self.view.draw_minimap(screen, n, subFont, [
+            (0 if n else None, "HEAD", Colors.LIGHT_GREY),
+            (n - 1 if n else None, "TAIL", Colors.LIGHT_GREY),
+            (self.view.current, "CURR", Colors.ORANGE)
+        ])
 
     def _redraw(self, screen, drawNULL=True):
         # Erase the list
-        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 340))
         self.drawList(screen, drawNULL=drawNULL)
         update_status_ui(screen)
         pygame.display.update()
 
     def insertAtTail(self, data, screen):
-        if self.length >= self.size:
-            set_status("Limit Reached!", Colors.RED, "> Capacity Full")
-            return
+        for event in self.core.push_back(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "new":
+                self.showNode(event[2], event[1])
+                self.view.follow(len(self.nodes) - 1, len(self.nodes))
+                self.layout()
+
+                set_status(f"Node Added: {data}", Colors.GREEN, "> newNode = Node(data)")
+                self._redraw(screen)
+                pygame.time.delay(1000)
 
-        newNode = DLLNode(data, self.currentPos)
-        self.nodes.append(newNode)
-        self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
-        
-        set_status(f"Node Added: {data}", Colors.GREEN, "> newNode = Node(data)")
-        self._redraw(screen)
-        pygame.time.delay(1000)
+            elif kind == "set" and event[1] == "head":
+                set_status("Head & Tail Updated", Colors.GREEN, "> head = tail = newNode")
+
+            elif kind == "link" and event[2] == "next":
+                set_status("Linking Next...", Colors.ORANGE, "> tail.next = newNode")
+                self._redraw(screen)
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                set_status("Linking Prev...", Colors.ORANGE, "> newNode.prev = tail")
+                self._redraw(screen)
+                pygame.time.delay(1000)
+
+            elif kind == "set" and event[3] != NIL:
+                set_status("Tail Updated!", Colors.GREEN, "> tail = newNode")
 
-        if self.head is None:
-            self.head = newNode
-            self.tail = newNode
-            set_status("Head & Tail Updated", Colors.GREEN, "> head = tail = newNode")
-        else:
-            self.tail.next = newNode
-            set_status("Linking Next...", Colors.ORANGE, "> tail.next = newNode")
-            self._redraw(screen)
-            pygame.time.delay(1000)
-            
-
-            newNode.prev = self.tail
-            set_status("Linking Prev...", Colors.ORANGE, "> newNode.prev = tail")
-            self._redraw(screen)
-            pygame.time.delay(1000)
-            
-            self.tail = newNode
-            set_status("Tail Updated!", Colors.GREEN, "> tail = newNode")
-
-        self.length += 1
         self._redraw(screen)
         pygame.time.delay(500)
 
     def insertAtHead(self, data, screen):
-        if self.length >= self.size:
-            set_status("Limit Reached!", Colors.RED, "> Capacity Full")
-            return
+        for event in self.core.push_front(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "new":
+                # Shift: lay the list out one slot to the right
+                if self.nodes:
+                    set_status("Shifting Nodes...", Colors.ORANGE, "> Shifting Right")
+                    pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 290))
+                    self.view.follow(0, len(self.nodes) + 1)
+                    self.layout(shift=1)
+                    self.drawList(screen, drawNULL=False)
+                    update_status_ui(screen)
+                    # Erase the NULL text
+                    erase_rect = pygame.Rect(self.head.shape.x - 90, self.head.shape.y + 40, 60, 40)
+                    pygame.draw.rect(screen, Colors.GREY, erase_rect)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
+
+                self.showNode(0, event[1])
+                self.view.follow(0, len(self.nodes))
+                self.layout()
+
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
+                self._redraw(screen, drawNULL=False)
+                pygame.time.delay(1000)
 
-        # Shift
-        if self.length > 0:
-            set_status("Shifting Nodes...", Colors.ORANGE, "> Shifting Right")
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 280))
-            for node in self.nodes:
-                node.shape.x += 125
-            self.drawList(screen, drawNULL=False)
-            update_status_ui(screen)
-            # Erase the NULL text
-            erase_rect = pygame.Rect(self.head.shape.x - 90, self.head.shape.y + 40, 60, 40)
-            pygame.draw.rect(screen, Colors.GREY, erase_rect)
-            pygame.display.update()
-            pygame.time.delay(1000)
-
-        start_x = self.start_x_coord
-        start_y = 480
-        newNode = DLLNode(data, (start_x, start_y))
-        
-        set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
-        self.nodes.insert(0, newNode)
-        self.length += 1
-        self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
-        self._redraw(screen, drawNULL=False)
-        pygame.time.delay(1000)
+            elif kind == "link" and event[2] == "next":
+                set_status("Linking Forward...", Colors.ORANGE, "> newNode.next = head")
+                self._redraw(screen, drawNULL=False)
+                pygame.time.delay(1000)
 
-        if self.head is None:
-            self.head = newNode
-            self.tail = newNode
-        else:
-            newNode.next = self.head
-            set_status("Linking Forward...", Colors.ORANGE, "> newNode.next = head")
-            self._redraw(screen, drawNULL=False)
-            pygame.time.delay(1000)
-            
-            self.head.prev = newNode
-            set_status("Linking Backward...", Colors.ORANGE, "> head.prev = newNode")
-            self._redraw(screen, drawNULL=False)
-            pygame.time.delay(1000)
-            
-            self.head = newNode
+            elif kind == "link":
+                set_status("Linking Backward...", Colors.ORANGE, "> head.prev = newNode")
+                self._redraw(screen, drawNULL=False)
+                pygame.time.delay(1000)
 
         set_status("Head Updated!", Colors.GREEN, "> head = newNode")
         self._redraw(screen)
         pygame.time.delay(500)
 
     def insertAtPos(self, data, pos, screen):
-        # Checks
-        if pos < 1 or pos > self.length + 1:
-            set_status("Invalid Position", Colors.RED)
-            return
-        if pos == 1: 
+        # Edge cases; the core checks bounds and capacity
+        if pos == 1:
             self.insertAtHead(data, screen)
             return
-        if pos == self.length + 1: 
+        if pos == self.length + 1:
             self.insertAtTail(data, screen)
             return
-        if self.length >= self.size: 
-            set_status("Limit Reached", Colors.RED)
-            return
 
-        set_status("Traversing...", Colors.ORANGE, "> while i < pos - 1")
-        temp = self.head
-        draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+        temp = newNode = after = None
+        for event in self.core.insert_at(pos - 1, data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-        for i in range(pos - 2):
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
-            temp = temp.next
-            draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
+            if kind == "visit":
+                # Node before pos, from the nearer end
+                temp = self.moveTemp(screen, temp, event, pos - 2)
 
-        set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
-        
-        newNode = DLLNode(data, (temp.shape.x + 60, temp.shape.y + 150))
-        
-        pygame.draw.rect(screen, Colors.TEAL, newNode.shape, border_radius=2)
-        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (newNode.shape.x, newNode.shape.y))
-        screen.blit(newNode.text, newNode.text.get_rect(center=newNode.shape.center))
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+            elif kind == "new":
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
 
-        # NewNode.next = temp.next
-        set_status("Linking Next...", Colors.ORANGE, "> newNode.next = temp.next")
-        
-        # Line: NewNode Right -> Right -> Up -> Left -> Up -> Temp.next Left
-        start_pos = (newNode.shape.x + newNode.shape.width, newNode.shape.y + 20)
-        corner1 = (start_pos[0] + 10, start_pos[1])  # Right
-        corner2 = (corner1[0], corner1[1] - 40)  # Up
-        corner3 = (corner2[0] - 45, corner2[1])  # Left
-        corner4 = (corner3[0], temp.next.shape.y + temp.next.shape.height - 10)  # Up
-        end_pos = (temp.next.shape.x, temp.next.shape.y + temp.next.shape.height - 10)  # Temp.next Left
-        
-        # Draw line
-        pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner1, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, end_pos, 2)
-        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [(end_pos[0], end_pos[1]), (end_pos[0]-5, end_pos[1]-5), (end_pos[0]-5, end_pos[1]+5)])
-        
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        newNode.next = temp.next
+                after = temp.next
+                newNode = self.pool.views[event[1]]
+                self.view.attach(newNode, (temp.shape.x + 60, temp.shape.y + 150))
 
-        # Temp.next.prev = NewNode
-        set_status("Linking Back...", Colors.ORANGE, "> temp.next.prev = newNode")
-        
-        # Erase the temp.next.prev arrow
-        erase_rect = pygame.Rect(temp.next.shape.x - 35, temp.next.shape.y + 40, 35, 15)
-        pygame.draw.rect(screen, Colors.GREY, erase_rect)
-        pygame.display.update()
-        pygame.time.delay(200)
-
-        # Line: Temp.next Left -> Down -> Right -> Down -> left Bottom
-        start_pos = (temp.next.shape.x, temp.next.shape.y + 50)
-        corner1 = (start_pos[0] - 15, start_pos[1])  # Left
-        corner2 = (corner1[0], corner1[1] + 50)  # Down
-        corner3 = (newNode.shape.x + newNode.shape.width + 25, corner2[1]) # Right
-        corner4 = (corner3[0], newNode.shape.y + 50) # Down
-        end_pos = (newNode.shape.x + newNode.shape.width, corner4[1])
-
-        pygame.draw.line(screen, Colors.ORANGE, start_pos, corner1, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner1, corner2, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner2, corner3, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner3, corner4, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner4, end_pos, 2)
-        pygame.draw.polygon(screen, Colors.ORANGE, [(end_pos[0], end_pos[1]), (end_pos[0]+5, end_pos[1]-5), (end_pos[0]+5, end_pos[1]+5)])
-        
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        temp.next.prev = newNode
+                screen.blit(chrome.get((newNode.shape.size, Colors.TEAL, None)), newNode.shape)
+                screen.blit(newNode.text, newNode.text.get_rect(center=newNode.shape.center))
 
-        # Temp.next = NewNode
-        set_status("Linking Temp Next...", Colors.ORANGE, "> temp.next = newNode")
-        
-        # Erase temp's next arrow
-        erase_rect = pygame.Rect(temp.next.shape.x - 35, temp.next.shape.y + 15, 35, 15)
-        pygame.draw.rect(screen, Colors.GREY, erase_rect)
-        pygame.display.update()
-        pygame.time.delay(200)
-        
-        # Line: Temp Right -> Down -> Left -> Down -> NewNode
-        start_pos = (temp.shape.x + temp.shape.width, temp.shape.y + 20)
-        corner1 = (start_pos[0] + 10, start_pos[1]) # Right
-        corner2 = (corner1[0], newNode.shape.y - 20) # Down
-        corner3 = (newNode.shape.x - 15, corner2[1]) # Left
-        corner4 = (corner3[0], newNode.shape.y + 20) # Down
-        end_pos = (newNode.shape.x, corner4[1])
-        
-        pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner1, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, end_pos, 2)
-        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [(end_pos[0], end_pos[1]), (end_pos[0]-5, end_pos[1]-5), (end_pos[0]-5, end_pos[1]+5)])
-        
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        temp.next = newNode
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        # NewNode.prev = temp
-        set_status("Linking Node Prev...", Colors.ORANGE, "> newNode.prev = temp")
-        
-        # Line: NewNode Left -> Up -> Right -> Up -> Temp 
-        start_pos = (newNode.shape.x, newNode.shape.y + 50)
-        corner1 = (start_pos[0] - 10, start_pos[1]) # Left
-        corner2 = (corner1[0], temp.shape.y + temp.shape.height + 15) # Up
-        corner3 = (temp.shape.x + temp.shape.width + 15, corner2[1]) # Right
-        corner4 = (corner3[0], corner3[1] - 40) # Up
-        end_pos = (temp.shape.x + temp.shape.width, corner4[1])
-        
-        pygame.draw.line(screen, Colors.ORANGE, start_pos, corner1, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner1, corner2, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner2, corner3, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner3, corner4, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner4, end_pos, 2)
-        pygame.draw.polygon(screen, Colors.ORANGE, [(end_pos[0], end_pos[1]), (end_pos[0]+5, end_pos[1]-5), (end_pos[0]+5, end_pos[1]+5)])
-        
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        newNode.prev = temp
+            elif kind == "link" and event[1] == newNode.idx and event[2] == "next":
+                # NewNode.next = temp.next
+                set_status("Linking Next...", Colors.ORANGE, "> newNode.next = temp.next")
+
+                # Line: NewNode Right -> Right -> Up -> Left -> Up -> Temp.next Left
+                start_pos = (newNode.shape.x + newNode.shape.width, newNode.shape.y + 20)
+                corner1 = (start_pos[0] + 10, start_pos[1])  # Right
+                corner2 = (corner1[0], corner1[1] - 40)  # Up
+                corner3 = (corner2[0] - 45, corner2[1])  # Left
+                corner4 = (corner3[0], after.shape.y + after.shape.height - 10)  # Up
+                end_pos = (after.shape.x, after.shape.y + after.shape.height - 10)  # Temp.next Left
+
+                # Draw line
+                pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner1, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, end_pos, 2)
+                blit_polygon(screen, SMALL_NEXT_HEAD, Colors.LIGHT_GREY, *end_pos)
+
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == after.idx:
+                # Temp.next.prev = NewNode
+                set_status("Linking Back...", Colors.ORANGE, "> temp.next.prev = newNode")
+
+                # Erase the temp.next.prev arrow
+                erase_rect = pygame.Rect(after.shape.x - 35, after.shape.y + 40, 35, 15)
+                pygame.draw.rect(screen, Colors.GREY, erase_rect)
+                pygame.display.update()
+                pygame.time.delay(200)
+
+                # Line: Temp.next Left -> Down -> Right -> Down -> left Bottom
+                start_pos = (after.shape.x, after.shape.y + 50)
+                corner1 = (start_pos[0] - 15, start_pos[1])  # Left
+                corner2 = (corner1[0], corner1[1] + 50)  # Down
+                corner3 = (newNode.shape.x + newNode.shape.width + 25, corner2[1]) # Right
+                corner4 = (corner3[0], newNode.shape.y + 50) # Down
+                end_pos = (newNode.shape.x + newNode.shape.width, corner4[1])
+
+                pygame.draw.line(screen, Colors.ORANGE, start_pos, corner1, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner1, corner2, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner2, corner3, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner3, corner4, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner4, end_pos, 2)
+                blit_polygon(screen, SMALL_PREV_HEAD, Colors.ORANGE, *end_pos)
+
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == temp.idx:
+                # Temp.next = NewNode
+                set_status("Linking Temp Next...", Colors.ORANGE, "> temp.next = newNode")
+
+                # Erase temp's next arrow
+                erase_rect = pygame.Rect(after.shape.x - 35, after.shape.y + 15, 35, 15)
+                pygame.draw.rect(screen, Colors.GREY, erase_rect)
+                pygame.display.update()
+                pygame.time.delay(200)
+
+                # Line: Temp Right -> Down -> Left -> Down -> NewNode
+                start_pos = (temp.shape.x + temp.shape.width, temp.shape.y + 20)
+                corner1 = (start_pos[0] + 10, start_pos[1]) # Right
+                corner2 = (corner1[0], newNode.shape.y - 20) # Down
+                corner3 = (newNode.shape.x - 15, corner2[1]) # Left
+                corner4 = (corner3[0], newNode.shape.y + 20) # Down
+                end_pos = (newNode.shape.x, corner4[1])
+
+                pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner1, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, end_pos, 2)
+                blit_polygon(screen, SMALL_NEXT_HEAD, Colors.LIGHT_GREY, *end_pos)
+
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                # NewNode.prev = temp
+                set_status("Linking Node Prev...", Colors.ORANGE, "> newNode.prev = temp")
+
+                # Line: NewNode Left -> Up -> Right -> Up -> Temp
+                start_pos = (newNode.shape.x, newNode.shape.y + 50)
+                corner1 = (start_pos[0] - 10, start_pos[1]) # Left
+                corner2 = (corner1[0], temp.shape.y + temp.shape.height + 15) # Up
+                corner3 = (temp.shape.x + temp.shape.width + 15, corner2[1]) # Right
+                corner4 = (corner3[0], corner3[1] - 40) # Up
+                end_pos = (temp.shape.x + temp.shape.width, corner4[1])
+
+                pygame.draw.line(screen, Colors.ORANGE, start_pos, corner1, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner1, corner2, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner2, corner3, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner3, corner4, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner4, end_pos, 2)
+                blit_polygon(screen, SMALL_PREV_HEAD, Colors.ORANGE, *end_pos)
+
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "placed":
+                # Realign List
+                set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
+                self.showNode(event[1], newNode.idx)
+
+                self.layout()
+                self._redraw(screen)
+                erase_pointer(screen, temp, "TEMP")
 
-        # Realign List
-        set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
-        self.nodes.insert(pos - 1, newNode)
-        self.length += 1
-        
-        self._recalculate_positions()
-        self._redraw(screen)
-        erase_pointer(screen, temp, "TEMP")
         set_status("Insertion Complete!", Colors.GREEN, "> Success")
         pygame.time.delay(500)
 
 
     def deleteHead(self, screen):
-        if self.head is None: 
-            set_status("List Empty!", Colors.RED, "> return")
-            return
-        
-        set_status("Deleting Head...", Colors.ORANGE, "> head = head.next")
-        
-        # Simple Red Border Highlight
-        pygame.draw.rect(screen, Colors.RED, self.head.shape, 2)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+        old = None
+        for event in self.core.pop_front():
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit":
+                set_status("Deleting Head...", Colors.ORANGE, "> head = head.next")
+
+                # Simple Red Border Highlight
+                old = self.pool.views[event[2]]
+                self.follow(screen, 0)
+                pygame.draw.rect(screen, Colors.RED, old.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        if self.head.next:
-            erase_pointer(screen, self.head, "HEAD")
+            elif kind == "set" and event[1] == "head" and self.head:
+                erase_pointer(screen, old, "HEAD")
+                draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-            self.head = self.head.next
+            elif kind == "removed":
+                self.hideNode(event[1])
 
-            draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-            self.head.prev = None
-        else:
-            self.head = None
-            self.tail = None
-            
-        self.length -= 1
-        self.nodes.pop(0)
-        
         set_status("Deleting Head...", Colors.ORANGE, "> del head.prev; head.prev = NULL")
-        self._recalculate_positions()
+        self.layout()
         self._redraw(screen)
         update_status_ui(screen)
         pygame.display.update()
@@ -526,206 +615,204 @@ class DLL:
         pygame.time.delay(500)
 
     def deleteTail(self, screen):
-        if self.tail is None: 
-            set_status("List Empty!", Colors.RED, "> return")
-            return
-        if self.head == self.tail: 
+        if self.length < 2:
             self.deleteHead(screen)
             return
-        
-        set_status("Deleting Tail...", Colors.ORANGE, "> tail = tail.prev")
-        
-        # Simple Red Border Highlight
-        pygame.draw.rect(screen, Colors.RED, self.tail.shape, 2)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        erase_pointer(screen, self.tail, "TAIL")
 
-        self.tail = self.tail.prev
-        
-        draw_pointer(self.tail, "TAIL", Colors.LIGHT_GREY)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+        for event in self.core.pop_back():
+            kind = event[0]
+            if kind == "visit":
+                set_status("Deleting Tail...", Colors.ORANGE, "> tail = tail.prev")
 
-        set_status("Deleting Tail...", Colors.ORANGE, "> del tail.next; tail.next = NULL")
-        
-        self.tail.next = None
-        self.nodes.pop()
-        self.length -= 1
+                # Simple Red Border Highlight
+                old = self.pool.views[event[2]]
+                self.follow(screen, event[3])
+                pygame.draw.rect(screen, Colors.RED, old.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        self._recalculate_positions()
+                erase_pointer(screen, old, "TAIL")
+
+            elif kind == "set":
+                draw_pointer(self.tail, "TAIL", Colors.LIGHT_GREY, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                set_status("Deleting Tail...", Colors.ORANGE, "> del tail.next; tail.next = NULL")
+
+            elif kind == "removed":
+                self.hideNode(event[1])
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+        self.layout()
         self._redraw(screen)
         set_status("Tail Deleted!", Colors.GREEN, "> Success")
         pygame.time.delay(500)
 
     def deleteFromPos(self, pos, screen):
-        if pos < 1 or pos > self.length: 
+        if pos < 1 or pos > self.length:
             set_status("Invalid Position", Colors.RED, "> Out of bounds")
             return
-        if pos == 1: 
+        if pos == 1:
             self.deleteHead(screen)
             return
-        if pos == self.length: 
+        if pos == self.length:
             self.deleteTail(screen)
             return
-        
-        set_status("Traversing...", Colors.ORANGE, "> while i < pos - 1")
-        
-        temp = self.head
-        
-        draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        for i in range(pos - 1):
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
-            temp = temp.next
-            draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-            
-        prevNode = temp.prev
-        nextNode = temp.next
-
-        set_status("Deleting Node...", Colors.TEAL_BRIGHT, "> prevNode = temp.prev")
-        if prevNode == self.head:
-            draw_pointer_on_head(prevNode, "PREV", Colors.TEAL_BRIGHT, screen)
-        else:
-            draw_pointer(prevNode, "PREV", Colors.TEAL_BRIGHT, screen)
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
 
-        set_status("Deleting Node...", Colors.TEAL_BRIGHT, "> nextNode = temp.next")
-        draw_pointer(nextNode, "NEXT", Colors.TEAL_BRIGHT, screen)
+        temp = prevNode = nextNode = None
+        for event in self.core.remove_at(pos - 1):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and event[1] == "temp":
+                # Node at pos, from the nearer end
+                temp = self.moveTemp(screen, temp, event, pos - 1)
+
+            elif kind == "visit" and event[1] == "prev":
+                prevNode = self.pool.views[event[2]]
+                set_status("Deleting Node...", Colors.TEAL_BRIGHT, "> prevNode = temp.prev")
+                if prevNode == self.head:
+                    draw_pointer_on_head(prevNode, "PREV", Colors.TEAL_BRIGHT, screen)
+                else:
+                    draw_pointer(prevNode, "PREV", Colors.TEAL_BRIGHT, screen)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
-        
-        set_status("Bypassing...", Colors.ORANGE, "> prev.next = next")
-        
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        # Erase prevNode.next arrow
-        erase_rect = pygame.Rect(prevNode.next.shape.x - 35, prevNode.next.shape.y + 15, 35, 15)
-        pygame.draw.rect(screen, Colors.GREY, erase_rect)
-        pygame.display.update()
-        pygame.time.delay(200)
-
-        # Line: PrevNode Right -> Up -> Right -> Down -> NextNode Left
-        start = (prevNode.shape.x + prevNode.shape.width, prevNode.shape.y + 20)
-        corner1 = (start[0] + 10, start[1])  # Right
-        corner2 = (corner1[0], prevNode.shape.y - 40)  # Up
-        corner3 = (nextNode.shape.x - 10, corner2[1])  # Right
-        corner4 = (corner3[0], nextNode.shape.y + 5)  # Down
-        end = (nextNode.shape.x, nextNode.shape.y + 5)  # NextNode Left
-        
-        pygame.draw.line(screen, Colors.LIGHT_GREY, start, corner1, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, end, 2)
-        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [(end[0], end[1]), (end[0]-5, end[1]-5), (end[0]-5, end[1]+5)])
+            elif kind == "visit":
+                nextNode = self.pool.views[event[2]]
+                set_status("Deleting Node...", Colors.TEAL_BRIGHT, "> nextNode = temp.next")
+                draw_pointer(nextNode, "NEXT", Colors.TEAL_BRIGHT, screen)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        # Erase newNode.prev arrow
-        erase_rect = pygame.Rect(temp.next.shape.x - 35, temp.next.shape.y + 40, 35, 15)
-        pygame.draw.rect(screen, Colors.GREY, erase_rect)
-        pygame.display.update()
-        pygame.time.delay(200)
+            elif kind == "link" and event[2] == "next":
+                set_status("Bypassing...", Colors.ORANGE, "> prev.next = next")
+
+                # Erase prevNode.next arrow
+                erase_rect = pygame.Rect(temp.shape.x - 35, temp.shape.y + 15, 35, 15)
+                pygame.draw.rect(screen, Colors.GREY, erase_rect)
+                pygame.display.update()
+                pygame.time.delay(200)
+
+                # Line: PrevNode Right -> Up -> Right -> Down -> NextNode Left
+                start = (prevNode.shape.x + prevNode.shape.width, prevNode.shape.y + 20)
+                corner1 = (start[0] + 10, start[1])  # Right
+                corner2 = (corner1[0], prevNode.shape.y - 40)  # Up
+                corner3 = (nextNode.shape.x - 10, corner2[1])  # Right
+                corner4 = (corner3[0], nextNode.shape.y + 5)  # Down
+                end = (nextNode.shape.x, nextNode.shape.y + 5)  # NextNode Left
+
+                pygame.draw.line(screen, Colors.LIGHT_GREY, start, corner1, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner1, corner2, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner2, corner3, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner3, corner4, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner4, end, 2)
+                blit_polygon(screen, SMALL_NEXT_HEAD, Colors.LIGHT_GREY, *end)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                # Erase newNode.prev arrow
+                erase_rect = pygame.Rect(nextNode.shape.x - 35, nextNode.shape.y + 40, 35, 15)
+                pygame.draw.rect(screen, Colors.GREY, erase_rect)
+                pygame.display.update()
+                pygame.time.delay(200)
+
+                set_status("Bypassing...", Colors.ORANGE, "> next.prev = prev")
+
+                # Line: NextNode Left -> Down -> Left -> Up -> PrevNode Right
+                start_b = (nextNode.shape.x, nextNode.shape.y + 50)
+                corner1_b = (start_b[0] - 10, start_b[1])  # Left
+                corner2_b = (corner1_b[0], nextNode.shape.y + 110)  # Down
+                corner3_b = (prevNode.shape.x + prevNode.shape.width + 10, corner2_b[1])  # Left
+                corner4_b = (corner3_b[0], prevNode.shape.y + 65)  # Up
+                end_b = (prevNode.shape.x + prevNode.shape.width, prevNode.shape.y + 65)  # PrevNode Right
+
+                pygame.draw.line(screen, Colors.ORANGE, start_b, corner1_b, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner1_b, corner2_b, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner2_b, corner3_b, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner3_b, corner4_b, 2)
+                pygame.draw.line(screen, Colors.ORANGE, corner4_b, end_b, 2)
+                blit_polygon(screen, SMALL_PREV_HEAD, Colors.ORANGE, *end_b)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "removed":
+                self.hideNode(event[1])
+
+        self.layout()
 
-        set_status("Bypassing...", Colors.ORANGE, "> next.prev = prev")
-        
-        # Line: NextNode Left -> Down -> Left -> Up -> PrevNode Right
-        start_b = (nextNode.shape.x, nextNode.shape.y + 50)
-        corner1_b = (start_b[0] - 10, start_b[1])  # Left
-        corner2_b = (corner1_b[0], nextNode.shape.y + 110)  # Down
-        corner3_b = (prevNode.shape.x + prevNode.shape.width + 10, corner2_b[1])  # Left
-        corner4_b = (corner3_b[0], prevNode.shape.y + 65)  # Up
-        end_b = (prevNode.shape.x + prevNode.shape.width, prevNode.shape.y + 65)  # PrevNode Right
-        
-        pygame.draw.line(screen, Colors.ORANGE, start_b, corner1_b, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner1_b, corner2_b, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner2_b, corner3_b, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner3_b, corner4_b, 2)
-        pygame.draw.line(screen, Colors.ORANGE, corner4_b, end_b, 2)
-        pygame.draw.polygon(screen, Colors.ORANGE, [(end_b[0], end_b[1]), (end_b[0]+5, end_b[1]-5), (end_b[0]+5, end_b[1]+5)])
-        
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        # Update Logic
-        prevNode.next = nextNode
-        nextNode.prev = prevNode
-        self.nodes.pop(pos-1)
-        self.length -= 1
-        
-        self._recalculate_positions()
-        
         self._redraw(screen)
         set_status("Deleted!", Colors.GREEN, "> Success")
         pygame.time.delay(500)
 
     def search(self, data, screen):
-        if not self.head: 
-            set_status("List Empty!", Colors.RED, "> return")
-            return
-        
-        set_status(f"Searching {data}...", Colors.ORANGE, "> while temp != None")
-        temp = self.head
-        idx = 1
-        found = False
-        
-        draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-        
-        while temp:
-            if str(temp.data) == str(data):
-                found = True
-                # Orange Background Fill using the modified draw method
-                temp.draw(screen, self, highlight_color=Colors.ORANGE, fill=True)
-                
-                set_status(f"Found {data} at Pos {idx}", Colors.GREEN, f"> return {idx}")
+        temp = None
+        for event in self.core.scan(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and temp is None:
+                set_status(f"Searching {data}...", Colors.ORANGE, "> while temp != None")
+                temp = self.head
+                self.follow(screen, 0)
+
+                draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
                 update_status_ui(screen)
                 pygame.display.update()
                 pygame.time.delay(1000)
-                break
-            
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
-            temp = temp.next
-            idx += 1
-            
-            if temp:
+
+            elif kind == "visit":
+                if temp == self.head:
+                    erase_pointer(screen, temp, "TEMP_ABOVE")
+                else:
+                    erase_pointer(screen, temp, "TEMP")
+                temp = self.pool.views[event[2]]
+                self.follow(screen, event[3])
+
                 draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
                 update_status_ui(screen)
                 pygame.display.update()
-                pygame.time.delay(1000)
-            
-        if not found:
-            set_status("Value Not Found", Colors.RED, "> return -1")
-            
+                self.pause(1000)
+
+            elif kind == "found":
+                _, slot, idx, comparisons = event
+                if slot != NIL:
+                    # Orange Background Fill using the modified draw method
+                    temp.draw(screen, self, highlight_color=Colors.ORANGE, fill=True)
+
+                    set_status(f"Found {data} at Pos {idx + 1}", Colors.GREEN, f"> return {idx + 1}")
+                    update_status_ui(screen)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
+
+        # Indexed search: one probe of the pool's value index, then the express lanes rank the slot
+        hash_slot, hash_idx = self.core.lookup(data)
+        hash_pos = hash_idx + 1 if hash_slot != NIL else -1
+        self.search_stats = (data, comparisons, idx + 1 if slot != NIL else -1, hash_pos)
+
+        if slot == NIL:
+            set_status("Value Not Found", Colors.RED, f"> walk: {comparisons} compares; index[data]: 1 probe")
+
         self._redraw(screen)
 
     def destroy(self, screen):
@@ -733,35 +820,36 @@ class DLL:
         update_status_ui(screen)
         pygame.display.update()
         pygame.time.delay(500)
-        while self.head:
-            erase_pointer(screen, self.head, "HEAD")
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
+        for event in self.core.clear():
+            kind = event[0]
+            if kind == "visit":
+                self.follow(screen, 0)
+                erase_pointer(screen, self.head, "HEAD")
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(500)
 
-            self.head = self.head.next
+            elif kind == "set" and event[1] == "head":
+                if self.head:
+                    draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+                set_status("Clearing...", Colors.ORANGE, "> head = head.next")
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(500)
 
-            if self.head:
-                draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
-            set_status("Clearing...", Colors.ORANGE, "> head = head.next")
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
-
-            if self.nodes: 
-                self.nodes.pop(0)
-
-            set_status("Clearing...", Colors.ORANGE, "> del head.prev")
-            self._redraw(screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
-            set_status("Clearing...", Colors.ORANGE, "> while head != None")
-        self.tail = None
-        self.length = 0
-        self.currentPos = (self.start_x_coord, 480)
-        set_status("List Cleared", Colors.GREEN, "> Success")
+            elif kind == "removed":
+                self.hideNode(event[1])
+                self.layout()
 
+                set_status("Clearing...", Colors.ORANGE, "> del head.prev")
+                self._redraw(screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(1000)
+                set_status("Clearing...", Colors.ORANGE, "> while head != None")
+        self.view.current = None
+        self.search_stats = None
+        set_status("List Cleared", Colors.GREEN, "> Success")
 
 
 def run(screen):
@@ -775,7 +863,7 @@ def run(screen):
 
     # Text rendering
     title = titleFont.render("Doubly Linked List", True, Colors.TEAL)
-    cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+    cap_value_txt = paraFont.render(f"Capacity (Max {MAX_NODES}): ", True, Colors.LIGHT_GREY)
     value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
     value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
     pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
@@ -787,11 +875,11 @@ def run(screen):
 
     dll = DLL(6)
 
-    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK)
+    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK, 4)
     cap_bar.text = "6"
     node_bar = InputBar(100, 230, 130, 40, Colors.BLACK, 4)
-    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 2)
-    pos_delete_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 2)
+    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 4)
+    pos_delete_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 4)
     search_val_bar = InputBar(660, 315, 120, 40, Colors.BLACK, 2)
 
     set_max_button = Button(240, 145, 120, 40, "Set Max", None, 18)
@@ -804,9 +892,17 @@ def run(screen):
     delete_at_pos_button = Button(520, 315, 120, 40, "Delete", None, 18)
     search_button = Button(790, 315, 120, 40, "Search", None, 18)
     back_button = Button(930, 15, 70, 35, "← Back", None, 18)
+    pool_button = Button(370, 145, 105, 40, "Pool: Off", None, 18)
+    show_pool = False
+    fill_button = Button(370, 100, 105, 38, "Fill", None, 18)
+
+    ui = WidgetIndex([set_max_button, insert_tail_button, insert_head_button, insert_at_pos_button,
+                      delete_head_button, delete_tail_button, destroy_button, delete_at_pos_button,
+                      search_button, back_button, pool_button, fill_button, cap_bar, node_bar,
+                      pos_insert_bar, pos_delete_bar, search_val_bar])
 
     running = True
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     while running:
         screen.fill(Colors.GREY)
@@ -828,6 +924,8 @@ def run(screen):
         delete_at_pos_button.draw(screen)
         search_button.draw(screen)
         back_button.draw(screen)
+        pool_button.draw(screen)
+        fill_button.draw(screen)
 
         cap_bar.draw(screen)
         node_bar.draw(screen)
@@ -836,9 +934,13 @@ def run(screen):
         search_val_bar.draw(screen)
 
         dll.drawList(screen)
+        if show_pool:
+            draw_pool(dll.pool, screen, with_prev=True)
+        draw_search_stats(dll.search_stats, screen)
         update_status_ui(screen)
 
-        for event in pygame.event.get():
+        for event in sched.events():
+            ui.dispatch(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
 
@@ -848,12 +950,31 @@ def run(screen):
             pos_delete_bar.handle_input(event)
             search_val_bar.handle_input(event)
 
+            # Scrolling the list view: wheel, arrow keys, or a click on the minimap
+            if event.type == pygame.MOUSEWHEEL:
+                dll.scroll((event.x - event.y) * dll.view.stride)
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                dll.scroll(dll.view.stride if event.key == pygame.K_RIGHT else -dll.view.stride)
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and \
+                    dll.view.minimap.inflate(0, 16).collidepoint(event.pos):
+                dll.view.jump(event.pos[0], len(dll.nodes))
+                dll.layout()
+
+            if fill_button.is_clicked(event):
+                if dll.length >= dll.size:
+                    set_status("Limit Reached!", Colors.RED, "> Capacity Full")
+                else:
+                    count = dll.size - dll.length
+                    dll.fill(str(random.randint(1, 999)) for _ in range(count))
+                    set_status(f"Filled {count} Nodes", Colors.GREEN, f"> tail.next = newNode (x{count})")
+
             if set_max_button.is_clicked(event):
-                if cap_bar.text.isdigit() and 0 < int(cap_bar.text) <= 6:
-                    dll = DLL(int(cap_bar.text))
+                if cap_bar.text.isdigit() and 0 < int(cap_bar.text) <= MAX_NODES:
+                    dll.size = int(cap_bar.text)
+                    dll.clear()
                     set_status(f"Max Set to {cap_bar.text}", Colors.GREEN)
                 else:
-                    set_status("Invalid Max (1-6)", Colors.RED)
+                    set_status(f"Invalid Max (1-{MAX_NODES})", Colors.RED)
 
             if insert_tail_button.is_clicked(event):
                 if node_bar.text:
@@ -906,11 +1027,15 @@ def run(screen):
                 else:
                     set_status("Input Value", Colors.RED)
 
+            if pool_button.is_clicked(event):
+                show_pool = not show_pool
+                pool_button.text = "Pool: On" if show_pool else "Pool: Off"
+
             if back_button.is_clicked(event):
                 return "back"
 
         update_status_ui(screen)
         pygame.display.update()
-        clock.tick(60)
+        sched.sleep()
 
     return "back"
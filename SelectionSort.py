@@ -2,6 +2,8 @@ import pygame
 import sys
 import random
 import Colors
+import widgets
+from frame_scheduler import FrameScheduler
 
 # --- Configuration ---
 SCREEN_WIDTH = 1000
@@ -47,62 +49,17 @@ font_logic = get_font(22)
 
 # --- UI Components ---
 
-class Button:
+class Button(widgets.Button):
     def __init__(self, x, y, w, h, text, func, color=BUTTON_COLOR):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.func = func
-        self.base_color = color
-        self.hover_color = BUTTON_HOVER
-        self.is_hovered = False
+        super().__init__(x, y, w, h, text, func, color=color, hover_color=BUTTON_HOVER,
+                         text_color=(255, 255, 255), font=font_ui, radius=5)
 
-    def draw(self, surface):
-        col = self.hover_color if self.is_hovered else self.base_color
-        pygame.draw.rect(surface, col, self.rect, border_radius=5)
-        txt = font_ui.render(self.text, True, (255, 255, 255))
-        surface.blit(txt, txt.get_rect(center=self.rect.center))
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_hovered and self.func:
-                return self.func() # Return result (e.g., "back")
-        return None
 
-
-class InputBox:
+class InputBox(widgets.InputBox):
     def __init__(self, x, y, w, h, text='', numeric_only=False, max_chars=20):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.active = False
-        self.color_inactive = (100, 100, 100)
-        self.color_active = Colors.TEAL
-        self.numeric_only = numeric_only
-        self.max_chars = max_chars
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.rect.collidepoint(event.pos)
-        if event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
-            else:
-                valid = False
-                if self.numeric_only:
-                    if event.unicode.isdigit(): valid = True
-                else:
-                    if event.unicode.isdigit() or event.unicode in ', ': valid = True
-
-                if valid and len(self.text) < self.max_chars:
-                    self.text += event.unicode
-
-    def draw(self, surface):
-        col = self.color_active if self.active else self.color_inactive
-        pygame.draw.rect(surface, INPUT_BG, self.rect, border_radius=5)
-        pygame.draw.rect(surface, col, self.rect, 2, border_radius=5)
-        txt = font_ui.render(self.text, True, TEXT_COLOR)
-        surface.blit(txt, (self.rect.x + 5, self.rect.y + (self.rect.height // 2 - 8)))
+        accept = str.isdigit if numeric_only else (lambda ch: ch.isdigit() or ch in ', ')
+        super().__init__(x, y, w, h, text, max_chars, accept, font=font_ui, bg_color=INPUT_BG,
+                         inactive_color=(100, 100, 100), text_color=TEXT_COLOR, pad=(5, None))
 
 
 class Slider:
@@ -391,7 +348,7 @@ class SelectionSortVisualizer:
 
 # --- Main Run Function ---
 def run(screen):
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
     viz = SelectionSortVisualizer()
 
     # --- Actions (Defined internally to access viz and scope) ---
@@ -434,6 +391,7 @@ def run(screen):
     # Group UI Elements for Event Loop
     ui_elements = [size_input, btn_rand, input_box, btn_load, btn_mode, 
                    btn_prev, btn_play, btn_next, btn_reset, btn_back, speed_slider]
+    ui = widgets.WidgetIndex(el for el in ui_elements if el is not speed_slider)
 
     viz.generate_random(5)
 
@@ -441,7 +399,8 @@ def run(screen):
     while running:
         viz.update(speed_slider.val)
 
-        for event in pygame.event.get():
+        for event in sched.events():
+            target = ui.dispatch(event)
             if event.type == pygame.QUIT:
                 return "quit"
 
@@ -449,19 +408,9 @@ def run(screen):
             input_box.handle_event(event)
             speed_slider.handle_event(event)
 
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for btn in ui_elements:
-                    if isinstance(btn, Button):
-                        result = btn.handle_event(event)
-                        if result == "back":
-                            return "back"
-
-            if event.type == pygame.MOUSEMOTION:
-                for btn in ui_elements:
-                    if isinstance(btn, Button):
-                        btn.handle_event(event)
-                    elif isinstance(btn, Slider):
-                        btn.handle_event(event)
+            if event.type == pygame.MOUSEBUTTONDOWN and isinstance(target, Button):
+                if target.click() == "back":
+                    return "back"
 
         screen.fill(BG_COLOR)
 
@@ -532,6 +481,6 @@ def run(screen):
         lx = draw_legend(lx, leg_y + 25, SORTED_COLOR, "Sorted")
 
         pygame.display.flip()
-        clock.tick(60)
+        sched.sleep(viz.playing)
 
     return "back"
\ No newline at end of file
@@ -1,27 +1,36 @@
 import pygame
-from button_template import Button
+from widgets import Button, InputBar, WidgetIndex
 import Colors
 import importlib.util
 import os
+import random
 import sys
+from node_pool import NodePool, PooledNode, SurfaceCache, NIL
+from list_view import ListView
+from linked_list_core import SinglyCore
+from frame_scheduler import FrameScheduler
+from sprites import labels, null_labels, chrome, blit_polygon, draw_pool, draw_search_stats
 
+MAX_NODES = 5000
+VISIBLE_NODES = 8  # Nodes that fit across the screen at the 125px stride
+LANES_SHOWN = 4  # Express lanes drawn above the list
+HOP_DELAY = 400  # Pause per express-lane hop
 
-class Node:
-    def __init__(self, data, pos, next=None):
-        # Logical terms
-        self.data = data
-        self.next = next
 
-        # UI terms
-        self.shape = pygame.Rect(pos[0], pos[1], 90, 70)
-        self.text = nodeFont.render(f"{data}", True, Colors.LIGHT_GREY)
+class Node(PooledNode):
+    __slots__ = ("shape", "text")
 
-    def draw(self, screen, sll):
-        # Draw node box
-        pygame.draw.rect(screen, Colors.TEAL, self.shape, border_radius=2)
+    def __init__(self, pool, idx):
+        # Logical terms (data/next live in the pool's arrays)
+        super().__init__(pool, idx)
 
-        # Labels
-        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (self.shape.x, self.shape.y))
+        # UI terms: the list view hands out a Rect and label only while the node is on screen
+        self.shape = None
+        self.text = None
+
+    def draw(self, screen, sll):
+        # Node box and "data:" label, one sprite per node size
+        screen.blit(chrome.get((self.shape.size, Colors.TEAL, None)), self.shape)
         text_rect = self.text.get_rect(center=self.shape.center)
         screen.blit(self.text, text_rect)
 
@@ -31,46 +40,26 @@ class Node:
             draw_pointer(self, "TAIL", Colors.LIGHT_GREY, screen)
 
         # Arrows
+        start_x = self.shape.x + self.shape.width
+        start_y = self.shape.y + self.shape.height // 2
         if self.next is not None:
-            start_x = self.shape.x + self.shape.width
-            start_y = self.shape.y + self.shape.height // 2
-
-            end_x = self.next.shape.x
-            end_y = self.next.shape.y + self.next.shape.height // 2
-
-            # Draw line between nodes
-            pygame.draw.line(screen, Colors.LIGHT_GREY,
-                             (start_x, start_y), (end_x, end_y), 2)
-
-            # Arrow-head (triangle)
-            arrow_size = 7
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_x, end_y),
-                (end_x - arrow_size, end_y - arrow_size),
-                (end_x - arrow_size, end_y + arrow_size)
-            ])
-        else:
-            # Draw NULL arrow
-            start_x = self.shape.x + self.shape.width
-            start_y = self.shape.y + self.shape.height // 2
+            if self.next.shape is not None:
+                end_x = self.next.shape.x
+                end_y = self.next.shape.y + self.next.shape.height // 2
+            else:
+                # Next node is scrolled off screen: point towards where it would be
+                end_x = start_x + 35
+                end_y = start_y
 
+            # Line between nodes and its arrow-head
+            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (end_x, end_y), 2)
+            blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, end_y)
+        else:
+            # Arrow to NULL
             null_x = start_x + 60
-            null_y = start_y
-
-            # Line to NULL
-            pygame.draw.line(screen, Colors.LIGHT_GREY,
-                             (start_x, start_y), (null_x, null_y), 2)
-
-            # Arrow-head pointing to NULL
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (null_x, null_y),
-                (null_x - 7, null_y - 7),
-                (null_x - 7, null_y + 7)
-            ])
-
-            # Draw the NULL text
-            null_text = paraFont.render("NULL", True, Colors.LIGHT_GREY)
-            screen.blit(null_text, (null_x + 5, null_y - 10))
+            pygame.draw.line(screen, Colors.LIGHT_GREY, (start_x, start_y), (null_x, start_y), 2)
+            blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, null_x, start_y)
+            screen.blit(null_labels.get(Colors.LIGHT_GREY), (null_x + 5, start_y - 10))
 
 
 # Font helper
@@ -92,7 +81,7 @@ status_color = Colors.LIGHT_GREY
 
 # Text rendering
 title = titleFont.render("Singly Linked List", True, Colors.TEAL)
-cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+cap_value_txt = paraFont.render(f"Capacity (Max {MAX_NODES}): ", True, Colors.LIGHT_GREY)
 value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
 value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
 pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
@@ -101,6 +90,15 @@ pos_txt_2 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
 status_msg = "Ready"
 logic_msg = "Waiting for a operation..."
 
+node_texts = SurfaceCache(lambda text: nodeFont.render(text, True, Colors.LIGHT_GREY))
+
+ARROW_HEAD = ((0, 0), (-7, -7), (-7, 7))  # Points relative to the tip
+INSERT_HEAD = ((0, 0), (-10, -5), (-10, 5))  # End of the bent links drawn while inserting
+TEMP_HEAD = ((1, 0), (-7, -7), (7, -7))  # TEMP pointer stacked above HEAD
+POINTER_DOWN = ((0, 0), (-10, -15), (10, -15))
+POINTER_UP = ((0, 0), (-10, 15), (10, 15))
+POINTER_ABOVE = ((0, 0), (-10, -16), (10, -16))  # Stacked above another pointer
+
 
 def set_status(message, color, logic_message=""):
     global status_msg, status_color, logic_msg
@@ -123,67 +121,19 @@ def update_status_ui(screen):
     screen.blit(status_surf, (500, 50))
 
 
-# Input Bar Class
-class InputBar:
-    def __init__(self, x, y, width, height, bg_color, max_chars=1):
-        self.shape = pygame.Rect(x, y, width, height)
-        self.bg_color = bg_color
-        self.inactive_color = Colors.LIGHT_GREY
-        self.active_color = Colors.TEAL
-        self.color = self.inactive_color
-        self.active = False
-        self.text = ""
-        self.max_chars = max_chars
-        self.input_font = get_font(19)
-        self.text_rendered = self.input_font.render(self.text, True, Colors.LIGHT_GREY)
-
-    def handle_input(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.shape.collidepoint(event.pos)
-            self.color = self.active_color if self.active else self.inactive_color
-
-        if self.active and event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_BACKSPACE and len(self.text) > 0:
-                self.text = self.text[:len(self.text) - 1]
-            elif event.key == pygame.K_RETURN:
-                pass
-            elif event.unicode.isprintable():
-                if len(self.text) < self.max_chars:
-                    self.text += event.unicode
-
-        self.text_rendered = self.input_font.render(self.text, True, Colors.LIGHT_GREY)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, self.bg_color, self.shape, border_radius=5)
-        pygame.draw.rect(screen, self.color, self.shape, 2, border_radius=5)
-        screen.blit(self.text_rendered, (self.shape.x + 2, self.shape.y + 5))
-
-
 # Helper pointer drawing
 def draw_pointer(node, text, color, screen):
     node_x = node.shape.x + node.shape.width // 2
 
     # Up-pointing triangle (same style as QUEUE FRONT)
+    lbl_head = labels.get((text, color))
     if text == "TAIL":
         node_y = node.shape.y + node.shape.height + 8
-        pygame.draw.polygon(screen, color, [
-            (node_x, node_y),
-            (node_x - 10, node_y + 15),
-            (node_x + 10, node_y + 15)
-        ])
-    else:
-        node_y = node.shape.y - 10
-        pygame.draw.polygon(screen, color, [
-            (node_x, node_y),
-            (node_x - 10, node_y - 15),
-            (node_x + 10, node_y - 15)
-        ])
-
-    # Label
-    lbl_head = subFont.render(f"{text}", True, color)
-    if text == "TAIL":
+        blit_polygon(screen, POINTER_UP, color, node_x, node_y)
         screen.blit(lbl_head, (node_x - lbl_head.get_width() // 2, node_y + 20))
     else:
+        node_y = node.shape.y - 10
+        blit_polygon(screen, POINTER_DOWN, color, node_x, node_y)
         screen.blit(lbl_head, (node_x - lbl_head.get_width() // 2, node_y - 37))
 
 
@@ -222,24 +172,21 @@ def draw_pointer_on_head(node, text, color, screen):
     temp_x = node.shape.x + node.shape.width // 2
     temp_y = node.shape.y - 20
 
-    # Draw TEMP pointer
-    pygame.draw.polygon(screen, color, [
-        (temp_x, temp_y - 29),  # Tip of TEMP pointer (above HEAD)
-        (temp_x - 10, temp_y - 45),  # Left point
-        (temp_x + 10, temp_y - 45)  # Right point
-    ])
+    # Draw TEMP pointer, tip above HEAD
+    blit_polygon(screen, POINTER_ABOVE, color, temp_x, temp_y - 29)
 
-    lbl_temp = subFont.render(f"{text}", True, color)
+    lbl_temp = labels.get((text, color))
     screen.blit(lbl_temp, (temp_x - lbl_temp.get_width() // 2, temp_y - 65))
 
 # Linked Lists class
 class SLL:
-    def __init__(self, size, head=None):
-        # Logical terms
-        self.head = head
-        self.size = size
-        self.length = 1
-        self.tail = None
+    def __init__(self, size):
+        # Logical terms: the core owns the pool and the express lanes, and each of its
+        # operations yields one event per step, which the methods below animate
+        self.core = SinglyCore(size, NodePool(MAX_NODES, Node, indexed=True))
+        self.pool = self.core.pool
+        self.lanes = self.core.lanes
+        self.search_stats = None  # (value, comparisons, walk pos, index pos) of the last search
 
         # UI terms
         self.initialPos = {
@@ -250,223 +197,283 @@ class SLL:
             5: (160, 480),
             6: (90, 480),
         }
-        self.currentPos = self.initialPos[self.size]
-        self.nodes = []  # For drawing
+        self.nodes = []  # In list order; only the visible ones get drawn
 
-    def drawList(self, screen):
-        for node in self.nodes:
-            node.draw(screen, self)
+        # Scrolling camera over the nodes; long lists start at the left edge
+        self.view = ListView(self.originX(), 480, lambda node: node_texts.get(f"{node.data}"))
 
-    def insertAtTail(self, data, screen):
-        if self.length > self.size:
-            set_status("Limit Reached!", Colors.RED, "> if self.length > self.size: return")
-            return
-        newNode = Node(data, self.currentPos)
-        self.length += 1
-        self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
-        self.nodes.append(newNode)
+    @property
+    def size(self):
+        return self.core.size
 
-        set_status(f"Node Added: {data}", Colors.GREEN, f"> tail.next = newNode")
+    @size.setter
+    def size(self, size):
+        self.core.size = size
 
-        # Clear previous list
-        rect_x = self.initialPos[self.size][0]
-        rect_y = self.initialPos[self.size][1]
-        clear_rect = pygame.Rect(rect_x, rect_y, 1000, 150)
-        pygame.draw.rect(screen, Colors.GREY, clear_rect)
+    @property
+    def length(self):
+        return self.core.length
 
-        # New List
-        self.drawList(screen)
+    @property
+    def head(self):
+        return self.pool.view(self.core.head)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+    @property
+    def tail(self):
+        return self.pool.view(self.core.tail)
 
-        # Empty List
-        if self.head is None:
-            self.head = newNode
-            self.tail = newNode
-        else:
-            self.tail.next = newNode
-            self.tail = newNode
+    def originX(self):
+        return self.initialPos.get(self.size, self.initialPos[6])[0]
 
-        set_status("Tail Updated!", Colors.GREEN, "> tail = newNode")
+    def showNode(self, pos, slot):
+        # The core put slot at 0-based pos: mirror it in the drawing order
+        node = self.pool.views[slot]
+        self.nodes.insert(pos, node)
+        return node
 
-    def insertAtHead(self, data, screen):
-        if self.length > self.size:
-            set_status("Limit Reached!", Colors.RED, "> Capacity Full")
-            return
+    def hideNode(self, pos):
+        self.view.release(self.nodes.pop(pos))
 
-        if self.length > 0:
-            set_status("Shifting Nodes...", Colors.ORANGE, "> Shifting existing nodes right")
+    def clear(self):
+        for node in self.nodes:
+            self.view.release(node)
+        self.nodes.clear()
+        self.core.reset()
+        self.search_stats = None
+        self.view.origin_x = self.originX()
+        self.view.scroll = 0
+        self.view.current = None
+        self.layout()
+
+    def fill(self, values):
+        # Append without animating, for building long lists
+        self.core.extend(values)
+        self.nodes = [self.pool.views[slot] for slot in self.core.slots()]
+        self.layout()
+
+    def layout(self, shift=0):
+        self.view.layout(self.nodes, shift)
+
+    def scroll(self, dx):
+        if self.view.scroll_by(dx, len(self.nodes)):
+            self.layout()
+
+    def follow(self, screen, index):
+        # Keep the node an operation points at on screen, redrawing the list if the camera moves
+        if self.view.follow(index, len(self.nodes)):
+            self.layout()
+            pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
+            self.drawList(screen)
 
-            # Clear the list area
-            pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 280))
+    def pause(self, ms):
+        # Walks over long lists speed up so a full traversal takes about as long as a short one
+        n = len(self.nodes)
+        pygame.time.delay(ms if n <= VISIBLE_NODES else ms * VISIBLE_NODES // n)
+
+    def drawLanes(self, screen):
+        # Express lanes as rows of dots (one per tall enough node) joined by their links, lane 1 lowest
+        if self.lanes.length != len(self.nodes):
+            return  # Mid-operation, before the core has placed or after it has removed a node
+        view = self.view
+        for level in range(1, min(self.lanes.levels(), LANES_SHOWN + 1)):
+            y = 428 - 7 * level
+            xs = [view.world_x(i) + view.node_w // 2 - view.scroll
+                  for i in self.lanes.lane(level, view.first, view.last)]
+            if len(xs) > 1:
+                pygame.draw.lines(screen, Colors.TEAL, False, [(x, y) for x in xs], 1)
+            for x in xs:
+                pygame.draw.circle(screen, Colors.TEAL_BRIGHT, (x, y), 3)
+
+    def moveTemp(self, screen, temp, event):
+        # Animate a visit event: TEMP starts on the head (temp is None) or hops there from temp
+        _, name, slot, i, level = event
+        if temp is not None:
+            if temp == self.head:
+                erase_pointer(screen, temp, "TEMP_ABOVE")
+            else:
+                erase_pointer(screen, temp, "TEMP")
+            self.drawLanes(screen)
 
-            # Shift coordinates
-            for node in self.nodes:
-                node.shape.x += 125
+        node = self.pool.views[slot]
+        self.follow(screen, i)
+        if node == self.head:
+            draw_pointer_on_head(node, "TEMP", Colors.ORANGE, screen)
+        else:
+            draw_pointer(node, "TEMP", Colors.ORANGE, screen)
 
-            # Redraw shifted nodes
-            self.drawList(screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
+        if temp is not None:
+            set_status("Traversing...", Colors.ORANGE,
+                       "> temp = temp.next" if level == 0 else f"> temp = temp.lane[{level}]")
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(500 if temp is None else HOP_DELAY)
+        return node
 
-        # 2. Create the new node at the start position
-        start_x = self.initialPos[self.size][0]
-        start_y = self.initialPos[self.size][1]
-        newNode = Node(data, (start_x, start_y))
+    def drawList(self, screen):
+        self.drawLanes(screen)
+        for node in self.view.visible(self.nodes):
+            node.draw(screen, self)
+
+        n = len(self.nodes)
+        self.view.draw_minimap(screen, n, subFont, [
+            (0 if n else None, "HEAD", Colors.LIGHT_GREY),
+            (n - 1 if n else None, "TAIL", Colors.LIGHT_GREY),
+            (self.view.current, "CURR", Colors.ORANGE)
+        ])
 
-        set_status("Linking...", Colors.ORANGE, "> newNode.next = head")
-        newNode.next = self.head
+    def insertAtTail(self, data, screen):
+        for event in self.core.push_back(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-        self.nodes.insert(0, newNode)
-        self.length += 1
+            if kind == "new":
+                self.showNode(event[2], event[1])
+                self.view.follow(len(self.nodes) - 1, len(self.nodes))
+                self.layout()
 
-        self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
+                set_status(f"Node Added: {data}", Colors.GREEN, f"> tail.next = newNode")
 
-        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 280))
-        self.drawList(screen)
+                # Clear previous list
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
 
-        set_status("New Node Inserted!", Colors.GREEN, "> newNode.next = head")
+                # New List
+                self.drawList(screen)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        self.head = newNode
+        set_status("Tail Updated!", Colors.GREEN, "> tail = newNode")
 
-        if self.tail is None:
-            self.tail = newNode
+    def insertAtHead(self, data, screen):
+        for event in self.core.push_front(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-        set_status("Head Updated!", Colors.GREEN, "> head = newNode")
-        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 280))
-        self.drawList(screen)
+            if kind == "new" and self.nodes:
+                set_status("Shifting Nodes...", Colors.ORANGE, "> Shifting existing nodes right")
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
+                # Clear the list area
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
 
+                # Shift coordinates: lay the list out one slot to the right
+                self.view.follow(0, len(self.nodes) + 1)
+                self.layout(shift=1)
 
-    def deleteHead(self, screen):
-        if self.head is None:
-            set_status("List Empty!", Colors.RED, "> if head is None: return")
-            return
-        else:
-            set_status("Initializing...", Colors.ORANGE, "> temp = head")
-            temp = self.head
+                # Redraw shifted nodes
+                self.drawList(screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-            draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
+            elif kind == "link":
+                set_status("Linking...", Colors.ORANGE, "> newNode.next = head")
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
+            elif kind == "placed":
+                self.showNode(0, event[2])
+                self.view.follow(0, len(self.nodes))
+                self.layout()
 
-            erase_pointer(screen, temp, "HEAD")
-            erase_pointer(screen, temp, "TEMP_ABOVE")
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
+                self.drawList(screen)
 
-            set_status("Updating Head...", Colors.ORANGE, "> head = head.next")
-            draw_pointer(self.head, "TEMP", Colors.ORANGE, screen)
+                set_status("New Node Inserted!", Colors.GREEN, "> newNode.next = head")
 
-            if self.head.next:
-                self.head = self.head.next
-            else:
-                self.head = None
-                self.tail = None
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
+            elif kind == "set" and event[1] == "head":
+                set_status("Head Updated!", Colors.GREEN, "> head = newNode")
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
+                self.drawList(screen)
 
-            # Draw new HEAD pointer if exists
-            if self.head:
-                draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
 
-            set_status("Deleting Node...", Colors.ORANGE, "> delete temp")
-            self.length -= 1
-            self.nodes.pop(0)
+    def deleteHead(self, screen):
+        for event in self.core.pop_front():
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-            for node in self.nodes:
-                node.shape.x -= 125
+            if kind == "visit":
+                set_status("Initializing...", Colors.ORANGE, "> temp = head")
+                temp = self.moveTemp(screen, None, event)
 
-            # Update current position for next node
-            if len(self.nodes) > 0:
-                last_node = self.nodes[-1]
-                self.currentPos = (last_node.shape.x + 125, self.currentPos[1])
-            else:
-                # Reset to initial position if list is empty
-                self.currentPos = self.initialPos[self.size]
+                erase_pointer(screen, temp, "HEAD")
+                erase_pointer(screen, temp, "TEMP_ABOVE")
 
-            set_status("Head Deleted!", Colors.GREEN, "> Success")
-            update_status_ui(screen)
-            pygame.time.delay(500)
+                set_status("Updating Head...", Colors.ORANGE, "> head = head.next")
+                draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
 
-    def deleteTail(self, screen):
-        if self.tail is None:
-            set_status("List Empty!", Colors.RED, "> if tail is None: return")
-            return
+            elif kind == "set" and event[1] == "head":
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        if self.head == self.tail:
-            self.deleteHead(screen)
-            return
+                # Draw new HEAD pointer if exists
+                if self.head:
+                    draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        set_status("Initializing...", Colors.ORANGE, "> temp = head")
-        temp = self.head
+            elif kind == "removed":
+                set_status("Deleting Node...", Colors.ORANGE, "> delete temp")
+                self.hideNode(0)
+                self.layout()
 
-        draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
+        set_status("Head Deleted!", Colors.GREEN, "> Success")
         update_status_ui(screen)
-        pygame.display.update()
         pygame.time.delay(500)
 
-        # Traverse to the second to last node
-        set_status("Traversing...", Colors.ORANGE, "> while temp.next != tail:")
-        while temp.next != self.tail:
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
+    def deleteTail(self, screen):
+        if self.length == 1:
+            self.deleteHead(screen)
+            return
 
-            temp = temp.next
+        temp = None
+        for event in self.core.pop_back():
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-            # Draw new pointer
-            if self.length > 3:
-                draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
+            if kind == "visit":
+                if temp is None:
+                    set_status("Initializing...", Colors.ORANGE, "> temp = head")
+                temp = self.moveTemp(screen, temp, event)
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
-
-        # Logical Deletion
-        set_status("Removing Tail...", Colors.ORANGE, "> tail = temp; tail.next = None")
-        del self.tail
-        self.nodes.pop()
-        self.length -= 1
-
-        self.tail = temp
-        self.tail.next = None
-
-        # Clear previous list
-        rect_x = self.initialPos[self.size][0]
-        rect_y = self.initialPos[self.size][1]
-        clear_rect = pygame.Rect(rect_x, rect_y, 1000, 150)
-        pygame.draw.rect(screen, Colors.GREY, clear_rect)
+            elif kind == "set":
+                # Logical Deletion
+                set_status("Removing Tail...", Colors.ORANGE, "> tail = temp; tail.next = None")
 
-        # New List
-        self.drawList(screen)
+            elif kind == "removed":
+                self.hideNode(event[1])
+                self.layout()
 
-        erase_pointer(screen, self.tail, "TAIL")
-        if self.length > 3:
-            draw_pointer(self.tail, "TEMP", Colors.ORANGE, screen)
+                # Clear previous list
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 250))
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                # New List
+                self.drawList(screen)
 
-        self.currentPos = (self.tail.shape.x + 125, self.tail.shape.y)
+                erase_pointer(screen, self.tail, "TAIL")
+                if self.length > 2:
+                    draw_pointer(self.tail, "TEMP", Colors.ORANGE, screen)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
         set_status("Tail Deleted!", Colors.GREEN, "> Success")
         update_status_ui(screen)
@@ -474,137 +481,99 @@ class SLL:
         pygame.time.delay(500)
 
     def insertAtPos(self, data, pos, screen):
-        # 1. Validation
+        # 1. Edge cases; the core validates the rest
         if pos <= 1:
             self.insertAtHead(data, screen)
             return
-        if pos > self.length + 1:
-            set_status("Invalid Position!", Colors.RED, "> pos > length + 1")
-            return
-        if self.length >= self.size + 1:
-            set_status("Limit Reached!", Colors.RED, "> Capacity Full")
-            return
-
-        if pos == self.length:
+        if pos == self.length + 1:
             self.insertAtTail(data, screen)
             return
 
-        set_status("Traversing...", Colors.ORANGE, "> while i < pos - 1:")
+        temp = newNode = None
+        for event in self.core.insert_at(pos - 1, data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-        # 2. Traversal
-        temp = self.head
-        draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-        pygame.display.update()
-        pygame.time.delay(500)
+            if kind == "visit":
+                # 2. Traversal: hop along the express lanes instead of walking every node
+                if temp is None:
+                    set_status("Traversing...", Colors.ORANGE, "> ride the express lanes to pos - 1")
+                temp = self.moveTemp(screen, temp, event)
 
-        for i in range(pos - 2):
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
-
-            temp = temp.next
-
-            draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
-
-        # 3. Create Visual Node (Lowered)
-        set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
-
-        newNode = Node(data, (temp.shape.x + 60, temp.shape.y + 150))
-
-        pygame.draw.rect(screen, Colors.TEAL, newNode.shape, border_radius=2)
-        screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (newNode.shape.x, newNode.shape.y))
-        text_rect = newNode.text.get_rect(center=newNode.shape.center)
-        screen.blit(newNode.text, text_rect)
-
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
-
-        set_status("Linking Next...", Colors.ORANGE, "> newNode.next = temp.next")
-        newNode.next = temp.next
+            elif kind == "new":
+                # 3. Create Visual Node (Lowered)
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
 
-        if temp.next:
-            start_pos = (newNode.shape.x + newNode.shape.width // 2, newNode.shape.y)
-            corner_pos = (start_pos[0], temp.next.shape.y + temp.next.shape.height // 1.2)
-            end_pos = (temp.next.shape.x, corner_pos[1])
+                newNode = self.pool.views[event[1]]
+                self.view.attach(newNode, (temp.shape.x + 60, temp.shape.y + 150))
 
-            pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner_pos, 2)
-            pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos, end_pos, 2)
+                screen.blit(chrome.get((newNode.shape.size, Colors.TEAL, None)), newNode.shape)
+                text_rect = newNode.text.get_rect(center=newNode.shape.center)
+                screen.blit(newNode.text, text_rect)
 
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_pos[0], end_pos[1]),
-                (end_pos[0] - 10, end_pos[1] - 5),
-                (end_pos[0] - 10, end_pos[1] + 5)
-            ])
-
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
-
-        set_status("Linking Previous...", Colors.ORANGE, "> temp.next = newNode")
-        temp.next = newNode
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        # Erase the old arrow
-        erase_x = temp.shape.x + temp.shape.width
-        erase_y = temp.shape.y + (temp.shape.height // 2) - 10
-        pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
+            elif kind == "link" and event[1] == newNode.idx:
+                set_status("Linking Next...", Colors.ORANGE, "> newNode.next = temp.next")
 
-        # Draw Arrow: Down then Right
-        start_pos = (temp.shape.x + temp.shape.width // 2, temp.shape.y + temp.shape.height)
-        corner_pos = (start_pos[0], newNode.shape.y + newNode.shape.height // 2)
-        end_pos = (newNode.shape.x, corner_pos[1])
+                if temp.next:
+                    start_pos = (newNode.shape.x + newNode.shape.width // 2, newNode.shape.y)
+                    corner_pos = (start_pos[0], temp.next.shape.y + temp.next.shape.height // 1.2)
+                    end_pos = (temp.next.shape.x, corner_pos[1])
 
-        pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner_pos, 2)
-        pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos, end_pos, 2)
+                    pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner_pos, 2)
+                    pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos, end_pos, 2)
 
-        pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-            (end_pos[0], end_pos[1]),
-            (end_pos[0] - 10, end_pos[1] - 5),
-            (end_pos[0] - 10, end_pos[1] + 5)
-        ])
+                    blit_polygon(screen, INSERT_HEAD, Colors.LIGHT_GREY, *end_pos)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
+            elif kind == "link":
+                set_status("Linking Previous...", Colors.ORANGE, "> temp.next = newNode")
 
-        self.length += 1
-        self.nodes.insert(pos - 1, newNode)
+                # Erase the old arrow
+                erase_x = temp.shape.x + temp.shape.width
+                erase_y = temp.shape.y + (temp.shape.height // 2) - 10
+                pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
 
-        start_x = self.initialPos[self.size][0]
-        y_pos = self.initialPos[self.size][1]
+                # Draw Arrow: Down then Right
+                start_pos = (temp.shape.x + temp.shape.width // 2, temp.shape.y + temp.shape.height)
+                corner_pos = (start_pos[0], newNode.shape.y + newNode.shape.height // 2)
+                end_pos = (newNode.shape.x, corner_pos[1])
 
-        for node in self.nodes:
-            node.shape.x = start_x
-            node.shape.y = y_pos
+                pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner_pos, 2)
+                pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos, end_pos, 2)
 
-            node.text_rect = node.text.get_rect(center=node.shape.center)
+                blit_polygon(screen, INSERT_HEAD, Colors.LIGHT_GREY, *end_pos)
 
-            start_x += 125
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        self.currentPos = (start_x, y_pos)
+            elif kind == "placed":
+                set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
 
-        # Update Tail logic
-        if newNode.next is None:
-            self.tail = newNode
+                self.showNode(event[1], event[2])
+                self.layout()
 
-        # Redraw List
-        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 350))
-        self.drawList(screen)
+                # Redraw List
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 340))
+                self.drawList(screen)
 
-        if temp == self.head:
-            draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-        else:
-            draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
+                if temp == self.head:
+                    draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
+                else:
+                    draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
         # Clean up temp pointer
         if temp == self.head:
@@ -624,109 +593,90 @@ class SLL:
         if pos == 1:
             self.deleteHead(screen)
             return
-        if pos == self.length - 1:
+        if pos == self.length:
             self.deleteTail(screen)
             return
 
-        set_status("Traversing...", Colors.ORANGE, "> finding pos - 1")
-
-        # 2. Traversal
-        temp = self.head
-        prev = None
+        temp = prev = None
+        for event in self.core.remove_at(pos - 1):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
 
-        # Draw initial status
-        draw_pointer_on_head(temp,"TEMP",Colors.ORANGE, screen)
+            if kind == "visit" and event[1] == "prev":
+                # Hopped to pos - 1, then one step for temp
+                prev = self.pool.views[event[2]]
+                if prev == self.head:
+                    draw_pointer_on_head(prev, "PREV", Colors.TEAL_BRIGHT, screen)
+                else:
+                    draw_pointer(prev, "PREV", Colors.TEAL_BRIGHT, screen)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(500)
+                set_status("Traversing...", Colors.ORANGE, "> prev = temp; temp = temp.next")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
 
-        for i in range(pos - 1):
-            # Erase previous pointers
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
-            if prev:
-                if prev == self.head:
-                    erase_pointer(screen, prev, "TEMP_ABOVE")
+            elif kind == "visit" and event[3] == pos - 1:
+                if temp == self.head:
+                    erase_pointer(screen, temp, "TEMP_ABOVE")
                 else:
-                    erase_pointer(screen, prev, "PREV")
+                    erase_pointer(screen, temp, "TEMP")
 
-            # Move pointers
-            prev = temp
-            temp = temp.next
+                temp = self.pool.views[event[2]]
+                self.follow(screen, pos - 1)
+                draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
 
-            draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
-            if prev == self.head:
-                draw_pointer_on_head(prev, "PREV", Colors.TEAL_BRIGHT, screen)
-            else:
-                draw_pointer(prev, "PREV", Colors.TEAL_BRIGHT, screen)
+            elif kind == "visit":
+                # 2. Traversal: hop to pos - 1 along the express lanes
+                if temp is None:
+                    set_status("Traversing...", Colors.ORANGE, "> ride the express lanes to pos - 1")
+                temp = self.moveTemp(screen, temp, event)
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(500)
-
-        set_status("Re-linking...", Colors.ORANGE, "> prev.next = temp.next")
-
-        prev.next = temp.next
-
-        # Update
-        # Erase the old arrow
-        if prev is not None and temp.next is not None:
-            erase_x = prev.shape.x + prev.shape.width
-            erase_y = prev.shape.y + (prev.shape.height // 2) - 10
-            pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
-
-            start_pos = (prev.shape.x + prev.shape.width // 2 + 25, prev.shape.y)
-            corner_pos_1 = (start_pos[0], prev.shape.y - (prev.shape.height // 2) - 20)
-            corner_pos_2 = (temp.next.shape.x + 10, temp.next.shape.y - temp.next.shape.height // 2 - 20)
-            end_pos = (temp.next.shape.x + 10, temp.next.shape.y)
-
-            # Draw Vertical Line (Up)
-            pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner_pos_1, 2)
-            # Draw Horizontal Line (Corner 1 to 2)
-            pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos_1, corner_pos_2, 2)
-            # Draw Horizontal Line (Right)
-            pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos_2, end_pos, 2)
-
-            # Arrowhead pointing Right
-            pygame.draw.polygon(screen, Colors.LIGHT_GREY, [
-                (end_pos[0] + 1, end_pos[1]),  # Tip of TEMP pointer (above HEAD)
-                (end_pos[0] - 7, end_pos[1] - 7),  # Left point
-                (end_pos[0] + 7, end_pos[1] - 7)  # Right point
-            ])
+            elif kind == "link" and event[1] == prev.idx:
+                set_status("Re-linking...", Colors.ORANGE, "> prev.next = temp.next")
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(1000)
+                # Erase the old arrow
+                if temp.next is not None:
+                    erase_x = prev.shape.x + prev.shape.width
+                    erase_y = prev.shape.y + (prev.shape.height // 2) - 10
+                    pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
 
+                    start_pos = (prev.shape.x + prev.shape.width // 2 + 25, prev.shape.y)
+                    corner_pos_1 = (start_pos[0], prev.shape.y - (prev.shape.height // 2) - 20)
+                    corner_pos_2 = (temp.next.shape.x + 10, temp.next.shape.y - temp.next.shape.height // 2 - 20)
+                    end_pos = (temp.next.shape.x + 10, temp.next.shape.y)
 
-        set_status("Deleting Node...", Colors.ORANGE, ">temp.next = None; del temp")
+                    # Draw Vertical Line (Up)
+                    pygame.draw.line(screen, Colors.LIGHT_GREY, start_pos, corner_pos_1, 2)
+                    # Draw Horizontal Line (Corner 1 to 2)
+                    pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos_1, corner_pos_2, 2)
+                    # Draw Horizontal Line (Right)
+                    pygame.draw.line(screen, Colors.LIGHT_GREY, corner_pos_2, end_pos, 2)
 
-        temp.next = None
+                    # Arrowhead pointing Right
+                    blit_polygon(screen, TEMP_HEAD, Colors.LIGHT_GREY, *end_pos)
 
-        erase_x = temp.shape.x + temp.shape.width
-        erase_y = temp.shape.y + (temp.shape.height // 2) - 10
-        pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
+                    update_status_ui(screen)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
 
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
+            elif kind == "link":
+                set_status("Deleting Node...", Colors.ORANGE, ">temp.next = None; del temp")
 
-        del temp
-        self.nodes.pop(pos - 1)
-        self.length -= 1
+                erase_x = temp.shape.x + temp.shape.width
+                erase_y = temp.shape.y + (temp.shape.height // 2) - 10
+                pygame.draw.rect(screen, Colors.GREY, (erase_x, erase_y, 35, 20))
 
-        set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
 
-        for i in range(pos - 1, len(self.nodes)):
-            self.nodes[i].shape.x -= 125
-            # Update text rect position
-            self.nodes[i].text_rect = self.nodes[i].text.get_rect(center=self.nodes[i].shape.center)
+            elif kind == "removed":
+                self.hideNode(event[1])
 
-        # Update the 'currentPos' for next insertions
-        self.currentPos = (self.currentPos[0] - 125, self.currentPos[1])
+                set_status("Realigning List...", Colors.ORANGE, "> Formatting UI")
+                self.layout()
 
         set_status("Deletion Complete!", Colors.GREEN, "> Success")
         update_status_ui(screen)
@@ -734,41 +684,25 @@ class SLL:
         pygame.time.delay(1000)
 
     def search(self, data, screen):
-        if self.head is None:
-            set_status("List is Empty!", Colors.RED, "> if head is None: return")
-            return
-
-        set_status(f"Searching for {data}...", Colors.ORANGE, "> while temp is not None; if data == temp.data")
-
-        # Traversal
-        temp = self.head
-        index = 1
-        found = False
-
-        # Draw initial pointer
-        draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-        update_status_ui(screen)
-        pygame.display.update()
-        pygame.time.delay(1000)
-
-        while temp is not None:
-            # Compare Data (Convert both to string to be safe)
-            if str(temp.data) == str(data):
-                found = True
-
-                pygame.draw.rect(screen, Colors.ORANGE, temp.shape, border_radius=2)
-                screen.blit(subFont.render("data: ", True, Colors.LIGHT_GREY), (temp.shape.x, temp.shape.y))
-                text_rect = (temp.text.get_rect(center=temp.shape.center))
-                screen.blit(temp.text, text_rect)
-
-                set_status(f"Found at Pos: {index}", Colors.GREEN, f"> return {index}")
-
+        temp = None
+        for event in self.core.scan(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and temp is None:
+                set_status(f"Searching for {data}...", Colors.ORANGE, "> while temp is not None; if data == temp.data")
+
+                # Draw initial pointer
+                temp = self.head
+                self.follow(screen, 0)
+                draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
                 update_status_ui(screen)
                 pygame.display.update()
                 pygame.time.delay(1000)
-                break
 
-            else:
+            elif kind == "visit":
                 # Erase current pointer before moving
                 if temp == self.head:
                     erase_pointer(screen, temp, "TEMP_ABOVE")
@@ -776,28 +710,42 @@ class SLL:
                     erase_pointer(screen, temp, "TEMP")
 
                 # Move to next
-                temp = temp.next
-                index += 1
+                temp = self.pool.views[event[2]]
+                self.follow(screen, event[3])
+                draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(1000)
+
+            elif kind == "found":
+                _, slot, index, comparisons = event
+                if slot != NIL:
+                    screen.blit(chrome.get((temp.shape.size, Colors.ORANGE, None)), temp.shape)
+                    text_rect = (temp.text.get_rect(center=temp.shape.center))
+                    screen.blit(temp.text, text_rect)
+
+                    set_status(f"Found at Pos: {index + 1}", Colors.GREEN, f"> return {index + 1}")
 
-                # If next node exists, draw pointer there
-                if temp is not None:
-                    draw_pointer(temp, "TEMP", Colors.ORANGE, screen)
                     update_status_ui(screen)
                     pygame.display.update()
                     pygame.time.delay(1000)
 
         # Cleanup
-        if temp is not None:
-            if temp == self.head:
-                erase_pointer(screen, temp, "TEMP_ABOVE")
-            else:
-                erase_pointer(screen, temp, "TEMP")
+        if temp == self.head:
+            erase_pointer(screen, temp, "TEMP_ABOVE")
+        else:
+            erase_pointer(screen, temp, "TEMP")
+
+        # Indexed search: one probe of the pool's value index, then the express lanes rank the slot
+        hash_slot, hash_idx = self.core.lookup(data)
+        hash_pos = hash_idx + 1 if hash_slot != NIL else -1
+        self.search_stats = (data, comparisons, index + 1 if slot != NIL else -1, hash_pos)
 
-        if not found:
-            set_status("Value Not Found", Colors.RED, "> return -1")
+        if slot == NIL:
+            set_status("Value Not Found", Colors.RED, f"> walk: {comparisons} compares; index[data]: 1 probe")
             update_status_ui(screen)
         else:
-            set_status("Search Complete", Colors.GREEN, "> Success")
+            set_status("Search Complete", Colors.GREEN, f"> walk: {comparisons} compares; index[data]: 1 probe")
             update_status_ui(screen)
 
         pygame.display.update()
@@ -805,43 +753,42 @@ class SLL:
 
 
     def destroyList(self, screen):
-        if self.head is None:
-            set_status("List is already Empty!", Colors.RED, "> if head is None: return")
-            return
-
         set_status("Clearing List...", Colors.ORANGE, "> while head is not None:")
 
-        while self.head is not None:
-            temp = self.head
+        for event in self.core.clear():
+            kind = event[0]
+            if kind == "error":
+                set_status("List is already Empty!", Colors.RED, "> if head is None: return")
+                return
 
-            draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(300)
+            if kind == "visit":
+                temp = self.pool.views[event[2]]
+                self.follow(screen, 0)
 
-            erase_pointer(screen, temp, "HEAD")
-            erase_pointer(screen, temp, "TEMP_ABOVE")
+                draw_pointer_on_head(temp, "TEMP", Colors.ORANGE, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(300)
 
-            self.head = self.head.next
+                erase_pointer(screen, temp, "HEAD")
+                erase_pointer(screen, temp, "TEMP_ABOVE")
 
-            if len(self.nodes) > 0:
-                self.nodes.pop(0)
-            self.length -= 1
+            elif kind == "removed":
+                self.hideNode(0)
+                self.layout()
 
-            pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 320))
-            self.drawList(screen)
+                pygame.draw.rect(screen, Colors.GREY, (0, 360, 1000, 320))
+                self.drawList(screen)
 
-            if self.head:
-                draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+                if self.head:
+                    draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
 
-            update_status_ui(screen)
-            pygame.display.update()
-            pygame.time.delay(300)
+                update_status_ui(screen)
+                pygame.display.update()
+                self.pause(300)
 
-        self.tail = None
-        self.nodes = []
-        self.length = 1
-        self.currentPos = self.initialPos[self.size]
+        self.view.current = None
+        self.search_stats = None
 
         set_status("List Cleared!", Colors.GREEN, "> New Max Capacity Set")
         update_status_ui(screen)
@@ -858,7 +805,7 @@ def run(screen):
 
     # Text rendering
     title = titleFont.render("Singly Linked List", True, Colors.TEAL)
-    cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+    cap_value_txt = paraFont.render(f"Capacity (Max {MAX_NODES}): ", True, Colors.LIGHT_GREY)
     value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
     value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
     pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
@@ -867,11 +814,11 @@ def run(screen):
     status_msg = "Ready"
     logic_msg = "Waiting for a operation..."
 
-    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK)
+    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK, 4)
     cap_bar.text = "6"
     node_bar = InputBar(100, 230, 130, 40, Colors.BLACK, 4)
-    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 2)
-    pos_delete_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 2)
+    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 4)
+    pos_delete_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 4)
     search_val_bar = InputBar(660, 315, 120, 40, Colors.BLACK, 2)
 
     set_max_button = Button(240, 145, 120, 40, "Set Max", None, 18)
@@ -884,10 +831,18 @@ def run(screen):
     delete_at_pos_button = Button(520, 315, 120, 40, "Delete", None, 18)
     search_button = Button(790, 315, 120, 40, "Search", None, 18)
     back_button = Button(930, 15, 70, 35, "← Back", None, 18)
+    pool_button = Button(370, 145, 105, 40, "Pool: Off", None, 18)
+    show_pool = False
+    fill_button = Button(370, 100, 105, 38, "Fill", None, 18)
 
     sll = SLL(6)
+    ui = WidgetIndex([set_max_button, insert_tail_button, insert_head_button, insert_at_pos_button,
+                      delete_head_button, delete_tail_button, destroy_button, delete_at_pos_button,
+                      search_button, back_button, pool_button, fill_button, cap_bar, node_bar,
+                      pos_insert_bar, pos_delete_bar, search_val_bar])
+
     running = True
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     while running:
         screen.fill(Colors.GREY)
@@ -909,6 +864,8 @@ def run(screen):
         delete_at_pos_button.draw(screen)
         search_button.draw(screen)
         back_button.draw(screen)
+        pool_button.draw(screen)
+        fill_button.draw(screen)
 
         cap_bar.draw(screen)
         node_bar.draw(screen)
@@ -917,11 +874,33 @@ def run(screen):
         search_val_bar.draw(screen)
 
         sll.drawList(screen)
+        if show_pool:
+            draw_pool(sll.pool, screen)
+        draw_search_stats(sll.search_stats, screen)
 
-        for event in pygame.event.get():
+        for event in sched.events():
+            ui.dispatch(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
 
+            # Scrolling the list view: wheel, arrow keys, or a click on the minimap
+            if event.type == pygame.MOUSEWHEEL:
+                sll.scroll((event.x - event.y) * sll.view.stride)
+            if event.type == pygame.KEYDOWN and event.key in (pygame.K_LEFT, pygame.K_RIGHT):
+                sll.scroll(sll.view.stride if event.key == pygame.K_RIGHT else -sll.view.stride)
+            if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1 and \
+                    sll.view.minimap.inflate(0, 16).collidepoint(event.pos):
+                sll.view.jump(event.pos[0], len(sll.nodes))
+                sll.layout()
+
+            if fill_button.is_clicked(event):
+                if sll.length >= sll.size:
+                    set_status("Limit Reached!", Colors.RED, "> Capacity Full")
+                else:
+                    count = sll.size - sll.length
+                    sll.fill(str(random.randint(1, 999)) for _ in range(count))
+                    set_status(f"Filled {count} Nodes", Colors.GREEN, "> tail.next = newNode (x{count})")
+
             if insert_tail_button.is_clicked(event):
                 if node_bar.text != "":
                     sll.insertAtTail(node_bar.text, screen)
@@ -937,16 +916,14 @@ def run(screen):
                     set_status("Value Empty!", Colors.RED, "> Enter Value to Insert")
 
             if set_max_button.is_clicked(event):
-                if cap_value_txt != "" and 6 >= int(cap_bar.text) > 0:
+                if cap_value_txt != "" and MAX_NODES >= int(cap_bar.text) > 0:
                     sll.size = int(cap_bar.text)
-                    sll.nodes.clear()
-                    sll.currentPos = sll.initialPos[sll.size]
-                    sll.length = 1
+                    sll.clear()
                     set_status("Capacity Updated!", Colors.GREEN, f"> size = {cap_bar.text}")
                 elif cap_bar.text == "":
                     set_status("Capacity can't be empty!", Colors.RED, "> cap_value != ''")
-                elif int(cap_bar.text) > 6:
-                    set_status("Capacity should be < 6", Colors.RED, "> ")
+                elif int(cap_bar.text) > MAX_NODES:
+                    set_status(f"Capacity should be <= {MAX_NODES}", Colors.RED, "> ")
                 else:
                     set_status("Invalid Capacity!", Colors.RED, "> ")
 
@@ -972,9 +949,9 @@ def run(screen):
                     set_status("Position can't be empty!", Colors.RED, "> ")
                 elif not pos_delete_bar.text.isdigit():
                     set_status("Pos must be a number!", Colors.RED, "> ")
-                elif sll.length == 1:
+                elif sll.length == 0:
                     set_status("List is Empty!", Colors.RED, "> ")
-                elif int(pos_delete_bar.text) > sll.length - 1:
+                elif int(pos_delete_bar.text) > sll.length:
                     set_status("Invalid Position!", Colors.RED, "> ")
                 else:
                     sll.deleteFromPos(int(pos_delete_bar.text), screen)
@@ -987,6 +964,10 @@ def run(screen):
                     sll.search(search_val_bar.text, screen)
                     search_val_bar.text = ""
 
+            if pool_button.is_clicked(event):
+                show_pool = not show_pool
+                pool_button.text = "Pool: On" if show_pool else "Pool: Off"
+
             if back_button.is_clicked(event):
                 return "back"
         
@@ -998,5 +979,5 @@ def run(screen):
 
         update_status_ui(screen)
         pygame.display.update()
-        clock.tick(60)
+        sched.sleep()
     return "back"
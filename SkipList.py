@@ -0,0 +1,420 @@
+import pygame
+from widgets import Button, InputBar, WidgetIndex
+import Colors
+import random
+from node_pool import PooledNode, SurfaceCache, NIL
+import skip_list_core
+from skip_list_core import SkipListCore
+from frame_scheduler import FrameScheduler
+from sprites import labels, chrome, blit_polygon
+
+MAX_NODES = 8
+MAX_LEVELS = 5  # Towers are capped here so they fit above the list
+BASE_Y = 590  # Top of the level-0 node boxes
+LEVEL_H = 32  # Rise per level
+HEAD_X = 30
+NODES_X = 115  # First node's x; each next one is STRIDE further right
+STRIDE = 100
+NIL_X = 925
+
+
+# Font config and sizes
+def get_font(size):
+    try:
+        return pygame.font.Font("ScienceGothic-Regular.ttf", size)
+    except:
+        return pygame.font.SysFont('Arial', size)
+
+
+# Font loaders
+titleFont = get_font(40)
+paraFont = get_font(17)
+subFont = get_font(13)
+nodeFont = get_font(28)
+logicFont = get_font(15)
+statFont = get_font(19)
+
+status_msg = "Ready"
+logic_msg = "Waiting for operation..."
+status_color = Colors.LIGHT_GREY
+
+node_texts = SurfaceCache(lambda text: nodeFont.render(text, True, Colors.LIGHT_GREY))
+
+ARROW_HEAD = ((0, 0), (-7, -7), (-7, 7))  # Points relative to the tip
+
+
+def set_status(message, color, logic_message=""):
+    global status_msg, status_color, logic_msg
+    status_msg = message
+    status_color = color
+    logic_msg = logic_message
+
+
+def update_status_ui(screen):
+    pygame.draw.rect(screen, Colors.GREY, (480, 50, 450, 100))
+
+    logic_lbl = statFont.render("Logic Flow: ", True, Colors.LIGHT_GREY)
+    screen.blit(logic_lbl, (500, 90))
+    logic_txt = logicFont.render(f"{logic_msg}", True, Colors.TEAL_BRIGHT)
+    screen.blit(logic_txt, (500, 115))
+
+    status_surf = nodeFont.render(status_msg, True, status_color)
+    screen.blit(status_surf, (500, 50))
+
+
+def draw_search_stats(stats, screen):
+    # Last search: keys compared against the ones a walk along level 0 would have compared
+    if stats is None:
+        return
+    key, comparisons, walk, found = stats
+    where = "found" if found else "not found"
+    search_txt = f"Search {key}: {comparisons} compares on the express levels, {walk} walking level 0 -> {where}"
+    screen.blit(subFont.render(search_txt, True, Colors.ORANGE), (50, 680))
+
+
+class SkipNode(PooledNode):
+    __slots__ = ("shape", "text")
+
+    def __init__(self, pool, idx):
+        # The key lives in the pool, the tower height in the core; the Rect is built once per slot
+        super().__init__(pool, idx)
+        self.shape = pygame.Rect(0, BASE_Y, 80, 56)
+        self.text = None
+
+    def place(self, x):
+        self.shape.x = x
+        self.text = node_texts.get(f"{self.data}")
+
+
+class SkipListScene:
+    def __init__(self, seed):
+        self.seed = seed
+        self.core = SkipListCore(MAX_NODES, SkipNode, seed, MAX_LEVELS)
+        self.pool = self.core.pool
+        self.keys = random.Random(seed)  # Keys for Fill, from the same seed
+        self.nodes = []  # In key order
+        self.path = []  # (slot, level) points of the current search, HEAD first
+        self.search_stats = None  # (key, comparisons, level-0 comparisons, found) of the last search
+
+    def height(self, slot):
+        return self.core.height[slot]
+
+    def name(self, slot):
+        if slot == NIL:
+            return "NIL"
+        return "HEAD" if slot == self.core.head else f"{self.pool.data[slot]}"
+
+    def cell(self, slot, level):
+        # Where slot's link on level is drawn: the node box on level 0, a small box per level above
+        x = HEAD_X if slot == self.core.head else self.pool.views[slot].shape.x
+        w = 60 if slot == self.core.head else 80
+        if level == 0:
+            return pygame.Rect(x, BASE_Y, w, 56)
+        return pygame.Rect(x, BASE_Y - level * LEVEL_H, w, 24)
+
+    def _recalculate_positions(self):
+        for i, node in enumerate(self.nodes):
+            node.place(NODES_X + i * STRIDE)
+
+    def drawTower(self, screen, slot, color=Colors.TEAL, border=None):
+        for level in range(1, self.height(slot)):
+            rect = self.cell(slot, level)
+            pygame.draw.rect(screen, color, rect, border_radius=2)
+            if border is not None:
+                pygame.draw.rect(screen, border, rect, 2, border_radius=2)
+            lbl = labels.get((f"next[{level}]", Colors.LIGHT_GREY))
+            screen.blit(lbl, lbl.get_rect(center=rect.center))
+        node = self.pool.views[slot]
+        screen.blit(chrome.get((node.shape.size, color, border)), node.shape)
+        screen.blit(node.text, node.text.get_rect(center=node.shape.center))
+
+    def drawHead(self, screen):
+        for level in range(self.core.levels()):
+            rect = self.cell(self.core.head, level)
+            pygame.draw.rect(screen, Colors.BLACK, rect, border_radius=2)
+            text = "HEAD" if level == 0 else f"L{level}"
+            lbl = labels.get((text, Colors.LIGHT_GREY))
+            screen.blit(lbl, lbl.get_rect(center=rect.center))
+
+    def drawLinks(self, screen):
+        # Follow every level's links in the core, so a node mid-insert or mid-delete floats unlinked
+        core = self.core
+        for level in range(core.levels()):
+            x = core.head
+            while True:
+                after = core.next[level][x]
+                start = self.cell(x, level)
+                end_x = NIL_X if after == NIL else self.cell(after, level).x
+                y = start.centery
+                pygame.draw.line(screen, Colors.LIGHT_GREY, (start.right, y), (end_x, y), 2)
+                blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, end_x, y)
+                if after == NIL:
+                    break
+                x = after
+        # NIL column at the right
+        top = BASE_Y - (core.levels() - 1) * LEVEL_H
+        pygame.draw.rect(screen, Colors.BLACK, (NIL_X, top, 30, BASE_Y + 56 - top), border_radius=2)
+        lbl = labels.get(("NIL", Colors.LIGHT_GREY))
+        screen.blit(lbl, (NIL_X + 15 - lbl.get_width() // 2, BASE_Y + 60))
+
+    def drawPath(self, screen):
+        # The search path, HEAD's top level first: right along a level, down where the next key is too big
+        # Points sit near each box's left edge, so the path runs along the links and clear of the labels
+        points = [(rect.x + 8, rect.centery) for rect in (self.cell(slot, level) for slot, level in self.path)]
+        if len(points) > 1:
+            pygame.draw.lines(screen, Colors.ORANGE, False, points, 3)
+        for point in points:
+            pygame.draw.circle(screen, Colors.ORANGE, point, 4)
+        if self.path:
+            slot, level = self.path[-1]
+            pygame.draw.rect(screen, Colors.ORANGE, self.cell(slot, level), 2, border_radius=2)
+
+    def drawList(self, screen, highlight=None, color=Colors.ORANGE):
+        self.drawLinks(screen)
+        self.drawHead(screen)
+        for node in self.nodes:
+            if node == highlight:
+                self.drawTower(screen, node.idx, Colors.TEAL, color)
+            else:
+                self.drawTower(screen, node.idx)
+        self.drawPath(screen)
+
+        levels_txt = f"keys: {self.core.length}/{MAX_NODES}   levels: {self.core.levels()}   seed: {self.seed}"
+        screen.blit(subFont.render(levels_txt, True, Colors.LIGHT_GREY), (50, 380))
+
+    def _redraw(self, screen, highlight=None, color=Colors.ORANGE):
+        # Erase the list
+        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        self.drawList(screen, highlight, color)
+        draw_search_stats(self.search_stats, screen)
+        update_status_ui(screen)
+        pygame.display.update()
+
+    def descend(self, screen, event, key):
+        # Animate a visit or down event of the walk from HEAD's top level
+        if event[0] == "visit":
+            _, slot, level = event
+            self.path.append((slot, level))
+            set_status("Searching...", Colors.ORANGE, f"> {self.name(slot)} < {key}: x = x.next[{level}]")
+            self._redraw(screen)
+            pygame.time.delay(700)
+            return
+
+        _, slot, level, after = event
+        reason = "NIL" if after == NIL else f"{self.name(after)} >= {key}"
+        if level > 0:
+            self.path.append((slot, level - 1))
+            set_status("Going Down...", Colors.ORANGE, f"> x.next[{level}] is {reason}: drop to level {level - 1}")
+        else:
+            set_status("Level 0 Reached", Colors.ORANGE, f"> x.next[0] is {reason}: stop")
+        self._redraw(screen)
+        pygame.time.delay(700)
+
+    def insert(self, key, screen):
+        self.path = [(self.core.head, self.core.levels() - 1)]
+        node = None
+        for event in self.core.insert(key):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                break
+
+            if kind in ("visit", "down"):
+                self.descend(screen, event, key)
+
+            elif kind == "grow":
+                set_status("New Level!", Colors.ORANGE, f"> levels = {event[1]}; HEAD.next[{event[1] - 1}] = NIL")
+                self._redraw(screen)
+                pygame.time.delay(700)
+
+            elif kind == "new":
+                _, slot, height = event
+                before = self.path[-1][0]
+                node = self.pool.views[slot]
+                self.nodes.insert(0 if before == self.core.head else self.nodes.index(self.pool.views[before]) + 1, node)
+                self._recalculate_positions()
+
+                # Heights come from coin flips: keep going up on heads
+                flips = ["heads"] * (height - 1) + (["tails"] if height < MAX_LEVELS else [])
+                set_status(f"New Node: Height {height}", Colors.ORANGE, f"> flips: {', '.join(flips)}")
+                self._redraw(screen, node)
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                _, slot, level, target, _ = event
+                set_status("Linking...", Colors.ORANGE, f"> {self.name(slot)}.next[{level}] = {self.name(target)}")
+                self._redraw(screen, node)
+                pygame.time.delay(500)
+
+            elif kind == "placed":
+                set_status(f"Inserted {key}", Colors.GREEN, "> Success")
+
+        self.path = []
+        self._redraw(screen)
+
+    def delete(self, key, screen):
+        self.path = [(self.core.head, self.core.levels() - 1)]
+        node = None
+        for event in self.core.remove(key):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                break
+
+            if kind in ("visit", "down"):
+                self.descend(screen, event, key)
+
+            elif kind == "link":
+                _, slot, level, target, old = event
+                node = self.pool.views[old]
+                set_status("Unlinking...", Colors.ORANGE, f"> {self.name(slot)}.next[{level}] = {self.name(target)}")
+                self._redraw(screen, node, Colors.RED)
+                pygame.time.delay(500)
+
+            elif kind == "shrink":
+                set_status("Level Dropped", Colors.ORANGE, f"> HEAD.next[{event[1]}] was NIL: levels = {event[1]}")
+                self._redraw(screen, node, Colors.RED)
+                pygame.time.delay(700)
+
+            elif kind == "removed":
+                self.nodes.remove(self.pool.views[event[1]])
+                self._recalculate_positions()
+                set_status(f"Deleted {key}", Colors.GREEN, "> Success")
+
+        self.path = []
+        self._redraw(screen)
+
+    def search(self, key, screen):
+        self.path = [(self.core.head, self.core.levels() - 1)]
+        for event in self.core.find(key):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                self.path = []
+                break
+
+            if kind in ("visit", "down"):
+                self.descend(screen, event, key)
+
+            elif kind == "found":
+                _, slot, comparisons = event
+                keys = self.core.keys()
+                walk = sum(1 for k in keys if k < key) + (1 if any(k >= key for k in keys) else 0)
+                self.search_stats = (key, comparisons, walk, slot != NIL)
+                if slot != NIL:
+                    self.path.append((slot, 0))
+                    set_status(f"Found {key}", Colors.GREEN, f"> x.next[0] == {key}: {comparisons} compares")
+                    self._redraw(screen, self.pool.views[slot], Colors.GREEN)
+                else:
+                    set_status("Value Not Found", Colors.RED, f"> x.next[0] != {key}: {comparisons} compares")
+                    self._redraw(screen)
+                pygame.time.delay(1000)
+
+        # Leave the path on screen until the next operation
+        self._redraw(screen)
+
+    def fill(self):
+        # Insert random keys without animating until the list is full
+        while self.core.length < MAX_NODES:
+            skip_list_core.run(self.core.insert(self.keys.randrange(100)))
+        self.nodes = [self.pool.views[slot] for slot in self.core.level(0)]
+        self._recalculate_positions()
+        self.path = []
+
+
+def run(screen):
+    # Text rendering
+    title = titleFont.render("Skip List", True, Colors.TEAL)
+    seed_txt = paraFont.render("Seed: ", True, Colors.LIGHT_GREY)
+    value_txt = paraFont.render("Key (0-99): ", True, Colors.LIGHT_GREY)
+    legend_txt = subFont.render("Each node's height is a run of coin flips; searches ride the top levels and drop down",
+                                True, Colors.LIGHT_GREY)
+
+    skip = SkipListScene(0)
+
+    seed_bar = InputBar(100, 145, 130, 40, Colors.BLACK, 6)
+    seed_bar.text = "0"
+    node_bar = InputBar(100, 230, 130, 40, Colors.BLACK, 2)
+
+    reset_button = Button(240, 145, 120, 40, "Reset", None, 18)
+    fill_button = Button(370, 145, 105, 40, "Fill", None, 18)
+    insert_button = Button(240, 230, 120, 40, "Insert", None, 18)
+    delete_button = Button(370, 230, 120, 40, "Delete", None, 18)
+    search_button = Button(500, 230, 120, 40, "Search", None, 18)
+    back_button = Button(930, 15, 70, 35, "← Back", None, 18)
+
+    ui = WidgetIndex([reset_button, fill_button, insert_button, delete_button, search_button, back_button,
+                      seed_bar, node_bar])
+
+    running = True
+    sched = FrameScheduler()
+
+    while running:
+        screen.fill(Colors.GREY)
+
+        screen.blit(title, (50, 40))
+        screen.blit(legend_txt, (50, 88))
+        screen.blit(seed_txt, (100, 115))
+        screen.blit(value_txt, (100, 200))
+
+        reset_button.draw(screen)
+        fill_button.draw(screen)
+        insert_button.draw(screen)
+        delete_button.draw(screen)
+        search_button.draw(screen)
+        back_button.draw(screen)
+
+        seed_bar.draw(screen)
+        node_bar.draw(screen)
+
+        skip.drawList(screen)
+        draw_search_stats(skip.search_stats, screen)
+        update_status_ui(screen)
+
+        for event in sched.events():
+            ui.dispatch(event)
+            if event.type == pygame.QUIT:
+                pygame.quit()
+
+            seed_bar.handle_input(event)
+            node_bar.handle_input(event)
+
+            if reset_button.is_clicked(event):
+                if seed_bar.text.isdigit():
+                    skip = SkipListScene(int(seed_bar.text))
+                    set_status(f"Seed Set to {seed_bar.text}", Colors.GREEN, "> same seed, same towers")
+                else:
+                    set_status("Invalid Seed", Colors.RED)
+
+            if fill_button.is_clicked(event):
+                skip.fill()
+                set_status("Filled", Colors.GREEN, f"> {skip.core.length} keys, {skip.core.levels()} levels")
+
+            if insert_button.is_clicked(event):
+                if node_bar.text.isdigit():
+                    skip.insert(int(node_bar.text), screen)
+                    node_bar.text = ""
+                else:
+                    set_status("Input Key", Colors.RED)
+
+            if delete_button.is_clicked(event):
+                if node_bar.text.isdigit():
+                    skip.delete(int(node_bar.text), screen)
+                    node_bar.text = ""
+                else:
+                    set_status("Input Key", Colors.RED)
+
+            if search_button.is_clicked(event):
+                if node_bar.text.isdigit():
+                    skip.search(int(node_bar.text), screen)
+                else:
+                    set_status("Input Key", Colors.RED)
+
+            if back_button.is_clicked(event):
+                return "back"
+
+        update_status_ui(screen)
+        pygame.display.update()
+        sched.sleep()
+
+    return "back"
@@ -0,0 +1,501 @@
+import pygame
+from widgets import Button, InputBar, WidgetIndex
+import Colors
+from node_pool import NodePool, PooledNode, NIL
+from linked_list_core import UnrolledCore
+from frame_scheduler import FrameScheduler
+from sprites import labels, null_labels, blit_polygon
+
+MAX_ENTRIES = 24
+MIN_BLOCK, MAX_BLOCK = 4, 64
+CELL = 20  # Side of one entry's cell
+COLUMNS = 8  # Cells per row inside a block; bigger blocks wrap onto more rows
+
+
+# Font config and sizes
+def get_font(size):
+    try:
+        return pygame.font.Font("ScienceGothic-Regular.ttf", size)
+    except:
+        return pygame.font.SysFont('Arial', size)
+
+
+# Font loaders
+titleFont = get_font(40)
+paraFont = get_font(17)
+subFont = get_font(13)
+nodeFont = get_font(28)
+logicFont = get_font(15)
+statFont = get_font(19)
+
+status_msg = "Ready"
+logic_msg = "Waiting for operation..."
+status_color = Colors.LIGHT_GREY
+
+ARROW_HEAD = ((0, 0), (-7, -7), (-7, 7))  # Points relative to the tip
+POINTER_DOWN = ((0, 0), (-10, -15), (10, -15))
+
+
+def set_status(message, color, logic_message=""):
+    global status_msg, status_color, logic_msg
+    status_msg = message
+    status_color = color
+    logic_msg = logic_message
+
+
+def update_status_ui(screen):
+    pygame.draw.rect(screen, Colors.GREY, (480, 50, 450, 100))
+
+    logic_lbl = statFont.render("Logic Flow: ", True, Colors.LIGHT_GREY)
+    screen.blit(logic_lbl, (500, 90))
+    logic_txt = logicFont.render(f"{logic_msg}", True, Colors.TEAL_BRIGHT)
+    screen.blit(logic_txt, (500, 115))
+
+    status_surf = nodeFont.render(status_msg, True, status_color)
+    screen.blit(status_surf, (500, 50))
+
+
+def draw_pointer(node, text, color, screen):
+    # Above the block; several pointers on one block share it, e.g. "HEAD / TEMP"
+    node_x = node.shape.x + node.shape.width // 2
+    node_y = node.shape.y - 4
+    blit_polygon(screen, POINTER_DOWN, color, node_x, node_y)
+    lbl = labels.get((text, color))
+    screen.blit(lbl, (node_x - lbl.get_width() // 2, node_y - 31))
+
+
+def draw_block_stats(ull, screen):
+    # How the entries sit in blocks: one next link per block instead of one per entry
+    core = ull.core
+    fill = core.length * 100 // (core.blocks * core.block_size) if core.blocks else 0
+    stats_txt = (f"entries: {core.length}/{core.size}   blocks: {core.blocks}   block size: {core.block_size}"
+                 f"   fill: {fill}%   next links: {core.blocks} (one per entry: {core.length})")
+    screen.blit(subFont.render(stats_txt, True, Colors.LIGHT_GREY), (50, 660))
+
+
+def draw_search_stats(stats, screen):
+    # Last search: entries compared and blocks walked
+    if stats is None:
+        return
+    value, comparisons, blocks, pos = stats
+    where = f"pos {pos}" if pos > 0 else "not found"
+    search_txt = f"Search '{value}': {comparisons} compares in {blocks} blocks -> {where}"
+    screen.blit(subFont.render(search_txt, True, Colors.ORANGE), (50, 680))
+
+
+class Block(PooledNode):
+    __slots__ = ("shape",)
+
+    def __init__(self, pool, idx):
+        # The entries live in the pool (a list per slot); the Rect is built once per slot
+        super().__init__(pool, idx)
+        self.shape = pygame.Rect(0, 0, 0, 0)
+
+    def resize(self, block_size):
+        cols = min(block_size, COLUMNS)
+        rows = -(-block_size // COLUMNS)
+        self.shape.size = (cols * CELL + 8, rows * CELL + 22)
+
+    def cell(self, offset):
+        x = self.shape.x + 4 + (offset % COLUMNS) * CELL
+        y = self.shape.y + 18 + (offset // COLUMNS) * CELL
+        return pygame.Rect(x, y, CELL - 2, CELL - 2)
+
+    def draw(self, screen, ull, highlight_color=None, marked=(), mark_color=Colors.ORANGE):
+        entries = self.data
+        pygame.draw.rect(screen, Colors.BLACK, self.shape, border_radius=3)
+        if highlight_color is not None:
+            pygame.draw.rect(screen, highlight_color, self.shape, 2, border_radius=3)
+
+        # Header: slot address and how full the block is
+        screen.blit(labels.get((f"@{self.idx}", Colors.LIGHT_GREY)), (self.shape.x + 4, self.shape.y + 2))
+        count = labels.get((f"{len(entries)}/{ull.core.block_size}", Colors.LIGHT_GREY))
+        screen.blit(count, (self.shape.right - count.get_width() - 4, self.shape.y + 2))
+
+        for offset in range(ull.core.block_size):
+            rect = self.cell(offset)
+            if offset >= len(entries):
+                pygame.draw.rect(screen, Colors.GREY, rect, border_radius=2)
+                continue
+            color = mark_color if offset in marked else Colors.TEAL
+            pygame.draw.rect(screen, color, rect, border_radius=2)
+            text = labels.get((f"{entries[offset]}", Colors.LIGHT_GREY))
+            screen.blit(text, text.get_rect(center=rect.center))
+
+
+class ULL:
+    def __init__(self, size, block_size):
+        # The core keeps the blocks in its pool; each of its operations yields
+        # one event per step, which the methods below animate
+        pool = NodePool(UnrolledCore.blocks_for(size, block_size), Block)
+        for block in pool.views:
+            block.resize(block_size)
+        self.core = UnrolledCore(size, block_size, pool)
+        self.pool = pool
+        self.nodes = []  # Blocks in list order
+        self.search_stats = None  # (value, comparisons, blocks walked, pos) of the last search
+
+    @property
+    def length(self):
+        return self.core.length
+
+    @property
+    def head(self):
+        return self.pool.view(self.core.head)
+
+    @property
+    def tail(self):
+        return self.pool.view(self.core.tail)
+
+    def _recalculate_positions(self):
+        # Blocks flow left to right and wrap onto a new row at the screen's edge
+        x, y, row_height = 60, 410, 0
+        for block in self.nodes:
+            if x + block.shape.width > 940 and x > 60:
+                x, y = 60, y + row_height + 45
+            block.shape.topleft = (x, y)
+            row_height = max(row_height, block.shape.height)
+            x += block.shape.width + 45
+
+    def drawList(self, screen):
+        for block, after in zip(self.nodes, self.nodes[1:]):
+            self.drawLink(screen, block, after)
+        if self.nodes:
+            # The tail's next is NULL
+            last = self.nodes[-1]
+            y = last.shape.centery
+            pygame.draw.line(screen, Colors.LIGHT_GREY, (last.shape.right, y), (last.shape.right + 25, y), 2)
+            blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, last.shape.right + 25, y)
+            screen.blit(null_labels.get(Colors.LIGHT_GREY), (last.shape.right + 28, y - 10))
+        for block in self.nodes:
+            block.draw(screen, self)
+        self.drawPointers(screen)
+
+    def drawPointers(self, screen, temp=None):
+        # temp is a (block, name) pair from a walk, drawn in orange on top of HEAD / TAIL
+        names = {}
+        for block, name in ((self.head, "HEAD"), (self.tail, "TAIL"), temp or (None, None)):
+            if block:
+                names.setdefault(block, []).append(name)
+        for block, shared in names.items():
+            color = Colors.ORANGE if temp and block == temp[0] else Colors.LIGHT_GREY
+            draw_pointer(block, " / ".join(shared), color, screen)
+
+    def drawLink(self, screen, block, after):
+        start = (block.shape.right, block.shape.centery)
+        end = (after.shape.x, after.shape.centery)
+        if after.shape.y == block.shape.y:
+            pygame.draw.line(screen, Colors.LIGHT_GREY, start, end, 2)
+        else:
+            # Wraps to the next row: out to the right, down into the gap, back to the left edge
+            gap_y = block.shape.bottom + 6
+            points = [start, (start[0] + 15, start[1]), (start[0] + 15, gap_y),
+                      (end[0] - 15, gap_y), (end[0] - 15, end[1]), end]
+            pygame.draw.lines(screen, Colors.LIGHT_GREY, False, points, 2)
+        blit_polygon(screen, ARROW_HEAD, Colors.LIGHT_GREY, *end)
+
+    def _redraw(self, screen):
+        # Erase the list
+        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        self.drawList(screen)
+        draw_block_stats(self, screen)
+        update_status_ui(screen)
+        pygame.display.update()
+
+    def show(self, screen, message, logic, color=Colors.ORANGE, marks=(), pointer=None, delay=1000):
+        # One animation frame: redraw, then outline the blocks in marks ((block, color, offsets) triples)
+        set_status(message, color, logic)
+        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        self.drawList(screen)
+        for block, highlight, offsets in marks:
+            block.draw(screen, self, highlight, offsets, highlight)
+        if pointer is not None:
+            self.drawPointers(screen, pointer)
+        draw_block_stats(self, screen)
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(delay)
+
+    def play(self, screen, op, start="head"):
+        # Animate one core operation, event by event; returns its last event, or None after an error
+        skipped = 0  # Entries the walk has hopped over
+        event = None
+        for event in op:
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return None
+
+            if kind == "visit":
+                _, name, slot, i, _ = event
+                block = self.pool.views[slot]
+                if name != "temp":
+                    self.show(screen, "Checking Neighbour...", f"> {name} = {'temp.next' if name == 'next' else 'block before temp'}",
+                              marks=[(block, Colors.TEAL_BRIGHT, ())], pointer=(block, name.upper()))
+                elif i == 0 or start == "tail":
+                    self.show(screen, "Traversing...", f"> temp = {start}", pointer=(block, "TEMP"))
+                else:
+                    skipped += len(self.nodes[i - 1].data)
+                    self.show(screen, "Traversing...", f"> temp = temp.next  (skipped {skipped} entries)",
+                              pointer=(block, "TEMP"))
+
+            elif kind == "new":
+                block = self.pool.views[event[1]]
+                self.nodes.insert(event[2], block)
+                self._recalculate_positions()
+                self.show(screen, "New Block...", "> newBlock = Block()", marks=[(block, Colors.ORANGE, ())])
+
+            elif kind == "split":
+                _, slot, new, moved = event
+                block, new_block = self.pool.views[slot], self.pool.views[new]
+                half = self.core.half
+                self.show(screen, "Block Full: Splitting...", f"> newBlock.extend(block[{half}:]); del block[{half}:]",
+                          marks=[(block, Colors.ORANGE, ()), (new_block, Colors.ORANGE, range(moved))])
+
+            elif kind == "shift":
+                _, slot, into, moved = event
+                block, into_block = self.pool.views[slot], self.pool.views[into]
+                filled = range(len(into_block.data) - moved, len(into_block.data))
+                self.show(screen, "Underflow: Borrowing...", f"> block.extend(next[:{moved}]); del next[:{moved}]",
+                          marks=[(block, Colors.ORANGE, ()), (into_block, Colors.ORANGE, filled)])
+
+            elif kind == "merge":
+                _, slot, other, moved = event
+                block, other_block = self.pool.views[slot], self.pool.views[other]
+                merged = range(len(block.data) - moved, len(block.data))
+                self.show(screen, "Underflow: Merging...", f"> block.extend(other)  # {moved} entries",
+                          marks=[(block, Colors.ORANGE, merged), (other_block, Colors.RED, ())])
+
+            elif kind == "link":
+                _, slot, _, target, _ = event
+                after = "NULL" if target == NIL else f"@{target}"
+                self.show(screen, "Linking...", f"> @{slot}.next = {after}", delay=500)
+
+            elif kind == "set":
+                _, name, slot, _ = event
+                self.show(screen, f"{name.capitalize()} Updated", f"> {name} = {'NULL' if slot == NIL else f'@{slot}'}",
+                          delay=500)
+
+            elif kind == "put":
+                _, slot, offset, value = event
+                block = self.pool.views[slot]
+                self.show(screen, f"Inserted {value}", f"> block.insert({offset}, {value})", Colors.GREEN,
+                          marks=[(block, Colors.GREEN, (offset,))])
+
+            elif kind == "take":
+                _, slot, offset, value = event
+                block = self.pool.views[slot]
+                self.show(screen, f"Removed {value}", f"> block.pop({offset})", Colors.GREEN,
+                          marks=[(block, Colors.RED, ())])
+
+            elif kind == "removed":
+                block = self.nodes.pop(event[1])
+                self._recalculate_positions()
+                self.show(screen, "Block Freed", f"> free(@{block.idx})", delay=500)
+
+            elif kind == "found":
+                _, slot, pos, comparisons = event
+                if slot != NIL:
+                    block = self.pool.views[slot]
+                    offset = pos - sum(len(b.data) for b in self.nodes[:self.nodes.index(block)])
+                    self.show(screen, f"Found at Pos {pos + 1}", f"> return {pos + 1}", Colors.GREEN,
+                              marks=[(block, Colors.ORANGE, (offset,))])
+
+        self._recalculate_positions()
+        self._redraw(screen)
+        return event
+
+    def insertAtTail(self, data, screen):
+        if self.play(screen, self.core.push_back(data), start="tail"):
+            set_status("Inserted at Tail!", Colors.GREEN, "> Success")
+
+    def insertAtHead(self, data, screen):
+        if self.play(screen, self.core.push_front(data)):
+            set_status("Inserted at Head!", Colors.GREEN, "> Success")
+
+    def insertAtPos(self, data, pos, screen):
+        # 1-based positions, like the other list scenes
+        start = "tail" if pos == self.length + 1 else "head"
+        if self.play(screen, self.core.insert_at(pos - 1, data), start):
+            set_status("Inserted!", Colors.GREEN, "> Success")
+
+    def deleteHead(self, screen):
+        if self.play(screen, self.core.pop_front()):
+            set_status("Head Deleted!", Colors.GREEN, "> Success")
+
+    def deleteTail(self, screen):
+        if self.play(screen, self.core.pop_back()):
+            set_status("Tail Deleted!", Colors.GREEN, "> Success")
+
+    def deleteFromPos(self, pos, screen):
+        if self.play(screen, self.core.remove_at(pos - 1)):
+            set_status("Deleted!", Colors.GREEN, "> Success")
+
+    def search(self, data, screen):
+        event = self.play(screen, self.core.find(data))
+        if event is None:
+            return
+        _, slot, pos, comparisons = event
+        blocks = self.nodes.index(self.pool.views[slot]) + 1 if slot != NIL else self.core.blocks
+        self.search_stats = (data, comparisons, blocks, pos + 1 if slot != NIL else -1)
+        if slot == NIL:
+            set_status("Value Not Found", Colors.RED, f"> {comparisons} compares in {blocks} blocks")
+        else:
+            set_status(f"Found {data} at Pos {pos + 1}", Colors.GREEN, f"> {comparisons} compares in {blocks} blocks")
+        self._redraw(screen)
+
+    def destroy(self, screen):
+        if self.play(screen, self.core.clear()):
+            self.search_stats = None
+            set_status("List Cleared", Colors.GREEN, "> Success")
+
+
+def run(screen):
+    # Text rendering
+    title = titleFont.render("Unrolled Linked List", True, Colors.TEAL)
+    cap_value_txt = paraFont.render(f"Max (1-{MAX_ENTRIES}):", True, Colors.LIGHT_GREY)
+    block_value_txt = paraFont.render(f"Block ({MIN_BLOCK}-{MAX_BLOCK}):", True, Colors.LIGHT_GREY)
+    value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
+    value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
+    pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
+    pos_txt_2 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
+    legend_txt = subFont.render("Each node holds a block of entries: split when full, refill or merge when under half",
+                                True, Colors.LIGHT_GREY)
+
+    ull = ULL(16, 4)
+
+    cap_bar = InputBar(100, 145, 80, 40, Colors.BLACK, 2)
+    cap_bar.text = "16"
+    block_bar = InputBar(210, 145, 80, 40, Colors.BLACK, 2)
+    block_bar.text = "4"
+    node_bar = InputBar(100, 230, 130, 40, Colors.BLACK, 2)
+    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 2)
+    pos_delete_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 2)
+    search_val_bar = InputBar(660, 315, 120, 40, Colors.BLACK, 2)
+
+    set_button = Button(310, 145, 120, 40, "Set", None, 18)
+    insert_tail_button = Button(240, 230, 120, 40, "Insert Tail", None, 18)
+    insert_head_button = Button(370, 230, 120, 40, "Insert Head", None, 18)
+    insert_at_pos_button = Button(240, 315, 120, 40, "Insert", None, 18)
+    delete_head_button = Button(500, 170, 130, 50, "Delete Head", None, 18)
+    delete_tail_button = Button(640, 170, 130, 50, "Delete Tail", None, 18)
+    destroy_button = Button(780, 170, 130, 50, "Destroy", None, 18)
+    delete_at_pos_button = Button(520, 315, 120, 40, "Delete", None, 18)
+    search_button = Button(790, 315, 120, 40, "Search", None, 18)
+    back_button = Button(930, 15, 70, 35, "← Back", None, 18)
+
+    ui = WidgetIndex([set_button, insert_tail_button, insert_head_button, insert_at_pos_button,
+                      delete_head_button, delete_tail_button, destroy_button, delete_at_pos_button,
+                      search_button, back_button, cap_bar, block_bar, node_bar, pos_insert_bar,
+                      pos_delete_bar, search_val_bar])
+
+    running = True
+    sched = FrameScheduler()
+
+    while running:
+        screen.fill(Colors.GREY)
+
+        screen.blit(title, (50, 40))
+        screen.blit(legend_txt, (50, 88))
+        screen.blit(cap_value_txt, (100, 115))
+        screen.blit(block_value_txt, (210, 115))
+        screen.blit(value_txt_1, (100, 200))
+        screen.blit(value_txt_2, (660, 285))
+        screen.blit(pos_txt_1, (100, 285))
+        screen.blit(pos_txt_2, (380, 285))
+
+        set_button.draw(screen)
+        insert_tail_button.draw(screen)
+        insert_head_button.draw(screen)
+        insert_at_pos_button.draw(screen)
+        delete_head_button.draw(screen)
+        delete_tail_button.draw(screen)
+        destroy_button.draw(screen)
+        delete_at_pos_button.draw(screen)
+        search_button.draw(screen)
+        back_button.draw(screen)
+
+        cap_bar.draw(screen)
+        block_bar.draw(screen)
+        node_bar.draw(screen)
+        pos_insert_bar.draw(screen)
+        pos_delete_bar.draw(screen)
+        search_val_bar.draw(screen)
+
+        ull.drawList(screen)
+        draw_block_stats(ull, screen)
+        draw_search_stats(ull.search_stats, screen)
+        update_status_ui(screen)
+
+        for event in sched.events():
+            ui.dispatch(event)
+            if event.type == pygame.QUIT:
+                pygame.quit()
+
+            cap_bar.handle_input(event)
+            block_bar.handle_input(event)
+            node_bar.handle_input(event)
+            pos_insert_bar.handle_input(event)
+            pos_delete_bar.handle_input(event)
+            search_val_bar.handle_input(event)
+
+            if set_button.is_clicked(event):
+                if not (cap_bar.text.isdigit() and 0 < int(cap_bar.text) <= MAX_ENTRIES):
+                    set_status(f"Invalid Max (1-{MAX_ENTRIES})", Colors.RED)
+                elif not (block_bar.text.isdigit() and MIN_BLOCK <= int(block_bar.text) <= MAX_BLOCK):
+                    set_status(f"Invalid Block ({MIN_BLOCK}-{MAX_BLOCK})", Colors.RED)
+                else:
+                    ull = ULL(int(cap_bar.text), int(block_bar.text))
+                    set_status(f"Max {cap_bar.text}, Block {block_bar.text}", Colors.GREEN)
+
+            if insert_tail_button.is_clicked(event):
+                if node_bar.text:
+                    ull.insertAtTail(node_bar.text, screen)
+                    node_bar.text = ""
+                else:
+                    set_status("Input Value", Colors.RED)
+
+            if insert_head_button.is_clicked(event):
+                if node_bar.text:
+                    ull.insertAtHead(node_bar.text, screen)
+                    node_bar.text = ""
+                else:
+                    set_status("Input Value", Colors.RED)
+
+            if insert_at_pos_button.is_clicked(event):
+                if node_bar.text and pos_insert_bar.text.isdigit():
+                    ull.insertAtPos(node_bar.text, int(pos_insert_bar.text), screen)
+                    pos_insert_bar.text = ""
+                else:
+                    set_status("Check Inputs", Colors.RED)
+
+            if delete_head_button.is_clicked(event):
+                ull.deleteHead(screen)
+
+            if delete_tail_button.is_clicked(event):
+                ull.deleteTail(screen)
+
+            if destroy_button.is_clicked(event):
+                ull.destroy(screen)
+
+            if delete_at_pos_button.is_clicked(event):
+                if pos_delete_bar.text.isdigit():
+                    ull.deleteFromPos(int(pos_delete_bar.text), screen)
+                    pos_delete_bar.text = ""
+                else:
+                    set_status("Invalid Position", Colors.RED)
+
+            if search_button.is_clicked(event):
+                if search_val_bar.text:
+                    ull.search(search_val_bar.text, screen)
+                else:
+                    set_status("Input Value", Colors.RED)
+
+            if back_button.is_clicked(event):
+                return "back"
+
+        update_status_ui(screen)
+        pygame.display.update()
+        sched.sleep()
+
+    return "back"
@@ -0,0 +1,763 @@
+import pygame
+from widgets import Button, InputBar, WidgetIndex
+import Colors
+from node_pool import NodePool, PooledNode, SurfaceCache, NIL
+from linked_list_core import XorCore
+from frame_scheduler import FrameScheduler
+import sprites
+from sprites import labels, null_labels, chrome, blit_polygon, draw_search_stats
+
+MAX_NODES = 6
+
+
+# Font config and sizes
+def get_font(size):
+    try:
+        return pygame.font.Font("ScienceGothic-Regular.ttf", size)
+    except:
+        return pygame.font.SysFont('Arial', size)
+
+
+# Font loaders
+titleFont = get_font(40)
+paraFont = get_font(17)
+subFont = get_font(13)
+nodeFont = get_font(28)
+logicFont = get_font(15)
+statFont = get_font(19)
+
+status_msg = "Ready"
+logic_msg = "Waiting for operation..."
+status_color = Colors.LIGHT_GREY
+
+node_texts = SurfaceCache(lambda text: nodeFont.render(text, True, Colors.LIGHT_GREY))
+
+NEXT_HEAD = ((0, 0), (-7, -5), (-7, 5))  # Points relative to the tip
+PREV_HEAD = ((0, 0), (7, -5), (7, 5))
+POINTER_DOWN = ((0, 0), (-10, -15), (10, -15))
+POINTER_UP = ((0, 0), (-10, 15), (10, 15))
+POINTER_ABOVE = ((0, 0), (-10, -16), (10, -16))  # Stacked above another pointer
+
+
+def addr(slot):
+    # A node's "address": its pool slot + 1, so NULL (NIL) is address 0
+    return slot + 1
+
+
+def set_status(message, color, logic_message=""):
+    global status_msg, status_color, logic_msg
+    status_msg = message
+    status_color = color
+    logic_msg = logic_message
+
+
+def update_status_ui(screen):
+    pygame.draw.rect(screen, Colors.GREY, (480, 50, 450, 100))
+
+    logic_lbl = statFont.render("Logic Flow: ", True, Colors.LIGHT_GREY)
+    screen.blit(logic_lbl, (500, 90))
+    logic_txt = logicFont.render(f"{logic_msg}", True, Colors.TEAL_BRIGHT)
+    screen.blit(logic_txt, (500, 115))
+
+    status_surf = nodeFont.render(status_msg, True, status_color)
+    screen.blit(status_surf, (500, 50))
+
+
+def draw_pointer(node, text, color, screen):
+    node_x = node.shape.x + node.shape.width // 2
+    if text == "TAIL":
+        node_y = node.shape.y + node.shape.height + 8
+        blit_polygon(screen, POINTER_UP, color, node_x, node_y)
+        lbl = labels.get((text, color))
+        screen.blit(lbl, (node_x - lbl.get_width() // 2, node_y + 20))
+    else:
+        node_y = node.shape.y - 10
+        blit_polygon(screen, POINTER_DOWN, color, node_x, node_y)
+        lbl = labels.get((text, color))
+        screen.blit(lbl, (node_x - lbl.get_width() // 2, node_y - 37))
+
+
+def erase_pointer(screen, node, pointer_type="HEAD"):
+    # Calculate center of the node
+    node_x = node.shape.x + node.shape.width // 2
+
+    if pointer_type == "TAIL":
+        clear_rect = pygame.Rect(0, 0, 80, 50)
+        clear_rect.centerx = node_x
+        clear_rect.y = node.shape.y + node.shape.height + 2
+    elif pointer_type == "TEMP_ABOVE":
+        clear_rect = pygame.Rect(0, 0, 80, 40)
+        clear_rect.centerx = node_x
+        clear_rect.bottom = node.shape.y - 48
+    else:
+        clear_rect = pygame.Rect(0, 0, 80, 50)
+        clear_rect.centerx = node_x
+        clear_rect.bottom = node.shape.y - 2
+
+    pygame.draw.rect(screen, Colors.GREY, clear_rect)
+
+
+def draw_pointer_on_head(node, text, color, screen):
+    temp_x = node.shape.x + node.shape.width // 2
+    temp_y = node.shape.y - 20
+
+    # Draw TEMP pointer, tip above HEAD
+    blit_polygon(screen, POINTER_ABOVE, color, temp_x, temp_y - 29)
+
+    lbl_temp = labels.get((text, color))
+    screen.blit(lbl_temp, (temp_x - lbl_temp.get_width() // 2, temp_y - 65))
+
+
+def draw_pool(pool, screen):
+    # next[] holds a node's both link while the slot is in use and the free list otherwise
+    rows = pool.table(count=sprites.POOL_COLUMNS)
+    rows[2] = ("both", [str(pool.next[i]) if pool.in_use[i] else cell for i, cell in enumerate(rows[2][1])])
+    sprites.draw_pool(pool, screen, rows=rows)
+    links_txt = f"links: {pool.next.itemsize} B/node (next + prev: {2 * pool.next.itemsize} B)"
+    screen.blit(subFont.render(links_txt, True, Colors.LIGHT_GREY), (700, 632))
+
+
+class XorNode(PooledNode):
+    __slots__ = ("shape", "text")
+
+    def __init__(self, pool, idx):
+        # data and the both link live in the pool's arrays; the Rect is built once per slot
+        super().__init__(pool, idx)
+        self.shape = pygame.Rect(0, 0, 90, 70)
+        self.text = None
+
+    @property
+    def both(self):
+        return self.pool.next[self.idx]
+
+    def place(self, pos):
+        self.shape.topleft = pos
+        self.text = node_texts.get(f"{self.data}")
+
+    def draw(self, screen, xll, highlight_color=Colors.TEAL, fill=False):
+        # Node box, border highlight and "data:" label, one sprite per node size and colors
+        if fill:
+            screen.blit(chrome.get((self.shape.size, highlight_color, None)), self.shape)
+        else:
+            border = highlight_color if highlight_color != Colors.TEAL else None
+            screen.blit(chrome.get((self.shape.size, Colors.TEAL, border)), self.shape)
+
+        text_rect = self.text.get_rect(center=self.shape.center)
+        screen.blit(self.text, text_rect)
+
+        # Address in the top right corner, the one link along the bottom
+        addr_lbl = labels.get((f"@{addr(self.idx)}", Colors.BLACK))
+        screen.blit(addr_lbl, (self.shape.right - addr_lbl.get_width() - 3, self.shape.y))
+        both = self.both if self.both != NIL else "-"  # A new node is unlinked until its first relink
+        screen.blit(labels.get((f"both: {both}", Colors.LIGHT_GREY)), (self.shape.x, self.shape.bottom - 16))
+
+        if self == xll.head:
+            draw_pointer(self, "HEAD", Colors.LIGHT_GREY, screen)
+        if self == xll.tail:
+            draw_pointer(self, "TAIL", Colors.LIGHT_GREY, screen)
+
+
+class XLL:
+    def __init__(self, size, pool=None):
+        # The core owns the pool (a resized list takes over the old one); each of its
+        # operations yields one event per step, which the methods below animate
+        if pool is None:
+            pool = NodePool(MAX_NODES, XorNode, with_prev=False)
+        self.core = XorCore(size, pool)
+        self.pool = self.core.pool
+        self.size = size
+        self.nodes = []
+
+        node_width = 90
+        gap_between_nodes = 35
+        null_space = 30
+        left_margin = 30
+
+        total_width_needed = (size * node_width) + ((size - 1) * gap_between_nodes) + null_space + left_margin
+        self.start_x_coord = max(30, (1000 - total_width_needed) // 2 + left_margin)
+        self.currentPos = (self.start_x_coord, 480)
+
+        self.search_stats = None  # (value, comparisons, walk pos, index pos) of the last search
+
+    @property
+    def length(self):
+        return self.core.length
+
+    @property
+    def head(self):
+        return self.pool.view(self.core.head)
+
+    @property
+    def tail(self):
+        return self.pool.view(self.core.tail)
+
+    def showNode(self, pos, slot, xy):
+        # The core's node for slot goes into the drawing order at 0-based pos
+        node = self.pool.views[slot]
+        node.place(xy)
+        self.nodes.insert(pos, node)
+        return node
+
+    def drawLinks(self, screen, drawNULL=True):
+        # One line per neighbouring pair, with a head at each end: both directions come from the same field
+        for left, right in zip(self.nodes, self.nodes[1:]):
+            start = (left.shape.right, left.shape.y + 35)
+            end = (right.shape.x, right.shape.y + 35)
+            pygame.draw.line(screen, Colors.LIGHT_GREY, start, end, 2)
+            blit_polygon(screen, NEXT_HEAD, Colors.LIGHT_GREY, *end)
+            blit_polygon(screen, PREV_HEAD, Colors.ORANGE, *start)
+
+        if not self.nodes or not drawNULL:
+            return
+        # NULL at both ends: address 0 is what both is XORed with there
+        first, last = self.nodes[0], self.nodes[-1]
+        y = last.shape.y + 35
+        null_x = last.shape.right + 30
+        pygame.draw.line(screen, Colors.LIGHT_GREY, (last.shape.right, y), (null_x, y), 2)
+        blit_polygon(screen, NEXT_HEAD, Colors.LIGHT_GREY, null_x, y)
+        screen.blit(null_labels.get(Colors.LIGHT_GREY), (null_x + 5, y - 10))
+
+        null_x = first.shape.x - 30
+        pygame.draw.line(screen, Colors.ORANGE, (first.shape.x, y), (null_x, y), 2)
+        blit_polygon(screen, PREV_HEAD, Colors.ORANGE, null_x, y)
+        screen.blit(null_labels.get(Colors.ORANGE), (max(5, null_x - 55), y - 10))
+
+    def drawList(self, screen, drawNULL=True):
+        self.drawLinks(screen, drawNULL)
+        for node in self.nodes:
+            node.draw(screen, self)
+
+    def _recalculate_positions(self):
+        start_x = self.start_x_coord
+        y_pos = 480
+        for node in self.nodes:
+            node.shape.x = start_x
+            node.shape.y = y_pos
+            start_x += 125
+        self.currentPos = (start_x, y_pos)
+
+    def _redraw(self, screen, drawNULL=True):
+        # Erase the list
+        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        self.drawList(screen, drawNULL=drawNULL)
+        update_status_ui(screen)
+        pygame.display.update()
+
+    def showLink(self, screen, event, message, logic):
+        # Animate a link event: the node's only field changes, so outline the node and show the XOR
+        _, slot, _, both, old = event
+        node = self.pool.views[slot]
+        set_status(message, Colors.ORANGE, f"{logic} = {both}  (was {old})")
+        pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 330))
+        self.drawList(screen)
+        node.draw(screen, self, highlight_color=Colors.ORANGE)
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(1000)
+
+    def moveTemp(self, screen, temp, event, target):
+        # Animate a visit event on the way to 0-based target: the core starts TEMP at whichever
+        # end is fewer steps away, and every hop XORs temp's link with where TEMP came from
+        _, name, slot, i, level = event
+        node = self.pool.views[slot]
+        if temp is None:
+            end = "tail" if level < 0 else "head"
+            set_status("Traversing...", Colors.ORANGE, f"> prev = NULL; temp = {end} ({abs(i - target)} steps)")
+        else:
+            if temp == self.head:
+                erase_pointer(screen, temp, "TEMP_ABOVE")
+            else:
+                erase_pointer(screen, temp, "TEMP")
+            came = i + 2 if level < 0 else i - 2  # Position TEMP reached temp from
+            prev = addr(self.nodes[came].idx) if 0 <= came < len(self.nodes) else 0
+            set_status("Traversing...", Colors.ORANGE,
+                       f"> temp = temp.both ^ prev = {temp.both} ^ {prev} = @{addr(slot)}")
+
+        if node == self.head:
+            draw_pointer_on_head(node, "TEMP", Colors.ORANGE, screen)
+        else:
+            draw_pointer(node, "TEMP", Colors.ORANGE, screen)
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(1000)
+        return node
+
+    def insertAtTail(self, data, screen):
+        for event in self.core.push_back(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "new":
+                self.showNode(len(self.nodes), event[1], self.currentPos)
+                self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
+
+                set_status(f"Node Added: {data}", Colors.GREEN, "> newNode = Node(data)")
+                self._redraw(screen)
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == self.core.tail:
+                self.showLink(screen, event, "Linking Tail...", "> tail.both = addr(tail.prev) ^ addr(newNode)")
+
+            elif kind == "link":
+                self.showLink(screen, event, "Linking New Node...", "> newNode.both = addr(tail) ^ 0")
+
+            elif kind == "set" and event[1] == "head":
+                set_status("Head & Tail Updated", Colors.GREEN, "> head = tail = newNode")
+
+            elif kind == "set":
+                set_status("Tail Updated!", Colors.GREEN, "> tail = newNode")
+
+        self._redraw(screen)
+        pygame.time.delay(500)
+
+    def insertAtHead(self, data, screen):
+        for event in self.core.push_front(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "new":
+                # Shift
+                if self.nodes:
+                    set_status("Shifting Nodes...", Colors.ORANGE, "> Shifting Right")
+                    pygame.draw.rect(screen, Colors.GREY, (0, 370, 1000, 280))
+                    for node in self.nodes:
+                        node.shape.x += 125
+                    self.drawList(screen, drawNULL=False)
+                    update_status_ui(screen)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
+
+                self.showNode(0, event[1], (self.start_x_coord, 480))
+
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data)")
+                self.currentPos = (self.currentPos[0] + 125, self.currentPos[1])
+                self._redraw(screen, drawNULL=False)
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == self.core.head:
+                self.showLink(screen, event, "Linking Head...", "> head.both = addr(newNode) ^ addr(head.next)")
+
+            elif kind == "link":
+                self.showLink(screen, event, "Linking New Node...", "> newNode.both = 0 ^ addr(head)")
+
+        set_status("Head Updated!", Colors.GREEN, "> head = newNode")
+        self._redraw(screen)
+        pygame.time.delay(500)
+
+    def insertAtPos(self, data, pos, screen):
+        # Edge cases; the core checks bounds and capacity
+        if pos == 1:
+            self.insertAtHead(data, screen)
+            return
+        if pos == self.length + 1:
+            self.insertAtTail(data, screen)
+            return
+
+        temp = newNode = None
+        for event in self.core.insert_at(pos - 1, data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit":
+                # Node before pos, from the nearer end
+                temp = self.moveTemp(screen, temp, event, pos - 2)
+
+            elif kind == "new":
+                set_status("Creating Node...", Colors.ORANGE, "> newNode = Node(data); after = temp.both ^ prev")
+
+                after = self.nodes[pos - 1]
+                newNode = self.pool.views[event[1]]
+                newNode.place((temp.shape.x + 60, temp.shape.y + 150))
+
+                # Floating node, joined to the two nodes it goes between
+                pygame.draw.line(screen, Colors.ORANGE, (temp.shape.centerx, temp.shape.bottom),
+                                 (newNode.shape.x, newNode.shape.centery), 2)
+                pygame.draw.line(screen, Colors.ORANGE, (newNode.shape.right, newNode.shape.centery),
+                                 (after.shape.centerx, after.shape.bottom), 2)
+                newNode.draw(screen, self)
+
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == newNode.idx:
+                set_status("Linking New Node...", Colors.ORANGE, f"> newNode.both = addr(temp) ^ addr(after) = {event[3]}")
+                newNode.draw(screen, self, highlight_color=Colors.ORANGE)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link" and event[1] == temp.idx:
+                set_status("Relinking Temp...", Colors.ORANGE,
+                           f"> temp.both ^= addr(after) ^ addr(newNode): {event[4]} -> {event[3]}")
+                temp.draw(screen, self, highlight_color=Colors.ORANGE)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                set_status("Relinking After...", Colors.ORANGE,
+                           f"> after.both ^= addr(temp) ^ addr(newNode): {event[4]} -> {event[3]}")
+                after.draw(screen, self, highlight_color=Colors.ORANGE)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "placed":
+                self.nodes.insert(event[1], newNode)
+                self._recalculate_positions()
+
+        self._redraw(screen)
+        set_status("Inserted!", Colors.GREEN, "> Success")
+        pygame.time.delay(500)
+
+    def deleteHead(self, screen):
+        old = None
+        for event in self.core.pop_front():
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit":
+                set_status("Deleting Head...", Colors.ORANGE, "> head = head.both ^ 0")
+
+                # Simple Red Border Highlight
+                old = self.pool.views[event[2]]
+                pygame.draw.rect(screen, Colors.RED, old.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "set" and event[1] == "head" and self.head:
+                erase_pointer(screen, old, "HEAD")
+                draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                self.showLink(screen, event, "Unlinking Old Head...", "> head.both ^= addr(old head)")
+
+            elif kind == "removed":
+                self.nodes.pop(event[1])
+
+        self._recalculate_positions()
+        self._redraw(screen)
+        set_status("Head Deleted!", Colors.GREEN, "> Success")
+        pygame.time.delay(500)
+
+    def deleteTail(self, screen):
+        if self.length < 2:
+            self.deleteHead(screen)
+            return
+
+        old = None
+        for event in self.core.pop_back():
+            kind = event[0]
+            if kind == "visit":
+                set_status("Deleting Tail...", Colors.ORANGE, "> tail = tail.both ^ 0")
+
+                # Simple Red Border Highlight
+                old = self.pool.views[event[2]]
+                pygame.draw.rect(screen, Colors.RED, old.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+                erase_pointer(screen, old, "TAIL")
+
+            elif kind == "set":
+                draw_pointer(self.tail, "TAIL", Colors.LIGHT_GREY, screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link":
+                self.showLink(screen, event, "Unlinking Old Tail...", "> tail.both ^= addr(old tail)")
+
+            elif kind == "removed":
+                self.nodes.pop(event[1])
+
+        self._recalculate_positions()
+        self._redraw(screen)
+        set_status("Tail Deleted!", Colors.GREEN, "> Success")
+        pygame.time.delay(500)
+
+    def deleteFromPos(self, pos, screen):
+        if pos < 1 or pos > self.length:
+            set_status("Invalid Position", Colors.RED, "> Out of bounds")
+            return
+        if pos == 1:
+            self.deleteHead(screen)
+            return
+        if pos == self.length:
+            self.deleteTail(screen)
+            return
+
+        temp = None
+        for event in self.core.remove_at(pos - 1):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit" and event[1] == "temp":
+                # Node at pos, from the nearer end
+                temp = self.moveTemp(screen, temp, event, pos - 1)
+
+            elif kind == "visit":
+                # The neighbours the walk already knows: one is where TEMP came from, the other its XOR
+                node = self.pool.views[event[2]]
+                label = event[1].upper()
+                draw_pointer(node, label, Colors.TEAL_BRIGHT, screen)
+                set_status("Finding Neighbours...", Colors.ORANGE, f"> {event[1]} = @{addr(event[2])} (pos {event[3] + 1})")
+                pygame.draw.rect(screen, Colors.RED, temp.shape, 2)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+
+            elif kind == "link" and self.nodes.index(self.pool.views[event[1]]) < pos - 1:
+                self.showLink(screen, event, "Bypassing Node...", "> prev.both ^= addr(temp) ^ addr(next)")
+
+            elif kind == "link":
+                self.showLink(screen, event, "Bypassing Node...", "> next.both ^= addr(temp) ^ addr(prev)")
+
+            elif kind == "removed":
+                self.nodes.pop(event[1])
+
+        self._recalculate_positions()
+        self._redraw(screen)
+        set_status("Deleted!", Colors.GREEN, "> Success")
+        pygame.time.delay(500)
+
+    def search(self, data, screen):
+        temp = None
+        for event in self.core.find(data):
+            kind = event[0]
+            if kind == "error":
+                set_status(event[1], Colors.RED, event[2])
+                return
+
+            if kind == "visit":
+                if temp is None:
+                    set_status(f"Searching {data}...", Colors.ORANGE, "> prev = NULL; temp = head")
+                temp = self.moveTemp(screen, temp, event, event[3])
+
+            elif kind == "found":
+                _, slot, idx, comparisons = event
+                if slot != NIL:
+                    # Orange Background Fill using the modified draw method
+                    temp.draw(screen, self, highlight_color=Colors.ORANGE, fill=True)
+
+                    set_status(f"Found {data} at Pos {idx + 1}", Colors.GREEN, f"> return {idx + 1}")
+                    update_status_ui(screen)
+                    pygame.display.update()
+                    pygame.time.delay(1000)
+
+        # No value index here: without express lanes there is nothing to turn its slots into positions
+        self.search_stats = (data, comparisons, idx + 1 if slot != NIL else -1, None)
+
+        if slot == NIL:
+            set_status("Value Not Found", Colors.RED, f"> walk: {comparisons} compares")
+
+        self._redraw(screen)
+
+    def destroy(self, screen):
+        set_status("Clearing...", Colors.ORANGE, "> while head != None")
+        update_status_ui(screen)
+        pygame.display.update()
+        pygame.time.delay(500)
+        for event in self.core.clear():
+            kind = event[0]
+            if kind == "visit":
+                erase_pointer(screen, self.head, "HEAD")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
+
+            elif kind == "set" and event[1] == "head":
+                if self.head:
+                    draw_pointer(self.head, "HEAD", Colors.LIGHT_GREY, screen)
+                set_status("Clearing...", Colors.ORANGE, "> head = head.both ^ 0")
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(500)
+
+            elif kind == "removed":
+                self.nodes.pop(event[1])
+
+                set_status("Clearing...", Colors.ORANGE, "> del old head")
+                self._redraw(screen)
+                update_status_ui(screen)
+                pygame.display.update()
+                pygame.time.delay(1000)
+                set_status("Clearing...", Colors.ORANGE, "> while head != None")
+        self.currentPos = (self.start_x_coord, 480)
+        self.search_stats = None
+        set_status("List Cleared", Colors.GREEN, "> Success")
+
+
+def run(screen):
+    # Text rendering
+    title = titleFont.render("XOR Linked List", True, Colors.TEAL)
+    cap_value_txt = paraFont.render("Capacity (Max 6): ", True, Colors.LIGHT_GREY)
+    value_txt_1 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
+    value_txt_2 = paraFont.render("Value: ", True, Colors.LIGHT_GREY)
+    pos_txt_1 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
+    pos_txt_2 = paraFont.render("Pos: ", True, Colors.LIGHT_GREY)
+    legend_txt = subFont.render("Each node keeps one link: both = addr(prev) ^ addr(next), with addr(NULL) = 0",
+                                True, Colors.LIGHT_GREY)
+
+    xll = XLL(6)
+
+    cap_bar = InputBar(100, 145, 130, 40, Colors.BLACK)
+    cap_bar.text = "6"
+    node_bar = InputBar(100, 230, 130, 40, Colors.BLACK, 4)
+    pos_insert_bar = InputBar(100, 315, 130, 40, Colors.BLACK, 2)
+    pos_delete_bar = InputBar(380, 315, 130, 40, Colors.BLACK, 2)
+    search_val_bar = InputBar(660, 315, 120, 40, Colors.BLACK, 2)
+
+    set_max_button = Button(240, 145, 120, 40, "Set Max", None, 18)
+    insert_tail_button = Button(240, 230, 120, 40, "Insert Tail", None, 18)
+    insert_head_button = Button(370, 230, 120, 40, "Insert Head", None, 18)
+    insert_at_pos_button = Button(240, 315, 120, 40, "Insert", None, 18)
+    delete_head_button = Button(500, 170, 130, 50, "Delete Head", None, 18)
+    delete_tail_button = Button(640, 170, 130, 50, "Delete Tail", None, 18)
+    destroy_button = Button(780, 170, 130, 50, "Destroy", None, 18)
+    delete_at_pos_button = Button(520, 315, 120, 40, "Delete", None, 18)
+    search_button = Button(790, 315, 120, 40, "Search", None, 18)
+    back_button = Button(930, 15, 70, 35, "← Back", None, 18)
+    pool_button = Button(370, 145, 105, 40, "Pool: Off", None, 18)
+    show_pool = False
+
+    ui = WidgetIndex([set_max_button, insert_tail_button, insert_head_button, insert_at_pos_button,
+                      delete_head_button, delete_tail_button, destroy_button, delete_at_pos_button,
+                      search_button, back_button, pool_button, cap_bar, node_bar, pos_insert_bar,
+                      pos_delete_bar, search_val_bar])
+
+    running = True
+    sched = FrameScheduler()
+
+    while running:
+        screen.fill(Colors.GREY)
+
+        screen.blit(title, (50, 40))
+        screen.blit(legend_txt, (50, 88))
+        screen.blit(cap_value_txt, (100, 115))
+        screen.blit(value_txt_1, (100, 200))
+        screen.blit(value_txt_2, (660, 285))
+        screen.blit(pos_txt_1, (100, 285))
+        screen.blit(pos_txt_2, (380, 285))
+
+        set_max_button.draw(screen)
+        insert_tail_button.draw(screen)
+        insert_head_button.draw(screen)
+        insert_at_pos_button.draw(screen)
+        delete_head_button.draw(screen)
+        delete_tail_button.draw(screen)
+        destroy_button.draw(screen)
+        delete_at_pos_button.draw(screen)
+        search_button.draw(screen)
+        back_button.draw(screen)
+        pool_button.draw(screen)
+
+        cap_bar.draw(screen)
+        node_bar.draw(screen)
+        pos_insert_bar.draw(screen)
+        pos_delete_bar.draw(screen)
+        search_val_bar.draw(screen)
+
+        xll.drawList(screen)
+        if show_pool:
+            draw_pool(xll.pool, screen)
+        draw_search_stats(xll.search_stats, screen)
+        update_status_ui(screen)
+
+        for event in sched.events():
+            ui.dispatch(event)
+            if event.type == pygame.QUIT:
+                pygame.quit()
+
+            cap_bar.handle_input(event)
+            node_bar.handle_input(event)
+            pos_insert_bar.handle_input(event)
+            pos_delete_bar.handle_input(event)
+            search_val_bar.handle_input(event)
+
+            if set_max_button.is_clicked(event):
+                if cap_bar.text.isdigit() and 0 < int(cap_bar.text) <= 6:
+                    xll = XLL(int(cap_bar.text), xll.pool)
+                    set_status(f"Max Set to {cap_bar.text}", Colors.GREEN)
+                else:
+                    set_status("Invalid Max (1-6)", Colors.RED)
+
+            if insert_tail_button.is_clicked(event):
+                if node_bar.text:
+                    xll.insertAtTail(node_bar.text, screen)
+                    node_bar.text = ""
+                    set_status("Inserted at tail", Colors.GREEN)
+                else:
+                    set_status("Input Value", Colors.RED)
+
+            if insert_head_button.is_clicked(event):
+                if node_bar.text:
+                    xll.insertAtHead(node_bar.text, screen)
+                    node_bar.text = ""
+                    set_status("Inserted at head", Colors.GREEN)
+                else:
+                    set_status("Input Value", Colors.RED)
+
+            if insert_at_pos_button.is_clicked(event):
+                if node_bar.text and pos_insert_bar.text.isdigit():
+                    xll.insertAtPos(node_bar.text, int(pos_insert_bar.text), screen)
+                    pos_insert_bar.text = ""
+                    set_status("Inserted at position", Colors.GREEN)
+                else:
+                    set_status("Check Inputs", Colors.RED)
+
+            if delete_head_button.is_clicked(event):
+                xll.deleteHead(screen)
+                set_status("Deleted from head", Colors.GREEN)
+
+            if delete_tail_button.is_clicked(event):
+                xll.deleteTail(screen)
+                set_status("Deleted from tail", Colors.GREEN)
+
+            if destroy_button.is_clicked(event):
+                xll.destroy(screen)
+                set_status("List destroyed", Colors.GREEN)
+
+            if delete_at_pos_button.is_clicked(event):
+                if pos_delete_bar.text.isdigit():
+                    xll.deleteFromPos(int(pos_delete_bar.text), screen)
+                    pos_delete_bar.text = ""
+                    set_status("Deleted from position", Colors.GREEN)
+                else:
+                    set_status("Invalid Position", Colors.RED)
+
+            if search_button.is_clicked(event):
+                if search_val_bar.text:
+                    xll.search(search_val_bar.text, screen)
+                    set_status("Search completed", Colors.GREEN)
+                else:
+                    set_status("Input Value", Colors.RED)
+
+            if pool_button.is_clicked(event):
+                show_pool = not show_pool
+                pool_button.text = "Pool: On" if show_pool else "Pool: Off"
+
+            if back_button.is_clicked(event):
+                return "back"
+
+        update_status_ui(screen)
+        pygame.display.update()
+        sched.sleep()
+
+    return "back"
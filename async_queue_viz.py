@@ -0,0 +1,278 @@
+import pygame
+import asyncio
+from collections import deque
+import Colors
+import widgets
+from queue_viz import (
+    Button, InputBox, font_title, font_ui, font_elem, font_index, font_logic,
+    BACKGROUND_COLOR, ELEMENT_COLOR, HOVER_COLOR, HIGHLIGHT_COLOR, TEXT_COLOR,
+    CONTAINER_COLOR, ERROR_COLOR, SUCCESS_COLOR
+)
+
+# --- Configuration ---
+MAX_ASYNC_CAPACITY = 20
+FRAME_SECONDS = 1 / 60
+RATES = [1, 2, 5, 10, 20, 50]        # Items per second, per producer / per consumer
+DEPTH_SAMPLE_SECONDS = 0.1
+DEPTH_HISTORY = 300                  # 30 s of queue depth samples
+LATENCY_WINDOW = 500                 # Percentiles over the last N items
+
+IDLE_COLOR = (80, 80, 80)
+BLOCKED_COLOR = HIGHLIGHT_COLOR
+
+# Layout
+QUEUE_X = 330
+QUEUE_Y = 200
+QUEUE_W = 600
+SLOT_H = 50
+CHART = pygame.Rect(330, 400, 600, 150)
+
+
+def percentile(sorted_vals, p):
+    if not sorted_vals:
+        return 0.0
+    k = min(len(sorted_vals) - 1, int(round(p / 100 * (len(sorted_vals) - 1))))
+    return sorted_vals[k]
+
+
+# --- Main Run Function ---
+def run(screen):
+    # The scene is one coroutine: pygame frames and the producer/consumer tasks share an event loop
+    return asyncio.run(run_async(screen))
+
+
+async def run_async(screen):
+    loop = asyncio.get_running_loop()
+
+    sim = {
+        "queue": None,
+        "waiting": deque(),  # the items in the queue, front first, mirrored next to put/get
+        "tasks": [],
+        "capacity": 6,
+        "producers": 2,
+        "consumers": 1,
+        "prod_rate": 5,
+        "cons_rate": 5,
+        "next_id": 1,
+        "completed": 0,
+        "blocked": {},       # worker name -> True while waiting on put (full) / get (empty)
+        "latencies": deque(maxlen=LATENCY_WINDOW),
+        "depth": deque(maxlen=DEPTH_HISTORY),
+        "throughput": 0.0,
+        "by_capacity": {},   # capacity -> last measured throughput
+        "window_start": 0.0,
+        "window_done": 0
+    }
+
+    state = {
+        "status_message": "Async Producer / Consumer",
+        "status_color": TEXT_COLOR,
+        "logic_message": "await queue.put(item) blocks when full"
+    }
+
+    cap_input = InputBox(50, 100, 80, 40, text=str(sim["capacity"]), is_numeric_only=True, max_chars=2)
+
+    def set_status(msg, color, logic_msg=""):
+        state["status_message"] = msg
+        state["status_color"] = color
+        state["logic_message"] = logic_msg
+
+    # --- Simulated Workers ---
+    async def producer(name, q):
+        while True:
+            await asyncio.sleep(1 / sim["prod_rate"])
+            item = (sim["next_id"], loop.time())
+            sim["next_id"] += 1
+            sim["blocked"][name] = q.full()
+            await q.put(item)  # Suspends this producer (only) while the queue is full
+            sim["waiting"].append(item)
+            sim["blocked"][name] = False
+
+    async def consumer(name, q):
+        while True:
+            sim["blocked"][name] = q.empty()
+            item_id, created = await q.get()
+            sim["waiting"].popleft()
+            sim["blocked"][name] = False
+            await asyncio.sleep(1 / sim["cons_rate"])  # Service time
+            sim["latencies"].append(loop.time() - created)
+            sim["completed"] += 1
+            q.task_done()
+
+    async def sampler(q):
+        while True:
+            sim["depth"].append(q.qsize())
+            await asyncio.sleep(DEPTH_SAMPLE_SECONDS)
+
+    def restart():
+        """ (Re)create the bounded queue and all tasks with the current settings """
+        for t in sim["tasks"]:
+            t.cancel()
+        q = asyncio.Queue(maxsize=sim["capacity"])
+        sim["queue"] = q
+        sim["waiting"].clear()
+        sim["blocked"] = {}
+        sim["latencies"].clear()
+        sim["depth"].clear()
+        sim["window_start"] = loop.time()
+        sim["window_done"] = sim["completed"]
+        sim["tasks"] = (
+            [asyncio.create_task(producer(f"P{i + 1}", q)) for i in range(sim["producers"])]
+            + [asyncio.create_task(consumer(f"C{i + 1}", q)) for i in range(sim["consumers"])]
+            + [asyncio.create_task(sampler(q))]
+        )
+
+    # --- Button Actions ---
+    def set_capacity():
+        try:
+            if not cap_input.text: return
+            new_cap = int(cap_input.text)
+            if new_cap > MAX_ASYNC_CAPACITY:
+                set_status(f"Error: Max Limit is {MAX_ASYNC_CAPACITY}!", ERROR_COLOR, f"Constraint: Capacity <= {MAX_ASYNC_CAPACITY}")
+                return
+            if new_cap < 1:
+                set_status("Capacity must be >= 1", ERROR_COLOR, "Error: Invalid Size")
+                return
+            sim["capacity"] = new_cap
+            restart()
+            set_status(f"Capacity set to {new_cap}", SUCCESS_COLOR, f"asyncio.Queue(maxsize={new_cap})")
+        except ValueError:
+            set_status("Invalid Capacity", ERROR_COLOR)
+
+    def cycle(key, options, label):
+        sim[key] = options[(options.index(sim[key]) + 1) % len(options)]
+        restart()
+        set_status(f"{label}: {sim[key]}", SUCCESS_COLOR, "Tasks restarted")
+
+    def go_back():
+        return "back"
+
+    btn_set_cap = Button(140, 100, 100, 40, "Set Cap", set_capacity)
+    btn_prod_n = Button(50, 180, 120, 40, "Producers", lambda: cycle("producers", [1, 2, 3, 4], "Producers"))
+    btn_cons_n = Button(180, 180, 120, 40, "Consumers", lambda: cycle("consumers", [1, 2, 3, 4], "Consumers"))
+    btn_prod_r = Button(50, 260, 120, 40, "Prod Rate", lambda: cycle("prod_rate", RATES, "Producer rate"))
+    btn_cons_r = Button(180, 260, 120, 40, "Cons Rate", lambda: cycle("cons_rate", RATES, "Consumer rate"))
+    btn_back = Button(900, 15, 80, 40, "← Back", go_back)
+
+    buttons = [btn_set_cap, btn_prod_n, btn_cons_n, btn_prod_r, btn_cons_r, btn_back]
+    input_boxes = [cap_input]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
+
+    # --- Drawing Helpers ---
+    def draw_workers(names, x, label):
+        screen.blit(font_ui.render(label, True, TEXT_COLOR), (x - 20, QUEUE_Y - 75))
+        for i, name in enumerate(names):
+            cy = QUEUE_Y - 40 + i * 30
+            blocked = sim["blocked"].get(name, False)
+            pygame.draw.circle(screen, BLOCKED_COLOR if blocked else ELEMENT_COLOR, (x, cy), 11)
+            screen.blit(font_index.render(name, True, TEXT_COLOR), (x + 16, cy - 6))
+
+    def draw_queue():
+        cap = sim["capacity"]
+        slot_w = QUEUE_W / cap
+        items = sim["waiting"]
+
+        pygame.draw.line(screen, CONTAINER_COLOR, (QUEUE_X, QUEUE_Y + 80), (QUEUE_X + QUEUE_W, QUEUE_Y + 80), 3)
+        pygame.draw.line(screen, CONTAINER_COLOR, (QUEUE_X, QUEUE_Y + 90 + SLOT_H), (QUEUE_X + QUEUE_W, QUEUE_Y + 90 + SLOT_H), 3)
+        for i in range(cap):
+            rect = pygame.Rect(QUEUE_X + i * slot_w + 2, QUEUE_Y + 85, slot_w - 4, SLOT_H)
+            if i < len(items):
+                pygame.draw.rect(screen, ELEMENT_COLOR, rect, border_radius=6)
+                if slot_w >= 40:
+                    txt = font_elem.render(str(items[i][0]), True, TEXT_COLOR)
+                    screen.blit(txt, txt.get_rect(center=rect.center))
+            else:
+                pygame.draw.rect(screen, IDLE_COLOR, rect, 1, border_radius=6)
+
+    def draw_depth_chart():
+        pygame.draw.rect(screen, Colors.BLACK, CHART, border_radius=6)
+        screen.blit(font_ui.render("Queue depth over time", True, TEXT_COLOR), (CHART.x, CHART.y - 25))
+        cap = sim["capacity"]
+        top = CHART.y + 10
+        usable = CHART.height - 20
+
+        # Capacity line
+        pygame.draw.line(screen, HIGHLIGHT_COLOR, (CHART.x, top), (CHART.right, top), 1)
+        screen.blit(font_index.render(f"cap {cap}", True, HIGHLIGHT_COLOR), (CHART.right - 45, top + 3))
+
+        samples = list(sim["depth"])
+        if len(samples) >= 2:
+            dx = CHART.width / (DEPTH_HISTORY - 1)
+            points = [(CHART.x + i * dx, top + usable - usable * d / cap) for i, d in enumerate(samples)]
+            pygame.draw.lines(screen, HOVER_COLOR, False, points, 2)
+
+    def draw_stats(now):
+        lat = sorted(sim["latencies"])
+        p50, p95, p99 = (percentile(lat, p) * 1000 for p in (50, 95, 99))
+        lines = [
+            f"Producers: {sim['producers']} x {sim['prod_rate']}/s",
+            f"Consumers: {sim['consumers']} x {sim['cons_rate']}/s",
+            f"Throughput: {sim['throughput']:.1f} items/s",
+            f"Latency p50: {p50:.0f} ms",
+            f"Latency p95: {p95:.0f} ms",
+            f"Latency p99: {p99:.0f} ms",
+        ]
+        for k, line in enumerate(lines):
+            screen.blit(font_logic.render(line, True, TEXT_COLOR), (50, 330 + k * 22))
+
+        # Throughput measured at each capacity tried so far
+        screen.blit(font_ui.render("Capacity -> Throughput", True, TEXT_COLOR), (50, 475))
+        for k, (cap, tp) in enumerate(sorted(sim["by_capacity"].items())[:8]):
+            col = HIGHLIGHT_COLOR if cap == sim["capacity"] else TEXT_COLOR
+            screen.blit(font_logic.render(f"cap {cap:>2}: {tp:.1f} items/s", True, col), (50, 500 + k * 20))
+
+    # --- Main Loop (a coroutine: await instead of clock.tick) ---
+    restart()
+    try:
+        while True:
+            now = loop.time()
+
+            # Throughput over a rolling 2 s window
+            if now - sim["window_start"] >= 2.0:
+                sim["throughput"] = (sim["completed"] - sim["window_done"]) / (now - sim["window_start"])
+                sim["by_capacity"][sim["capacity"]] = sim["throughput"]
+                sim["window_start"], sim["window_done"] = now, sim["completed"]
+
+            for event in pygame.event.get():
+                target = ui.dispatch(event)
+                if event.type == pygame.QUIT:
+                    return "quit"
+
+                for box in input_boxes:
+                    box.handle_event(event)
+
+                if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                    if target.click() == "back":
+                        return "back"
+
+            # --- Drawing ---
+            screen.fill(BACKGROUND_COLOR)
+
+            title_surf = font_title.render("ASYNC QUEUE", True, ELEMENT_COLOR)
+            screen.blit(title_surf, (50, 30))
+
+            status_surf = font_ui.render(state["status_message"], True, state["status_color"])
+            screen.blit(status_surf, (350, 30))
+            logic_label = font_ui.render("Logic Flow:", True, Colors.LIGHT_GREY)
+            screen.blit(logic_label, (350, 60))
+            logic_surf = font_logic.render(f"> {state['logic_message']}", True, Colors.TEAL_BRIGHT)
+            screen.blit(logic_surf, (350, 85))
+
+            screen.blit(font_ui.render(f"Capacity (Max {MAX_ASYNC_CAPACITY}):", True, Colors.LIGHT_GREY), (50, 65))
+            screen.blit(font_ui.render("Workers:", True, Colors.LIGHT_GREY), (50, 155))
+            screen.blit(font_ui.render("Rates:", True, Colors.LIGHT_GREY), (50, 235))
+
+            for box in input_boxes: box.draw(screen)
+            for btn in buttons: btn.draw(screen)
+
+            draw_workers([f"P{i + 1}" for i in range(sim["producers"])], QUEUE_X + 20, "Producers")
+            draw_workers([f"C{i + 1}" for i in range(sim["consumers"])], QUEUE_X + QUEUE_W - 100, "Consumers")
+            draw_queue()
+            draw_depth_chart()
+            draw_stats(now)
+
+            pygame.display.flip()
+            await asyncio.sleep(FRAME_SECONDS)
+    finally:
+        for t in sim["tasks"]:
+            t.cancel()
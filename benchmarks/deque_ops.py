@@ -0,0 +1,50 @@
+"""
+Headless benchmark: the deque scene's block-linked model (deque_core.BlockDeque)
+vs a list-based deque (insert(0) / pop(0) at the front, like the old queue
+scene's list), with collections.deque as the C reference.
+
+Each round pushes and pops at both ends around a steady backlog of items,
+so the list has to shift the whole backlog on every front operation.
+
+Run from the repository root:
+    python -m benchmarks.deque_ops
+"""
+import time
+from collections import deque
+
+from deque_core import BlockDeque, ListDeque
+
+ROUNDS = 10 ** 5  # Each round: appendleft, append, popleft, pop
+BACKLOGS = [0, 1000, 10000, 100000]
+
+
+def churn(dq, backlog):
+    for i in range(backlog):
+        dq.append(i)
+    for i in range(ROUNDS):
+        dq.appendleft(i)
+        dq.append(i)
+        dq.popleft()
+        dq.pop()
+
+
+def time_it(factory, backlog):
+    dq = factory()
+    start = time.perf_counter()
+    churn(dq, backlog)
+    return time.perf_counter() - start, dq
+
+
+def main():
+    print(f"{ROUNDS} rounds of appendleft/append/popleft/pop")
+    print(f"{'backlog':>9}{'list (s)':>12}{'blocks (s)':>13}{'deque (s)':>12}{'blocks vs list':>17}{'blocks alloc/freed':>21}")
+    for backlog in BACKLOGS:
+        t_list, _ = time_it(ListDeque, backlog)
+        t_block, bd = time_it(BlockDeque, backlog)
+        t_deque, _ = time_it(deque, backlog)
+        print(f"{backlog:>9}{t_list:>12.3f}{t_block:>13.3f}{t_deque:>12.3f}"
+              f"{t_list / t_block:>16.1f}x{f'{bd.allocated}/{bd.freed}':>21}")
+
+
+if __name__ == "__main__":
+    main()
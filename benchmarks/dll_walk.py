@@ -0,0 +1,88 @@
+"""
+Headless benchmark: reaching position k in a doubly linked list.
+
+Builds an N-node NodePool list with prev links and times a batch of random
+positional lookups walked three ways: always forward from the head, from
+whichever end is nearer (next from the head or prev from the tail), and the
+way DoublyLinkedList.DLL.walkTo does it, the cheaper of express-lane hops
+from the head and prev steps from the tail.
+
+Run from the repository root:
+    python -m benchmarks.dll_walk
+"""
+import random
+import time
+
+from express_lanes import ExpressLanes
+from node_pool import NodePool
+
+N = 10 ** 4
+QUERIES = 2000
+
+
+def build(n):
+    pool = NodePool(n)
+    head = tail = pool.alloc(0)
+    for i in range(1, n):
+        idx = pool.alloc(i)
+        pool.next[tail] = idx
+        pool.prev[idx] = tail
+        tail = idx
+    return pool, head, tail
+
+
+def from_head(pool, head, tail, pos):
+    i = head
+    for _ in range(pos):
+        i = pool.next[i]
+    return i, pos
+
+
+def nearer_end(pool, head, tail, pos):
+    back = N - 1 - pos
+    if pos <= back:
+        return from_head(pool, head, tail, pos)
+    i = tail
+    for _ in range(back):
+        i = pool.prev[i]
+    return i, back
+
+
+def lanes_or_tail(lanes):
+    def walk(pool, head, tail, pos):
+        back = N - 1 - pos
+        path = lanes.path(pos)
+        if back >= len(path):
+            return path[-1][1], len(path)
+        i = tail
+        for _ in range(back):
+            i = pool.prev[i]
+        return i, back
+    return walk
+
+
+def main():
+    pool, head, tail = build(N)
+    lanes = ExpressLanes(N, seed=0)
+    for pos in range(N):
+        lanes.insert(pos, pos)  # build() hands out slots in order
+    rng = random.Random(0)
+    queries = [rng.randrange(N) for _ in range(QUERIES)]
+
+    print(f"{N} nodes, {QUERIES} random positions")
+    print(f"{'walk':>18}{'total (ms)':>12}{'avg steps':>12}")
+    expected = None
+    for name, walk in [("head only", from_head), ("nearer end", nearer_end),
+                       ("lanes or tail", lanes_or_tail(lanes))]:
+        start = time.perf_counter()
+        found = [walk(pool, head, tail, pos) for pos in queries]
+        elapsed = time.perf_counter() - start
+        slots = [slot for slot, _ in found]
+        assert expected is None or slots == expected
+        expected = slots
+        steps = sum(s for _, s in found) / QUERIES
+        print(f"{name:>18}{elapsed * 1e3:>12.1f}{steps:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
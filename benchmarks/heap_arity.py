@@ -0,0 +1,36 @@
+"""
+Headless benchmark: insert / extract throughput of the heap core for
+arity d = 2..8 (n pushes of random values, then n pops).
+
+Run from the repository root:
+    python -m benchmarks.heap_arity
+"""
+import operator
+import random
+import time
+
+from heap_core import Heap, MIN_ARITY, MAX_ARITY
+
+SIZES = [10 ** 5, 10 ** 6]
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'n':>10}{'d':>4}{'insert (s)':>13}{'extract (s)':>14}{'comparisons':>14}{'moves':>12}")
+    for n in SIZES:
+        values = [rng.randint(0, n) for _ in range(n)]
+        for d in range(MIN_ARITY, MAX_ARITY + 1):
+            pq = Heap(operator.lt, capacity=n, arity=d)
+            t_ins = time_it(lambda: [pq.push(v) for v in values])
+            t_ext = time_it(lambda: [pq.pop() for _ in range(n)])
+            print(f"{n:>10}{d:>4}{t_ins:>13.3f}{t_ext:>14.3f}{pq.comparisons:>14}{pq.moves:>12}")
+
+
+if __name__ == "__main__":
+    main()
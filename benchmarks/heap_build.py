@@ -0,0 +1,47 @@
+"""
+Headless benchmark: Floyd's bottom-up build_heap vs n sequential inserts.
+
+Run from the repository root:
+    python -m benchmarks.heap_build
+"""
+import operator
+import random
+import time
+
+from heap_core import Heap
+
+SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def sequential_inserts(higher, values):
+    pq = Heap(higher, capacity=len(values))
+    for v in values:
+        pq.push(v)
+    return pq
+
+
+def bottom_up(higher, values):
+    pq = Heap(higher, capacity=len(values))
+    pq.build_heap(values)
+    return pq
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'heap':<8}{'n':>10}{'n inserts (s)':>16}{'build_heap (s)':>16}{'speedup':>10}")
+    for label, higher in (("max", operator.gt), ("min", operator.lt)):
+        for n in SIZES:
+            values = [rng.randint(0, n) for _ in range(n)]
+            t_seq = time_it(lambda: sequential_inserts(higher, values))
+            t_build = time_it(lambda: bottom_up(higher, values))
+            print(f"{label:<8}{n:>10}{t_seq:>16.3f}{t_build:>16.3f}{t_seq / t_build:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
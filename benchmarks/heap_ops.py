@@ -0,0 +1,108 @@
+"""
+Headless benchmark: insert / extract throughput of the shared heap core
+against the previous recursive, swap-based MaxHeap (kept below verbatim as
+the "before" baseline), plus the cost of recording step traces.
+
+Run from the repository root:
+    python -m benchmarks.heap_ops
+"""
+import operator
+import random
+import time
+import tracemalloc
+
+from heap_core import Heap
+
+SIZES = [10 ** 4, 10 ** 5, 10 ** 6]
+
+
+class LegacyMaxHeap:
+    """ max_heap.MaxHeap before the shared core: tuple swaps and recursive heapify """
+    def __init__(self, capacity=15):
+        self.heap = []
+        self.capacity = capacity
+
+    def parent(self, i): return (i - 1) // 2
+    def left(self, i): return 2 * i + 1
+    def right(self, i): return 2 * i + 2
+
+    def swap(self, i, j):
+        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+
+    def insert(self, val):
+        self.heap.append(val)
+        index = len(self.heap) - 1
+        while index > 0 and self.heap[index] > self.heap[self.parent(index)]:
+            self.swap(index, self.parent(index))
+            index = self.parent(index)
+
+    def extract_max(self):
+        max_item = self.heap[0]
+        last_item = self.heap.pop()
+        if self.heap:
+            self.heap[0] = last_item
+            self.max_heapify(0)
+        return max_item
+
+    def max_heapify(self, i):
+        largest = i
+        l = self.left(i)
+        r = self.right(i)
+        if l < len(self.heap) and self.heap[l] > self.heap[largest]:
+            largest = l
+        if r < len(self.heap) and self.heap[r] > self.heap[largest]:
+            largest = r
+        if largest != i:
+            self.swap(i, largest)
+            self.max_heapify(largest)
+
+
+def time_it(func):
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+def trace_cost(values):
+    """ Time and peak allocation of push+pop with tracing off (None) and on (a list) """
+    rows = []
+    for label, make_trace in (("off", lambda: None), ("on", list)):
+        pq = Heap(operator.gt, capacity=len(values))
+        tracemalloc.start()
+        start = time.perf_counter()
+        for v in values:
+            pq.push(v, make_trace())
+        for _ in range(len(values)):
+            pq.pop(make_trace())
+        elapsed = time.perf_counter() - start
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        rows.append((label, elapsed, peak))
+    return rows
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'n':>10}{'op':>9}{'before (s)':>13}{'after (s)':>12}{'speedup':>10}")
+    for n in SIZES:
+        values = [rng.randint(0, n) for _ in range(n)]
+        old = LegacyMaxHeap(capacity=n)
+        new = Heap(operator.gt, capacity=n)
+
+        ins_old = time_it(lambda: [old.insert(v) for v in values])
+        ins_new = time_it(lambda: [new.push(v) for v in values])
+        ext_old = time_it(lambda: [old.extract_max() for _ in range(n)])
+        ext_new = time_it(lambda: [new.pop() for _ in range(n)])
+
+        print(f"{n:>10}{'insert':>9}{ins_old:>13.3f}{ins_new:>12.3f}{ins_old / ins_new:>9.1f}x")
+        print(f"{n:>10}{'extract':>9}{ext_old:>13.3f}{ext_new:>12.3f}{ext_old / ext_new:>9.1f}x")
+        print(f"{'':>10}{'':>9}  core counters: {new.comparisons} comparisons, {new.moves} moves")
+
+    n = 2000  # traces snapshot the whole array per step, so keep this small
+    print(f"\ntrace recording, {n} push + {n} pop")
+    for label, elapsed, peak in trace_cost([rng.randint(0, n) for _ in range(n)]):
+        print(f"  trace {label:<4}{elapsed:>8.3f} s   peak alloc {peak / 1024:>8.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
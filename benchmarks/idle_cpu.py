@@ -0,0 +1,89 @@
+"""
+CPU use of the menu and the visualizer loops while nobody touches them.
+
+Each scene is opened with nothing playing and left alone for SECONDS, then
+closed by a timer-posted click on its Back button (the menu by a QUIT). It
+runs twice: once with frame_scheduler.IDLE_SLEEP off, which is the old
+loop that polls events and redraws at 60 fps forever, and once with it on,
+where the loop blocks in pygame.event.wait until input or a timer is due.
+Reports frames drawn per second and CPU time as a share of wall time, on an
+off-screen display with SDL's dummy video driver.
+
+Run from the repository root:
+    python -m benchmarks.idle_cpu
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+import frame_scheduler
+
+SECONDS = 3
+
+# (module, where its Back button is); None closes with QUIT instead
+SCENES = [
+    ("main", None),
+    ("SinglyLinkedList", (965, 32)),
+    ("SkipList", (965, 32)),
+    ("bubble_sort_viz", (940, 35)),
+    ("min_heap", (940, 35)),
+    ("tree2", (940, 40)),
+    ("queue_viz", (940, 35)),
+    ("deque_viz", (940, 35)),
+]
+
+
+def open_scene(name, screen):
+    module = __import__(name)
+    if name == "main":
+        return module.run_main_game
+    return lambda: module.run(screen)
+
+
+def measure(run, back):
+    if back is None:
+        leave = pygame.event.Event(pygame.QUIT)
+    else:
+        leave = pygame.event.Event(pygame.MOUSEBUTTONDOWN, pos=back, button=1)
+    pygame.event.clear()
+    pygame.time.set_timer(leave, SECONDS * 1000, loops=1)
+
+    frames = [0]
+    flip, update = pygame.display.flip, pygame.display.update
+
+    def count(draw):
+        def counted(*args):
+            frames[0] += 1
+            return draw(*args)
+        return counted
+
+    pygame.display.flip, pygame.display.update = count(flip), count(update)
+    try:
+        wall, cpu = time.perf_counter(), time.process_time()
+        run()
+        wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+    finally:
+        pygame.display.flip, pygame.display.update = flip, update
+    return frames[0] / wall, cpu / wall
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1000, 700))
+    print(f"idle for {SECONDS} s per scene")
+    print(f"{'scene':>18}{'poll fps':>10}{'poll cpu':>10}{'sleep fps':>11}{'sleep cpu':>11}")
+    for name, back in SCENES:
+        run = open_scene(name, screen)
+        row = []
+        for idle_sleep in (False, True):
+            frame_scheduler.IDLE_SLEEP = idle_sleep
+            row += measure(run, back)
+        poll_fps, poll_cpu, sleep_fps, sleep_cpu = row
+        print(f"{name:>18}{poll_fps:>10.1f}{poll_cpu:>10.1%}{sleep_fps:>11.1f}{sleep_cpu:>11.1%}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
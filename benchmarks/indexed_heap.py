@@ -0,0 +1,90 @@
+"""
+Headless benchmark: Dijkstra on a random sparse graph, run with the
+IndexedMinHeap (decrease_key in place) and with a plain heap using lazy
+deletion (push a duplicate entry, skip stale ones on pop).
+
+Run from the repository root:
+    python -m benchmarks.indexed_heap
+"""
+import operator
+import random
+import time
+
+from heap_core import Heap, IndexedMinHeap
+
+SIZES = [10 ** 4, 10 ** 5]
+EDGES_PER_NODE = 8
+
+
+def random_graph(n, rng):
+    adj = [[] for _ in range(n)]
+    for u in range(n):
+        for _ in range(EDGES_PER_NODE):
+            adj[u].append((rng.randrange(n), rng.randint(1, 100)))
+    return adj
+
+
+def dijkstra_indexed(adj):
+    n = len(adj)
+    dist = [None] * n
+    pq = IndexedMinHeap(capacity=n)
+    pq.push(0, 0)
+    pushes = peak = 1
+    while pq.heap:
+        u, d = pq.pop()
+        dist[u] = d
+        for v, w in adj[u]:
+            if dist[v] is not None:
+                continue
+            nd = d + w
+            i = pq.pos.get(v)
+            if i is None:
+                pq.push(v, nd)
+                pushes += 1
+                peak = max(peak, len(pq.heap))
+            elif nd < pq.heap[i]:
+                pq.decrease_key(v, nd)
+    return dist, pushes, peak
+
+
+def dijkstra_lazy(adj):
+    n = len(adj)
+    dist = [None] * n
+    best = {0: 0}
+    pq = Heap(operator.lt, capacity=n * EDGES_PER_NODE + 1)
+    pq.push((0, 0))
+    pushes = peak = 1
+    while pq.heap:
+        d, u = pq.pop()
+        if dist[u] is not None:
+            continue  # stale duplicate
+        dist[u] = d
+        for v, w in adj[u]:
+            if dist[v] is not None:
+                continue
+            nd = d + w
+            if nd < best.get(v, nd + 1):
+                best[v] = nd
+                pq.push((nd, v))
+                pushes += 1
+                peak = max(peak, len(pq.heap))
+    return dist, pushes, peak
+
+
+def main():
+    rng = random.Random(42)
+    print(f"{'n':>8}{'variant':>10}{'time (s)':>11}{'pushes':>10}{'peak size':>11}")
+    for n in SIZES:
+        adj = random_graph(n, rng)
+        results = []
+        for label, func in (("indexed", dijkstra_indexed), ("lazy", dijkstra_lazy)):
+            start = time.perf_counter()
+            dist, pushes, peak = func(adj)
+            elapsed = time.perf_counter() - start
+            results.append(dist)
+            print(f"{n:>8}{label:>10}{elapsed:>11.3f}{pushes:>10}{peak:>11}")
+        assert results[0] == results[1], "variants disagree"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+"""
+Headless fuzz and benchmark: 10^6 random operations on each list core.
+
+linked_list_core's SinglyCore, DoublyCore, CircularCore and XorCore run a seeded
+mix of push/pop at both ends, insert/remove at a position and search (find,
+checked against a plain scan), each drained with run() so no animation is
+involved. A plain Python list replays
+the same operations as the reference: the ends and length are compared after
+every operation and the full contents (both directions for the doubly and
+XOR linked lists) every CHECK_EVERY operations. pygame is never imported.
+
+Run from the repository root:
+    python -m benchmarks.list_cores
+"""
+import random
+import sys
+import time
+
+from linked_list_core import SinglyCore, DoublyCore, CircularCore, XorCore, run
+from node_pool import NIL
+
+OPS = 10 ** 6
+CAPACITY = 512
+CHECK_EVERY = 1000
+KINDS = ("push_front", "push_back", "pop_front", "pop_back", "insert_at", "remove_at", "find")
+
+
+def script(seed):
+    """ (kind, pos fraction, value) triples; positions are scaled to the length at run time """
+    rng = random.Random(seed)
+    return [(rng.choice(KINDS), rng.random(), rng.randrange(1000)) for _ in range(OPS)]
+
+
+def apply(core, ref, kind, frac, value):
+    """ Run one operation on the core and the reference list; returns the core's last event """
+    n = len(ref)
+    if kind == "push_front":
+        if n < core.size:
+            ref.insert(0, value)
+        return run(core.push_front(value))
+    if kind == "push_back":
+        if n < core.size:
+            ref.append(value)
+        return run(core.push_back(value))
+    if kind == "pop_front":
+        if ref:
+            ref.pop(0)
+        return run(core.pop_front())
+    if kind == "pop_back":
+        if ref:
+            ref.pop()
+        return run(core.pop_back())
+    if kind == "insert_at":
+        pos = int(frac * (n + 1))
+        if n < core.size:
+            ref.insert(pos, value)
+        return run(core.insert_at(pos, value))
+    if kind == "remove_at":
+        pos = int(frac * n)
+        if ref:
+            ref.pop(pos)
+        return run(core.remove_at(pos))
+    event = run(core.find(value))
+    if ref:
+        expect = ref.index(value) if value in ref else -1
+        assert event[2] == expect, (event, expect)
+        assert run(core.scan(value))[1:3] == event[1:3]
+    return event
+
+
+def check_ends(core, ref):
+    assert core.length == len(ref)
+    if not ref:
+        assert core.first() == NIL
+        return
+    pool = core.pool
+    assert pool.data[core.first()] == ref[0]
+    last = core.last if isinstance(core, CircularCore) else core.tail
+    assert pool.data[last] == ref[-1]
+
+
+def check_all(core, ref):
+    assert core.values() == ref
+    assert core.pool.used == len(ref)
+    if ref and core.lanes is not None:
+        assert core.pool.data[core.lanes.locate(len(ref) // 2)] == ref[len(ref) // 2]
+    if isinstance(core, DoublyCore):
+        back, slot = [], core.tail
+        while slot != NIL:
+            back.append(core.pool.data[slot])
+            slot = core.pool.prev[slot]
+        assert back == ref[::-1]
+    if isinstance(core, XorCore):
+        assert [core.pool.data[slot] for slot in core.slots(backward=True)] == ref[::-1]
+
+
+def fuzz(make, ops):
+    core, ref = make(), []
+    start = time.perf_counter()
+    for i, (kind, frac, value) in enumerate(ops):
+        apply(core, ref, kind, frac, value)
+        check_ends(core, ref)
+        if i % CHECK_EVERY == 0:
+            check_all(core, ref)
+    check_all(core, ref)
+    return time.perf_counter() - start
+
+
+def bench(make, ops):
+    core = make()
+    calls = {kind: getattr(core, kind) for kind in KINDS}
+    start = time.perf_counter()
+    for kind, frac, value in ops:
+        n = core.length
+        if kind == "insert_at":
+            run(calls[kind](int(frac * (n + 1)), value))
+        elif kind == "remove_at":
+            run(calls[kind](int(frac * n)))
+        elif kind in ("push_front", "push_back", "find"):
+            run(calls[kind](value))
+        else:
+            run(calls[kind]())
+    return time.perf_counter() - start
+
+
+def main():
+    ops = script(0)
+    print(f"{OPS} random operations per core, capacity {CAPACITY}")
+    print(f"{'core':>14}{'fuzz (s)':>12}{'bench (s)':>12}{'per op (us)':>14}")
+    for make in (SinglyCore, DoublyCore, CircularCore, XorCore):
+        factory = lambda: make(CAPACITY, seed=0)
+        fuzzed = fuzz(factory, ops)
+        elapsed = bench(factory, ops)
+        print(f"{make.__name__:>14}{fuzzed:>12.2f}{elapsed:>12.2f}{elapsed * 1e6 / OPS:>14.2f}")
+    assert "pygame" not in sys.modules
+    print("pygame imported: no")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Profile drawList for the three linked-list scenes on a 100-node list.
+
+Each scene gets a list of NODES nodes laid out on one row (each list's view
+is widened so every node holds a Rect, not just one screen's worth) and
+drawList is called FRAMES times onto an off-screen display with SDL's dummy
+video driver. Reports milliseconds per frame and microseconds per node.
+
+Run from the repository root:
+    python -m benchmarks.list_drawing
+"""
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+import pygame
+
+NODES = 100
+FRAMES = 200
+
+
+def singly(screen):
+    import SinglyLinkedList as S
+    sll = S.SLL(NODES)
+    sll.view.width = sll.view.world_x(NODES) + 200
+    sll.fill([str(i % 10) for i in range(NODES)])
+    return sll
+
+
+def doubly(screen):
+    import DoublyLinkedList as D
+    dll = D.DLL(NODES)
+    dll.view.width = dll.view.world_x(NODES) + 200
+    dll.fill([str(i % 10) for i in range(NODES)])
+    return dll
+
+
+def circular(screen):
+    import CircularLinkedList as C
+    scll = C.SCLL(NODES)
+    scll.view.width = scll.view.world_x(NODES) + 200
+    scll.fill([str(i % 10) for i in range(NODES)])
+    return scll
+
+
+def profile(scene, screen):
+    scene.drawList(screen)  # Warm up any caches
+    start = time.perf_counter()
+    for _ in range(FRAMES):
+        scene.drawList(screen)
+    return (time.perf_counter() - start) / FRAMES
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((1000, 700))
+    print(f"drawList on {NODES} nodes, {FRAMES} frames")
+    print(f"{'scene':>10}{'ms/frame':>12}{'us/node':>12}")
+    for make in (singly, doubly, circular):
+        elapsed = profile(make(screen), screen)
+        print(f"{make.__name__:>10}{elapsed * 1e3:>12.3f}{elapsed * 1e6 / NODES:>12.1f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Headless benchmark: value search in a pooled linked list, walk vs index.
+
+Builds a SinglyCore list of N nodes holding string values (as the scenes
+store them) and looks up a batch of present and absent values two ways:
+scan(), walking from the head comparing str(data) like the scenes' search
+animation, and find(), which answers from the pool's value index and ranks
+the slot it names along the express lanes, without walking.
+
+Run from the repository root:
+    python -m benchmarks.list_search
+"""
+import random
+import time
+
+from linked_list_core import SinglyCore, run
+
+N = 10 ** 5
+QUERIES = 200
+
+
+def build(n):
+    core = SinglyCore(n, seed=0)
+    core.extend(str(i) for i in range(n))
+    return core
+
+
+def main():
+    core = build(N)
+    rng = random.Random(0)
+    # Half the queries hit somewhere in the list, half miss (a full walk)
+    queries = [str(rng.randrange(N)) for _ in range(QUERIES // 2)] + [str(N + i) for i in range(QUERIES // 2)]
+
+    start = time.perf_counter()
+    walked = [run(core.scan(q)) for q in queries]
+    walk_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indexed = [run(core.find(q)) for q in queries]
+    index_s = time.perf_counter() - start
+
+    # Same (slot, pos) either way; the index compares nothing
+    assert [event[1:3] for event in walked] == [event[1:3] for event in indexed]
+    assert all(event[3] == 0 for event in indexed)
+    comparisons = sum(event[3] for event in walked)
+    print(f"{N} nodes, {QUERIES} searches ({QUERIES // 2} absent)")
+    print(f"{'method':>12}{'total (ms)':>12}{'per search (us)':>18}{'compares':>12}")
+    print(f"{'walk':>12}{walk_s * 1e3:>12.1f}{walk_s * 1e6 / QUERIES:>18.1f}{comparisons:>12}")
+    print(f"{'index':>12}{index_s * 1e3:>12.3f}{index_s * 1e6 / QUERIES:>18.2f}{0:>12}")
+
+
+if __name__ == "__main__":
+    main()
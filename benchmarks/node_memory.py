@@ -0,0 +1,150 @@
+"""
+Headless benchmark: memory held by 10^6 list and tree nodes.
+
+Each structure is built twice under tracemalloc: once with a plain
+dict-backed node class (the logical fields the scenes' Node classes used to
+carry) and once with the compact representation the scenes now use:
+bst_core.BSTNode (__slots__) for the BST scene, and node_pool.NodePool
+(parallel arrays, no per-node objects) for the linked-list scenes.
+
+The doubly linked list's pool (next and prev arrays, as DoublyCore keeps it)
+is then measured against the XOR list's pool, which keeps a single
+both = addr(prev) ^ addr(next) array (XorCore's layout). DoublyCore's express
+lanes come on top of its pool and are left out, so only the links differ.
+
+Run from the repository root:
+    python -m benchmarks.node_memory
+"""
+import random
+import time
+import tracemalloc
+
+import bst_core
+from node_pool import NodePool, NIL
+
+N = 10 ** 6
+
+
+class DictListNode:
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+class DictTreeNode:
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+class SlotListNode:
+    __slots__ = ("data", "next")
+
+    def __init__(self, data):
+        self.data = data
+        self.next = None
+
+
+def build_list(node_cls):
+    head = tail = node_cls(0)
+    for i in range(1, N):
+        tail.next = tail = node_cls(i)
+    return head
+
+
+def build_pool():
+    pool = NodePool(N)
+    prev = pool.alloc(0)
+    for i in range(1, N):
+        idx = pool.alloc(i)
+        pool.next[prev] = idx
+        prev = idx
+    return pool
+
+
+def build_doubly_pool():
+    pool = build_pool()
+    prev = NIL
+    for i in range(N):
+        pool.prev[i] = prev
+        prev = i
+    return pool
+
+
+def build_xor_pool():
+    # Slots are allocated in order, so node i's neighbours are slots i - 1 and i + 1
+    pool = NodePool(N, with_prev=False)
+    for i in range(N):
+        pool.alloc(i)
+        pool.next[i] = i ^ (i + 2 if i + 1 < N else 0)  # addr(prev) ^ addr(next), addr = slot + 1
+    return pool
+
+
+def build_bst(keys):
+    tree = bst_core.BSTCore()
+    for k in keys:
+        bst_core.run(tree.insert(k))
+    return tree.root
+
+
+def copy_tree(root, node_cls):
+    """ The same tree shape with node_cls nodes, copied iteratively """
+    new_root = node_cls(root.value)
+    stack = [(root, new_root)]
+    while stack:
+        src, dst = stack.pop()
+        if src.left is not None:
+            dst.left = node_cls(src.left.value)
+            stack.append((src.left, dst.left))
+        if src.right is not None:
+            dst.right = node_cls(src.right.value)
+            stack.append((src.right, dst.right))
+    return new_root
+
+
+def traced(func, *args):
+    """ (result, seconds, MiB still allocated once func returns) """
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+    held = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return result, elapsed, held / 2 ** 20
+
+
+def report(name, elapsed, mib):
+    print(f"{name:>28}{elapsed:>10.2f}{mib:>10.1f}{mib * 2 ** 20 / N:>12.1f}")
+
+
+def main():
+    print(f"{N} nodes (time is under tracemalloc)")
+    print(f"{'structure':>28}{'time (s)':>10}{'MiB':>10}{'bytes/node':>12}")
+
+    for name, func, args in [("list, dict nodes", build_list, (DictListNode,)),
+                             ("list, __slots__ nodes", build_list, (SlotListNode,)),
+                             ("list, NodePool arrays", build_pool, ())]:
+        result, elapsed, mib = traced(func, *args)
+        report(name, elapsed, mib)
+        del result
+
+    for name, func in [("DLL pool (next, prev)", build_doubly_pool),
+                       ("XOR pool (both)", build_xor_pool)]:
+        pool, elapsed, mib = traced(func)
+        report(name, elapsed, mib)
+        links = 2 if pool.prev is not None else 1
+        print(f"{'links only':>28}{'':>20}{links * pool.next.itemsize:>12}")
+        del pool
+
+    # Keys are drawn before tracing so only the nodes are counted
+    keys = random.Random(0).sample(range(N * 10), N)
+    root, elapsed, mib = traced(build_bst, keys)
+    report("BST, BSTNode (__slots__)", elapsed, mib)
+    copy, elapsed, mib = traced(copy_tree, root, DictTreeNode)
+    report("BST, dict nodes (copy)", elapsed, mib)
+
+
+if __name__ == "__main__":
+    main()
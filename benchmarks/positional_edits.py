@@ -0,0 +1,120 @@
+"""
+Headless benchmark: insert/delete at a position in a 10^5-node list.
+
+The list lives in a NodePool like the scenes'. Each edit needs the node
+before position k: once by walking next[] from the head (what the scenes
+did before), once through express_lanes.ExpressLanes, which reaches it in
+O(log n) hops and keeps its spans up to date on the same path.
+
+Run from the repository root:
+    python -m benchmarks.positional_edits
+"""
+import random
+import time
+
+from express_lanes import ExpressLanes
+from node_pool import NodePool, NIL
+
+N = 10 ** 5
+EDITS = 1000
+
+
+def build(n):
+    """ Pool of capacity n + EDITS holding 0..n-1 in order, and its head slot """
+    pool = NodePool(n + EDITS)
+    head = prev = pool.alloc(0)
+    for i in range(1, n):
+        idx = pool.alloc(i)
+        pool.next[prev] = idx
+        prev = idx
+    return pool, head
+
+
+def edits(seed):
+    """ (insert?, pos) pairs; positions are 1 .. length - 1 so there is always a node before pos """
+    rng = random.Random(seed)
+    length, out = N, []
+    for _ in range(EDITS):
+        insert = rng.random() < 0.5
+        out.append((insert, rng.randrange(1, length)))
+        length += 1 if insert else -1
+    return out
+
+
+def link_after(pool, before, data):
+    idx = pool.alloc(data)
+    pool.next[idx] = pool.next[before]
+    pool.next[before] = idx
+    return idx
+
+
+def unlink_after(pool, before):
+    idx = pool.next[before]
+    pool.next[before] = pool.next[idx]
+    pool.free(idx)
+    return idx
+
+
+def run_walk(pool, head, ops):
+    hops = 0
+    for insert, pos in ops:
+        before = head
+        for _ in range(pos - 1):
+            before = pool.next[before]
+        hops += pos - 1
+        if insert:
+            link_after(pool, before, -1)
+        else:
+            unlink_after(pool, before)
+    return hops
+
+
+def run_lanes(pool, head, ops):
+    lanes = ExpressLanes(pool.capacity, seed=0)
+    i = head
+    for pos in range(N):
+        lanes.insert(pos, i)
+        i = pool.next[i]
+
+    start = time.perf_counter()
+    hops = 0
+    for insert, pos in ops:
+        path = lanes.path(pos - 1)
+        before = path[-1][1]
+        hops += len(path)
+        if insert:
+            lanes.insert(pos, link_after(pool, before, -1))
+        else:
+            lanes.remove(pos)
+            unlink_after(pool, before)
+    return hops, time.perf_counter() - start
+
+
+def contents(pool, head):
+    out, i = [], head
+    while i != NIL:
+        out.append(pool.data[i])
+        i = pool.next[i]
+    return out
+
+
+def main():
+    ops = edits(0)
+    print(f"{N} nodes, {EDITS} positional edits")
+    print(f"{'method':>16}{'total (ms)':>12}{'per edit (us)':>16}{'hops':>12}")
+
+    pool, head = build(N)
+    start = time.perf_counter()
+    hops = run_walk(pool, head, ops)
+    elapsed = time.perf_counter() - start
+    walked = contents(pool, head)
+    print(f"{'walk next[]':>16}{elapsed * 1e3:>12.1f}{elapsed * 1e6 / EDITS:>16.1f}{hops:>12}")
+
+    pool, head = build(N)
+    hops, elapsed = run_lanes(pool, head, ops)
+    assert contents(pool, head) == walked
+    print(f"{'express lanes':>16}{elapsed * 1e3:>12.1f}{elapsed * 1e6 / EDITS:>16.1f}{hops:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Headless benchmark: 10^6 enqueue/dequeue pairs on the queue scene's model
+(collections.deque, popleft) vs the old list model (pop(0)), with the
+queue holding a steady backlog of items.
+
+Run from the repository root:
+    python -m benchmarks.queue_ops
+"""
+import time
+from collections import deque
+
+PAIRS = 10 ** 6
+BACKLOGS = [0, 1000, 10000]
+
+
+def list_queue(backlog):
+    q = list(range(backlog))
+    for i in range(PAIRS):
+        q.append(i)
+        q.pop(0)
+
+
+def deque_queue(backlog):
+    q = deque(range(backlog))
+    for i in range(PAIRS):
+        q.append(i)
+        q.popleft()
+
+
+def time_it(func, backlog):
+    start = time.perf_counter()
+    func(backlog)
+    return time.perf_counter() - start
+
+
+def main():
+    print(f"{PAIRS} enqueue/dequeue pairs")
+    print(f"{'backlog':>9}{'list.pop(0) (s)':>18}{'deque.popleft (s)':>20}{'speedup':>10}")
+    for backlog in BACKLOGS:
+        t_list = time_it(list_queue, backlog)
+        t_deque = time_it(deque_queue, backlog)
+        print(f"{backlog:>9}{t_list:>18.3f}{t_deque:>20.3f}{t_list / t_deque:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Headless benchmark: skip list vs the BST scene's core on 10^5 keys.
+
+skip_list_core.SkipListCore (seeded levels) and bst_core.BSTCore, the
+tree2 scene's core, each drain their insert/search/delete generators for
+N distinct keys in two arrival orders:
+    random   a seeded shuffle
+    sorted   ascending, the BST's worst case
+then look every key up and delete every key, both in a shuffled order.
+bst_core does not rebalance, so sorted keys build a chain as deep as the
+tree is large; that run takes quadratic time and is capped at SORTED_BST
+keys (per-op times are for the capped size, and grow linearly with it).
+Reports microseconds per operation and the BST's height. pygame is never
+imported.
+
+Run from the repository root:
+    python -m benchmarks.skip_list
+"""
+import random
+import sys
+import time
+
+import bst_core
+import skip_list_core
+
+N = 10 ** 5
+SORTED_BST = 10 ** 4
+
+
+def bst_height(root):
+    """ Deepest level, iteratively (a sorted build is too deep to recurse) """
+    height, stack = 0, [(root, 1)] if root else []
+    while stack:
+        node, depth = stack.pop()
+        height = max(height, depth)
+        stack.extend((child, depth + 1) for child in (node.left, node.right) if child is not None)
+    return height
+
+
+def bench_bst(keys, lookups):
+    tree = bst_core.BSTCore()
+    run = bst_core.run
+    start = time.perf_counter()
+    for k in keys:
+        run(tree.insert(k))
+    insert = time.perf_counter() - start
+    height = bst_height(tree.root)
+
+    start = time.perf_counter()
+    for k in lookups:
+        assert run(tree.search(k))[1] is not None
+    search = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for k in lookups:
+        run(tree.delete(k))
+    delete = time.perf_counter() - start
+    assert tree.root is None
+    return insert, search, delete, f"height {height}"
+
+
+def bench_skip(keys, lookups):
+    core = skip_list_core.SkipListCore(len(keys), seed=0)
+    run = skip_list_core.run
+    start = time.perf_counter()
+    for k in keys:
+        run(core.insert(k))
+    insert = time.perf_counter() - start
+    levels = core.levels()
+
+    start = time.perf_counter()
+    for k in lookups:
+        assert run(core.find(k))[1] != skip_list_core.NIL
+    search = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for k in lookups:
+        run(core.remove(k))
+    delete = time.perf_counter() - start
+    assert core.length == 0
+    return insert, search, delete, f"{levels} levels"
+
+
+def main():
+    rng = random.Random(0)
+    shuffled = rng.sample(range(N * 10), N)
+    orders = [("random", shuffled), ("sorted", sorted(shuffled))]
+
+    print(f"{N} keys, microseconds per operation")
+    print(f"{'keys':>8}{'structure':>12}{'n':>8}{'insert':>10}{'search':>10}{'delete':>10}  shape")
+    for order, keys in orders:
+        for name, bench in (("skip list", bench_skip), ("BST", bench_bst)):
+            run_keys = keys[:SORTED_BST] if order == "sorted" and bench is bench_bst else keys
+            lookups = random.Random(1).sample(run_keys, len(run_keys))
+            insert, search, delete, shape = bench(run_keys, lookups)
+            n = len(run_keys)
+            print(f"{order:>8}{name:>12}{n:>8}{insert * 1e6 / n:>10.2f}{search * 1e6 / n:>10.2f}"
+                  f"{delete * 1e6 / n:>10.2f}  {shape}")
+    assert "pygame" not in sys.modules
+    print("pygame imported: no")
+
+
+if __name__ == "__main__":
+    main()
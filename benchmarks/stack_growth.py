@@ -0,0 +1,69 @@
+"""
+Headless benchmark: 10^7 pushes then 10^7 pops on the stack scene's
+dynamic-array model (stack_core.DynamicArrayStack) with 2x and 1.5x growth,
+and on a plain Python list for reference.
+
+Reports reallocations (grows + shrinks), items copied, amortised cost per
+push and peak traced memory. A larger growth factor means fewer copies but
+more unused slots at the peak. Each model runs twice (timed, then traced),
+so the whole benchmark takes a few minutes.
+
+Run from the repository root:
+    python -m benchmarks.stack_growth
+"""
+import time
+import tracemalloc
+
+from stack_core import DynamicArrayStack, GROWTH_FACTORS
+
+N = 10 ** 7
+
+
+def run_dynamic(growth):
+    stack = DynamicArrayStack(growth=growth)
+    push, pop = stack.push, stack.pop
+    for _ in range(N):
+        push(None)
+    grows, copied, peak_capacity = stack.reallocs, stack.copies, stack.peak_capacity
+    for _ in range(N):
+        pop()
+    return stack, grows, copied, peak_capacity
+
+
+def run_list():
+    stack = []
+    push, pop = stack.append, stack.pop
+    for _ in range(N):
+        push(None)
+    for _ in range(N):
+        pop()
+
+
+def measure(func, *args):
+    """ Time an untraced run, then repeat it under tracemalloc for the peak (tracing slows it down) """
+    start = time.perf_counter()
+    result = func(*args)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    func(*args)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, elapsed, peak / 2 ** 20
+
+
+def main():
+    print(f"{N} pushes then {N} pops")
+    print(f"{'model':>12}{'time (s)':>10}{'grows':>8}{'reallocs':>10}{'copied':>12}"
+          f"{'cost/push':>11}{'peak cap':>11}{'peak MiB':>10}")
+    for growth in GROWTH_FACTORS:
+        (stack, grows, copied, peak_cap), elapsed, peak = measure(run_dynamic, growth)
+        print(f"{f'dynamic {growth:g}x':>12}{elapsed:>10.2f}{grows:>8}{stack.reallocs:>10}{copied:>12}"
+              f"{stack.amortised_cost():>11.2f}{peak_cap:>11}{peak:>10.1f}")
+
+    _, elapsed, peak = measure(run_list)
+    print(f"{'list':>12}{elapsed:>10.2f}{'-':>8}{'-':>10}{'-':>12}{'-':>11}{'-':>11}{peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
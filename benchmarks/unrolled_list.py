@@ -0,0 +1,65 @@
+"""
+Headless benchmark: unrolled linked list vs the singly linked list core.
+
+linked_list_core's SinglyCore keeps one entry per node; UnrolledCore keeps
+up to block_size entries per node in a Python list, so a walk follows one
+next link per block instead of one per entry. For each size both are filled
+through push_back, then timed on:
+    iterate   core.values(), every entry in list order
+    insert    INSERTS positional inserts at seeded random positions
+SinglyCore reaches a position along its express lanes (O(log n) hops);
+UnrolledCore walks block by block (n / block_size hops) and then shifts
+entries inside one block. pygame is never imported.
+
+Run from the repository root:
+    python -m benchmarks.unrolled_list
+"""
+import random
+import sys
+import time
+
+from linked_list_core import SinglyCore, UnrolledCore, run
+
+SIZES = (10 ** 5, 10 ** 6)
+BLOCK_SIZES = (4, 16, 64)
+INSERTS = 1000
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def insert_all(core, positions):
+    for pos in positions:
+        run(core.insert_at(pos, -1))
+
+
+def main():
+    print(f"{'size':>9}{'core':>16}{'nodes':>10}{'build (s)':>11}{'iterate (ms)':>14}{'insert (us)':>13}")
+    for n in SIZES:
+        rng = random.Random(n)
+        positions = [rng.randrange(n + i + 1) for i in range(INSERTS)]
+        makers = [("SinglyCore", lambda: SinglyCore(n + INSERTS, seed=0))]
+        makers += [(f"Unrolled B={b}", lambda b=b: UnrolledCore(n + INSERTS, b)) for b in BLOCK_SIZES]
+        expected = None
+        for name, make in makers:
+            core = make()
+            _, build = timed(core.extend, range(n))
+            values, iterate = timed(core.values)
+            _, insert = timed(insert_all, core, positions)
+            after = core.values()
+            assert values == list(range(n))
+            if expected is None:
+                expected = after
+            assert after == expected
+            nodes = core.blocks if isinstance(core, UnrolledCore) else core.length
+            print(f"{n:>9}{name:>16}{nodes:>10}{build:>11.2f}{iterate * 1e3:>14.1f}{insert * 1e6 / INSERTS:>13.1f}")
+            del core, values, after
+    assert "pygame" not in sys.modules
+    print("pygame imported: no")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""
+Binary search tree core for the BST scene (tree2.py).
+
+Pure Python (no pygame). BSTNode holds only the logical fields in
+__slots__, so a node costs a fixed-size object instead of an object plus a
+per-instance dict; the scene keeps each node's on-screen position in a
+separate view object.
+
+BSTCore's insert/search/delete are generators, like the linked-list cores:
+each applies one step, yields an event describing it, and carries on when
+asked. tree2 animates the events as they arrive; run() just drains them,
+which is what the headless benchmarks time.
+    ("visit", node, side)           compared against node, going "left"/"right"
+    ("exists", node)                insert: value already in the tree, nothing changed
+    ("new", node, parent, side)     node linked as parent.left/right (parent None: root)
+    ("found", node)                 end of a search; node None if missing
+    ("target", node, case)          delete: node holds the value; case "leaf",
+                                    "left"/"right" (its only child) or "two"
+    ("successor", node)             delete: walking to the inorder successor
+    ("copy", target, succ, old)     target's value old replaced by succ's
+    ("unlink", node, child)         node cut out of the tree, child in its place
+"""
+
+
+class BSTNode:
+    __slots__ = ("value", "left", "right", "height")
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+def run(op):
+    """ Drain an operation without animating it; returns its last event """
+    event = None
+    for event in op:
+        pass
+    return event
+
+
+class BSTCore:
+    def __init__(self):
+        self.root = None
+
+    def insert(self, value):
+        """ Insert value (duplicates are ignored) """
+        if self.root is None:
+            self.root = BSTNode(value)
+            yield ("new", self.root, None, None)
+            return
+        curr = self.root
+        while True:
+            if value == curr.value:
+                yield ("exists", curr)
+                return
+            if value < curr.value:
+                yield ("visit", curr, "left")
+                if curr.left is None:
+                    curr.left = BSTNode(value)
+                    yield ("new", curr.left, curr, "left")
+                    return
+                curr = curr.left
+            else:
+                yield ("visit", curr, "right")
+                if curr.right is None:
+                    curr.right = BSTNode(value)
+                    yield ("new", curr.right, curr, "right")
+                    return
+                curr = curr.right
+
+    def search(self, value):
+        curr = self.root
+        while curr is not None and curr.value != value:
+            if value < curr.value:
+                yield ("visit", curr, "left")
+                curr = curr.left
+            else:
+                yield ("visit", curr, "right")
+                curr = curr.right
+        yield ("found", curr)
+
+    def delete(self, value):
+        """ Remove value if present (two children: copy the inorder successor up) """
+        parent, curr = None, self.root
+        while curr is not None and curr.value != value:
+            parent = curr
+            if value < curr.value:
+                yield ("visit", curr, "left")
+                curr = curr.left
+            else:
+                yield ("visit", curr, "right")
+                curr = curr.right
+        if curr is None:
+            yield ("found", None)
+            return
+
+        if curr.left is not None and curr.right is not None:
+            yield ("target", curr, "two")
+            succ_parent, succ = curr, curr.right
+            yield ("successor", succ)
+            while succ.left is not None:
+                succ_parent, succ = succ, succ.left
+                yield ("successor", succ)
+            old, curr.value = curr.value, succ.value
+            yield ("copy", curr, succ, old)
+            if succ_parent is curr:
+                succ_parent.right = succ.right
+            else:
+                succ_parent.left = succ.right
+            yield ("unlink", succ, succ.right)
+            return
+
+        child = curr.left if curr.left is not None else curr.right
+        yield ("target", curr, "leaf" if child is None else ("left" if child is curr.left else "right"))
+        if parent is None:
+            self.root = child
+        elif parent.left is curr:
+            parent.left = child
+        else:
+            parent.right = child
+        yield ("unlink", curr, child)
+
+
+def inorder(root):
+    """ Values in sorted order (iterative, so deep unbalanced trees don't hit the recursion limit) """
+    stack, curr = [], root
+    while stack or curr is not None:
+        while curr is not None:
+            stack.append(curr)
+            curr = curr.left
+        curr = stack.pop()
+        yield curr.value
+        curr = curr.right
+
+
+# AVL helpers
+def get_height(node):
+    if not node: return 0
+    return 1 + max(get_height(node.left), get_height(node.right))
+
+
+def get_balance(node):
+    if not node: return 0
+    return get_height(node.left) - get_height(node.right)
+
+
+def rotate_right(y):
+    x = y.left
+    T2 = x.right
+    x.right = y
+    y.left = T2
+    return x
+
+
+def rotate_left(x):
+    y = x.right
+    T2 = y.left
+    y.left = x
+    x.right = T2
+    return y
@@ -1,7 +1,10 @@
 import pygame
 import sys
 import math
+import threading
 import Colors
+import widgets
+from frame_scheduler import FrameScheduler
 
 # --- Configuration ---
 SCREEN_WIDTH = 1000
@@ -20,7 +23,9 @@ ERROR_COLOR = (255, 87, 87)
 SUCCESS_COLOR = (0, 200, 81)
 
 # Logic Constraints
-MAX_ALLOWED_CAPACITY = 12 
+MAX_ALLOWED_CAPACITY = 12  # Fixed mode only; growable mode doubles past it
+RESIZE_ANIM_MS = 700
+THREAD_RATES = [1, 2, 5, 10, 20, 50, 100, 1000]  # Producer / consumer speeds (items per second)
 
 # Dimensions
 OUTER_RADIUS = 200
@@ -44,17 +49,54 @@ font_label = get_font(14, bold=True)
 
 
 # --- Logic Structure: Array Based Circular Queue ---
-class CircularQueueArray:
+class RingBuffer:
+    """
+    The array a circular queue lives in, as the donut draws it: `size` slots in `queue`,
+    None where a slot is empty. Subclasses keep count and front (-1 when empty) and
+    rear their own way.
+    """
     def __init__(self, size):
         self.size = size
         self.queue = [None] * size
+
+    def peek(self):
+        if self.count == 0: return None
+        return self.queue[self.front]
+
+
+class CircularQueueArray(RingBuffer):
+    def __init__(self, size, growable=False):
+        super().__init__(size)
         self.front = -1
         self.rear = -1
         self.count = 0
 
+        # Growable mode: double when full, halve when at most 1/4 full (never below min_size)
+        self.growable = growable
+        self.min_size = size
+        self.resizes = 0
+        self.last_moves = []  # (old index, new index) of each item moved by the last resize
+
+    def resize(self, new_size):
+        """ Unroll the ring into a fresh buffer: items keep their order and front moves to index 0 """
+        if new_size < self.count:
+            return False
+        self.last_moves = [((self.front + k) % self.size, k) for k in range(self.count)]
+        items = [self.queue[old] for old, _ in self.last_moves]
+        self.queue = items + [None] * (new_size - self.count)
+        self.size = new_size
+        if self.count:
+            self.front, self.rear = 0, self.count - 1
+        else:
+            self.front, self.rear = -1, -1
+        self.resizes += 1
+        return True
+
     def enqueue(self, value):
         if self.count == self.size:
-            return False  # Full
+            if not self.growable:
+                return False  # Full
+            self.resize(self.size * 2)  # Amortised O(1): each item is copied O(1) times on average
 
         if self.front == -1:  # First element
             self.front = 0
@@ -80,72 +122,67 @@ class CircularQueueArray:
             self.front = (self.front + 1) % self.size
 
         self.count -= 1
+
+        # Shrink at 1/4 occupancy (not 1/2) so alternating enqueue/dequeue can't thrash
+        if self.growable and self.size > self.min_size and self.count <= self.size // 4:
+            self.resize(max(self.min_size, self.size // 2))
         return val
 
-    def peek(self):
-        if self.count == 0: return None
-        return self.queue[self.front]
 
+class SPSCRing(RingBuffer):
+    """
+    Bounded single-producer / single-consumer ring on the same array layout.
+    The producer only writes `tail` and the consumer only writes `head` (both count up
+    forever, slot = counter % size), so no lock is needed: a slot is filled before
+    tail moves past it and emptied before head does. count, front and rear are
+    read off the two counters.
+    """
+    def __init__(self, size):
+        super().__init__(size)
+        self.head = 0  # Next slot to pop (consumer thread only)
+        self.tail = 0  # Next slot to push (producer thread only)
 
-# --- UI Classes ---
-class Button:
-    def __init__(self, x, y, w, h, text, action_func=None):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.action = action_func
-        self.is_hovered = False
+    @property
+    def count(self):
+        return self.tail - self.head
 
-    def draw(self, surface):
-        color = HOVER_COLOR if self.is_hovered else FILLED_COLOR
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-        txt = font_ui.render(self.text, True, TEXT_COLOR)
-        surface.blit(txt, txt.get_rect(center=self.rect.center))
+    @property
+    def front(self):
+        return self.head % self.size if self.tail != self.head else -1
 
-    def check_hover(self, mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
+    @property
+    def rear(self):
+        return (self.tail - 1) % self.size if self.tail != self.head else -1
 
-    def check_click(self, mouse_pos):
-        """Returns the result of the action if clicked, else None"""
-        if self.is_hovered and self.action:
-            return self.action()
-        return None
+    def enqueue(self, value):
+        if self.tail - self.head == self.size:
+            return False  # Full: producer must back off
+        self.queue[self.tail % self.size] = value
+        self.tail += 1  # Publish only after the slot is written
+        return True
 
+    def dequeue(self):
+        if self.head == self.tail:
+            return None  # Empty: consumer must wait
+        slot = self.head % self.size
+        val = self.queue[slot]
+        self.queue[slot] = None
+        self.head += 1  # Free the slot only after it is read
+        return val
+
+
+# --- UI Classes ---
+class Button(widgets.Button):
+    def __init__(self, x, y, w, h, text, action_func=None):
+        super().__init__(x, y, w, h, text, action_func, color=FILLED_COLOR, hover_color=HOVER_COLOR,
+                         text_color=TEXT_COLOR, font=font_ui)
 
-class InputBox:
-    def __init__(self, x, y, w, h, text='', max_chars=9, is_numeric_only=False):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.color_active = FILLED_COLOR
-        self.color_inactive = Colors.LIGHT_GREY
-        self.color = self.color_inactive
-        self.text = text
-        self.txt_surface = font_ui.render(text, True, TEXT_COLOR)
-        self.active = False
-        self.max_chars = max_chars
-        self.is_numeric = is_numeric_only
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.rect.collidepoint(event.pos)
-            self.color = self.color_active if self.active else self.color_inactive
-        if event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_RETURN:
-                pass
-            elif event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
-            else:
-                if len(self.text) < self.max_chars:
-                    if self.is_numeric:
-                        if event.unicode.isdigit():
-                            self.text += event.unicode
-                    else:
-                        self.text += event.unicode
-            self.txt_surface = font_ui.render(self.text, True, TEXT_COLOR)
 
-    def draw(self, screen):
-        pygame.draw.rect(screen, INPUT_BG_COLOR, self.rect, border_radius=5)
-        # Center vertically
-        screen.blit(self.txt_surface, (self.rect.x + 8, self.rect.y + (self.rect.height // 2 - 8)))
-        pygame.draw.rect(screen, self.color, self.rect, 2, border_radius=5)
+class InputBox(widgets.InputBox):
+    def __init__(self, x, y, w, h, text='', max_chars=9, is_numeric_only=False):
+        super().__init__(x, y, w, h, text, max_chars, str.isdigit if is_numeric_only else str.isprintable,
+                         font=font_ui, bg_color=INPUT_BG_COLOR, inactive_color=Colors.LIGHT_GREY,
+                         active_color=FILLED_COLOR, text_color=TEXT_COLOR)
 
 
 # --- Helper: Draw Donut Segment (High Res) ---
@@ -198,7 +235,7 @@ def draw_pointer_label(surface, text, angle_deg, center, radius, color):
 
 # --- Main Run Function ---
 def run(screen):
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     # --- Local Logic State ---
     state = {
@@ -208,7 +245,25 @@ def run(screen):
         "status_col": TEXT_COLOR,
         "logic_msg": "Waiting...",
         "peek_mode": False,
-        "peek_timer": 0
+        "peek_timer": 0,
+        "growable": False,
+        "resize_anim": None  # {"start", "old_size", "moves"} while a resize is being animated
+    }
+
+    # Producer / consumer threads (each counter is written by exactly one thread)
+    sim = {
+        "running": False,
+        "threads": [],
+        "stop": threading.Event(),  # set to wake the workers out of their pause and end them
+        "prod_rate": 10,
+        "cons_rate": 5,
+        "produced": 0,
+        "consumed": 0,
+        "prod_stalls": 0,
+        "cons_stalls": 0,
+        "ops_per_sec": 0.0,
+        "sample_time": 0,
+        "sample_consumed": 0
     }
 
     # UI Elements
@@ -222,50 +277,98 @@ def run(screen):
         state["logic_msg"] = logic
 
     def set_capacity():
+        if sim["running"]:
+            set_status("Stop the threads first", ERROR_COLOR)
+            return
         try:
             if not cap_input.text: return
             new_cap = int(cap_input.text)
 
-            if new_cap > MAX_ALLOWED_CAPACITY:
+            if new_cap > MAX_ALLOWED_CAPACITY and not state["growable"]:
                 set_status(f"Max Capacity is {MAX_ALLOWED_CAPACITY}", ERROR_COLOR)
                 cap_input.text = str(MAX_ALLOWED_CAPACITY)
-                cap_input.txt_surface = font_ui.render(cap_input.text, True, TEXT_COLOR)
                 return
 
             if new_cap < 1:
                 set_status("Capacity must be >= 1", ERROR_COLOR)
                 return
 
-            # Reset Queue with new capacity
-            state["capacity"] = new_cap
-            state["cq"] = CircularQueueArray(new_cap)
-            set_status(f"Capacity set to {new_cap}. Queue Reset.", SUCCESS_COLOR)
+            cq = state["cq"]
+            old_size = cq.size
+            cq.min_size = new_cap
+            if cq.resize(new_cap):
+                # Contents fit: unroll them into the new ring instead of starting over
+                start_resize_anim(old_size)
+                state["capacity"] = new_cap
+                set_status(f"Capacity set to {new_cap}.", SUCCESS_COLOR, "Unroll front..rear into new array")
+            else:
+                state["capacity"] = new_cap
+                state["cq"] = CircularQueueArray(new_cap, state["growable"])
+                set_status(f"Capacity set to {new_cap}. Queue Reset.", SUCCESS_COLOR)
 
         except ValueError:
             set_status("Invalid Capacity", ERROR_COLOR)
 
+    def start_resize_anim(old_size):
+        state["resize_anim"] = {
+            "start": pygame.time.get_ticks(),
+            "old_size": old_size,
+            "moves": state["cq"].last_moves
+        }
+        sched.animate(RESIZE_ANIM_MS)
+
     def do_enqueue():
+        if sim["running"]:
+            set_status("Producer thread owns enqueue", ERROR_COLOR, "SPSC: one writer per end")
+            return
         val = val_input.text.strip()
         if not val:
             set_status("Enter a value!", ERROR_COLOR, "if val is None: return")
             return
 
+        old_size = state["cq"].size
         success = state["cq"].enqueue(val)
         if not success:
             set_status("Queue Overflow! (Full)", ERROR_COLOR, "if count == size: Overflow")
             return
 
         val_input.text = ""
-        val_input.txt_surface = font_ui.render("", True, TEXT_COLOR)
-        set_status(f"Enqueued: {val}", SUCCESS_COLOR, f"rear = (rear + 1) % {state['capacity']}")
+        if state["cq"].size != old_size:
+            start_resize_anim(old_size)
+            state["capacity"] = state["cq"].size
+            set_status(f"Full: grew {old_size} -> {state['capacity']}, Enqueued: {val}", SUCCESS_COLOR,
+                       "if count == size: copy front..rear into size*2 array")
+        else:
+            set_status(f"Enqueued: {val}", SUCCESS_COLOR, f"rear = (rear + 1) % {state['capacity']}")
 
     def do_dequeue():
+        if sim["running"]:
+            set_status("Consumer thread owns dequeue", ERROR_COLOR, "SPSC: one writer per end")
+            return
+        old_size = state["cq"].size
         val = state["cq"].dequeue()
         if val is None:
             set_status("Queue Underflow! (Empty)", ERROR_COLOR, "if count == 0: Underflow")
+        elif state["cq"].size != old_size:
+            start_resize_anim(old_size)
+            state["capacity"] = state["cq"].size
+            set_status(f"Dequeued: {val}, shrank {old_size} -> {state['capacity']}", SUCCESS_COLOR,
+                       "if count <= size / 4: copy into size / 2 array")
         else:
             set_status(f"Dequeued: {val}", SUCCESS_COLOR, f"front = (front + 1) % {state['capacity']}")
 
+    def toggle_growable():
+        if sim["running"]:
+            set_status("Stop the threads first", ERROR_COLOR)
+            return
+        state["growable"] = not state["growable"]
+        state["cq"].growable = state["growable"]
+        btn_grow.text = "Growable: On" if state["growable"] else "Growable: Off"
+        if state["growable"]:
+            set_status("Growable mode", SUCCESS_COLOR, "Full -> double | 1/4 full -> halve")
+        else:
+            set_status("Fixed-size mode", SUCCESS_COLOR, "Full -> Overflow")
+
     def do_peek():
         val = state["cq"].peek()
         if val is None:
@@ -273,9 +376,84 @@ def run(screen):
         else:
             state["peek_mode"] = True
             state["peek_timer"] = pygame.time.get_ticks()
+            sched.wake_in(1000)  # the highlight clears after a second
             set_status(f"Front Item: {val}", HIGHLIGHT_COLOR, f"return queue[{state['cq'].front}]")
 
+    # --- Producer / Consumer Threads ---
+    def producer_loop(ring, stop):
+        n = 1
+        while not stop.is_set():
+            if ring.enqueue(n):
+                n += 1
+                sim["produced"] += 1
+            else:
+                sim["prod_stalls"] += 1  # Backpressure: ring full
+            stop.wait(1 / sim["prod_rate"])
+
+    def consumer_loop(ring, stop):
+        while not stop.is_set():
+            if ring.dequeue() is not None:
+                sim["consumed"] += 1
+            else:
+                sim["cons_stalls"] += 1  # Starved: ring empty
+            stop.wait(1 / sim["cons_rate"])
+
+    def start_threads():
+        ring = SPSCRing(state["capacity"])
+        # Carry the current contents over into the ring
+        while state["cq"].count:
+            ring.enqueue(state["cq"].dequeue())
+        state["cq"] = ring
+        state["resize_anim"] = None
+
+        sim.update(running=True, produced=0, consumed=0, prod_stalls=0, cons_stalls=0, ops_per_sec=0.0,
+                   sample_time=pygame.time.get_ticks(), sample_consumed=0, stop=threading.Event())
+        sim["threads"] = [
+            threading.Thread(target=producer_loop, args=(ring, sim["stop"]), daemon=True),
+            threading.Thread(target=consumer_loop, args=(ring, sim["stop"]), daemon=True)
+        ]
+        for t in sim["threads"]:
+            t.start()
+        btn_threads.text = "Threads: On"
+        set_status("Producer + Consumer running", SUCCESS_COLOR, "tail += 1 (producer) | head += 1 (consumer)")
+
+    def stop_threads():
+        if not sim["running"]:
+            return
+        sim["running"] = False
+        sim["stop"].set()  # Cuts short the pause each worker is in, so the joins return at once
+        for t in sim["threads"]:
+            t.join()
+        sim["threads"] = []
+
+        # Back to the plain (single-threaded) queue with the same contents
+        ring = state["cq"]
+        cq = CircularQueueArray(state["capacity"], state["growable"])
+        while ring.count:
+            cq.enqueue(ring.dequeue())
+        state["cq"] = cq
+        btn_threads.text = "Threads: Off"
+        set_status("Threads stopped", TEXT_COLOR, "Manual mode")
+
+    def toggle_threads():
+        if sim["running"]:
+            stop_threads()
+        else:
+            start_threads()
+
+    def next_rate(rate):
+        return THREAD_RATES[(THREAD_RATES.index(rate) + 1) % len(THREAD_RATES)]
+
+    def cycle_prod_rate():
+        sim["prod_rate"] = next_rate(sim["prod_rate"])
+        btn_prod.text = f"Prod: {sim['prod_rate']}/s"
+
+    def cycle_cons_rate():
+        sim["cons_rate"] = next_rate(sim["cons_rate"])
+        btn_cons.text = f"Cons: {sim['cons_rate']}/s"
+
     def go_back():
+        stop_threads()
         return "back"
 
     # Buttons
@@ -283,15 +461,19 @@ def run(screen):
     btn_enq = Button(200, 180, 100, 40, "Enqueue", do_enqueue)
     btn_deq = Button(50, 240, 120, 50, "Dequeue", do_dequeue)
     btn_peek = Button(180, 240, 120, 50, "Peek", do_peek)
+    btn_grow = Button(50, 300, 160, 40, "Growable: Off", toggle_growable)
+    btn_threads = Button(50, 370, 160, 40, "Threads: Off", toggle_threads)
+    btn_prod = Button(50, 420, 120, 40, f"Prod: {sim['prod_rate']}/s", cycle_prod_rate)
+    btn_cons = Button(180, 420, 120, 40, f"Cons: {sim['cons_rate']}/s", cycle_cons_rate)
     btn_back = Button(900, 15, 80, 40, "← Back", go_back)
 
-    buttons = [btn_set_cap, btn_enq, btn_deq, btn_peek, btn_back]
+    buttons = [btn_set_cap, btn_enq, btn_deq, btn_peek, btn_grow, btn_threads, btn_prod, btn_cons, btn_back]
     input_boxes = [val_input, cap_input]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
 
     # --- Main Loop ---
     running = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
         current_time = pygame.time.get_ticks()
 
         # Handle Peek Highlight Timer
@@ -301,22 +483,18 @@ def run(screen):
                 set_status("Ready", TEXT_COLOR, "Waiting...")
 
         # --- Event Handling ---
-        for event in pygame.event.get():
+        for event in sched.events():
+            target = ui.dispatch(event)
             if event.type == pygame.QUIT:
+                stop_threads()
                 return "quit"
             
             for box in input_boxes:
                 box.handle_event(event)
             
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for btn in buttons:
-                    result = btn.check_click(event.pos)
-                    # Handle return signal
-                    if result == "back":
-                        return "back"
-
-        for btn in buttons:
-            btn.check_hover(mouse_pos)
+            if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                if target.click() == "back":
+                    return "back"
 
         # --- Drawing ---
         screen.fill(BACKGROUND_COLOR)
@@ -328,22 +506,62 @@ def run(screen):
         screen.blit(font_logic.render(f"> {state['logic_msg']}", True, HOVER_COLOR), (450, 85))
 
         # Labels
-        screen.blit(font_ui.render(f"Capacity (Max {MAX_ALLOWED_CAPACITY}):", True, TEXT_COLOR), (50, 65))
+        cap_lbl = "Capacity (grows x2):" if state["growable"] else f"Capacity (Max {MAX_ALLOWED_CAPACITY}):"
+        screen.blit(font_ui.render(cap_lbl, True, TEXT_COLOR), (50, 65))
         screen.blit(font_ui.render(f"Count: {state['cq'].count} / {state['capacity']}", True, TEXT_COLOR), (50, 135))
         screen.blit(font_ui.render("Value:", True, TEXT_COLOR), (50, 155))
 
         for box in input_boxes: box.draw(screen)
         for btn in buttons: btn.draw(screen)
 
+        # Producer / Consumer Stats
+        if sim["running"]:
+            if current_time - sim["sample_time"] >= 1000:
+                consumed = sim["consumed"]
+                sim["ops_per_sec"] = (consumed - sim["sample_consumed"]) * 1000 / (current_time - sim["sample_time"])
+                sim["sample_time"], sim["sample_consumed"] = current_time, consumed
+
+            occupancy = state["cq"].count / state["capacity"]
+            stats = [
+                f"Occupancy: {occupancy:.0%}",
+                f"Throughput: {sim['ops_per_sec']:.1f} ops/s",
+                f"Produced: {sim['produced']}  (full stalls: {sim['prod_stalls']})",
+                f"Consumed: {sim['consumed']}  (empty stalls: {sim['cons_stalls']})"
+            ]
+            for k, line in enumerate(stats):
+                screen.blit(font_logic.render(line, True, TEXT_COLOR), (50, 480 + k * 22))
+
+            # Occupancy bar: full = producer is being throttled by the consumer
+            bar = pygame.Rect(50, 575, 250, 14)
+            pygame.draw.rect(screen, EMPTY_COLOR, bar, border_radius=4)
+            fill = bar.copy()
+            fill.width = int(bar.width * occupancy)
+            pygame.draw.rect(screen, HIGHLIGHT_COLOR if occupancy >= 1 else FILLED_COLOR, fill, border_radius=4)
+
         # 2. Visualization (The Donut)
         angle_step = 360 / state["capacity"]
         cq_obj = state["cq"]
 
+        # Resize animation: moved items slide from their old slot to their new one
+        anim = state["resize_anim"]
+        moving = set()
+        if anim is not None:
+            t = (current_time - anim["start"]) / RESIZE_ANIM_MS
+            if t >= 1:
+                state["resize_anim"] = anim = None
+            else:
+                moving = {new for _, new in anim["moves"]}
+
+        # Big rings: label every n-th index, and only draw values that fit their segment
+        label_every = max(1, state["capacity"] // 16)
+        show_values = angle_step >= 14
+        gap = min(2, angle_step / 6)
+
         for i in range(state["capacity"]):
-            start_deg = -90 + (i * angle_step) + 2
-            end_deg = -90 + ((i + 1) * angle_step) - 2
+            start_deg = -90 + (i * angle_step) + gap
+            end_deg = -90 + ((i + 1) * angle_step) - gap
 
-            is_filled = cq_obj.queue[i] is not None
+            is_filled = cq_obj.queue[i] is not None and i not in moving
 
             bg_col = EMPTY_COLOR
             should_fill = is_filled
@@ -362,19 +580,33 @@ def run(screen):
             # Draw Index
             mid_angle = (start_deg + end_deg) / 2
             mid_rad = math.radians(mid_angle)
-            idx_x = CENTER[0] + (OUTER_RADIUS + 15) * math.cos(mid_rad)
-            idx_y = CENTER[1] + (OUTER_RADIUS + 15) * math.sin(mid_rad)
-            idx_surf = font_index.render(str(i), True, Colors.LIGHT_GREY)
-            screen.blit(idx_surf, idx_surf.get_rect(center=(idx_x, idx_y)))
+            if i % label_every == 0:
+                idx_x = CENTER[0] + (OUTER_RADIUS + 15) * math.cos(mid_rad)
+                idx_y = CENTER[1] + (OUTER_RADIUS + 15) * math.sin(mid_rad)
+                idx_surf = font_index.render(str(i), True, Colors.LIGHT_GREY)
+                screen.blit(idx_surf, idx_surf.get_rect(center=(idx_x, idx_y)))
 
             # Draw Value
-            if is_filled:
+            if is_filled and show_values:
                 val_dist = (INNER_RADIUS + OUTER_RADIUS) / 2
                 val_x = CENTER[0] + val_dist * math.cos(mid_rad)
                 val_y = CENTER[1] + val_dist * math.sin(mid_rad)
                 val_surf = font_elem.render(str(cq_obj.queue[i]), True, TEXT_COLOR)
                 screen.blit(val_surf, val_surf.get_rect(center=(val_x, val_y)))
 
+        if anim is not None:
+            ease = 1 - (1 - t) ** 3
+            old_step = 360 / anim["old_size"]
+            for old, new in anim["moves"]:
+                mid = -90 + (old + 0.5) * old_step + ((new + 0.5) * angle_step - (old + 0.5) * old_step) * ease
+                half = (old_step + (angle_step - old_step) * ease) / 2 - gap
+                draw_donut_segment(screen, CENTER, INNER_RADIUS, OUTER_RADIUS, mid - half, mid + half, HIGHLIGHT_COLOR)
+                if show_values:
+                    val_dist = (INNER_RADIUS + OUTER_RADIUS) / 2
+                    val_surf = font_elem.render(str(cq_obj.queue[new]), True, TEXT_COLOR)
+                    screen.blit(val_surf, val_surf.get_rect(center=(CENTER[0] + val_dist * math.cos(math.radians(mid)),
+                                                                    CENTER[1] + val_dist * math.sin(math.radians(mid)))))
+
         # 3. Draw Pointers
         if cq_obj.count > 0:
             f_angle = -90 + (cq_obj.front * angle_step) + (angle_step / 2)
@@ -389,6 +621,6 @@ def run(screen):
                 draw_pointer_label(screen, "REAR", r_angle, CENTER, OUTER_RADIUS + 25, TEXT_COLOR)
 
         pygame.display.flip()
-        clock.tick(60)
+        sched.sleep(sim["running"])
 
     return "back"
\ No newline at end of file
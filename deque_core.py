@@ -0,0 +1,154 @@
+"""
+Double-ended queue backed by a doubly linked list of fixed-size blocks,
+the same layout CPython's collections.deque uses (there BLOCK_LEN is 64).
+
+Pure Python (no pygame), so it can be imported and benchmarked headless.
+Items live in left.data[leftindex] .. right.data[rightindex]. Pushing past
+the end of an edge block links in a new block; popping the last item of an
+edge block unlinks it. Nothing is ever shifted, so all four end operations
+are O(1).
+"""
+
+BLOCK_LEN = 4
+CENTER = (BLOCK_LEN - 1) // 2
+
+
+class Block:
+    __slots__ = ("data", "prev", "next", "bid")
+
+    def __init__(self, bid):
+        self.data = [None] * BLOCK_LEN
+        self.prev = None
+        self.next = None
+        self.bid = bid
+
+
+class BlockDeque:
+    def __init__(self, capacity=None):
+        self.capacity = capacity
+        self.allocated = 0  # Blocks ever allocated / freed (instrumentation)
+        self.freed = 0
+        self._reset()
+
+    def _new_block(self):
+        self.allocated += 1
+        return Block(self.allocated)
+
+    def _reset(self):
+        # Empty deque: one block, indices centred so either end can grow first
+        self.left = self.right = self._new_block()
+        self.leftindex = CENTER + 1
+        self.rightindex = CENTER
+        self.size = 0
+
+    def __len__(self):
+        return self.size
+
+    def __iter__(self):
+        block, i = self.left, self.leftindex
+        for _ in range(self.size):
+            yield block.data[i]
+            i += 1
+            if i == BLOCK_LEN:
+                block, i = block.next, 0
+
+    def blocks(self):
+        """ Live blocks, left to right """
+        block = self.left
+        while block is not None:
+            yield block
+            block = block.next
+
+    def is_full(self):
+        return self.capacity is not None and self.size >= self.capacity
+
+    def append(self, val):
+        if self.rightindex == BLOCK_LEN - 1:
+            block = self._new_block()
+            block.prev = self.right
+            self.right.next = block
+            self.right = block
+            self.rightindex = -1
+        self.rightindex += 1
+        self.right.data[self.rightindex] = val
+        self.size += 1
+
+    def appendleft(self, val):
+        if self.leftindex == 0:
+            block = self._new_block()
+            block.next = self.left
+            self.left.prev = block
+            self.left = block
+            self.leftindex = BLOCK_LEN
+        self.leftindex -= 1
+        self.left.data[self.leftindex] = val
+        self.size += 1
+
+    def pop(self):
+        if self.size == 0:
+            return None
+        val = self.right.data[self.rightindex]
+        self.right.data[self.rightindex] = None
+        self.rightindex -= 1
+        self.size -= 1
+        if self.size == 0:
+            # Back to a single block: recentre so both ends have room again
+            self.leftindex = CENTER + 1
+            self.rightindex = CENTER
+        elif self.rightindex < 0:
+            prev = self.right.prev
+            prev.next = None
+            self.right = prev
+            self.rightindex = BLOCK_LEN - 1
+            self.freed += 1
+        return val
+
+    def popleft(self):
+        if self.size == 0:
+            return None
+        val = self.left.data[self.leftindex]
+        self.left.data[self.leftindex] = None
+        self.leftindex += 1
+        self.size -= 1
+        if self.size == 0:
+            self.leftindex = CENTER + 1
+            self.rightindex = CENTER
+        elif self.leftindex == BLOCK_LEN:
+            nxt = self.left.next
+            nxt.prev = None
+            self.left = nxt
+            self.leftindex = 0
+            self.freed += 1
+        return val
+
+    def peek(self):
+        return self.left.data[self.leftindex] if self.size else None
+
+    def peek_right(self):
+        return self.right.data[self.rightindex] if self.size else None
+
+    def clear(self):
+        self.freed += sum(1 for _ in self.blocks())
+        self._reset()
+
+
+class ListDeque:
+    """ The naive alternative: one Python list, front at index 0 """
+
+    def __init__(self):
+        self.items = []
+
+    def __len__(self):
+        return len(self.items)
+
+    def append(self, val):
+        self.items.append(val)
+
+    def appendleft(self, val):
+        self.items.insert(0, val)  # Shifts every item right: O(n)
+
+    def pop(self):
+        return self.items.pop() if self.items else None
+
+    def popleft(self):
+        return self.items.pop(0) if self.items else None  # Shifts every item left: O(n)
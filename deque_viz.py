@@ -0,0 +1,286 @@
+import pygame
+import Colors
+import widgets
+from deque_core import BlockDeque, BLOCK_LEN
+from queue_viz import (
+    Button, InputBox, font_title, font_ui, font_index, font_logic,
+    BACKGROUND_COLOR, ELEMENT_COLOR, HIGHLIGHT_COLOR, TEXT_COLOR,
+    CONTAINER_COLOR, ERROR_COLOR, SUCCESS_COLOR
+)
+from frame_scheduler import FrameScheduler
+
+# --- Configuration ---
+MAX_ITEMS = 36           # Keeps the chain within three rows of blocks
+SLOT_W = 44
+SLOT_H = 50
+BLOCK_PAD = 6
+BLOCK_W = BLOCK_LEN * SLOT_W + 2 * BLOCK_PAD
+BLOCK_H = SLOT_H + 2 * BLOCK_PAD
+LINK_GAP = 40            # Space between blocks for the prev/next links
+BLOCKS_PER_ROW = 4
+CHAIN_X = 50
+CHAIN_Y = 400
+ROW_H = 100
+BLOCK_ANIM_MS = 700      # Flash on allocation, fade-out on free
+
+ALLOC_COLOR = SUCCESS_COLOR
+FREE_COLOR = ERROR_COLOR
+EMPTY_SLOT_COLOR = (80, 80, 80)
+
+
+def block_rect(k):
+    """ Screen rect of the k-th block in the chain (wraps onto rows of BLOCKS_PER_ROW) """
+    row, col = divmod(k, BLOCKS_PER_ROW)
+    return pygame.Rect(CHAIN_X + col * (BLOCK_W + LINK_GAP), CHAIN_Y + row * ROW_H, BLOCK_W, BLOCK_H)
+
+
+# --- Main Run Function ---
+def run(screen):
+    sched = FrameScheduler()
+
+    dq = BlockDeque(capacity=MAX_ITEMS)
+
+    state = {
+        "status_message": "Deque Initialized",
+        "status_color": TEXT_COLOR,
+        "logic_message": "Waiting for operation...",
+        "peek_side": None,
+        "peek_timer_start": 0,
+        "allocated": {},  # bid -> time the block was linked in
+        "freed": []       # (rect, bid, time) ghosts of unlinked blocks
+    }
+
+    val_input = InputBox(50, 100, 140, 40, text="", max_chars=4)
+
+    def set_status(msg, color, logic_msg=""):
+        state["status_message"] = msg
+        state["status_color"] = color
+        state["logic_message"] = logic_msg
+
+    def track_blocks(op):
+        """ Run op and record which blocks it allocated or freed, for the animations """
+        before = {b.bid: block_rect(k) for k, b in enumerate(dq.blocks())}
+        result = op()
+        after = {b.bid for b in dq.blocks()}
+        now = pygame.time.get_ticks()
+        if after != before.keys():
+            sched.animate(BLOCK_ANIM_MS)
+        for bid in after - before.keys():
+            state["allocated"][bid] = now
+        for bid in before.keys() - after:
+            state["freed"].append((before[bid], bid, now))
+        return result, after - before.keys(), before.keys() - after
+
+    def push(side):
+        val = val_input.text.strip()
+        if not val:
+            set_status("Enter a value first!", ERROR_COLOR, "if val is None: return")
+            return
+        if dq.is_full():
+            set_status("Deque Overflow!", ERROR_COLOR, f"Constraint: size <= {MAX_ITEMS}")
+            return
+
+        op = dq.appendleft if side == "left" else dq.append
+        _, new, _ = track_blocks(lambda: op(val))
+        val_input.text = ""
+
+        if side == "left":
+            logic = "leftindex == 0 -> link new block on the left" if new else "leftindex-- | left.data[leftindex] = val"
+        else:
+            logic = f"rightindex == {BLOCK_LEN - 1} -> link new block on the right" if new else "rightindex++ | right.data[rightindex] = val"
+        set_status(f"Pushed {val} ({'front' if side == 'left' else 'back'})", SUCCESS_COLOR, logic)
+
+    def pop(side):
+        if len(dq) == 0:
+            set_status("Deque Underflow!", ERROR_COLOR, "if size == 0: Underflow")
+            return
+
+        op = dq.popleft if side == "left" else dq.pop
+        val, _, gone = track_blocks(op)
+
+        if gone:
+            logic = f"{side} block emptied -> unlink and free it"
+        elif len(dq) == 0:
+            logic = "size == 0 -> recentre indices in the one block"
+        elif side == "left":
+            logic = "val = left.data[leftindex] | leftindex++"
+        else:
+            logic = "val = right.data[rightindex] | rightindex--"
+        set_status(f"Popped {val} ({'front' if side == 'left' else 'back'})", SUCCESS_COLOR, logic)
+
+    def peek(side):
+        if len(dq) == 0:
+            set_status("Deque is Empty", ERROR_COLOR, "return None")
+            return
+        state["peek_side"] = side
+        state["peek_timer_start"] = pygame.time.get_ticks()
+        sched.wake_in(1000)  # the highlight clears after a second
+        if side == "left":
+            set_status(f"Front Item: {dq.peek()}", HIGHLIGHT_COLOR, "return left.data[leftindex]")
+        else:
+            set_status(f"Back Item: {dq.peek_right()}", HIGHLIGHT_COLOR, "return right.data[rightindex]")
+
+    def clear_all():
+        track_blocks(dq.clear)
+        set_status("Deque Cleared", TEXT_COLOR, "Free every block, start over with one")
+
+    def go_back():
+        return "back"
+
+    buttons = [
+        Button(200, 100, 130, 40, "Push Front", lambda: push("left")),
+        Button(340, 100, 130, 40, "Push Back", lambda: push("right")),
+        Button(50, 160, 130, 40, "Pop Front", lambda: pop("left")),
+        Button(190, 160, 130, 40, "Pop Back", lambda: pop("right")),
+        Button(330, 160, 130, 40, "Peek Front", lambda: peek("left")),
+        Button(470, 160, 130, 40, "Peek Back", lambda: peek("right")),
+        Button(610, 160, 100, 40, "Clear", clear_all),
+        Button(900, 15, 80, 40, "← Back", go_back)
+    ]
+    input_boxes = [val_input]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
+
+    # --- Drawing Helpers ---
+    def draw_arrow(start, end, color):
+        pygame.draw.line(screen, color, start, end, 2)
+        dx = 1 if end[0] >= start[0] else -1
+        pygame.draw.polygon(screen, color, [end, (end[0] - 8 * dx, end[1] - 5), (end[0] - 8 * dx, end[1] + 5)])
+
+    def draw_links(k, rect):
+        """ next/prev arrows between block k and block k+1 (wrapping to the next row) """
+        nxt = block_rect(k + 1)
+        if nxt.y == rect.y:
+            draw_arrow((rect.right + 2, rect.y + 18), (nxt.x - 2, nxt.y + 18), CONTAINER_COLOR)
+            draw_arrow((nxt.x - 2, nxt.y + BLOCK_H - 18), (rect.right + 2, rect.y + BLOCK_H - 18), Colors.TEAL_BRIGHT)
+        else:
+            # Row wrap: next link runs down and back to the start of the next row
+            mid_y = rect.bottom + (ROW_H - BLOCK_H) // 2
+            pygame.draw.lines(screen, CONTAINER_COLOR, False,
+                              [(rect.right + 2, rect.y + 18), (rect.right + 15, rect.y + 18),
+                               (rect.right + 15, mid_y), (nxt.x - 15, mid_y), (nxt.x - 15, nxt.y + 18)], 2)
+            draw_arrow((nxt.x - 15, nxt.y + 18), (nxt.x - 2, nxt.y + 18), CONTAINER_COLOR)
+
+    def draw_block(k, block, now):
+        rect = block_rect(k)
+        border = CONTAINER_COLOR
+        born = state["allocated"].get(block.bid)
+        if born is not None and now - born < BLOCK_ANIM_MS:
+            border = ALLOC_COLOR
+        pygame.draw.rect(screen, Colors.BLACK, rect, border_radius=8)
+        pygame.draw.rect(screen, border, rect, 3 if border is ALLOC_COLOR else 2, border_radius=8)
+
+        bid_surf = font_index.render(f"block {block.bid}", True, border)
+        screen.blit(bid_surf, (rect.x + 4, rect.y - 14))
+
+        # Used slots are those inside [leftindex, rightindex] on the edge blocks, all slots in between
+        lo = dq.leftindex if block is dq.left else 0
+        hi = dq.rightindex if block is dq.right else BLOCK_LEN - 1
+        for i in range(BLOCK_LEN):
+            slot = pygame.Rect(rect.x + BLOCK_PAD + i * SLOT_W + 2, rect.y + BLOCK_PAD, SLOT_W - 4, SLOT_H)
+            if len(dq) and lo <= i <= hi:
+                color = ELEMENT_COLOR
+                if (state["peek_side"] == "left" and block is dq.left and i == lo) or \
+                        (state["peek_side"] == "right" and block is dq.right and i == hi):
+                    color = HIGHLIGHT_COLOR
+                pygame.draw.rect(screen, color, slot, border_radius=5)
+                txt_surf = font_logic.render(str(block.data[i]), True, TEXT_COLOR)
+                screen.blit(txt_surf, txt_surf.get_rect(center=slot.center))
+            else:
+                pygame.draw.rect(screen, EMPTY_SLOT_COLOR, slot, 1, border_radius=5)
+        return rect
+
+    def draw_index_marker(rect, i, label, below):
+        x = rect.x + BLOCK_PAD + i * SLOT_W + SLOT_W // 2
+        if below:
+            y = rect.bottom + 2
+            pygame.draw.polygon(screen, TEXT_COLOR, [(x, y), (x - 6, y + 9), (x + 6, y + 9)])
+            lbl = font_index.render(label, True, TEXT_COLOR)
+            screen.blit(lbl, lbl.get_rect(midtop=(x, y + 10)))
+        else:
+            y = rect.y - 16
+            pygame.draw.polygon(screen, TEXT_COLOR, [(x, y + 14), (x - 6, y + 5), (x + 6, y + 5)])
+            lbl = font_index.render(label, True, TEXT_COLOR)
+            screen.blit(lbl, lbl.get_rect(midbottom=(x, y + 3)))
+
+    def draw_freed(now):
+        alive = []
+        for rect, bid, t in state["freed"]:
+            age = now - t
+            if age >= BLOCK_ANIM_MS:
+                continue
+            alive.append((rect, bid, t))
+            ghost = rect.inflate(-int(rect.width * age / BLOCK_ANIM_MS), -int(rect.height * age / BLOCK_ANIM_MS))
+            pygame.draw.rect(screen, FREE_COLOR, ghost, 2, border_radius=8)
+            lbl = font_index.render(f"free {bid}", True, FREE_COLOR)
+            screen.blit(lbl, lbl.get_rect(center=rect.center))
+        state["freed"] = alive
+
+    # --- Main Loop ---
+    running = True
+    while running:
+        current_time = pygame.time.get_ticks()
+
+        if state["peek_side"] is not None and current_time - state["peek_timer_start"] > 1000:
+            state["peek_side"] = None
+            set_status("Ready", TEXT_COLOR, "Waiting...")
+
+        for event in sched.events():
+            target = ui.dispatch(event)
+            if event.type == pygame.QUIT:
+                return "quit"
+
+            for box in input_boxes:
+                box.handle_event(event)
+
+            if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                if target.click() == "back":
+                    return "back"
+
+        # --- Drawing ---
+        screen.fill(BACKGROUND_COLOR)
+
+        title_surf = font_title.render("DEQUE", True, ELEMENT_COLOR)
+        screen.blit(title_surf, (50, 30))
+
+        status_surf = font_ui.render(state["status_message"], True, state["status_color"])
+        screen.blit(status_surf, (350, 30))
+        logic_label = font_ui.render("Logic Flow:", True, Colors.LIGHT_GREY)
+        screen.blit(logic_label, (500, 60))
+        logic_surf = font_logic.render(f"> {state['logic_message']}", True, Colors.TEAL_BRIGHT)
+        screen.blit(logic_surf, (500, 85))
+
+        lbl_val = font_ui.render("Value:", True, Colors.LIGHT_GREY)
+        screen.blit(lbl_val, (50, 75))
+
+        for box in input_boxes: box.draw(screen)
+        for btn in buttons: btn.draw(screen)
+
+        # Block statistics
+        live = sum(1 for _ in dq.blocks())
+        stats = [
+            f"size: {len(dq)} / {MAX_ITEMS}",
+            f"block length: {BLOCK_LEN}",
+            f"live blocks: {live}",
+            f"allocated: {dq.allocated} | freed: {dq.freed}",
+            f"leftindex: {dq.leftindex} | rightindex: {dq.rightindex}",
+        ]
+        for k, line in enumerate(stats):
+            screen.blit(font_logic.render(line, True, TEXT_COLOR), (50 + (k % 3) * 300, 240 + (k // 3) * 22))
+
+        # Block chain
+        blocks = list(dq.blocks())
+        for k, block in enumerate(blocks):
+            if k + 1 < len(blocks):
+                draw_links(k, block_rect(k))
+        rects = [draw_block(k, block, current_time) for k, block in enumerate(blocks)]
+        draw_freed(current_time)
+
+        # LEFT / RIGHT index markers
+        if len(dq):
+            draw_index_marker(rects[0], dq.leftindex, "LEFT", below=False)
+            draw_index_marker(rects[-1], dq.rightindex, "RIGHT", below=True)
+
+        pygame.display.flip()
+        sched.sleep()
+
+    return "back"
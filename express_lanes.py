@@ -0,0 +1,161 @@
+"""
+Express lanes over a linked list, for O(log n) positional access.
+
+Pure Python (no pygame). An indexable skip list kept beside the scenes'
+NodePool lists: every node gets a random height, lane L links each node
+taller than L to the next such node, and span[L][slot] counts how many
+positions that link jumps (a link off the end spans to position length).
+Reaching position k rides the top lane while the spans still fit and drops
+a lane when they don't, so it visits O(log n) nodes instead of k, and
+insert/remove fix up the spans along that same path.
+
+Lanes are stored per pool slot in typed arrays, like the pool's own links;
+slot `capacity` is the head sentinel (position -1), and a lane's arrays are
+only allocated once some node is tall enough to use it. Positions are
+0-based here; the scenes' 1-based pos maps to pos - 1.
+
+The spans also work backwards: rank(slot) finds a node's position without
+walking from the head, by climbing along its tallest links to the end of
+the list, where every lane's spans add up to length.
+"""
+import random
+from array import array
+
+NIL = -1
+MAX_LEVEL = 16
+
+
+class ExpressLanes:
+    def __init__(self, capacity, seed=None):
+        self.capacity = capacity
+        self.head = capacity
+        self.rng = random.Random(seed)
+        self.next = []  # next[L][slot]: the following slot in lane L, or NIL
+        self.span = []  # span[L][slot]: positions that link covers
+        self.height = array("b", [0]) * (capacity + 1)  # Lanes each slot is in, set on insert
+        self.reset()
+
+    def reset(self):
+        self.next.clear()
+        self.span.clear()
+        self.length = 0
+        self.add_lane()
+
+    def add_lane(self):
+        self.next.append(array("q", [NIL]) * (self.capacity + 1))
+        self.span.append(array("q", [0]) * (self.capacity + 1))
+        self.span[-1][self.head] = self.length + 1
+
+    def levels(self):
+        return len(self.next)
+
+    def random_height(self):
+        height = 1
+        while height < MAX_LEVEL and self.rng.random() < 0.5:
+            height += 1
+        return height
+
+    def predecessors(self, pos):
+        """ Per lane, the last slot before position pos and that slot's position """
+        update = [self.head] * len(self.next)
+        rank = [-1] * len(self.next)
+        x, r = self.head, -1
+        for L in reversed(range(len(self.next))):
+            nxt, span = self.next[L], self.span[L]
+            while nxt[x] != NIL and r + span[x] < pos:
+                r += span[x]
+                x = nxt[x]
+            update[L], rank[L] = x, r
+        return update, rank
+
+    def insert(self, pos, slot):
+        """ Put slot at position pos (0 <= pos <= length); later nodes move up one """
+        update, rank = self.predecessors(pos)
+        height = self.random_height()
+        self.height[slot] = height
+        while len(self.next) < height:
+            self.add_lane()
+            update.append(self.head)
+            rank.append(-1)
+
+        for L in range(len(self.next)):
+            span, u = self.span[L], update[L]
+            if L < height:
+                nxt = self.next[L]
+                nxt[slot] = nxt[u]
+                nxt[u] = slot
+                covered = pos - rank[L]
+                span[slot] = span[u] - covered + 1
+                span[u] = covered
+            else:
+                span[u] += 1
+        self.length += 1
+
+    def remove(self, pos):
+        """ Take out the node at position pos (0 <= pos < length); returns its slot """
+        update, rank = self.predecessors(pos)
+        slot = self.next[0][update[0]]
+        for L in range(len(self.next)):
+            nxt, span, u = self.next[L], self.span[L], update[L]
+            if nxt[u] == slot:
+                span[u] += span[slot] - 1
+                nxt[u] = nxt[slot]
+            else:
+                span[u] -= 1
+
+        # Drop lanes nobody is tall enough for any more
+        while len(self.next) > 1 and self.next[-1][self.head] == NIL:
+            self.next.pop()
+            self.span.pop()
+        self.length -= 1
+        return slot
+
+    def path(self, pos):
+        """ The (lane, slot, position) hops taken to reach position pos, ending on it """
+        hops = []
+        if not 0 <= pos < self.length:
+            return hops
+        x, r = self.head, -1
+        for L in reversed(range(len(self.next))):
+            nxt, span = self.next[L], self.span[L]
+            while nxt[x] != NIL and r + span[x] <= pos:
+                r += span[x]
+                x = nxt[x]
+                hops.append((L, x, r))
+            if r == pos:
+                break
+        return hops
+
+    def rank(self, slot):
+        """ Position of slot (which must be in the list): ride its tallest links to the end and count back """
+        x, covered = slot, 0
+        while x != NIL:
+            top = self.height[x] - 1
+            covered += self.span[top][x]
+            x = self.next[top][x]
+        return self.length - covered
+
+    def locate(self, pos):
+        """ Slot at position pos, or NIL """
+        hops = self.path(pos)
+        return hops[-1][1] if hops else NIL
+
+    def lane(self, level, start=0, stop=None):
+        """
+        Positions of the nodes in lane `level`, from the last one at or before
+        start up to the first one at or past stop (so links crossing the
+        window are included); reaches start through the lanes above.
+        """
+        x, r = self.head, -1
+        for L in reversed(range(level, len(self.next))):
+            nxt, span = self.next[L], self.span[L]
+            while nxt[x] != NIL and r + span[x] <= start:
+                r += span[x]
+                x = nxt[x]
+        if r >= 0:
+            yield r
+        nxt, span = self.next[level], self.span[level]
+        while nxt[x] != NIL and (stop is None or r < stop):
+            r += span[x]
+            x = nxt[x]
+            yield r
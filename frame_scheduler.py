@@ -0,0 +1,73 @@
+"""
+Frame pacing for the menu and the visualizer loops.
+
+The loops used to call pygame.event.get() and clock.tick(60) forever, so a
+scene nobody was touching still redrew 60 times a second. FrameScheduler
+keeps that pace only while something is moving; otherwise sleep() blocks in
+pygame.event.wait until input arrives, a timer is due or IDLE_WAKE_MS passes.
+A loop swaps its two calls:
+    for event in sched.events():    # was pygame.event.get()
+    ...
+    sched.sleep(busy)               # was clock.tick(60)
+where busy is the scene's own "something is playing" test (a trace playing,
+a generator or script running, worker threads live). Short tweens call
+sched.animate(ms) when they start, and one-shot timers (a peek highlight
+that clears after a second) call sched.wake_in(ms), so neither needs to be
+part of busy. The frame after any event is always drawn at full pace, so a
+loop that draws before reading its events still shows the result.
+
+Set IDLE_SLEEP = False to get the old always-polling loop back
+(benchmarks/idle_cpu.py compares the two).
+"""
+import pygame
+
+FPS = 60
+IDLE_WAKE_MS = 1000  # an idle loop still runs at least this often
+IDLE_SLEEP = True
+
+
+class FrameScheduler:
+    def __init__(self, fps=FPS, wake_ms=IDLE_WAKE_MS):
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.wake_ms = wake_ms
+        self.pending = []  # the event that ended the last sleep
+        self.fresh = True  # events arrived this frame (and the first frame): draw one more
+        self.busy_until = 0
+        self.wake_at = None
+
+    def events(self):
+        events = self.pending + pygame.event.get()
+        self.pending = []
+        if events:
+            self.fresh = True
+        return events
+
+    def animate(self, ms):
+        """ Keep full frame rate for the next ms, for a tween that just started """
+        self.busy_until = max(self.busy_until, pygame.time.get_ticks() + ms)
+
+    def wake_in(self, ms):
+        """ Don't sleep past ms from now, for a timer that changes what is drawn """
+        at = pygame.time.get_ticks() + ms
+        self.wake_at = at if self.wake_at is None else min(self.wake_at, at)
+
+    def sleep(self, busy=False):
+        """ End of frame: pace to fps while busy, else block until an event; returns ms since the last frame """
+        now = pygame.time.get_ticks()
+        if busy or self.fresh or now < self.busy_until or not IDLE_SLEEP:
+            self.fresh = False
+            return self.clock.tick(self.fps)
+
+        timeout = self.wake_ms
+        if self.wake_at is not None:
+            timeout = min(timeout, self.wake_at - now)
+            if timeout <= 0:
+                self.wake_at = None
+                return self.clock.tick(self.fps)
+        event = pygame.event.wait(timeout + 1)  # + 1: past the deadline, for `now - start > ms` tests
+        if self.wake_at is not None and pygame.time.get_ticks() >= self.wake_at:
+            self.wake_at = None
+        if event.type != pygame.NOEVENT:
+            self.pending.append(event)
+        return self.clock.tick()
@@ -0,0 +1,434 @@
+"""
+Heap logic shared by the Min Heap and Max Heap visualizers.
+
+Pure Python (no pygame), so it can be imported and benchmarked headless.
+The heap order is set by a comparator: higher(a, b) is True when a belongs
+above b (operator.lt gives a min heap, operator.gt a max heap). Each node has
+up to `arity` children (d = 2..8): parent (i-1)//d, children d*i+1 .. d*i+d.
+"""
+import operator
+import os
+
+
+def record_step(trace, heap, kind, i, j, desc):
+    """ Append one animation frame (snapshot + highlighted indices) to a trace """
+    trace.append({
+        'heap': heap[:],
+        'mark': (kind, i, j),
+        'desc': desc
+    })
+
+
+def parse_batch(text):
+    """ Parse '5, 3, 8' (commas or spaces) or, if text is a file path, the file contents """
+    source = text.strip()
+    if os.path.isfile(source):
+        with open(source) as f:
+            source = f.read()
+    return [int(tok) for tok in source.replace(",", " ").split()]
+
+
+MIN_ARITY = 2
+MAX_ARITY = 8
+
+
+class Heap:
+    def __init__(self, higher=operator.lt, capacity=15, arity=2):
+        self.heap = []
+        self.capacity = capacity
+        self.higher = higher
+        self.arity = arity
+
+        # Instrumentation: element comparisons and array writes done by the sifts
+        self.comparisons = 0
+        self.moves = 0
+
+    def set_capacity(self, new_cap):
+        self.capacity = new_cap
+        if len(self.heap) > new_cap:
+            self.heap = self.heap[:new_cap]
+            return True
+        return False
+
+    def reset_counters(self):
+        self.comparisons = 0
+        self.moves = 0
+
+    def set_arity(self, d, trace=None):
+        """ Switch to a d-ary layout and re-heapify the current contents """
+        if not MIN_ARITY <= d <= MAX_ARITY:
+            return False, f"Arity must be {MIN_ARITY}..{MAX_ARITY}."
+        self.arity = d
+        self.build_heap(self.heap, trace)
+        return True, f"Arity set to {d}."
+
+    def parent(self, i): return (i - 1) // self.arity
+    def children(self, i): return range(self.arity * i + 1, min(self.arity * i + self.arity + 1, len(self.heap)))
+
+    def sift_up(self, i, trace=None):
+        """ Move heap[i] towards the root. Parents are shifted down into the hole, item written once """
+        heap = self.heap
+        higher = self.higher
+        item = heap[i]
+        comparisons = moves = 0
+
+        d = self.arity
+        while i > 0:
+            p = (i - 1) // d
+            comparisons += 1
+            if not higher(item, heap[p]):
+                if trace is not None:
+                    record_step(trace, heap, "compare", i, p, f"{item} stays below {heap[p]}")
+                break
+            if trace is not None:
+                record_step(trace, heap, "compare", i, p, f"{item} beats parent {heap[p]}")
+            heap[i] = heap[p]
+            moves += 1
+            if trace is not None:
+                heap[p] = item  # keep the snapshot readable: show item in the hole
+                record_step(trace, heap, "swap", i, p, f"Move {item} up to index {p}")
+            i = p
+
+        heap[i] = item
+        self.comparisons += comparisons
+        self.moves += moves + 1
+        return i
+
+    def sift_down(self, i, trace=None):
+        """ Iterative heapify: the best of the d children moves up into the hole until item fits """
+        heap = self.heap
+        higher = self.higher
+        n = len(heap)
+        d = self.arity
+        item = heap[i]
+        comparisons = moves = 0
+
+        child = d * i + 1
+        while child < n:
+            if d == 2:
+                right = child + 1
+                if right < n:
+                    comparisons += 1
+                    if higher(heap[right], heap[child]):
+                        child = right
+            else:
+                # Pick the best child among heap[child : child + d]
+                last = child + d if child + d < n else n
+                best = child
+                for c in range(child + 1, last):
+                    if higher(heap[c], heap[best]):
+                        best = c
+                comparisons += last - child - 1
+                child = best
+            comparisons += 1
+            if not higher(heap[child], item):
+                if trace is not None:
+                    record_step(trace, heap, "compare", i, child, f"{item} already beats child {heap[child]}")
+                break
+            if trace is not None:
+                record_step(trace, heap, "compare", i, child, f"Child {heap[child]} beats {item}")
+            heap[i] = heap[child]
+            moves += 1
+            if trace is not None:
+                heap[child] = item
+                record_step(trace, heap, "swap", i, child, f"Move {heap[i]} up, {item} down to index {child}")
+            i = child
+            child = d * i + 1
+
+        heap[i] = item
+        self.comparisons += comparisons
+        self.moves += moves + 1
+        return i
+
+    def push(self, val, trace=None):
+        """ Add val and restore heap order. Returns False if the heap is full """
+        if len(self.heap) >= self.capacity:
+            return False
+        self.heap.append(val)
+        if trace is not None:
+            record_step(trace, self.heap, "start", len(self.heap) - 1, -1, f"Append {val} at index {len(self.heap) - 1}")
+        self.sift_up(len(self.heap) - 1, trace)
+        if trace is not None:
+            record_step(trace, self.heap, "done", -1, -1, "Heap property holds")
+        return True
+
+    def pop(self, trace=None):
+        """ Remove and return the root (None if empty) """
+        heap = self.heap
+        if not heap:
+            return None
+        if trace is not None:
+            record_step(trace, heap, "start", 0, len(heap) - 1, f"Take root {heap[0]}, last leaf {heap[-1]} replaces it")
+        last = heap.pop()
+        if not heap:
+            return last
+        top = heap[0]
+        heap[0] = last
+        if trace is not None:
+            record_step(trace, heap, "swap", 0, -1, f"{last} moved to the root")
+        self.sift_down(0, trace)
+        if trace is not None:
+            record_step(trace, heap, "done", -1, -1, "Heap property holds")
+        return top
+
+    def build_heap(self, values, trace=None):
+        """ Floyd's bottom-up heapify: sift down every internal node, last to first. O(n) """
+        if len(values) > self.capacity:
+            return False, f"Too many values ({len(values)}). Capacity is {self.capacity}."
+
+        self.heap = list(values)
+        if trace is not None:
+            record_step(trace, self.heap, "start", -1, -1, f"Load {len(self.heap)} values as-is")
+
+        # Last internal node is the parent of the last leaf: (n-2)//d
+        for i in range((len(self.heap) - 2) // self.arity, -1, -1):
+            if trace is not None:
+                record_step(trace, self.heap, "sift", i, -1, f"Heapify subtree at index {i}")
+            self.sift_down(i, trace)
+
+        if trace is not None:
+            record_step(trace, self.heap, "done", -1, -1, "Heap property holds")
+        return True, f"Built heap of {len(self.heap)} values."
+
+    def insert_many(self, values, trace=None):
+        """ Batch insert: append everything, then one bottom-up heapify over the whole array """
+        if len(self.heap) + len(values) > self.capacity:
+            return False, f"Heap Full! Only {self.capacity - len(self.heap)} slots left."
+        success, _ = self.build_heap(self.heap + list(values), trace)
+        return success, f"Inserted {len(values)} values."
+
+    def peek(self):
+        if not self.heap:
+            return None
+        return self.heap[0]
+
+    def clear(self):
+        self.heap = []
+
+
+class IndexedMinHeap(Heap):
+    """
+    Min heap of (key, priority) entries with a key -> index position map, so a key's
+    priority can be changed or the key removed in O(log n) (Dijkstra / Prim style).
+    self.heap holds the priorities, self.keys the matching keys, self.pos[key] their index.
+    """
+    def __init__(self, capacity=15, arity=2):
+        super().__init__(operator.lt, capacity, arity)
+        self.keys = []
+        self.pos = {}
+
+    def _record(self, trace, kind, i, j, desc):
+        record_step(trace, self.heap, kind, i, j, desc)
+        trace[-1]['keys'] = self.keys[:]
+
+    def path_between(self, top, bottom):
+        """ Indices on the tree path from bottom up to its ancestor top """
+        path = [bottom]
+        while bottom > top:
+            bottom = (bottom - 1) // self.arity
+            path.append(bottom)
+        return path
+
+    def set_capacity(self, new_cap):
+        truncated = super().set_capacity(new_cap)
+        if truncated:
+            for key in self.keys[new_cap:]:
+                del self.pos[key]
+            self.keys = self.keys[:new_cap]
+        return truncated
+
+    def set_arity(self, d, trace=None):
+        if not MIN_ARITY <= d <= MAX_ARITY:
+            return False, f"Arity must be {MIN_ARITY}..{MAX_ARITY}."
+        self.arity = d
+        self.build_heap(list(zip(self.keys, self.heap)), trace)
+        return True, f"Arity set to {d}."
+
+    def sift_up(self, i, trace=None):
+        """ Hole-based sift up that moves keys with their priorities and keeps pos in step """
+        heap, keys, pos = self.heap, self.keys, self.pos
+        d = self.arity
+        item, key = heap[i], keys[i]
+        comparisons = moves = 0
+
+        while i > 0:
+            p = (i - 1) // d
+            comparisons += 1
+            if not item < heap[p]:
+                if trace is not None:
+                    self._record(trace, "compare", i, p, f"{key}:{item} stays below {keys[p]}:{heap[p]}")
+                break
+            if trace is not None:
+                self._record(trace, "compare", i, p, f"{key}:{item} beats parent {keys[p]}:{heap[p]}")
+            heap[i] = heap[p]
+            keys[i] = keys[p]
+            pos[keys[i]] = i
+            moves += 1
+            if trace is not None:
+                heap[p], keys[p] = item, key
+                self._record(trace, "swap", i, p, f"Move {key} up to index {p}, pos[{keys[i]}] = {i}")
+            i = p
+
+        heap[i] = item
+        keys[i] = key
+        pos[key] = i
+        self.comparisons += comparisons
+        self.moves += moves + 1
+        return i
+
+    def sift_down(self, i, trace=None):
+        """ Hole-based sift down that moves keys with their priorities and keeps pos in step """
+        heap, keys, pos = self.heap, self.keys, self.pos
+        n = len(heap)
+        d = self.arity
+        item, key = heap[i], keys[i]
+        comparisons = moves = 0
+
+        child = d * i + 1
+        while child < n:
+            last = child + d if child + d < n else n
+            best = child
+            for c in range(child + 1, last):
+                if heap[c] < heap[best]:
+                    best = c
+            comparisons += last - child
+            child = best
+            if not heap[child] < item:
+                if trace is not None:
+                    self._record(trace, "compare", i, child, f"{key}:{item} already beats child {keys[child]}:{heap[child]}")
+                break
+            if trace is not None:
+                self._record(trace, "compare", i, child, f"Child {keys[child]}:{heap[child]} beats {key}:{item}")
+            heap[i] = heap[child]
+            keys[i] = keys[child]
+            pos[keys[i]] = i
+            moves += 1
+            if trace is not None:
+                heap[child], keys[child] = item, key
+                self._record(trace, "swap", i, child, f"Move {keys[i]} up, {key} down to index {child}")
+            i = child
+            child = d * i + 1
+
+        heap[i] = item
+        keys[i] = key
+        pos[key] = i
+        self.comparisons += comparisons
+        self.moves += moves + 1
+        return i
+
+    def push(self, key, priority, trace=None):
+        if len(self.heap) >= self.capacity:
+            return False, f"Heap Full! Max capacity ({self.capacity}) reached."
+        if key in self.pos:
+            return False, f"Key '{key}' already queued. Use Decrease/Increase Key."
+
+        i = len(self.heap)
+        self.heap.append(priority)
+        self.keys.append(key)
+        self.pos[key] = i
+        if trace is not None:
+            self._record(trace, "start", i, -1, f"Append {key}:{priority} at index {i}")
+        end = self.sift_up(i, trace)
+        if trace is not None:
+            self._record(trace, "path", self.path_between(end, i), -1, f"{key} settled at index {end}")
+        return True, f"Inserted {key}:{priority}."
+
+    def _remove_at(self, i, trace=None):
+        """ Drop the entry at index i: the last leaf fills the gap and sifts whichever way it must """
+        heap, keys = self.heap, self.keys
+        if trace is not None:
+            self._record(trace, "start", i, len(heap) - 1, f"Remove {keys[i]}, last leaf {keys[-1]} fills index {i}")
+        del self.pos[keys[i]]
+        last, last_key = heap.pop(), keys.pop()
+        if i == len(heap):
+            return
+
+        heap[i] = last
+        keys[i] = last_key
+        self.pos[last_key] = i
+        if trace is not None:
+            self._record(trace, "swap", i, -1, f"{last_key} moved to index {i}")
+
+        if i > 0 and last < heap[(i - 1) // self.arity]:
+            end = self.sift_up(i, trace)
+            top, bottom = end, i
+        else:
+            end = self.sift_down(i, trace)
+            top, bottom = i, end
+        if trace is not None:
+            self._record(trace, "path", self.path_between(top, bottom), -1, f"{last_key} settled at index {end}")
+
+    def pop(self, trace=None):
+        """ Remove and return the (key, priority) with the smallest priority (None if empty) """
+        if not self.heap:
+            return None
+        top = (self.keys[0], self.heap[0])
+        self._remove_at(0, trace)
+        return top
+
+    def peek(self):
+        if not self.heap:
+            return None
+        return self.keys[0], self.heap[0]
+
+    def decrease_key(self, key, priority, trace=None):
+        """ Lower key's priority in place, then sift it up. O(log n) """
+        i = self.pos.get(key)
+        if i is None:
+            return False, f"Key '{key}' not in heap."
+        if priority > self.heap[i]:
+            return False, f"{priority} > current {self.heap[i]}. Use Increase Key."
+
+        self.heap[i] = priority
+        if trace is not None:
+            self._record(trace, "start", i, -1, f"pos[{key}] = {i}: priority -> {priority}")
+        end = self.sift_up(i, trace)
+        if trace is not None:
+            self._record(trace, "path", self.path_between(end, i), -1, f"{key} moved up to index {end}")
+        return True, f"Decreased {key} to {priority}."
+
+    def increase_key(self, key, priority, trace=None):
+        """ Raise key's priority in place, then sift it down. O(d log n) """
+        i = self.pos.get(key)
+        if i is None:
+            return False, f"Key '{key}' not in heap."
+        if priority < self.heap[i]:
+            return False, f"{priority} < current {self.heap[i]}. Use Decrease Key."
+
+        self.heap[i] = priority
+        if trace is not None:
+            self._record(trace, "start", i, -1, f"pos[{key}] = {i}: priority -> {priority}")
+        end = self.sift_down(i, trace)
+        if trace is not None:
+            self._record(trace, "path", self.path_between(i, end), -1, f"{key} moved down to index {end}")
+        return True, f"Increased {key} to {priority}."
+
+    def remove(self, key, trace=None):
+        i = self.pos.get(key)
+        if i is None:
+            return False, f"Key '{key}' not in heap."
+        priority = self.heap[i]
+        self._remove_at(i, trace)
+        return True, f"Removed {key}:{priority}."
+
+    def build_heap(self, entries, trace=None):
+        """ Bottom-up heapify of (key, priority) pairs """
+        keys = [k for k, _ in entries]
+        if len(set(keys)) != len(keys):
+            return False, "Keys must be unique."
+        if len(keys) > self.capacity:
+            return False, f"Too many values ({len(keys)}). Capacity is {self.capacity}."
+        self.keys = keys
+        self.pos = {k: i for i, k in enumerate(keys)}
+        return super().build_heap([p for _, p in entries], trace)
+
+    def insert_many(self, entries, trace=None):
+        if len(self.heap) + len(entries) > self.capacity:
+            return False, f"Heap Full! Only {self.capacity - len(self.heap)} slots left."
+        success, msg = self.build_heap(list(zip(self.keys, self.heap)) + list(entries), trace)
+        return success, (f"Inserted {len(entries)} values." if success else msg)
+
+    def clear(self):
+        self.heap = []
+        self.keys = []
+        self.pos = {}
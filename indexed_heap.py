@@ -0,0 +1,326 @@
+import pygame
+import widgets
+from heap_core import IndexedMinHeap
+from min_heap import (
+    Button, InputBox, get_font, font_title, font_ui, font_msg, font_node,
+    SCREEN_WIDTH, ORANGE, GREY_BG, TEAL, TEAL_HOVER, BLACK, WHITE, LIGHT_GREY,
+    ERROR_COLOR, SUCCESS_COLOR, COMPARE_COLOR, SWAP_COLOR,
+    MAX_CAPACITY, TRACE_STEP_MS
+)
+from frame_scheduler import FrameScheduler
+
+# -------------------------------------------------------------------------
+# INDEXED MIN HEAP (key -> priority, with decrease-key)
+# Widgets, colors and fonts come from the Min Heap scene.
+# -------------------------------------------------------------------------
+
+font_key = get_font(13)
+
+
+def run(SCREEN):
+    sched = FrameScheduler()
+    pq = IndexedMinHeap(capacity=MAX_CAPACITY)
+
+    state = {
+        "status_msg": "Indexed Min Heap Ready.",
+        "msg_color": WHITE,
+        "logic_msg": "Waiting for operation...",
+        # Animation trace (same history/step_index model as the sorting visualizers)
+        "trace": [],
+        "step": 0,
+        "playing": False,
+        "last_update": 0,
+        "record": True  # Off = operations run on the untraced fast path
+    }
+
+    # --- UI LAYOUT ---
+
+    # 1. Key / Priority Inputs
+    input_key = InputBox(50, 90, 80, 40, max_chars=3)
+    input_prio = InputBox(140, 90, 100, 40, max_chars=4, numeric_only=True)
+
+    # 2. Operations
+    y_op = 160
+
+    # 3. Trace Playback
+    y_play = 210
+    btn_rec = Button(320, y_play, 110, 35, "Trace: On", "REC")
+
+    buttons = [
+        Button(260, 90, 100, 40, "Insert", "INS"),
+        Button(370, 90, 100, 40, "Remove", "REM"),
+        Button(50, y_op, 150, 40, "Decrease Key", "DEC"),
+        Button(210, y_op, 150, 40, "Increase Key", "INC"),
+        Button(370, y_op, 120, 40, "Extract Min", "EXT"),
+        Button(500, y_op, 100, 40, "Peek", "PEEK"),
+        Button(610, y_op, 100, 40, "Clear", "CLR"),
+        Button(50, y_play, 80, 35, "Prev", "PREV"),
+        Button(140, y_play, 80, 35, "Play/||", "PLAY"),
+        Button(230, y_play, 80, 35, "Next", "NEXT"),
+        btn_rec,
+        Button(900, 15, 80, 40, "← Back", "BACK", color=ORANGE)
+    ]
+
+    input_boxes = [input_key, input_prio]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
+
+    def set_status(msg, color, logic=""):
+        state["status_msg"] = msg
+        state["msg_color"] = color
+        state["logic_msg"] = logic
+
+    def start_trace(trace):
+        state["trace"] = trace
+        state["step"] = 0
+        state["playing"] = True
+        state["last_update"] = pygame.time.get_ticks()
+
+    def stop_trace():
+        state["trace"] = []
+        state["step"] = 0
+        state["playing"] = False
+
+    def update_trace():
+        if state["playing"]:
+            now = pygame.time.get_ticks()
+            if now - state["last_update"] > TRACE_STEP_MS:
+                step_trace(1)
+                state["last_update"] = now
+
+    def step_trace(delta):
+        if not state["trace"]:
+            return
+        new_step = state["step"] + delta
+        if 0 <= new_step < len(state["trace"]):
+            state["step"] = new_step
+        elif new_step >= len(state["trace"]):
+            state["playing"] = False
+
+    def generate_tree_layout():
+        """ Node coordinates for the binary tree: equal-width leaf columns, parents centred over children """
+        positions = {}
+        start_y = 300
+        level_height = 80
+
+        leaf_count = sum(1 for i in range(MAX_CAPACITY) if 2 * i + 1 >= MAX_CAPACITY)
+        column_width = SCREEN_WIDTH / leaf_count
+        next_column = [0]
+
+        def place(i, level):
+            children = range(2 * i + 1, min(2 * i + 3, MAX_CAPACITY))
+            if children:
+                for c in children:
+                    place(c, level + 1)
+                x = (positions[children[0]][0] + positions[children[-1]][0]) / 2
+            else:
+                x = column_width * (next_column[0] + 0.5)
+                next_column[0] += 1
+            positions[i] = (x, start_y + (level * level_height))
+
+        place(0, 0)
+        return positions
+
+    node_positions = generate_tree_layout()
+
+    def read_key():
+        return input_key.text.strip().upper()
+
+    def read_priority():
+        txt = input_prio.text
+        return int(txt) if txt else None
+
+    def run_op(success, msg, logic, trace):
+        if success:
+            set_status(msg, SUCCESS_COLOR, logic)
+            if trace:
+                start_trace(trace)
+        else:
+            set_status(msg, ERROR_COLOR)
+        return success
+
+    # --- ACTION HANDLER ---
+    def execute_action(code):
+        if code == "BACK":
+            return "back"
+
+        if code in ("PREV", "NEXT"):
+            state["playing"] = False
+            step_trace(-1 if code == "PREV" else 1)
+            return None
+        if code == "PLAY":
+            if state["trace"]:
+                if state["step"] >= len(state["trace"]) - 1:
+                    state["step"] = 0
+                    state["playing"] = True
+                else:
+                    state["playing"] = not state["playing"]
+                state["last_update"] = pygame.time.get_ticks()
+            return None
+
+        # Any new operation replaces the trace on screen with the live heap
+        stop_trace()
+        trace = [] if state["record"] else None
+
+        if code == "REC":
+            state["record"] = not state["record"]
+            btn_rec.text = "Trace: On" if state["record"] else "Trace: Off"
+
+        elif code in ("INS", "DEC", "INC"):
+            key, prio = read_key(), read_priority()
+            if not key or prio is None:
+                set_status("Enter a Key and a Priority!", ERROR_COLOR)
+                return None
+            if code == "INS":
+                ok = run_op(*pq.push(key, prio, trace), "Append -> Bubble Up, pos[key] tracks index", trace)
+            elif code == "DEC":
+                ok = run_op(*pq.decrease_key(key, prio, trace), "i = pos[key] -> lower priority -> Bubble Up", trace)
+            else:
+                ok = run_op(*pq.increase_key(key, prio, trace), "i = pos[key] -> raise priority -> Heapify Down", trace)
+            if ok:
+                input_prio.text = ""
+
+        elif code == "REM":
+            key = read_key()
+            if not key:
+                set_status("Enter a Key!", ERROR_COLOR)
+                return None
+            if run_op(*pq.remove(key, trace), "i = pos[key] -> Last fills i -> Sift Up or Down", trace):
+                input_key.text = ""
+
+        elif code == "EXT":
+            item = pq.pop(trace)
+            if item is not None:
+                run_op(True, f"Extracted Min: {item[0]}:{item[1]}", "Root out -> Last to Root -> Heapify Down", trace)
+            else:
+                set_status("Heap is Empty!", ERROR_COLOR)
+
+        elif code == "PEEK":
+            item = pq.peek()
+            if item is not None:
+                set_status(f"Min: {item[0]}:{item[1]}", ORANGE, "Root Node (Index 0)")
+            else:
+                set_status("Heap is Empty", ERROR_COLOR)
+
+        elif code == "CLR":
+            pq.clear()
+            set_status("Heap Cleared", WHITE, "Reset")
+
+        return None
+
+    # --- DRAWING FUNCTIONS ---
+    def current_frame():
+        """ Heap contents + keys + highlight to draw: the trace step if one is loaded, else the live heap """
+        if state["trace"]:
+            frame = state["trace"][state["step"]]
+            return frame['heap'], frame['keys'], frame['mark']
+        return pq.heap, pq.keys, None
+
+    def draw_node(i, val, key, mark):
+        pos = node_positions[i]
+        rect = pygame.Rect(0, 0, 45, 45)
+        rect.center = pos
+
+        color = TEAL
+        if mark is not None:
+            if mark[0] == "path" and i in mark[1]:
+                color = ORANGE
+            elif mark[0] != "path" and i in (mark[1], mark[2]):
+                color = SWAP_COLOR if mark[0] == "swap" else COMPARE_COLOR
+
+        pygame.draw.rect(SCREEN, color, rect, border_radius=6)
+        pygame.draw.rect(SCREEN, LIGHT_GREY, rect, 1, border_radius=6)
+
+        txt_surf = font_node.render(str(val), True, BLACK)
+        SCREEN.blit(txt_surf, txt_surf.get_rect(center=rect.center))
+
+        # Key label above the node
+        key_surf = font_key.render(key, True, ORANGE if color != ORANGE else WHITE)
+        SCREEN.blit(key_surf, key_surf.get_rect(midbottom=(rect.centerx, rect.top - 2)))
+
+    def draw_pos_map(keys):
+        """ The position map, in index order: key -> index it currently lives at """
+        lbl = font_msg.render("pos[key]:", True, LIGHT_GREY)
+        SCREEN.blit(lbl, (50, 655))
+        x = 140
+        for i, key in enumerate(keys):
+            entry = font_key.render(f"{key}->{i}", True, TEAL_HOVER)
+            if x + entry.get_width() > SCREEN_WIDTH - 20:
+                break
+            SCREEN.blit(entry, (x, 657))
+            x += entry.get_width() + 12
+
+    def draw():
+        SCREEN.fill(GREY_BG)
+
+        # Header
+        title_surf = font_title.render("INDEXED HEAP", True, ORANGE)
+        SCREEN.blit(title_surf, (50, 30))
+
+        # Controls
+        lbl_key = font_ui.render("Key:", True, LIGHT_GREY)
+        SCREEN.blit(lbl_key, (50, 65))
+        lbl_prio = font_ui.render("Priority:", True, LIGHT_GREY)
+        SCREEN.blit(lbl_prio, (140, 65))
+        for box in input_boxes:
+            box.draw(SCREEN)
+
+        for btn in buttons:
+            btn.draw(SCREEN)
+
+        # Status Messages
+        s_surf = font_ui.render(state["status_msg"], True, state["msg_color"])
+        SCREEN.blit(s_surf, (550, 40))
+
+        l_lbl = font_ui.render("Logic Flow:", True, LIGHT_GREY)
+        SCREEN.blit(l_lbl, (550, 70))
+        l_surf = font_msg.render(f"> {state['logic_msg']}", True, TEAL_HOVER)
+        SCREEN.blit(l_surf, (550, 95))
+
+        # Trace Playback
+        if state["trace"]:
+            step_txt = f"Step {state['step'] + 1} / {len(state['trace'])}: {state['trace'][state['step']]['desc']}"
+            s_step = font_msg.render(step_txt, True, TEAL_HOVER)
+            SCREEN.blit(s_step, (445, y_play + 8))
+
+        # Divider
+        pygame.draw.line(SCREEN, TEAL, (0, 260), (SCREEN_WIDTH, 260), 2)
+
+        heap, keys, mark = current_frame()
+        path = mark[1] if mark is not None and mark[0] == "path" else ()
+
+        # Draw Connectors (the moved path is drawn thicker)
+        for i in range(1, len(heap)):
+            p = pq.parent(i)
+            on_path = i in path and p in path
+            pygame.draw.line(SCREEN, ORANGE if on_path else LIGHT_GREY,
+                             node_positions[p], node_positions[i], 4 if on_path else 2)
+
+        # Draw Nodes
+        for i in range(len(heap)):
+            draw_node(i, heap[i], keys[i], mark)
+
+        draw_pos_map(keys)
+
+        pygame.display.flip()
+
+    # --- MAIN LOOP ---
+    running = True
+    while running:
+        for event in sched.events():
+            target = ui.dispatch(event)
+            if event.type == pygame.QUIT:
+                return "quit"
+
+            for box in input_boxes:
+                box.handle_event(event)
+
+            if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                result = execute_action(target.action_code)
+                if result == "back":
+                    return "back"
+
+        update_trace()
+        draw()
+        sched.sleep(state["playing"])
+
+    return "back"
@@ -0,0 +1,827 @@
+"""
+Logic cores for the singly, doubly, circular, XOR and unrolled linked-list scenes.
+
+Pure Python (no pygame), so the lists can be fuzzed and benchmarked
+headless. A core keeps its nodes in a NodePool (with ExpressLanes beside
+it, except the XOR and unrolled lists), and every operation is a generator:
+it applies one step of the algorithm, yields an event describing that step,
+and carries on when the caller asks for the next one. The scenes iterate an operation and animate
+each event as it arrives; run() just drains it. Positions are 0-based.
+
+Events are tuples, kind first:
+    ("error", status, logic)            refused; nothing was changed
+    ("visit", name, slot, pos, lane)    pointer `name` moved to slot at pos, along
+                                        next (lane 0), prev (-1) or express lane L > 0
+    ("new", slot, pos)                  node allocated, on its way to pos
+    ("link", slot, field, target, old)  slot's next/prev now target (was old); for
+                                        field "both" they are XORed addresses
+    ("set", name, slot, old)            head / tail / last now slot (was old)
+    ("placed", pos, slot)               slot counted at pos
+    ("removed", pos, slot)              slot at pos unlinked and back in the pool
+    ("found", slot, pos, comparisons)   end of a search; slot NIL if missing, and
+                                        comparisons 0 when the value index answered it
+
+The unrolled list's blocks hold several entries each, which adds:
+    ("put", slot, offset, value)        value inserted into slot's block at offset
+    ("take", slot, offset, value)       value removed from slot's block at offset
+    ("split", slot, new, moved)         slot's last `moved` entries moved into block new
+    ("shift", slot, into, moved)        slot's first `moved` entries appended to block into
+    ("merge", slot, other, moved)       all `moved` entries of block other appended to slot
+"""
+from node_pool import NodePool, NIL
+from express_lanes import ExpressLanes
+
+
+def run(op):
+    """ Drain an operation without animating it; returns its last event """
+    event = None
+    for event in op:
+        pass
+    return event
+
+
+class ListCore:
+    pointers = ()
+    express = True  # Keep express lanes over the positions
+
+    def __init__(self, size, pool=None, seed=None):
+        self.size = size
+        self.pool = pool if pool is not None else NodePool(size, indexed=True)
+        self.lanes = ExpressLanes(self.pool.capacity, seed) if self.express else None
+        self.reset()
+
+    def reset(self):
+        self.pool.reset()
+        if self.lanes is not None:
+            self.lanes.reset()
+        self.length = 0
+        for name in self.pointers:
+            setattr(self, name, NIL)
+
+    def full(self):
+        return self.length >= self.size or self.pool.free_head == NIL
+
+    def slots(self):
+        """ Slots in list order, following next[] from the first node """
+        slot = self.first()
+        for _ in range(self.length):
+            yield slot
+            slot = self.pool.next[slot]
+
+    def values(self):
+        return [self.pool.data[slot] for slot in self.slots()]
+
+    def extend(self, values):
+        """ Append values without stopping per step, until the list is full; returns how many went in """
+        count = 0
+        for data in values:
+            if self.full():
+                break
+            run(self.push_back(data))
+            count += 1
+        return count
+
+    # Steps: each applies one change and returns the event describing it
+    def link(self, slot, field, target):
+        links = self.pool.next if field == "next" else self.pool.prev
+        old = links[slot]
+        links[slot] = target
+        return ("link", slot, field, target, old)
+
+    def point(self, name, slot):
+        old = getattr(self, name)
+        setattr(self, name, slot)
+        return ("set", name, slot, old)
+
+    def place(self, pos, slot):
+        self.lanes.insert(pos, slot)
+        self.length += 1
+        return ("placed", pos, slot)
+
+    def drop(self, pos):
+        slot = self.lanes.remove(pos)
+        self.length -= 1
+        self.pool.free(slot)
+        return ("removed", pos, slot)
+
+    def walk(self, name, pos):
+        """ Pointer `name` from the first node to pos along the express lanes; returns the slot there """
+        slot = self.first()
+        yield ("visit", name, slot, 0, 0)
+        for lane, hop, i in self.lanes.path(pos):
+            if i:
+                slot = hop
+                yield ("visit", name, slot, i, lane)
+        return slot
+
+    def indexed(self):
+        """ Whether lookup() can answer: the pool keeps a value index and the lanes can rank its slots """
+        return self.pool.index is not None and self.lanes is not None
+
+    def lookup(self, value):
+        """ (slot, pos) of the first node whose str(data) is str(value), or (NIL, -1), without walking """
+        found, pos = NIL, -1
+        for slot in self.pool.holding(value):
+            i = self.lanes.rank(slot)
+            if pos < 0 or i < pos:
+                found, pos = slot, i
+        return found, pos
+
+    def scan(self, value):
+        """ Linear walk from the first node comparing str(data) """
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        key = str(value)
+        found, pos, comparisons = NIL, -1, 0
+        for i, slot in enumerate(self.slots()):
+            yield ("visit", "temp", slot, i, 0)
+            comparisons += 1
+            if str(self.pool.data[slot]) == key:
+                found, pos = slot, i
+                break
+        yield ("found", found, pos, comparisons)
+
+    def find(self, value):
+        """ Answer from the value index when there is one, otherwise scan """
+        if not self.indexed():
+            yield from self.scan(value)
+        elif self.length == 0:
+            yield ("error", "List Empty!", "> return")
+        else:
+            yield ("found", *self.lookup(value), 0)
+
+    def clear(self):
+        """ Unlink the nodes one at a time from the front """
+        if self.length == 0:
+            yield ("error", "List is already Empty!", "> return")
+            return
+        while self.length:
+            yield from self.pop_front()
+
+
+class SinglyCore(ListCore):
+    pointers = ("head", "tail")
+
+    def first(self):
+        return self.head
+
+    def push_back(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> if length == size: return")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, self.length)
+        if self.tail == NIL:
+            yield self.point("head", slot)
+        else:
+            yield self.link(self.tail, "next", slot)
+        yield self.point("tail", slot)
+        yield self.place(self.length, slot)
+
+    def push_front(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, 0)
+        yield self.link(slot, "next", self.head)
+        yield self.place(0, slot)
+        yield self.point("head", slot)
+        if self.tail == NIL:
+            yield self.point("tail", slot)
+
+    def pop_front(self):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> if head is None: return")
+            return
+        yield ("visit", "temp", self.head, 0, 0)
+        yield self.point("head", self.pool.next[self.head])
+        if self.head == NIL:
+            yield self.point("tail", NIL)
+        yield self.drop(0)
+
+    def pop_back(self):
+        if self.length < 2:
+            yield from self.pop_front()
+            return
+        temp = yield from self.walk("temp", self.length - 2)
+        yield self.point("tail", temp)
+        yield self.link(temp, "next", NIL)
+        yield self.drop(self.length - 1)
+
+    def insert_at(self, pos, data):
+        if not 0 <= pos <= self.length:
+            yield ("error", "Invalid Position!", "> pos > length + 1")
+            return
+        if pos == 0:
+            yield from self.push_front(data)
+            return
+        if pos == self.length:
+            yield from self.push_back(data)
+            return
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        temp = yield from self.walk("temp", pos - 1)
+        slot = self.pool.alloc(data)
+        yield ("new", slot, pos)
+        yield self.link(slot, "next", self.pool.next[temp])
+        yield self.link(temp, "next", slot)
+        yield self.place(pos, slot)
+
+    def remove_at(self, pos):
+        if not 0 <= pos < self.length:
+            yield ("error", "Invalid Position!", "> pos out of bounds")
+            return
+        if pos == 0:
+            yield from self.pop_front()
+            return
+        if pos == self.length - 1:
+            yield from self.pop_back()
+            return
+        prev = yield from self.walk("temp", pos - 1)
+        temp = self.pool.next[prev]
+        yield ("visit", "temp", temp, pos, 0)
+        yield ("visit", "prev", prev, pos - 1, 0)
+        yield self.link(prev, "next", self.pool.next[temp])
+        yield self.link(temp, "next", NIL)
+        yield self.drop(pos)
+
+
+class DoublyCore(ListCore):
+    pointers = ("head", "tail")
+
+    def first(self):
+        return self.head
+
+    def walk_to(self, name, pos):
+        """ Pointer `name` to pos from the nearer end: lane hops from the head or prev links from the tail """
+        back = self.length - 1 - pos
+        if back >= len(self.lanes.path(pos)):
+            return (yield from self.walk(name, pos))
+        slot = self.tail
+        yield ("visit", name, slot, self.length - 1, -1)
+        for i in range(self.length - 2, pos - 1, -1):
+            slot = self.pool.prev[slot]
+            yield ("visit", name, slot, i, -1)
+        return slot
+
+    def push_back(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, self.length)
+        if self.tail == NIL:
+            yield self.point("head", slot)
+        else:
+            yield self.link(self.tail, "next", slot)
+            yield self.link(slot, "prev", self.tail)
+        yield self.point("tail", slot)
+        yield self.place(self.length, slot)
+
+    def push_front(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, 0)
+        if self.head == NIL:
+            yield self.point("tail", slot)
+        else:
+            yield self.link(slot, "next", self.head)
+            yield self.link(self.head, "prev", slot)
+        yield self.point("head", slot)
+        yield self.place(0, slot)
+
+    def pop_front(self):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        yield ("visit", "temp", self.head, 0, 0)
+        yield self.point("head", self.pool.next[self.head])
+        if self.head == NIL:
+            yield self.point("tail", NIL)
+        else:
+            yield self.link(self.head, "prev", NIL)
+        yield self.drop(0)
+
+    def pop_back(self):
+        if self.length < 2:
+            yield from self.pop_front()
+            return
+        yield ("visit", "temp", self.tail, self.length - 1, -1)
+        yield self.point("tail", self.pool.prev[self.tail])
+        yield self.link(self.tail, "next", NIL)
+        yield self.drop(self.length - 1)
+
+    def insert_at(self, pos, data):
+        if not 0 <= pos <= self.length:
+            yield ("error", "Invalid Position", "> pos out of bounds")
+            return
+        if pos == 0:
+            yield from self.push_front(data)
+            return
+        if pos == self.length:
+            yield from self.push_back(data)
+            return
+        if self.full():
+            yield ("error", "Limit Reached", "> Capacity Full")
+            return
+        temp = yield from self.walk_to("temp", pos - 1)
+        after = self.pool.next[temp]
+        slot = self.pool.alloc(data)
+        yield ("new", slot, pos)
+        yield self.link(slot, "next", after)
+        yield self.link(after, "prev", slot)
+        yield self.link(temp, "next", slot)
+        yield self.link(slot, "prev", temp)
+        yield self.place(pos, slot)
+
+    def remove_at(self, pos):
+        if not 0 <= pos < self.length:
+            yield ("error", "Invalid Position", "> Out of bounds")
+            return
+        if pos == 0:
+            yield from self.pop_front()
+            return
+        if pos == self.length - 1:
+            yield from self.pop_back()
+            return
+        temp = yield from self.walk_to("temp", pos)
+        prev, after = self.pool.prev[temp], self.pool.next[temp]
+        yield ("visit", "prev", prev, pos - 1, -1)
+        yield ("visit", "next", after, pos + 1, 0)
+        yield self.link(prev, "next", after)
+        yield self.link(after, "prev", prev)
+        yield self.drop(pos)
+
+
+class CircularCore(ListCore):
+    pointers = ("last",)
+
+    def first(self):
+        return NIL if self.last == NIL else self.pool.next[self.last]
+
+    def push_back(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, self.length)
+        if self.last == NIL:
+            yield self.link(slot, "next", slot)
+        else:
+            first = self.pool.next[self.last]
+            yield self.link(self.last, "next", slot)
+            yield self.link(slot, "next", first)
+        yield self.point("last", slot)
+        yield self.place(self.length, slot)
+
+    def push_front(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, 0)
+        if self.last == NIL:
+            yield self.link(slot, "next", slot)
+            yield self.point("last", slot)
+        else:
+            yield self.link(slot, "next", self.pool.next[self.last])
+            yield self.link(self.last, "next", slot)
+        yield self.place(0, slot)
+
+    def pop_front(self):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        first = self.pool.next[self.last]
+        yield ("visit", "curr", first, 0, 0)
+        if first == self.last:
+            yield self.point("last", NIL)
+        else:
+            yield self.link(self.last, "next", self.pool.next[first])
+        yield self.drop(0)
+
+    def pop_back(self):
+        if self.length < 2:
+            yield from self.pop_front()
+            return
+        curr = yield from self.walk("curr", self.length - 2)
+        yield self.link(curr, "next", self.pool.next[self.last])
+        yield self.point("last", curr)
+        yield self.drop(self.length - 1)
+
+    def insert_at(self, pos, data):
+        if not 0 <= pos <= self.length:
+            yield ("error", "Invalid Position", "> Position out of bounds")
+            return
+        if pos == 0:
+            yield from self.push_front(data)
+            return
+        if pos == self.length:
+            yield from self.push_back(data)
+            return
+        if self.full():
+            yield ("error", "Limit Reached", "> Capacity Full")
+            return
+        temp = yield from self.walk("curr", pos - 1)
+        after = self.pool.next[temp]
+        slot = self.pool.alloc(data)
+        yield ("new", slot, pos)
+        yield self.link(temp, "next", slot)
+        yield self.link(slot, "next", after)
+        yield self.place(pos, slot)
+
+    def remove_at(self, pos):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        if not 0 <= pos < self.length:
+            yield ("error", "Invalid Position", "> Position out of bounds")
+            return
+        if pos == 0:
+            yield from self.pop_front()
+            return
+        if pos == self.length - 1:
+            yield from self.pop_back()
+            return
+        prev = yield from self.walk("curr", pos - 1)
+        curr = self.pool.next[prev]
+        yield ("visit", "curr", curr, pos, 0)
+        yield ("visit", "prev", prev, pos - 1, 0)
+        yield self.link(prev, "next", self.pool.next[curr])
+        yield self.drop(pos)
+
+
+class XorCore(ListCore):
+    """
+    Doubly linked list with one link per node: both[slot] = addr(prev) ^ addr(next).
+    Python has no raw pointers, so a node's address is its pool slot + 1 and NIL's is
+    0; both[] lives in the pool's next[] and the pool has no prev[] at all. Stepping
+    needs the node you came from (after = both ^ addr(before)), so walks run from
+    whichever end is nearer and carry the previous slot along. There are no express
+    lanes: they would cost more per node than the dropped link saves.
+    """
+    pointers = ("head", "tail")
+    express = False
+
+    def __init__(self, size, pool=None, seed=None):
+        if pool is None:
+            pool = NodePool(size, with_prev=False)
+        super().__init__(size, pool, seed)
+
+    def first(self):
+        return self.head
+
+    def step(self, came_from, slot):
+        """ The neighbour of slot on the far side from came_from """
+        return (self.pool.next[slot] ^ (came_from + 1)) - 1
+
+    def slots(self, backward=False):
+        """ Slots in list order (tail to head if backward), XOR-stepping from the end """
+        before, slot = NIL, self.tail if backward else self.head
+        for _ in range(self.length):
+            yield slot
+            before, slot = slot, self.step(before, slot)
+
+    # Steps
+    def relink(self, slot, prev, after):
+        """ Point slot's one link at prev and after """
+        old = self.pool.next[slot]
+        both = self.pool.next[slot] = (prev + 1) ^ (after + 1)
+        return ("link", slot, "both", both, old)
+
+    def place(self, pos, slot):
+        self.length += 1
+        return ("placed", pos, slot)
+
+    def drop(self, pos, slot):
+        self.length -= 1
+        self.pool.free(slot)
+        return ("removed", pos, slot)
+
+    def walk_to(self, name, pos):
+        """ Pointer `name` to pos from the nearer end; returns (prev, slot, next) there """
+        backward = pos > (self.length - 1) // 2
+        before, slot = NIL, self.tail if backward else self.head
+        i, stride = (self.length - 1, -1) if backward else (0, 1)
+        yield ("visit", name, slot, i, -1 if backward else 0)
+        while i != pos:
+            before, slot = slot, self.step(before, slot)
+            i += stride
+            yield ("visit", name, slot, i, -1 if backward else 0)
+        after = self.step(before, slot)
+        return (after, slot, before) if backward else (before, slot, after)
+
+    def push_back(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, self.length)
+        if self.tail == NIL:
+            yield self.relink(slot, NIL, NIL)
+            yield self.point("head", slot)
+        else:
+            yield self.relink(slot, self.tail, NIL)
+            yield self.relink(self.tail, self.step(NIL, self.tail), slot)
+        yield self.point("tail", slot)
+        yield self.place(self.length, slot)
+
+    def push_front(self, data):
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        slot = self.pool.alloc(data)
+        yield ("new", slot, 0)
+        if self.head == NIL:
+            yield self.relink(slot, NIL, NIL)
+            yield self.point("tail", slot)
+        else:
+            yield self.relink(slot, NIL, self.head)
+            yield self.relink(self.head, slot, self.step(NIL, self.head))
+        yield self.point("head", slot)
+        yield self.place(0, slot)
+
+    def pop_front(self):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        slot = self.head
+        yield ("visit", "temp", slot, 0, 0)
+        after = self.step(NIL, slot)
+        yield self.point("head", after)
+        if after == NIL:
+            yield self.point("tail", NIL)
+        else:
+            yield self.relink(after, NIL, self.step(slot, after))
+        yield self.drop(0, slot)
+
+    def pop_back(self):
+        if self.length < 2:
+            yield from self.pop_front()
+            return
+        slot = self.tail
+        yield ("visit", "temp", slot, self.length - 1, -1)
+        before = self.step(NIL, slot)
+        yield self.point("tail", before)
+        yield self.relink(before, self.step(slot, before), NIL)
+        yield self.drop(self.length - 1, slot)
+
+    def insert_at(self, pos, data):
+        if not 0 <= pos <= self.length:
+            yield ("error", "Invalid Position", "> pos out of bounds")
+            return
+        if pos == 0:
+            yield from self.push_front(data)
+            return
+        if pos == self.length:
+            yield from self.push_back(data)
+            return
+        if self.full():
+            yield ("error", "Limit Reached", "> Capacity Full")
+            return
+        before, temp, after = yield from self.walk_to("temp", pos - 1)
+        beyond = self.step(temp, after)
+        slot = self.pool.alloc(data)
+        yield ("new", slot, pos)
+        yield self.relink(slot, temp, after)
+        yield self.relink(temp, before, slot)
+        yield self.relink(after, slot, beyond)
+        yield self.place(pos, slot)
+
+    def remove_at(self, pos):
+        if not 0 <= pos < self.length:
+            yield ("error", "Invalid Position", "> Out of bounds")
+            return
+        if pos == 0:
+            yield from self.pop_front()
+            return
+        if pos == self.length - 1:
+            yield from self.pop_back()
+            return
+        before, temp, after = yield from self.walk_to("temp", pos)
+        yield ("visit", "prev", before, pos - 1, -1)
+        yield ("visit", "next", after, pos + 1, 0)
+        yield self.relink(before, self.step(temp, before), after)
+        yield self.relink(after, before, self.step(temp, after))
+        yield self.drop(pos, temp)
+
+
+class UnrolledCore(ListCore):
+    """
+    Unrolled linked list: each pool slot is a block holding up to block_size (>= 2)
+    entries in a Python list (pool.data[slot]), the blocks linked through next[].
+    An insert into a full block splits it, moving its upper half into a new block
+    after it (appending past a full tail just starts a new block). A remove that
+    leaves a block under half full refills it from the next block, or merges the
+    two when they fit in one; a tail with no next block merges into the one before
+    it. size caps the entries and positions are entry positions; visit/new/placed/
+    removed count blocks. No express lanes: a walk already hops a block at a time.
+    """
+    pointers = ("head", "tail")
+    express = False
+
+    def __init__(self, size, block_size=4, pool=None, seed=None):
+        self.block_size = block_size
+        self.half = block_size // 2  # Fewest entries a block other than the tail keeps
+        if pool is None:
+            pool = NodePool(self.blocks_for(size, block_size))
+        super().__init__(size, pool, seed)
+
+    @staticmethod
+    def blocks_for(size, block_size):
+        """ Pool capacity for size entries: every block but the tail stays at least half full """
+        return size // (block_size // 2) + 2
+
+    def full(self):
+        return self.length >= self.size
+
+    def reset(self):
+        super().reset()
+        self.blocks = 0
+
+    def first(self):
+        return self.head
+
+    def slots(self):
+        """ Block slots in list order """
+        slot = self.head
+        while slot != NIL:
+            yield slot
+            slot = self.pool.next[slot]
+
+    def values(self):
+        out = []
+        for slot in self.slots():
+            out.extend(self.pool.data[slot])
+        return out
+
+    # Steps
+    def place(self, pos, slot):
+        self.blocks += 1
+        return ("placed", pos, slot)
+
+    def drop(self, pos, slot):
+        self.blocks -= 1
+        self.pool.free(slot)
+        return ("removed", pos, slot)
+
+    def put(self, slot, offset, value):
+        self.pool.data[slot].insert(offset, value)
+        self.length += 1
+        return ("put", slot, offset, value)
+
+    def take(self, slot, offset):
+        value = self.pool.data[slot].pop(offset)
+        self.length -= 1
+        return ("take", slot, offset, value)
+
+    def locate(self, name, pos):
+        """ Pointer `name` to the block holding entry pos; returns (prev block, block, offset, block index) """
+        if pos == self.length:
+            # Appending: straight to the tail, no walk
+            yield ("visit", name, self.tail, self.blocks - 1, 0)
+            return NIL, self.tail, len(self.pool.data[self.tail]), self.blocks - 1
+        data, links = self.pool.data, self.pool.next
+        prev, slot, start, i = NIL, self.head, 0, 0
+        yield ("visit", name, slot, 0, 0)
+        while pos >= start + len(data[slot]):
+            start += len(data[slot])
+            prev, slot = slot, links[slot]
+            i += 1
+            yield ("visit", name, slot, i, 0)
+        return prev, slot, pos - start, i
+
+    def insert_at(self, pos, data):
+        if not 0 <= pos <= self.length:
+            yield ("error", "Invalid Position!", "> pos out of bounds")
+            return
+        if self.full():
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        if self.head == NIL:
+            slot = self.pool.alloc([])
+            yield ("new", slot, 0)
+            yield self.point("head", slot)
+            yield self.point("tail", slot)
+            yield self.place(0, slot)
+            yield self.put(slot, 0, data)
+            return
+        _, slot, offset, i = yield from self.locate("temp", pos)
+        block = self.pool.data[slot]
+        if len(block) >= self.block_size:
+            if self.pool.free_head == NIL:
+                yield ("error", "Limit Reached!", "> no free block to split into")
+                return
+            appending = slot == self.tail and offset == len(block)
+            new = self.pool.alloc([])
+            yield ("new", new, i + 1)
+            if not appending:
+                self.pool.data[new].extend(block[self.half:])
+                del block[self.half:]
+                yield ("split", slot, new, len(self.pool.data[new]))
+            yield self.link(new, "next", self.pool.next[slot])
+            yield self.link(slot, "next", new)
+            if slot == self.tail:
+                yield self.point("tail", new)
+            yield self.place(i + 1, new)
+            if appending or offset > len(block):
+                slot, offset = new, offset - len(block)
+        yield self.put(slot, offset, data)
+
+    def push_back(self, data):
+        yield from self.insert_at(self.length, data)
+
+    def push_front(self, data):
+        yield from self.insert_at(0, data)
+
+    def remove_at(self, pos):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> if head is None: return")
+            return
+        if not 0 <= pos < self.length:
+            yield ("error", "Invalid Position!", "> pos out of bounds")
+            return
+        prev, slot, offset, i = yield from self.locate("temp", pos)
+        yield self.take(slot, offset)
+        yield from self.rebalance(prev, slot, i)
+
+    def rebalance(self, prev, slot, i):
+        """ Refill or merge block slot (at block index i) once it is under half full """
+        data, links = self.pool.data, self.pool.next
+        block = data[slot]
+        if len(block) >= self.half:
+            return
+        after = links[slot]
+        if after != NIL:
+            yield ("visit", "next", after, i + 1, 0)
+            if len(block) + len(data[after]) <= self.block_size:
+                moved = len(data[after])
+                block.extend(data[after])
+                yield ("merge", slot, after, moved)
+                yield self.link(slot, "next", links[after])
+                if after == self.tail:
+                    yield self.point("tail", slot)
+                yield self.drop(i + 1, after)
+            else:
+                moved = self.half - len(block)
+                block.extend(data[after][:moved])
+                del data[after][:moved]
+                yield ("shift", after, slot, moved)
+        elif not block:
+            # Empty tail with nothing after it
+            yield self.point("tail", prev)
+            if prev == NIL:
+                yield self.point("head", NIL)
+            else:
+                yield self.link(prev, "next", NIL)
+            yield self.drop(i, slot)
+        elif prev != NIL and len(data[prev]) + len(block) <= self.block_size:
+            yield ("visit", "prev", prev, i - 1, 0)
+            moved = len(block)
+            data[prev].extend(block)
+            yield ("merge", prev, slot, moved)
+            yield self.link(prev, "next", NIL)
+            yield self.point("tail", prev)
+            yield self.drop(i, slot)
+
+    def pop_front(self):
+        yield from self.remove_at(0)
+
+    def pop_back(self):
+        yield from self.remove_at(self.length - 1)
+
+    def find(self, value):
+        """ Walk the blocks, comparing str(data) entry by entry; there is no value index """
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        key = str(value)
+        start, comparisons = 0, 0
+        for i, slot in enumerate(self.slots()):
+            yield ("visit", "temp", slot, i, 0)
+            for offset, data in enumerate(self.pool.data[slot]):
+                comparisons += 1
+                if str(data) == key:
+                    yield ("found", slot, start + offset, comparisons)
+                    return
+            start += len(self.pool.data[slot])
+        yield ("found", NIL, -1, comparisons)
+
+    def clear(self):
+        """ Unlink whole blocks from the front """
+        if self.length == 0:
+            yield ("error", "List is already Empty!", "> return")
+            return
+        while self.head != NIL:
+            slot = self.head
+            yield ("visit", "temp", slot, 0, 0)
+            self.length -= len(self.pool.data[slot])
+            yield self.point("head", self.pool.next[slot])
+            if self.head == NIL:
+                yield self.point("tail", NIL)
+            yield self.drop(0, slot)
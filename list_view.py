@@ -0,0 +1,134 @@
+"""
+Virtualised, scrollable list view for the linked-list scenes.
+
+Node i sits at world x = origin_x + i * stride on one row; the view keeps a
+camera offset (scroll) and lays out only the nodes that fall inside the
+viewport. Those get a Rect (recycled from a small stack) and a label
+surface, every other node has shape None, so a list of thousands of nodes
+costs about one screen's worth of Rects. A minimap strip shows the whole
+list, the visible window and the HEAD / TAIL / current-pointer positions.
+
+The view is scene-agnostic: a node only needs `shape` and `text`
+attributes, and the scene passes label(node) to build the text surface.
+"""
+import pygame
+import Colors
+
+
+class ListView:
+    def __init__(self, origin_x, y, label, stride=125, node_size=(90, 70), width=1000,
+                 minimap=(100, 364, 800, 8)):
+        self.origin_x = origin_x
+        self.y = y
+        self.label = label
+        self.stride = stride
+        self.node_w, self.node_h = node_size
+        self.width = width
+        self.minimap = pygame.Rect(minimap)
+
+        self.scroll = 0        # Camera x, in world pixels
+        self.current = None    # Index the running operation points at (minimap marker)
+        self.first = self.last = 0  # Visible index range [first, last)
+        self.shown = []        # Nodes holding a Rect right now
+        self.spare_rects = []
+
+    def world_x(self, i):
+        return self.origin_x + i * self.stride
+
+    def max_scroll(self, n):
+        # Room for the last node plus its NULL arrow
+        content = self.world_x(n - 1) + self.node_w + 110 if n else 0
+        return max(0, content - self.width)
+
+    def clamp(self, n):
+        self.scroll = min(max(0, self.scroll), self.max_scroll(n))
+
+    def visible_range(self, n, shift=0):
+        first = (self.scroll - self.origin_x - self.node_w) // self.stride + 1 - shift
+        last = (self.scroll + self.width - self.origin_x) // self.stride + 1 - shift
+        return max(0, first), min(n, last)
+
+    def release(self, node):
+        if node.shape is not None:
+            self.spare_rects.append(node.shape)
+            node.shape = None
+
+    def attach(self, node, pos):
+        """ Give a node that is off the row (e.g. a new node drawn below it) a Rect at pos """
+        if node.shape is None:
+            node.shape = self.spare_rects.pop() if self.spare_rects else pygame.Rect(0, 0, self.node_w, self.node_h)
+            self.shown.append(node)
+        node.shape.topleft = pos
+        node.text = self.label(node)
+
+    def layout(self, nodes, shift=0):
+        """ Rects for the nodes in the viewport, none for the rest; shift leaves `shift` empty slots in front """
+        for node in self.shown:
+            self.release(node)
+        self.clamp(len(nodes) + shift)
+        self.first, self.last = self.visible_range(len(nodes), shift)
+        self.shown = nodes[self.first:self.last]
+        for i, node in enumerate(self.shown, self.first):
+            node.shape = self.spare_rects.pop() if self.spare_rects else pygame.Rect(0, 0, self.node_w, self.node_h)
+            node.shape.topleft = (self.world_x(i + shift) - self.scroll, self.y)
+            node.text = self.label(node)
+
+    def visible(self, nodes):
+        return [node for node in nodes[self.first:self.last] if node.shape is not None]
+
+    def scroll_by(self, dx, n):
+        old = self.scroll
+        self.scroll += dx
+        self.clamp(n)
+        return self.scroll != old
+
+    def follow(self, i, n):
+        """ Mark i as current and scroll so it and a neighbour on each side are on screen; True if the camera moved """
+        self.current = i
+        old = self.scroll
+        left = self.world_x(i) - self.stride
+        right = self.world_x(i) + self.node_w + self.stride
+        if left < self.scroll:
+            self.scroll = left
+        elif right > self.scroll + self.width:
+            self.scroll = right - self.width
+        self.clamp(n)
+        return self.scroll != old
+
+    def jump(self, mouse_x, n):
+        """ Centre the camera on the part of the list under mouse_x in the minimap """
+        frac = (mouse_x - self.minimap.x) / self.minimap.width
+        self.scroll = int(frac * (self.max_scroll(n) + self.width)) - self.width // 2
+        self.clamp(n)
+
+    def draw_minimap(self, screen, n, font, markers):
+        """ markers: (index, label, color) drawn as ticks along the strip """
+        if n == 0:
+            return
+        bar = self.minimap
+        pygame.draw.rect(screen, Colors.BLACK, bar, border_radius=3)
+
+        total = self.max_scroll(n) + self.width
+        view_x = bar.x + bar.width * self.scroll // total
+        view_w = max(4, bar.width * self.width // total)
+        pygame.draw.rect(screen, Colors.TEAL, (view_x, bar.y, view_w, bar.height), border_radius=3)
+
+        # Ticks, with the labels of markers that land close together joined into one
+        groups = []
+        for index, text, color in markers:
+            if index is None:
+                continue
+            x = bar.x + bar.width * (self.world_x(index) + self.node_w // 2) // total
+            pygame.draw.line(screen, color, (x, bar.y - 4), (x, bar.bottom + 3), 2)
+            near = next((group for group in groups if abs(x - group[0]) < 40), None)
+            if near:
+                near[1].append((text, color))
+            else:
+                groups.append((x, [(text, color)]))
+
+        for x, parts in groups:
+            surfs = [font.render(text if i == 0 else "/" + text, True, color) for i, (text, color) in enumerate(parts)]
+            lbl_x = x - sum(surf.get_width() for surf in surfs) // 2
+            for surf in surfs:
+                screen.blit(surf, (lbl_x, bar.bottom + 4))
+                lbl_x += surf.get_width()
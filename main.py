@@ -2,8 +2,10 @@ import pygame
 import sys
 import os
 import Colors
+import widgets
 import random
 import importlib.util
+from frame_scheduler import FrameScheduler
 
 SCREEN_WIDTH = 1000
 SCREEN_HEIGHT = 700
@@ -18,7 +20,7 @@ BUTTON_HOVER = Colors.TEAL_BRIGHT
 pygame.init()
 screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
 pygame.display.set_caption("Data Structure & Algorithm Visualizer")
-clock = pygame.time.Clock()
+sched = FrameScheduler()
 
 
 def get_font(size, bold=False):
@@ -34,43 +36,31 @@ font_button = get_font(18, bold=True)
 font_small = get_font(14)
 
 
-class Button:
+class Button(widgets.Button):
     def __init__(self, x, y, w, h, text, func, color=BUTTON_COLOR):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.func = func
-        self.base_color = color
-        self.hover_color = BUTTON_HOVER
-        self.is_hovered = False
-
-    def draw(self, surface):
-        col = self.hover_color if self.is_hovered else self.base_color
-        pygame.draw.rect(surface, col, self.rect, border_radius=8)
-        txt = font_button.render(self.text, True, (255, 255, 255))
-        surface.blit(txt, txt.get_rect(center=self.rect.center))
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEMOTION:
-            self.is_hovered = self.rect.collidepoint(event.pos)
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.is_hovered and self.func:
-                self.func()
+        super().__init__(x, y, w, h, text, func, color=color, hover_color=BUTTON_HOVER,
+                         text_color=(255, 255, 255), font=font_button)
 
 
 LINKED_LISTS = [
     ("Singly Linked List", "SinglyLinkedList.py"),
     ("Doubly Linked List", "DoublyLinkedList.py"),
     ("Circular Linked List", "CircularLinkedList.py"),
+    ("XOR Linked List", "XorLinkedList.py"),
+    ("Unrolled Linked List", "UnrolledLinkedList.py"),
 ]
 
 QUEUES = [
     ("Queue", "queue_viz.py"),
     ("Circular Queue", "circular_queue_viz.py"),
+    ("Async Queue", "async_queue_viz.py"),
+    ("Deque", "deque_viz.py"),
 ]
 
 HEAPS = [
     ("Min Heap", "min_heap.py"),
     ("Max Heap", "max_heap.py"),
+    ("Indexed Min Heap", "indexed_heap.py"),
 ]
 
 # Updated DATA_STRUCTURES list to include Heaps
@@ -79,6 +69,7 @@ DATA_STRUCTURES = [
     ("Queues", None),
     ("Heaps", None),  # <-- Added Heaps here
     ("Stack", "stack_viz.py"),
+    ("Skip List", "SkipList.py"),
     ("Binary Tree", "tree2.py"),
 ]
 
@@ -94,6 +85,8 @@ class MainApp:
     def __init__(self):
         self.state = "home"
         self.buttons = []
+        self.ui = None
+        self.ui_buttons = None  # the list self.ui indexes
         self.current_category = None
         self.current_viz = None
         self.viz_class_name = None
@@ -293,13 +286,21 @@ class MainApp:
             self.current_viz.update(speed_val)
 
     def handle_events(self):
-        for event in pygame.event.get():
+        for event in sched.events():
             if event.type == pygame.QUIT:
                 return False
-            for btn in self.buttons:
-                btn.handle_event(event)
+            target = self.widget_index().dispatch(event)
+            if event.type == pygame.MOUSEBUTTONDOWN and target is not None:
+                target.click()
         return True
 
+    def widget_index(self):
+        # Every screen swaps in a new button list; re-index when that happens
+        if self.ui_buttons is not self.buttons:
+            self.ui = widgets.WidgetIndex(self.buttons)
+            self.ui_buttons = self.buttons
+        return self.ui
+
 
 def run_main_game():
     app = MainApp()
@@ -310,7 +311,8 @@ def run_main_game():
         running = app.handle_events()
         app.update()
         app.draw()
-        clock.tick(60)
+        # The menus only change on input; an embedded sort trace keeps full pace while it plays
+        sched.sleep(app.state == "viz" and app.current_viz is not None and app.current_viz.playing)
 
 
 if __name__ == "__main__":
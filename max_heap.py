@@ -1,7 +1,10 @@
 import pygame
 import sys
-import math
+import operator
 import Colors
+import widgets
+from heap_core import Heap, parse_batch, MIN_ARITY, MAX_ARITY
+from frame_scheduler import FrameScheduler
 
 # -------------------------------------------------------------------------
 # CONFIGURATION & CONSTANTS
@@ -20,10 +23,15 @@ WHITE = (255, 255, 255)       # Text
 LIGHT_GREY = (238, 238, 238)  # Labels
 ERROR_COLOR = (255, 87, 87)
 SUCCESS_COLOR = (0, 200, 81)
+COMPARE_COLOR = (255, 215, 0)  # Gold (same as sorting visualizers)
+SWAP_COLOR = (155, 89, 182)    # Purple
 
 # MAX CAPACITY (Tree levels limit for display)
 MAX_CAPACITY = 31
 
+# Trace playback speed (ms per step)
+TRACE_STEP_MS = 600
+
 # -------------------------------------------------------------------------
 # FONTS
 # -------------------------------------------------------------------------
@@ -42,152 +50,55 @@ font_node = get_font(14)
 # UI CLASSES
 # -------------------------------------------------------------------------
 
-class Button:
+class Button(widgets.Button):
     def __init__(self, x, y, w, h, text, action_code, color=TEAL):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.action_code = action_code
-        self.base_color = color
-        self.hover_color = TEAL_HOVER if color == TEAL else ORANGE
-        self.is_hovered = False
-
-    def draw(self, surface):
-        color = self.hover_color if self.is_hovered else self.base_color
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-
-        txt_surf = font_ui.render(self.text, True, LIGHT_GREY)
-        txt_rect = txt_surf.get_rect(center=self.rect.center)
-        surface.blit(txt_surf, txt_rect)
-
-    def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
+        super().__init__(x, y, w, h, text, action_code, color=color,
+                         hover_color=TEAL_HOVER if color == TEAL else ORANGE, text_color=LIGHT_GREY,
+                         font=font_ui)
 
-    def is_clicked(self, pos):
-        return self.rect.collidepoint(pos)
 
-
-class InputBox:
+class InputBox(widgets.InputBox):
     def __init__(self, x, y, w, h, text='', numeric_only=False, max_chars=12):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.color = TEAL
-        self.text = text
-        self.active = False
-        self.numeric_only = numeric_only 
-        self.max_chars = max_chars
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                self.active = not self.active
-            else:
-                self.active = False
-            self.color = WHITE if self.active else TEAL
-            
-        if event.type == pygame.KEYDOWN:
-            if self.active:
-                if event.key == pygame.K_RETURN:
-                    self.active = False
-                    self.color = TEAL
-                elif event.key == pygame.K_BACKSPACE:
-                    self.text = self.text[:-1]
-                else:
-                    if self.numeric_only:
-                        if event.unicode.isdigit():
-                             if len(self.text) < self.max_chars:
-                                self.text += event.unicode
-                    else:
-                        if len(self.text) < self.max_chars:
-                            self.text += event.unicode
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, BLACK, self.rect, border_radius=6)
-        pygame.draw.rect(surface, self.color, self.rect, 2, border_radius=6)
-        txt_surface = font_ui.render(self.text, True, WHITE)
-        surface.blit(txt_surface, (self.rect.x + 10, self.rect.y + 10))
+        # Long input (batch lists) scrolls: only the tail that fits the box is shown
+        super().__init__(x, y, w, h, text, max_chars, str.isdigit if numeric_only else str.isprintable,
+                         font=font_ui, bg_color=BLACK, inactive_color=TEAL, active_color=WHITE,
+                         text_color=WHITE, radius=6, pad=(10, 10), toggle=True, blur_on_return=True,
+                         scroll=True)
 
 # -------------------------------------------------------------------------
 # DATA STRUCTURE: MAX HEAP
 # -------------------------------------------------------------------------
 
-class MaxHeap:
+class MaxHeap(Heap):
+    """ Max heap scene model: the shared heap core ordered with operator.gt """
     def __init__(self, capacity=15):
-        self.heap = []
-        self.capacity = capacity
-
-    def set_capacity(self, new_cap):
-        self.capacity = new_cap
-        if len(self.heap) > new_cap:
-            self.heap = self.heap[:new_cap]
-            return True 
-        return False
-
-    def parent(self, i): return (i - 1) // 2
-    def left(self, i): return 2 * i + 1
-    def right(self, i): return 2 * i + 2
-
-    def swap(self, i, j):
-        self.heap[i], self.heap[j] = self.heap[j], self.heap[i]
+        super().__init__(operator.gt, capacity)
 
-    def insert(self, val_str):
+    def insert(self, val_str, trace=None):
         if len(self.heap) >= self.capacity:
             return False, f"Heap Full! Max capacity ({self.capacity}) reached."
-        
+
         try:
             val = int(val_str)
         except ValueError:
             return False, "Please enter a valid integer."
 
-        self.heap.append(val)
-        index = len(self.heap) - 1
-        
-        # Bubble Up (Max Heap: Child > Parent means swap)
-        while index > 0 and self.heap[index] > self.heap[self.parent(index)]:
-            self.swap(index, self.parent(index))
-            index = self.parent(index)
-            
+        self.push(val, trace)
         return True, f"Inserted '{val}'."
 
-    def extract_max(self):
+    def extract_max(self, trace=None):
         if not self.heap:
             return None, "Heap is Empty!"
-        
-        max_item = self.heap[0]
-        last_item = self.heap.pop()
-        
-        if self.heap:
-            self.heap[0] = last_item
-            self.max_heapify(0)
-            
-        return max_item, f"Extracted Max: '{max_item}'."
-
-    def max_heapify(self, i):
-        largest = i
-        l = self.left(i)
-        r = self.right(i)
-        
-        if l < len(self.heap) and self.heap[l] > self.heap[largest]:
-            largest = l
-        if r < len(self.heap) and self.heap[r] > self.heap[largest]:
-            largest = r
-            
-        if largest != i:
-            self.swap(i, largest)
-            self.max_heapify(largest)
 
-    def peek(self):
-        if not self.heap:
-            return None
-        return self.heap[0]
-
-    def clear(self):
-        self.heap = []
+        item = self.pop(trace)
+        return item, f"Extracted Max: '{item}'."
 
 # -------------------------------------------------------------------------
 # MAIN VISUALIZER RUN FUNCTION
 # -------------------------------------------------------------------------
 
 def run(SCREEN):
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
     pq = MaxHeap(capacity=15)
     
     # State Dictionary to manage scope
@@ -196,53 +107,106 @@ def run(SCREEN):
         "msg_color": WHITE,
         "logic_msg": "Waiting for operation...",
         "peek_highlight": False,
-        "peek_timer": 0
+        "peek_timer": 0,
+        # Animation trace (same history/step_index model as the sorting visualizers)
+        "trace": [],
+        "step": 0,
+        "playing": False,
+        "last_update": 0,
+        "record": True  # Off = operations run on the untraced fast path
     }
 
     # --- UI ELEMENTS ---
     input_cap = InputBox(50, 90, 80, 40, text="15", numeric_only=True, max_chars=2)
     btn_set = Button(140, 90, 100, 40, "Set Cap", "SET_CAP")
+    input_batch = InputBox(260, 90, 180, 40, max_chars=60)
     
     y_op = 160
     input_val = InputBox(50, y_op, 200, 40, max_chars=10, numeric_only=True)
+
+    y_play = 210
+    btn_rec = Button(320, y_play, 110, 35, "Trace: On", "REC")
+    btn_arity = Button(900, y_op, 90, 40, "Arity: 2", "ARITY")
     
     buttons = [
         btn_set,
+        Button(450, 90, 90, 40, "Build", "BUILD"),
         Button(270, y_op, 100, 40, "Insert", "INS"),
         Button(390, y_op, 120, 40, "Extract Max", "EXT"),
         Button(530, y_op, 100, 40, "Peek", "PEEK"),
         Button(650, y_op, 100, 40, "Clear", "CLR"),
+        Button(770, y_op, 120, 40, "Batch Ins", "BATCH"),
+        Button(50, y_play, 80, 35, "Prev", "PREV"),
+        Button(140, y_play, 80, 35, "Play/||", "PLAY"),
+        Button(230, y_play, 80, 35, "Next", "NEXT"),
+        btn_rec,
+        btn_arity,
         Button(900, 15, 80, 40, "← Back", "BACK", color=ORANGE)
     ]
     
-    input_boxes = [input_cap, input_val]
+    input_boxes = [input_cap, input_batch, input_val]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
 
     def set_status(msg, color, logic=""):
         state["status_msg"] = msg
         state["msg_color"] = color
         state["logic_msg"] = logic
 
-    def generate_tree_layout():
-        """ Calculate node coordinates for a perfect binary tree visualization """
+    def start_trace(trace):
+        state["trace"] = trace
+        state["step"] = 0
+        state["playing"] = True
+        state["last_update"] = pygame.time.get_ticks()
+
+    def stop_trace():
+        state["trace"] = []
+        state["step"] = 0
+        state["playing"] = False
+
+    def update_trace():
+        if state["playing"]:
+            now = pygame.time.get_ticks()
+            if now - state["last_update"] > TRACE_STEP_MS:
+                step_trace(1)
+                state["last_update"] = now
+
+    def step_trace(delta):
+        if not state["trace"]:
+            return
+        new_step = state["step"] + delta
+        if 0 <= new_step < len(state["trace"]):
+            state["step"] = new_step
+        elif new_step >= len(state["trace"]):
+            state["playing"] = False
+
+    def generate_tree_layout(arity):
+        """ Node coordinates for a d-ary tree: every leaf gets an equal-width column, parents sit centred over their children """
         positions = {}
-        start_y = 280
-        level_height = 80 
-        
-        for i in range(MAX_CAPACITY):
-            level = int(math.log2(i + 1))
-            # Calculate horizontal position based on level
-            level_start_index = (1 << level) - 1
-            pos_in_level = i - level_start_index
-            nodes_in_level = 1 << level
-            
-            section_width = SCREEN_WIDTH / (nodes_in_level + 1)
-            x = section_width * (pos_in_level + 1)
-            y = start_y + (level * level_height)
-            
-            positions[i] = (x, y)
-        return positions
-    
-    node_positions = generate_tree_layout()
+        start_y = 300
+        level_height = 80
+
+        leaf_count = sum(1 for i in range(MAX_CAPACITY) if arity * i + 1 >= MAX_CAPACITY)
+        column_width = SCREEN_WIDTH / leaf_count
+        next_column = [0]
+
+        def place(i, level):
+            children = range(arity * i + 1, min(arity * i + arity + 1, MAX_CAPACITY))
+            if children:
+                for c in children:
+                    place(c, level + 1)
+                x = (positions[children[0]][0] + positions[children[-1]][0]) / 2
+            else:
+                x = column_width * (next_column[0] + 0.5)
+                next_column[0] += 1
+            positions[i] = (x, start_y + (level * level_height))
+
+        place(0, 0)
+
+        # Shrink nodes so neighbouring leaves don't overlap
+        node_size = min(45, int(column_width) - 8)
+        return positions, node_size
+
+    state["positions"], state["node_size"] = generate_tree_layout(pq.arity)
 
     # --- ACTION HANDLER ---
     def execute_action(code):
@@ -251,6 +215,28 @@ def run(SCREEN):
         if code == "BACK":
             return "back"
 
+        if code in ("PREV", "NEXT"):
+            state["playing"] = False
+            step_trace(-1 if code == "PREV" else 1)
+            return None
+        if code == "PLAY":
+            if state["trace"]:
+                if state["step"] >= len(state["trace"]) - 1:
+                    state["step"] = 0
+                    state["playing"] = True
+                else:
+                    state["playing"] = not state["playing"]
+                state["last_update"] = pygame.time.get_ticks()
+            return None
+
+        # Any new operation replaces the trace on screen with the live heap
+        stop_trace()
+
+        if code == "REC":
+            state["record"] = not state["record"]
+            btn_rec.text = "Trace: On" if state["record"] else "Trace: Off"
+            return None
+
         if code == "SET_CAP":
             txt = input_cap.text
             if not txt: return
@@ -271,19 +257,53 @@ def run(SCREEN):
         elif code == "INS":
             val = input_val.text
             if val:
-                success, msg = pq.insert(val)
+                trace = [] if state["record"] else None
+                success, msg = pq.insert(val, trace)
                 if success:
                     set_status(msg, SUCCESS_COLOR, f"Insert {val} -> Bubble Up if > Parent")
                     input_val.text = ""
+                    if trace:
+                        start_trace(trace)
                 else:
                     set_status(msg, ERROR_COLOR)
             else:
                 set_status("Enter a Value!", ERROR_COLOR)
 
+        elif code in ("BUILD", "BATCH"):
+            try:
+                values = parse_batch(input_batch.text)
+            except ValueError:
+                set_status("Batch: integers only (e.g. 5, 3, 8)", ERROR_COLOR)
+                return None
+            except OSError:
+                set_status("Could not read file", ERROR_COLOR)
+                return None
+            if not values:
+                set_status("Enter values or a file path!", ERROR_COLOR)
+                return None
+
+            trace = [] if state["record"] else None
+            if code == "BUILD":
+                success, msg = pq.build_heap(values, trace)
+                logic = "for i = n/2-1 .. 0: Max Heapify(i)"
+            else:
+                success, msg = pq.insert_many(values, trace)
+                logic = "Append all -> Bottom-up Heapify"
+            if success:
+                set_status(msg, SUCCESS_COLOR, logic)
+                input_batch.text = ""
+                if trace:
+                    start_trace(trace)
+            else:
+                set_status(msg, ERROR_COLOR)
+
         elif code == "EXT":
-            item, msg = pq.extract_max()
+            trace = [] if state["record"] else None
+            item, msg = pq.extract_max(trace)
             if item is not None:
                 set_status(msg, SUCCESS_COLOR, "Swap Root/Last -> Remove -> Max Heapify")
+                if trace:
+                    start_trace(trace)
             else:
                 set_status(msg, ERROR_COLOR)
 
@@ -293,9 +313,21 @@ def run(SCREEN):
                 set_status(f"Max Value: {item}", ORANGE, "Root Node (Index 0)")
                 state["peek_highlight"] = True
                 state["peek_timer"] = pygame.time.get_ticks()
+                sched.wake_in(1000)  # the highlight clears after a second
             else:
                 set_status("Heap is Empty", ERROR_COLOR)
 
+        elif code == "ARITY":
+            # Cycle d = 2..8 and re-heapify the current contents for the new shape
+            d = pq.arity + 1 if pq.arity < MAX_ARITY else MIN_ARITY
+            trace = [] if state["record"] else None
+            success, msg = pq.set_arity(d, trace)
+            state["positions"], state["node_size"] = generate_tree_layout(d)
+            btn_arity.text = f"Arity: {d}"
+            set_status(msg, SUCCESS_COLOR, f"Parent (i-1)/{d}, Children {d}i+1 .. {d}i+{d}")
+            if trace:
+                start_trace(trace)
+
         elif code == "CLR":
             pq.clear()
             set_status("Heap Cleared", WHITE, "Reset")
@@ -303,21 +335,29 @@ def run(SCREEN):
         return None
 
     # --- DRAWING FUNCTIONS ---
+    def current_frame():
+        """ Heap contents + highlight to draw: the trace step if one is loaded, else the live heap """
+        if state["trace"]:
+            frame = state["trace"][state["step"]]
+            return frame['heap'], frame['mark']
+        return pq.heap, None
+
     def draw_tree_connection(i, parent_i):
-        if i >= len(pq.heap): return
-        start = node_positions[parent_i]
-        end = node_positions[i]
+        start = state["positions"][parent_i]
+        end = state["positions"][i]
         pygame.draw.line(SCREEN, LIGHT_GREY, start, end, 2)
 
-    def draw_node(i, val):
-        pos = node_positions[i]
-        w, h = 45, 45
+    def draw_node(i, val, mark):
+        pos = state["positions"][i]
+        w = h = state["node_size"]
         rect = pygame.Rect(0, 0, w, h)
         rect.center = pos
         
-        # Color Logic for Peek
+        # Color Logic for Trace / Peek
         color = TEAL
-        if state["peek_highlight"] and i == 0:
+        if mark is not None and i in (mark[1], mark[2]):
+            color = SWAP_COLOR if mark[0] == "swap" else COMPARE_COLOR
+        elif state["peek_highlight"] and i == 0:
             if pygame.time.get_ticks() - state["peek_timer"] < 1000:
                 color = ORANGE
             else:
@@ -342,6 +382,11 @@ def run(SCREEN):
         lbl_cap = font_ui.render(f"Capacity (Max {MAX_CAPACITY}):", True, LIGHT_GREY)
         SCREEN.blit(lbl_cap, (50, 65))
         input_cap.draw(SCREEN)
+
+        # Batch UI
+        lbl_batch = font_msg.render("Batch (5,3,8 or file):", True, LIGHT_GREY)
+        SCREEN.blit(lbl_batch, (260, 67))
+        input_batch.draw(SCREEN)
         
         # Value UI
         lbl_val = font_ui.render("Value (Int):", True, LIGHT_GREY)
@@ -361,42 +406,45 @@ def run(SCREEN):
         l_surf = font_msg.render(f"> {state['logic_msg']}", True, TEAL_HOVER)
         SCREEN.blit(l_surf, (550, 95))
 
+        # Trace Playback
+        if state["trace"]:
+            step_txt = f"Step {state['step'] + 1} / {len(state['trace'])}: {state['trace'][state['step']]['desc']}"
+            s_step = font_msg.render(step_txt, True, TEAL_HOVER)
+            SCREEN.blit(s_step, (445, y_play + 8))
+
         # Divider
-        pygame.draw.line(SCREEN, TEAL, (0, 240), (SCREEN_WIDTH, 240), 2)
+        pygame.draw.line(SCREEN, TEAL, (0, 260), (SCREEN_WIDTH, 260), 2)
+
+        heap, mark = current_frame()
         
         # Draw Connectors
-        for i in range(1, len(pq.heap)):
+        for i in range(1, len(heap)):
             draw_tree_connection(i, pq.parent(i))
             
         # Draw Nodes
-        for i in range(len(pq.heap)):
-            draw_node(i, pq.heap[i])
+        for i in range(len(heap)):
+            draw_node(i, heap[i], mark)
 
         pygame.display.flip()
 
     # --- MAIN LOOP ---
     running = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
-        
-        for event in pygame.event.get():
+        for event in sched.events():
+            target = ui.dispatch(event)
             if event.type == pygame.QUIT:
                 return "quit"
-            
+
             for box in input_boxes:
                 box.handle_event(event)
-            
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for btn in buttons:
-                    if btn.is_clicked(mouse_pos):
-                        action_result = execute_action(btn.action_code)
-                        if action_result == "back":
-                            return "back"
 
-        for btn in buttons:
-            btn.check_hover(mouse_pos)
+            if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                action_result = execute_action(target.action_code)
+                if action_result == "back":
+                    return "back"
 
+        update_trace()
         draw()
-        clock.tick(60)
+        sched.sleep(state["playing"])
 
     return "back"
\ No newline at end of file
@@ -0,0 +1,156 @@
+"""
+Array-backed node pool shared by the linked-list scenes.
+
+Pure Python (no pygame). A pool owns `capacity` slots held in parallel
+arrays (data, next, prev) with links stored as slot indices and NIL (-1)
+for "no node"; the links are typed arrays, so they cost 8 bytes a slot
+rather than a pointer to an int object. Free slots are threaded into a free
+list through next[], so alloc() and free() are O(1) and node churn never
+creates Python objects. A pool built with with_prev=False has no prev[]
+array, for lists that keep a single link per node.
+
+With indexed=True the pool also keeps a value -> slots index, updated by
+alloc() and free(), so holding(value) finds the nodes holding a value with
+one dict probe instead of walking the list. Values are keyed as str(data),
+the way the scenes' search compares them. The pool knows nothing of list
+order; the list cores turn those slots into positions (ListCore.lookup).
+
+Each scene builds one view object per slot up front (its Node class, with
+the Rect it draws) by passing make_view; views read and write their links
+through the pool, so list code can keep saying node.next = other.
+"""
+from array import array
+
+NIL = -1
+
+
+class NodePool:
+    def __init__(self, capacity, make_view=None, indexed=False, with_prev=True):
+        self.capacity = capacity
+        self.data = [None] * capacity
+        self.next = array("q", [NIL]) * capacity
+        self.prev = array("q", [NIL]) * capacity if with_prev else None
+        self.in_use = bytearray(capacity)
+        self.index = {} if indexed else None  # str(value) -> {slot: None}, an insertion-ordered set
+        self.reset()
+
+        # One view per slot, created once and reused for every node that lives there
+        self.views = [make_view(self, i) for i in range(capacity)] if make_view else []
+
+    def reset(self):
+        """ Free every slot: the free list runs 0 -> 1 -> ... -> NIL """
+        for i in range(self.capacity):
+            self.data[i] = None
+            self.next[i] = i + 1 if i + 1 < self.capacity else NIL
+            self.in_use[i] = False
+        if self.prev is not None:
+            self.prev[:] = array("q", [NIL]) * self.capacity
+        self.free_head = 0 if self.capacity else NIL
+        self.used = 0
+        if self.index is not None:
+            self.index.clear()
+
+    def alloc(self, data):
+        """ Take the slot at the head of the free list; returns its index or NIL if the pool is full """
+        i = self.free_head
+        if i == NIL:
+            return NIL
+        self.free_head = self.next[i]
+        self.data[i] = data
+        self.next[i] = NIL
+        if self.prev is not None:
+            self.prev[i] = NIL
+        self.in_use[i] = True
+        self.used += 1
+        if self.index is not None:
+            self.index.setdefault(str(data), {})[i] = None
+        return i
+
+    def free(self, i):
+        """ Push slot i back on the free list """
+        if i == NIL or not self.in_use[i]:
+            return False
+        if self.index is not None:
+            key = str(self.data[i])
+            slots = self.index[key]
+            del slots[i]
+            if not slots:
+                del self.index[key]
+        self.data[i] = None
+        if self.prev is not None:
+            self.prev[i] = NIL
+        self.next[i] = self.free_head
+        self.in_use[i] = False
+        self.free_head = i
+        self.used -= 1
+        return True
+
+    def holding(self, value):
+        """ Slots whose data equals value as a string, in allocation order; one dict probe (needs indexed=True) """
+        return self.index.get(str(value), ())
+
+    def free_list(self):
+        i = self.free_head
+        while i != NIL:
+            yield i
+            i = self.next[i]
+
+    def view(self, i):
+        return None if i == NIL else self.views[i]
+
+    def table(self, with_prev=False, count=None):
+        """ Rows of the slot table drawn by the scenes' pool view: (label, one cell per slot) for the first count slots """
+        count = self.capacity if count is None else min(count, self.capacity)
+        link = lambda i: "NIL" if i == NIL else str(i)
+        used = self.in_use[:count]
+        rows = [("slot", [str(i) for i in range(count)]),
+                ("data", [str(d) if u else "-" for d, u in zip(self.data[:count], used)]),
+                ("next", [link(i) for i in self.next[:count]])]
+        if with_prev:
+            rows.append(("prev", [link(i) if u else "-" for i, u in zip(self.prev[:count], used)]))
+        return rows
+
+
+class PooledNode:
+    """
+    Per-slot view of a pool entry. data/next/prev go through the pool's arrays;
+    next and prev take and return views (or None) like ordinary node references.
+    """
+    __slots__ = ("pool", "idx")
+
+    def __init__(self, pool, idx):
+        self.pool = pool
+        self.idx = idx
+
+    @property
+    def data(self):
+        return self.pool.data[self.idx]
+
+    @property
+    def next(self):
+        return self.pool.view(self.pool.next[self.idx])
+
+    @next.setter
+    def next(self, node):
+        self.pool.next[self.idx] = NIL if node is None else node.idx
+
+    @property
+    def prev(self):
+        return self.pool.view(self.pool.prev[self.idx])
+
+    @prev.setter
+    def prev(self, node):
+        self.pool.prev[self.idx] = NIL if node is None else node.idx
+
+
+class SurfaceCache:
+    """ Memoises render(key), so a value seen before reuses its text surface """
+    def __init__(self, render):
+        self.render = render
+        self.surfaces = {}
+
+    def get(self, key):
+        surface = self.surfaces.get(key)
+        if surface is None:
+            surface = self.surfaces[key] = self.render(key)
+        return surface
@@ -0,0 +1,89 @@
+"""
+Operation scripts for the Stack and Queue scenes.
+
+Pure Python (no pygame). A script is a file (or an inline string with ';'
+between lines) of operations such as
+
+    push 1..1000    # a range, pushed one value at a time
+    pop 500         # a repeat count
+    push hello
+    peek
+
+enqueue / dequeue / front are accepted as aliases of push / pop / peek.
+stream_ops() is a generator: the file is read line by line and ranges and
+counts are expanded lazily, so a script of millions of ops never sits in
+memory as a list.
+"""
+import os
+from itertools import islice
+
+ALIASES = {
+    "push": "push", "enqueue": "push",
+    "pop": "pop", "dequeue": "pop",
+    "peek": "peek", "top": "peek", "front": "peek"
+}
+
+# Ops applied per frame; only the last state of each batch is drawn
+SCRIPT_SPEEDS = [1, 10, 100, 1000, 10000]
+
+
+def script_lines(source):
+    """ Lines of a script file if source is an existing path, else of the inline text """
+    source = source.strip()
+    if os.path.isfile(source):
+        with open(source) as f:
+            yield from f
+    else:
+        yield from source.split(";")
+
+
+def expand_line(line_no, line):
+    """ Yield the (op, value) pairs one script line stands for """
+    line = line.split("#", 1)[0].strip()
+    if not line:
+        return
+    parts = line.split()
+    op = ALIASES.get(parts[0].lower())
+    if op is None:
+        raise ValueError(f"Line {line_no}: unknown op '{parts[0]}'")
+    arg = parts[1] if len(parts) > 1 else None
+
+    if op == "push":
+        if arg is None:
+            raise ValueError(f"Line {line_no}: push needs a value")
+        if ".." not in arg:
+            yield ("push", arg)
+            return
+        try:
+            lo, hi = (int(x) for x in arg.split("..", 1))
+        except ValueError:
+            raise ValueError(f"Line {line_no}: bad range '{arg}'") from None
+        step = 1 if hi >= lo else -1
+        for v in range(lo, hi + step, step):
+            yield ("push", str(v))
+    else:
+        try:
+            count = int(arg) if arg else 1
+        except ValueError:
+            raise ValueError(f"Line {line_no}: bad count '{arg}'") from None
+        for _ in range(count):
+            yield (op, None)
+
+
+def stream_ops(source):
+    for line_no, line in enumerate(script_lines(source), 1):
+        yield from expand_line(line_no, line)
+
+
+def run_batch(ops, n, apply):
+    """
+    Pull up to n ops from the stream and apply(op, value) each one (apply returns
+    False for a rejected op, e.g. overflow). Returns (applied, rejected, finished).
+    """
+    applied = rejected = 0
+    for op, val in islice(ops, n):
+        if apply(op, val):
+            applied += 1
+        else:
+            rejected += 1
+    return applied, rejected, applied + rejected < n
@@ -1,6 +1,10 @@
 import pygame
 import sys
+from collections import deque
 import Colors
+import widgets
+from op_script import stream_ops, run_batch, SCRIPT_SPEEDS
+from frame_scheduler import FrameScheduler
 
 # --- Configuration ---
 # Map Colors
@@ -20,6 +24,10 @@ ELEM_HEIGHT = 70
 SPACING = 5
 START_X = 300
 MAX_ALLOWED_CAPACITY = 6
+SCRIPT_MAX_ITEMS = 10 ** 6  # Scripts get their own capacity, far past what fits on screen
+SUMMARY_HEAD = 3  # Items drawn at each end when the queue is longer than its slots
+SUMMARY_TAIL = 2
+SHIFT_ANIM_MS = 250  # Duration of the optional "shift left" slide after a dequeue
 
 # --- Font Loading ---
 def get_font(size, bold=False):
@@ -37,87 +45,47 @@ font_logic = get_font(13)
 
 
 # --- UI Classes ---
-class Button:
+class Button(widgets.Button):
     def __init__(self, x, y, w, h, text, action_func=None):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.action = action_func
-        self.is_hovered = False
+        super().__init__(x, y, w, h, text, action_func, color=ELEMENT_COLOR, hover_color=HOVER_COLOR,
+                         text_color=TEXT_COLOR, font=font_ui)
 
-    def draw(self, surface):
-        color = HOVER_COLOR if self.is_hovered else ELEMENT_COLOR
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
 
-        txt_surf = font_ui.render(self.text, True, TEXT_COLOR)
-        txt_rect = txt_surf.get_rect(center=self.rect.center)
-        surface.blit(txt_surf, txt_rect)
-
-    def check_hover(self, mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-
-    def check_click(self, mouse_pos):
-        """Returns the result of the action if clicked, else None"""
-        if self.is_hovered and self.action:
-            return self.action()
-        return None
-
-
-class InputBox:
+class InputBox(widgets.InputBox):
     def __init__(self, x, y, w, h, text='', is_numeric_only=False, max_chars=9):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.color_inactive = Colors.LIGHT_GREY
-        self.color_active = Colors.TEAL
-        self.color = self.color_inactive
-        self.text = text
-        self.txt_surface = font_ui.render(text, True, TEXT_COLOR)
-        self.active = False
-        self.is_numeric = is_numeric_only
-        self.max_chars = max_chars
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.rect.collidepoint(event.pos)
-            self.color = self.color_active if self.active else self.color_inactive
-
-        if event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_RETURN:
-                pass
-            elif event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
-            else:
-                if len(self.text) < self.max_chars:
-                    if self.is_numeric:
-                        if event.unicode.isdigit():
-                            self.text += event.unicode
-                    else:
-                        self.text += event.unicode
-            self.txt_surface = font_ui.render(self.text, True, TEXT_COLOR)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, INPUT_BG_COLOR, self.rect, border_radius=5)
-        # Center vertically
-        screen.blit(self.txt_surface, (self.rect.x + 8, self.rect.y + (self.rect.height // 2 - 8)))
-        pygame.draw.rect(screen, self.color, self.rect, 2, border_radius=5)
+        # Long text (script paths) scrolls so the tail stays visible
+        super().__init__(x, y, w, h, text, max_chars, str.isdigit if is_numeric_only else str.isprintable,
+                         font=font_ui, bg_color=INPUT_BG_COLOR, inactive_color=Colors.LIGHT_GREY,
+                         active_color=Colors.TEAL, text_color=TEXT_COLOR, scroll=True)
 
 
 # --- Main Run Function ---
 def run(screen):
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     # --- Local Logic State (Reset every time run is called) ---
     state = {
-        "queue": [],
+        # deque: popleft() is O(1); list.pop(0) would move every remaining item
+        "queue": deque(),
         "capacity": 6,
         "status_message": "Queue Initialized",
         "status_color": TEXT_COLOR,
         "logic_message": "Waiting for operation...",
         "peek_highlight_idx": -1,
-        "peek_timer_start": 0
+        "peek_timer_start": 0,
+        "shift_anim": True,  # Visual only: items slide left after a dequeue
+        "shift_start": -SHIFT_ANIM_MS,
+        # Script playback: a generator of (op, value), drained `batch` ops per frame
+        "script": None,
+        "batch": SCRIPT_SPEEDS[2],
+        "script_done": 0,
+        "script_rejected": 0
     }
 
     # UI Inputs
     val_input = InputBox(50, 180, 140, 40, text="", max_chars=9)
     cap_input = InputBox(50, 100, 80, 40, text="6", is_numeric_only=True, max_chars=2)
+    script_input = InputBox(50, 580, 190, 36, text="", max_chars=200)
 
     # --- Inner Helper Functions ---
     def set_status(msg, color, logic_msg=""):
@@ -133,7 +101,6 @@ def run(screen):
             if new_cap > MAX_ALLOWED_CAPACITY:
                 set_status(f"Error: Max Limit is {MAX_ALLOWED_CAPACITY}!", ERROR_COLOR, "Constraint: Capacity <= 6")
                 cap_input.text = str(MAX_ALLOWED_CAPACITY)
-                cap_input.txt_surface = font_ui.render(cap_input.text, True, TEXT_COLOR)
                 return
 
             if new_cap < 1:
@@ -141,7 +108,8 @@ def run(screen):
                 return
 
             if len(state["queue"]) > new_cap:
-                state["queue"] = state["queue"][:new_cap]
+                while len(state["queue"]) > new_cap:
+                    state["queue"].pop()
                 set_status(f"Resized to {new_cap}. Truncated.", ERROR_COLOR, "Rear items removed")
             else:
                 set_status(f"Capacity updated to {new_cap}", SUCCESS_COLOR, "capacity = " + str(new_cap))
@@ -161,7 +129,6 @@ def run(screen):
 
         state["queue"].append(val)
         val_input.text = ""
-        val_input.txt_surface = font_ui.render("", True, TEXT_COLOR)
         set_status(f"Enqueued: {val}", SUCCESS_COLOR, f"queue[rear] = {val} | rear++")
 
     def dequeue_item():
@@ -169,8 +136,14 @@ def run(screen):
             set_status("Queue Underflow!", ERROR_COLOR, "if size == 0: Underflow")
             return
 
-        removed = state["queue"].pop(0)
-        set_status(f"Dequeued: {removed}", SUCCESS_COLOR, f"val = queue[0] | Shift Left | rear--")
+        removed = state["queue"].popleft()
+        if state["shift_anim"]:
+            state["shift_start"] = pygame.time.get_ticks()
+            sched.animate(SHIFT_ANIM_MS)
+            logic = "val = queue[front] | front++ (O(1)) | slide is visual only"
+        else:
+            logic = "val = queue[front] | front++ (O(1))"
+        set_status(f"Dequeued: {removed}", SUCCESS_COLOR, logic)
 
     def peek_item():
         if len(state["queue"]) == 0:
@@ -179,8 +152,67 @@ def run(screen):
 
         state["peek_highlight_idx"] = 0
         state["peek_timer_start"] = pygame.time.get_ticks()
+        sched.wake_in(1000)  # the highlight clears after a second
         set_status(f"Front Item: {state['queue'][0]}", HIGHLIGHT_COLOR, "return queue[front]")
 
+    def toggle_shift():
+        state["shift_anim"] = not state["shift_anim"]
+        btn_shift.text = "Slide: On" if state["shift_anim"] else "Slide: Off"
+
+    # --- Script Playback ---
+    def apply_op(op, val):
+        """ One scripted op on the fast path (no status text or slide); False if rejected """
+        if op == "push":
+            if len(state["queue"]) >= SCRIPT_MAX_ITEMS:
+                return False
+            state["queue"].append(val)
+            return True
+        if op == "pop":
+            if not state["queue"]:
+                return False
+            state["queue"].popleft()
+            return True
+        return len(state["queue"]) > 0  # peek
+
+    def run_script():
+        source = script_input.text.strip()
+        if not source:
+            set_status("Enter a script file or ops!", ERROR_COLOR, "e.g. enqueue 1..1000; dequeue 500")
+            return
+        state["script"] = stream_ops(source)
+        state["script_done"] = 0
+        state["script_rejected"] = 0
+        set_status("Script running...", SUCCESS_COLOR,
+                   f"{state['batch']} ops per frame | script capacity {SCRIPT_MAX_ITEMS}")
+
+    def stop_script():
+        if state["script"] is not None:
+            state["script"] = None
+            set_status(f"Script stopped after {state['script_done']} ops", ERROR_COLOR,
+                       f"{state['script_rejected']} rejected")
+
+    def step_script():
+        """ Apply one batch; the frame drawn afterwards is the only one the batch gets """
+        try:
+            applied, rejected, finished = run_batch(state["script"], state["batch"], apply_op)
+        except (ValueError, OSError) as e:
+            state["script"] = None
+            set_status("Script error", ERROR_COLOR, str(e))
+            return
+        state["script_done"] += applied + rejected
+        state["script_rejected"] += rejected
+        logic = f"{state['script_done']} ops | {state['script_rejected']} rejected | size {len(state['queue'])}"
+        if finished:
+            state["script"] = None
+            set_status(f"Script finished: {state['script_done']} ops", SUCCESS_COLOR, logic)
+        else:
+            set_status(f"Script running: {state['script_done']} ops", SUCCESS_COLOR, logic)
+
+    def cycle_speed():
+        state["batch"] = SCRIPT_SPEEDS[(SCRIPT_SPEEDS.index(state["batch"]) + 1) % len(SCRIPT_SPEEDS)]
+        btn_speed.text = f"Batch: {state['batch']}"
+        set_status(f"Batch: {state['batch']} ops per frame", SUCCESS_COLOR, "Only the last frame of each batch is drawn")
+
     def go_back():
         return "back"
 
@@ -189,16 +221,20 @@ def run(screen):
     btn_enq = Button(200, 180, 100, 40, "Enqueue", enqueue_item)
     btn_deq = Button(50, 240, 120, 50, "Dequeue", dequeue_item)
     btn_peek = Button(180, 240, 120, 50, "Peek", peek_item)
+    btn_shift = Button(50, 300, 120, 40, "Slide: On", toggle_shift)
+    btn_run = Button(250, 580, 90, 36, "Run", run_script)
+    btn_speed = Button(50, 625, 190, 36, f"Batch: {state['batch']}", cycle_speed)
+    btn_stop = Button(250, 625, 90, 36, "Stop", stop_script)
     # The back button calls go_back which returns "back"
     btn_back = Button(900, 15, 80, 40, "← Back", go_back)
 
-    buttons = [btn_set_cap, btn_enq, btn_deq, btn_peek, btn_back]
-    input_boxes = [val_input, cap_input]
+    buttons = [btn_set_cap, btn_enq, btn_deq, btn_peek, btn_shift, btn_run, btn_speed, btn_stop, btn_back]
+    input_boxes = [val_input, cap_input, script_input]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
 
     # --- Main Loop ---
     running = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
         current_time = pygame.time.get_ticks()
 
         # Handle Peek Highlight Timer
@@ -208,23 +244,20 @@ def run(screen):
                 set_status("Ready", TEXT_COLOR, "Waiting...")
 
         # --- Event Handling ---
-        for event in pygame.event.get():
+        for event in sched.events():
+            target = ui.dispatch(event)
             if event.type == pygame.QUIT:
                 pygame.quit()
             
             for box in input_boxes:
                 box.handle_event(event)
             
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for btn in buttons:
-                    result = btn.check_click(event.pos)
-                    # If the button returned "back", exit the run function
-                    if result == "back":
-                        return "back"
+            if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                if target.click() == "back":
+                    return "back"
 
-        # Update Hover States
-        for btn in buttons:
-            btn.check_hover(mouse_pos)
+        if state["script"] is not None:
+            step_script()
 
         # --- Drawing ---
         screen.fill(BACKGROUND_COLOR)
@@ -245,12 +278,28 @@ def run(screen):
         screen.blit(lbl_cap, (50, 65))
         lbl_val = font_ui.render("Value:", True, Colors.LIGHT_GREY)
         screen.blit(lbl_val, (50, 155))
+        lbl_script = font_ui.render("Script (file or ops):", True, Colors.LIGHT_GREY)
+        screen.blit(lbl_script, (50, 555))
+        lbl_script_cap = font_index.render(f"Scripts may hold up to {SCRIPT_MAX_ITEMS} items", True, Colors.LIGHT_GREY)
+        screen.blit(lbl_script_cap, (50, 668))
 
         for box in input_boxes: box.draw(screen)
         for btn in buttons: btn.draw(screen)
 
         # 2. Visualization
-        container_width = state["capacity"] * (ELEM_WIDTH + SPACING) + SPACING
+        # A scripted run can leave more items than capacity; past what fits on screen
+        # the front and rear few are drawn, with a summary cell for everything between
+        size = len(state["queue"])
+        summary = size > MAX_ALLOWED_CAPACITY
+        slots = min(max(state["capacity"], size), MAX_ALLOWED_CAPACITY)
+        if summary:
+            shown = [(i, state["queue"][i]) for i in range(SUMMARY_HEAD)]
+            shown.append((None, f"+{size - SUMMARY_HEAD - SUMMARY_TAIL}"))
+            shown += [(i, state["queue"][i]) for i in range(size - SUMMARY_TAIL, size)]
+        else:
+            shown = list(enumerate(state["queue"]))
+
+        container_width = slots * (ELEM_WIDTH + SPACING) + SPACING
         container_y = 400
 
         # Guidelines
@@ -261,11 +310,24 @@ def run(screen):
                         (START_X, container_y + ELEM_HEIGHT + 10),
                         (START_X + container_width, container_y + ELEM_HEIGHT + 10), 4)
 
+        # Optional slide: items start one slot to the right and ease into place
+        slide = 0
+        elapsed = current_time - state["shift_start"]
+        if state["shift_anim"] and elapsed < SHIFT_ANIM_MS and not summary:
+            slide = int((ELEM_WIDTH + SPACING) * (1 - elapsed / SHIFT_ANIM_MS))
+
         # Elements
-        for i, item in enumerate(state["queue"]):
-            x_pos = START_X + i * (ELEM_WIDTH + SPACING) + SPACING
+        for col, (i, item) in enumerate(shown):
+            x_pos = START_X + col * (ELEM_WIDTH + SPACING) + SPACING + slide
             rect = pygame.Rect(x_pos, container_y, ELEM_WIDTH, ELEM_HEIGHT)
 
+            if i is None:
+                # Summary cell: how many items are hidden between the two ends
+                pygame.draw.rect(screen, CONTAINER_COLOR, rect, 2, border_radius=6)
+                txt_surf = font_index.render(item, True, TEXT_COLOR)
+                screen.blit(txt_surf, txt_surf.get_rect(center=rect.center))
+                continue
+
             bg_col = HIGHLIGHT_COLOR if i == state["peek_highlight_idx"] else ELEMENT_COLOR
             pygame.draw.rect(screen, bg_col, rect, border_radius=6)
 
@@ -277,8 +339,12 @@ def run(screen):
             idx_surf = font_index.render(f"{i}", True, Colors.LIGHT_GREY)
             screen.blit(idx_surf, (x_pos + 6, container_y + 4))
 
+        if size > state["capacity"]:
+            size_surf = font_ui.render(f"size {size} > capacity {state['capacity']} (scripted run)", True, Colors.LIGHT_GREY)
+            screen.blit(size_surf, (START_X, container_y + ELEM_HEIGHT + 70))
+
         # Pointers
-        if state["queue"]:
+        if shown:
             # FRONT
             front_x = START_X + SPACING + ELEM_WIDTH // 2
             front_y = container_y - 20
@@ -288,8 +354,8 @@ def run(screen):
             screen.blit(lbl_front, (front_x - 20, front_y - 35))
 
             # REAR
-            rear_idx = len(state["queue"]) - 1
-            rear_x = START_X + rear_idx * (ELEM_WIDTH + SPACING) + SPACING + ELEM_WIDTH // 2
+            rear_idx = len(shown) - 1
+            rear_x = START_X + rear_idx * (ELEM_WIDTH + SPACING) + SPACING + ELEM_WIDTH // 2 + slide
             rear_y = container_y + ELEM_HEIGHT + 20
             pygame.draw.polygon(screen, TEXT_COLOR,
                                 [(rear_x, rear_y), (rear_x - 10, rear_y + 15), (rear_x + 10, rear_y + 15)])
@@ -297,6 +363,6 @@ def run(screen):
             screen.blit(lbl_rear, (rear_x - 15, rear_y + 20))
 
         pygame.display.flip()
-        clock.tick(60)
+        sched.sleep(state["script"] is not None)
 
     return "back"
\ No newline at end of file
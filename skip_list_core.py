@@ -0,0 +1,180 @@
+"""
+Skip list core for the skip list scene (SkipList.py).
+
+Pure Python (no pygame). Keys live in a NodePool; every node gets a random
+height from a seeded RNG (each extra level on a coin flip, so runs with the
+same seed build the same towers), and level L links each node at least L + 1
+levels tall to the next such node in key order. A search starts on the top
+level at the head sentinel, runs right while the next key is smaller and
+drops a level when it isn't, so it visits O(log n) nodes on average whatever
+order the keys arrived in.
+
+Links are typed arrays per level, like ExpressLanes; slot `capacity` is the
+head sentinel (HEAD). Like linked_list_core, every operation is a generator
+yielding one event per step, which the scene animates; run() just drains it,
+for the headless benchmarks. Events:
+    ("error", status, logic)            refused; nothing was changed
+    ("visit", slot, level)              the search moved right along level to slot
+    ("down", slot, level, after)        slot's next on level is after (NIL or not smaller);
+                                        the search drops to level - 1, or stops at 0
+    ("grow", levels) / ("shrink", levels)   the list now has `levels` levels
+    ("new", slot, height)               node allocated with `height` levels
+    ("link", slot, level, target, old)  slot's next on level now target (was old)
+    ("placed", slot) / ("removed", slot)    slot counted in / unlinked and freed
+    ("found", slot, comparisons)        end of a search; slot NIL if missing
+"""
+import random
+from array import array
+
+from node_pool import NodePool, NIL
+
+MAX_LEVEL = 16
+
+
+def run(op):
+    """ Drain an operation without animating it; returns its last event """
+    event = None
+    for event in op:
+        pass
+    return event
+
+
+class SkipListCore:
+    def __init__(self, capacity, make_view=None, seed=None, max_level=MAX_LEVEL):
+        self.capacity = capacity
+        self.head = capacity  # HEAD sentinel slot
+        self.max_level = max_level
+        self.pool = NodePool(capacity, make_view, with_prev=False)
+        self.height = bytearray(capacity + 1)
+        self.rng = random.Random(seed)
+        self.next = []  # next[L][slot]: the following slot on level L, or NIL
+        self.reset()
+
+    def reset(self, seed=None):
+        """ Empty the list; with a seed, restart the height sequence too """
+        self.pool.reset()
+        if seed is not None:
+            self.rng.seed(seed)
+        self.next.clear()
+        self.next.append(array("q", [NIL]) * (self.capacity + 1))
+        self.height[self.head] = 1
+        self.length = 0
+
+    def levels(self):
+        return len(self.next)
+
+    def random_height(self):
+        height = 1
+        while height < self.max_level and self.rng.random() < 0.5:
+            height += 1
+        return height
+
+    def key(self, slot):
+        return self.pool.data[slot]
+
+    def keys(self):
+        """ Keys in order, along level 0 """
+        out, nxt, x = [], self.next[0], self.next[0][self.head]
+        while x != NIL:
+            out.append(self.pool.data[x])
+            x = nxt[x]
+        return out
+
+    def level(self, L):
+        """ Slots on level L, in key order """
+        nxt, x = self.next[L], self.next[L][self.head]
+        while x != NIL:
+            yield x
+            x = nxt[x]
+
+    # Steps
+    def link(self, slot, level, target):
+        nxt = self.next[level]
+        old = nxt[slot]
+        nxt[slot] = target
+        return ("link", slot, level, target, old)
+
+    def descend(self, key):
+        """ Top level to level 0, stopping before the first key >= key; returns (update, comparisons) """
+        data = self.pool.data
+        update = [self.head] * len(self.next)
+        comparisons = 0
+        x = self.head
+        for L in reversed(range(len(self.next))):
+            nxt = self.next[L]
+            while True:
+                after = nxt[x]
+                if after == NIL:
+                    break
+                comparisons += 1
+                if not data[after] < key:
+                    break
+                x = after
+                yield ("visit", x, L)
+            update[L] = x
+            yield ("down", x, L, nxt[x])
+        return update, comparisons
+
+    def find(self, key):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        update, comparisons = yield from self.descend(key)
+        after = self.next[0][update[0]]
+        yield ("found", after if after != NIL and self.pool.data[after] == key else NIL, comparisons)
+
+    def insert(self, key):
+        if self.length >= self.capacity:
+            yield ("error", "Limit Reached!", "> Capacity Full")
+            return
+        update, _ = yield from self.descend(key)
+        after = self.next[0][update[0]]
+        if after != NIL and self.pool.data[after] == key:
+            yield ("error", "Already Present", f"> {key} is in the list")
+            return
+
+        height = self.random_height()
+        while len(self.next) < height:
+            self.next.append(array("q", [NIL]) * (self.capacity + 1))
+            self.height[self.head] = len(self.next)
+            update.append(self.head)
+            yield ("grow", len(self.next))
+
+        slot = self.pool.alloc(key)
+        self.height[slot] = height
+        yield ("new", slot, height)
+        for L in range(height):
+            yield self.link(slot, L, self.next[L][update[L]])
+            yield self.link(update[L], L, slot)
+        self.length += 1
+        yield ("placed", slot)
+
+    def remove(self, key):
+        if self.length == 0:
+            yield ("error", "List Empty!", "> return")
+            return
+        update, _ = yield from self.descend(key)
+        slot = self.next[0][update[0]]
+        if slot == NIL or self.pool.data[slot] != key:
+            yield ("error", "Not Found", f"> {key} is not in the list")
+            return
+
+        for L in range(self.height[slot]):
+            yield self.link(update[L], L, self.next[L][slot])
+        # Drop levels nobody is tall enough for any more
+        while len(self.next) > 1 and self.next[-1][self.head] == NIL:
+            self.next.pop()
+            self.height[self.head] = len(self.next)
+            yield ("shrink", len(self.next))
+        self.pool.free(slot)
+        self.length -= 1
+        yield ("removed", slot)
+
+    def clear(self):
+        """ Remove the keys in order, one at a time from the front """
+        if self.length == 0:
+            yield ("error", "List is already Empty!", "> return")
+            return
+        while self.length:
+            yield from self.remove(self.pool.data[self.next[0][self.head]])
+
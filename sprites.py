@@ -0,0 +1,100 @@
+"""
+Sprites and panels shared by the linked-list scenes.
+
+Labels, arrow-heads and node boxes look the same on every frame, so each is
+rendered once per (text, color) / (shape, color) / (size, colors) into a
+SurfaceCache and then blitted. draw_pool() and draw_search_stats() draw the
+slot table and last-search panels along the bottom of the pooled lists.
+"""
+import pygame
+import Colors
+from itertools import islice
+from node_pool import SurfaceCache
+
+POOL_COLUMNS = 6  # Slots shown in the pool table
+
+
+# Font helper
+def get_font(size):
+    try:
+        return pygame.font.Font("ScienceGothic-Regular.ttf", size)
+    except:
+        return pygame.font.SysFont('Arial', size)
+
+
+paraFont = get_font(17)
+subFont = get_font(13)
+
+labels = SurfaceCache(lambda key: subFont.render(key[0], True, key[1]))
+null_labels = SurfaceCache(lambda color: paraFont.render("NULL", True, color))
+
+
+def render_polygon(key):
+    # Returns the sprite and the offset of its top-left corner from the polygon's anchor
+    points, color = key
+    left = min(x for x, _ in points)
+    top = min(y for _, y in points)
+    size = (max(x for x, _ in points) - left + 1, max(y for _, y in points) - top + 1)
+    surface = pygame.Surface(size, pygame.SRCALPHA)
+    pygame.draw.polygon(surface, color, [(x - left, y - top) for x, y in points])
+    return surface, (left, top)
+
+
+def render_chrome(key):
+    # A node's box, its highlight border if any and its "data:" label
+    (w, h), color, border = key
+    surface = pygame.Surface((w, h), pygame.SRCALPHA)
+    pygame.draw.rect(surface, color, (0, 0, w, h), border_radius=2)
+    if border is not None:
+        pygame.draw.rect(surface, border, (0, 0, w, h), 2, border_radius=2)
+    surface.blit(labels.get(("data: ", Colors.LIGHT_GREY)), (0, 0))
+    return surface
+
+
+polygons = SurfaceCache(render_polygon)
+chrome = SurfaceCache(render_chrome)
+
+
+def blit_polygon(screen, points, color, x, y):
+    surface, (dx, dy) = polygons.get((points, color))
+    screen.blit(surface, (x + dx, y + dy))
+
+
+def draw_pool(pool, screen, with_prev=False, rows=None):
+    # Slot table: one column per pool slot, in-use slots in teal, the free-list head in orange
+    if rows is None:
+        rows = pool.table(with_prev, POOL_COLUMNS)
+    for row, (label, cells) in enumerate(rows):
+        y = 612 + row * 20
+        screen.blit(labels.get((label, Colors.LIGHT_GREY)), (50, y))
+        for i, cell in enumerate(cells):
+            if i == pool.free_head:
+                color = Colors.ORANGE
+            elif pool.in_use[i]:
+                color = Colors.TEAL_BRIGHT
+            else:
+                color = Colors.LIGHT_GREY
+            screen.blit(labels.get((cell, color)), (110 + i * 65, y))
+
+    # Free list, threaded through next[]
+    free = list(islice(pool.free_list(), POOL_COLUMNS + 1))
+    chain = " -> ".join(str(i) for i in free[:POOL_COLUMNS])
+    tail = " -> ..." if len(free) > POOL_COLUMNS else " -> NIL"
+    free_txt = f"free: {chain}{tail}" if chain else "free: NIL"
+    screen.blit(subFont.render(free_txt, True, Colors.ORANGE), (530, 612))
+    used_txt = f"slots used: {pool.used}/{pool.capacity}"
+    screen.blit(subFont.render(used_txt, True, Colors.LIGHT_GREY), (530, 632))
+
+
+def draw_search_stats(stats, screen):
+    # Last search, linear walk and hash index side by side; hash_pos is None for lists without an index
+    if stats is None:
+        return
+    value, comparisons, walk_pos, hash_pos = stats
+    where = lambda pos: f"pos {pos}" if pos > 0 else "not found"
+    screen.blit(subFont.render(f"Search '{value}':", True, Colors.LIGHT_GREY), (530, 655))
+    walk_txt = f"walk: {comparisons} compares -> {where(walk_pos)}"
+    screen.blit(subFont.render(walk_txt, True, Colors.ORANGE), (530, 675))
+    if hash_pos is not None:
+        hash_txt = f"index: 1 probe -> {where(hash_pos)}"
+        screen.blit(subFont.render(hash_txt, True, Colors.TEAL_BRIGHT), (790, 675))
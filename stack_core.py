@@ -0,0 +1,103 @@
+"""
+Dynamic-array stack: a fixed-length buffer that is reallocated when it
+fills up, the way Python lists and C++ vectors grow.
+
+Pure Python (no pygame), so it can be imported and benchmarked headless.
+On a full push the buffer grows by `growth` (2x or 1.5x) and every item is
+copied across; on a pop that leaves it at 1/growth^2 occupancy it shrinks
+by the same factor, but never below a capacity set with reserve(). Cost
+is counted in element writes (1 per push plus the copies), so
+total_cost / pushes is the amortised cost per push.
+"""
+
+GROWTH_FACTORS = [2.0, 1.5]
+
+
+class DynamicArrayStack:
+    def __init__(self, growth=2.0, initial=1, shrink=True):
+        self.growth = growth
+        self.min_capacity = max(1, initial)
+        self.shrink = shrink
+        self.reserved = self.min_capacity  # Floor for shrinking, raised by reserve()
+        self.buffer = [None] * self.min_capacity
+        self.size = 0
+
+        # Instrumentation
+        self.reallocs = 0
+        self.copies = 0       # Element copies made by reallocations
+        self.pushes = 0
+        self.total_cost = 0   # Element writes: one per push + copies on grow
+        self.peak_capacity = self.min_capacity
+        self.last_resize = None  # (old_capacity, new_capacity, items_copied)
+
+    @property
+    def capacity(self):
+        return len(self.buffer)
+
+    def items(self):
+        return self.buffer[:self.size]
+
+    def reset_counters(self):
+        self.reallocs = self.copies = self.pushes = self.total_cost = 0
+        self.peak_capacity = self.capacity
+        self.last_resize = None
+
+    def resize(self, new_capacity):
+        """ Allocate a new buffer and copy the items across; returns the number copied """
+        if new_capacity < self.size:
+            return -1
+        old_capacity = self.capacity
+        new_buffer = [None] * new_capacity
+        # Copy a full buffer directly rather than through a temporary slice
+        new_buffer[:self.size] = self.buffer if self.size == old_capacity else self.buffer[:self.size]
+        self.buffer = new_buffer
+        self.reallocs += 1
+        self.copies += self.size
+        self.peak_capacity = max(self.peak_capacity, new_capacity)
+        self.last_resize = (old_capacity, new_capacity, self.size)
+        return self.size
+
+    def reserve(self, capacity):
+        """ Reallocate to exactly capacity and keep at least that much from now on; returns the number copied """
+        copied = self.resize(capacity)
+        if copied >= 0:
+            self.reserved = max(self.min_capacity, capacity)
+        return copied
+
+    def grown_capacity(self):
+        # int(1 * 1.5) == 1, so always grow by at least one slot
+        return max(self.capacity + 1, int(self.capacity * self.growth))
+
+    def push(self, val):
+        """ Returns the cost of this push in element writes (1, or 1 + copies on grow) """
+        copied = 0
+        if self.size == self.capacity:
+            copied = self.resize(self.grown_capacity())
+        self.buffer[self.size] = val
+        self.size += 1
+        self.pushes += 1
+        self.total_cost += 1 + copied
+        return 1 + copied
+
+    def pop(self):
+        if self.size == 0:
+            return None
+        self.size -= 1
+        val = self.buffer[self.size]
+        self.buffer[self.size] = None
+
+        # Shrink at 1/growth^2 occupancy (1/4 for 2x) so push/pop at a boundary can't thrash
+        if self.shrink and self.capacity > self.reserved and \
+                self.size <= self.capacity / (self.growth * self.growth):
+            self.resize(max(self.reserved, int(self.capacity / self.growth)))
+        return val
+
+    def peek(self):
+        return self.buffer[self.size - 1] if self.size else None
+
+    def amortised_cost(self):
+        return self.total_cost / self.pushes if self.pushes else 0.0
+
+    def clear(self):
+        self.buffer = [None] * self.reserved
+        self.size = 0
@@ -1,6 +1,11 @@
 import pygame
 import sys
+from collections import deque
 import Colors
+import widgets
+from stack_core import DynamicArrayStack, GROWTH_FACTORS
+from op_script import stream_ops, run_batch, SCRIPT_SPEEDS
+from frame_scheduler import FrameScheduler
 
 # --- Configuration ---
 SCREEN_WIDTH = 1000
@@ -16,12 +21,19 @@ INPUT_BG_COLOR = Colors.BLACK
 CONTAINER_COLOR = Colors.LIGHT_GREY
 ERROR_COLOR = (255, 87, 87)
 SUCCESS_COLOR = (0, 200, 81)
+FADED_COLOR = (90, 95, 105)  # Old buffer during copy-on-grow
 
 # Dimensions
 ELEM_WIDTH = 200
 ELEM_HEIGHT = 40
 SPACING = 5
 MAX_ALLOWED_CAPACITY = 10
+MAX_DYNAMIC_ITEMS = 64    # Dynamic-array mode: the buffer may grow past this, the stack may not
+GROW_ANIM_MS = 900        # Copy-on-grow animation
+COST_HISTORY = 60         # Pushes shown in the cost-per-push chart
+SCRIPT_MAX_ITEMS = 10 ** 6  # Scripts get their own capacity, far past what fits on screen
+SUMMARY_BOTTOM = 2  # Items drawn at each end when the stack is taller than its slots
+SUMMARY_TOP = 3
 
 # --- Font Loading Helper ---
 def get_font(size, bold=False):
@@ -35,75 +47,27 @@ font_title = get_font(28)
 font_ui = get_font(17)
 font_elem = get_font(19)
 font_logic = get_font(13)
+font_index = get_font(11)
 
 
 # --- UI Classes ---
-class Button:
+class Button(widgets.Button):
     def __init__(self, x, y, w, h, text, action_func=None):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.action = action_func
-        self.is_hovered = False
+        super().__init__(x, y, w, h, text, action_func, color=ELEMENT_COLOR, hover_color=HOVER_COLOR,
+                         text_color=TEXT_COLOR, font=font_ui)
 
-    def draw(self, surface):
-        color = HOVER_COLOR if self.is_hovered else ELEMENT_COLOR
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
 
-        txt_surf = font_ui.render(self.text, True, TEXT_COLOR)
-        txt_rect = txt_surf.get_rect(center=self.rect.center)
-        surface.blit(txt_surf, txt_rect)
-
-    def check_hover(self, mouse_pos):
-        self.is_hovered = self.rect.collidepoint(mouse_pos)
-
-    def check_click(self, mouse_pos):
-        """Returns the result of the action if clicked, else None"""
-        if self.is_hovered and self.action:
-            return self.action()
-        return None
-
-
-class InputBox:
+class InputBox(widgets.InputBox):
     def __init__(self, x, y, w, h, text='', is_numeric_only=False, max_chars=9):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.color_inactive = Colors.LIGHT_GREY
-        self.color_active = Colors.TEAL
-        self.color = self.color_inactive
-        self.text = text
-        self.txt_surface = font_ui.render(text, True, TEXT_COLOR)
-        self.active = False
-        self.is_numeric = is_numeric_only
-        self.max_chars = max_chars
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            self.active = self.rect.collidepoint(event.pos)
-            self.color = self.color_active if self.active else self.color_inactive
-
-        if event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_RETURN:
-                pass
-            elif event.key == pygame.K_BACKSPACE:
-                self.text = self.text[:-1]
-            else:
-                if len(self.text) < self.max_chars:
-                    if self.is_numeric:
-                        if event.unicode.isdigit():
-                            self.text += event.unicode
-                    else:
-                        self.text += event.unicode
-            self.txt_surface = font_ui.render(self.text, True, TEXT_COLOR)
-
-    def draw(self, screen):
-        pygame.draw.rect(screen, INPUT_BG_COLOR, self.rect, border_radius=5)
-        # Center text vertically
-        screen.blit(self.txt_surface, (self.rect.x + 8, self.rect.y + (self.rect.height // 2 - 8)))
-        pygame.draw.rect(screen, self.color, self.rect, 2, border_radius=5)
+        # Long text (script paths) scrolls so the tail stays visible
+        super().__init__(x, y, w, h, text, max_chars, str.isdigit if is_numeric_only else str.isprintable,
+                         font=font_ui, bg_color=INPUT_BG_COLOR, inactive_color=Colors.LIGHT_GREY,
+                         active_color=Colors.TEAL, text_color=TEXT_COLOR, scroll=True)
 
 
 # --- Main Run Function ---
 def run(screen):
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     # --- Local Logic State (Encapsulated) ---
     state = {
@@ -113,12 +77,23 @@ def run(screen):
         "status_color": TEXT_COLOR,
         "logic_message": "Waiting for operation...",
         "peek_highlight_idx": -1,
-        "peek_timer_start": 0
+        "peek_timer_start": 0,
+        # Dynamic-array mode: a reallocating buffer instead of a fixed capacity
+        "dynamic": False,
+        "dyn": DynamicArrayStack(growth=GROWTH_FACTORS[0]),
+        "costs": deque(maxlen=COST_HISTORY),  # Cost (element writes) of each recent push
+        "grow_anim": None,  # (old_items, old_capacity, new_capacity, start_time)
+        # Script playback: a generator of (op, value), drained `batch` ops per frame
+        "script": None,
+        "batch": SCRIPT_SPEEDS[2],
+        "script_done": 0,
+        "script_rejected": 0
     }
 
     # UI Elements
     val_input = InputBox(50, 180, 140, 40, text="", max_chars=9)
     cap_input = InputBox(50, 90, 80, 40, text="10", is_numeric_only=True, max_chars=2)
+    script_input = InputBox(50, 600, 190, 36, text="", max_chars=200)
 
     # --- Helper Functions (Inside run to access state) ---
     def set_status(msg, color, logic_msg=""):
@@ -126,15 +101,32 @@ def run(screen):
         state["status_color"] = color
         state["logic_message"] = logic_msg
 
+    def current_items():
+        return state["dyn"].items() if state["dynamic"] else state["stack"]
+
     def set_capacity():
         try:
             if not cap_input.text: return
             new_cap = int(cap_input.text)
 
+            if state["dynamic"]:
+                # Reserve / shrink-to-fit: reallocate the buffer to an explicit capacity,
+                # which pops then won't shrink below
+                dyn = state["dyn"]
+                if new_cap < max(1, dyn.size) or new_cap > MAX_DYNAMIC_ITEMS:
+                    set_status(f"Capacity must be {max(1, dyn.size)}..{MAX_DYNAMIC_ITEMS}", ERROR_COLOR,
+                               "Constraint: size <= capacity")
+                    return
+                old_items, old_cap = dyn.items(), dyn.capacity
+                copied = dyn.reserve(new_cap)
+                start_grow_anim(old_items, old_cap)
+                set_status(f"Buffer reserved at {new_cap}", SUCCESS_COLOR,
+                           f"new buffer[{new_cap}] | copy {copied} items | shrink floor = {new_cap}")
+                return
+
             if new_cap > MAX_ALLOWED_CAPACITY:
                 set_status(f"Error: Max Limit is {MAX_ALLOWED_CAPACITY}!", ERROR_COLOR, "Constraint: Capacity <= 10")
                 cap_input.text = str(MAX_ALLOWED_CAPACITY)
-                cap_input.txt_surface = font_ui.render(cap_input.text, True, TEXT_COLOR)
                 return
 
             if new_cap < 1:
@@ -157,31 +149,157 @@ def run(screen):
             set_status("Enter a value first!", ERROR_COLOR, "if val is None: return")
             return
 
-        if len(state["stack"]) >= state["capacity"]:
-            set_status("Stack Overflow!", ERROR_COLOR, "if len(stack) == capacity: Overflow")
-            return
+        if state["dynamic"]:
+            push_dynamic(val)
+        else:
+            if len(state["stack"]) >= state["capacity"]:
+                set_status("Stack Overflow!", ERROR_COLOR, "if len(stack) == capacity: Overflow")
+                return
 
-        state["stack"].append(val)
+            state["stack"].append(val)
+            set_status(f"Pushed: {val}", SUCCESS_COLOR, f"stack.append({val}) | Top: {len(state['stack']) - 1}")
         val_input.text = ""
-        val_input.txt_surface = font_ui.render("", True, TEXT_COLOR)
-        set_status(f"Pushed: {val}", SUCCESS_COLOR, f"stack.append({val}) | Top: {len(state['stack']) - 1}")
 
     def pop_item():
-        if len(state["stack"]) == 0:
+        if len(current_items()) == 0:
             set_status("Stack Underflow!", ERROR_COLOR, "if len(stack) == 0: Underflow")
             return
 
+        if state["dynamic"]:
+            dyn = state["dyn"]
+            old_items, old_cap = dyn.items(), dyn.capacity
+            popped = dyn.pop()
+            if dyn.capacity != old_cap:
+                start_grow_anim(old_items[:-1], old_cap)
+                set_status(f"Popped: {popped} (shrunk)", SUCCESS_COLOR,
+                           f"size <= capacity / {dyn.growth:g}^2 -> shrink to {dyn.capacity}")
+            else:
+                set_status(f"Popped: {popped}", SUCCESS_COLOR, f"size-- | val = buffer[{dyn.size}]")
+            return
+
         popped = state["stack"].pop()
         set_status(f"Popped: {popped}", SUCCESS_COLOR, f"val = stack.pop() | New Top: {len(state['stack']) - 1}")
 
     def top_item():
-        if len(state["stack"]) == 0:
+        items = current_items()
+        if len(items) == 0:
             set_status("Stack is Empty", ERROR_COLOR, "return None")
             return
 
-        state["peek_highlight_idx"] = len(state["stack"]) - 1
+        state["peek_highlight_idx"] = len(items) - 1
         state["peek_timer_start"] = pygame.time.get_ticks()
-        set_status(f"Top Element: {state['stack'][-1]}", HIGHLIGHT_COLOR, f"return stack[{len(state['stack']) - 1}]")
+        sched.wake_in(1000)  # the highlight clears after a second
+        set_status(f"Top Element: {items[-1]}", HIGHLIGHT_COLOR, f"return stack[{len(items) - 1}]")
+
+    # --- Dynamic-Array Mode ---
+    def start_grow_anim(old_items, old_cap):
+        state["grow_anim"] = (old_items, old_cap, state["dyn"].capacity, pygame.time.get_ticks())
+        sched.animate(GROW_ANIM_MS)
+
+    def push_dynamic(val):
+        dyn = state["dyn"]
+        if dyn.size >= MAX_DYNAMIC_ITEMS:
+            set_status("Stack Overflow!", ERROR_COLOR, f"Constraint: size <= {MAX_DYNAMIC_ITEMS}")
+            return
+
+        old_items, old_cap = dyn.items(), dyn.capacity
+        cost = dyn.push(val)
+        state["costs"].append(cost)
+        if cost > 1:
+            start_grow_anim(old_items, old_cap)
+            set_status(f"Pushed: {val} (grew {old_cap} -> {dyn.capacity})", SUCCESS_COLOR,
+                       f"full -> new buffer[{dyn.capacity}] | copy {cost - 1} items | write 1")
+        else:
+            set_status(f"Pushed: {val}", SUCCESS_COLOR, f"buffer[{dyn.size - 1}] = {val} | cost 1")
+
+    def toggle_mode():
+        state["dynamic"] = not state["dynamic"]
+        state["grow_anim"] = None
+        state["peek_highlight_idx"] = -1
+        if state["dynamic"]:
+            # Carry the fixed stack over into a fresh buffer, then count from zero
+            dyn = DynamicArrayStack(growth=state["dyn"].growth)
+            for item in state["stack"]:
+                dyn.push(item)
+            dyn.reset_counters()
+            state["dyn"] = dyn
+            state["costs"].clear()
+            btn_mode.text = "Mode: Dynamic"
+            set_status("Dynamic Array Mode", SUCCESS_COLOR, f"Full buffer -> grow x{dyn.growth:g} and copy")
+        else:
+            state["stack"] = state["dyn"].items()[:state["capacity"]]
+            btn_mode.text = "Mode: Fixed"
+            set_status("Fixed Capacity Mode", SUCCESS_COLOR, f"capacity = {state['capacity']}")
+
+    def toggle_growth():
+        dyn = state["dyn"]
+        dyn.growth = GROWTH_FACTORS[(GROWTH_FACTORS.index(dyn.growth) + 1) % len(GROWTH_FACTORS)]
+        btn_growth.text = f"Growth: {dyn.growth:g}x"
+        set_status(f"Growth factor: {dyn.growth:g}x", SUCCESS_COLOR,
+                   f"new_capacity = max(capacity + 1, capacity * {dyn.growth:g})")
+
+    # --- Script Playback ---
+    def apply_op(op, val):
+        """ One scripted op on the fast path (no status text or animation); False if rejected """
+        if op == "push":
+            if state["dynamic"]:
+                if state["dyn"].size >= SCRIPT_MAX_ITEMS:
+                    return False
+                state["costs"].append(state["dyn"].push(val))
+                return True
+            if len(state["stack"]) >= SCRIPT_MAX_ITEMS:
+                return False
+            state["stack"].append(val)
+            return True
+        if op == "pop":
+            if state["dynamic"]:
+                return state["dyn"].pop() is not None
+            if not state["stack"]:
+                return False
+            state["stack"].pop()
+            return True
+        return (state["dyn"].size if state["dynamic"] else len(state["stack"])) > 0  # peek
+
+    def run_script():
+        source = script_input.text.strip()
+        if not source:
+            set_status("Enter a script file or ops!", ERROR_COLOR, "e.g. push 1..1000; pop 500")
+            return
+        state["script"] = stream_ops(source)
+        state["script_done"] = 0
+        state["script_rejected"] = 0
+        state["grow_anim"] = None
+        set_status("Script running...", SUCCESS_COLOR,
+                   f"{state['batch']} ops per frame | script capacity {SCRIPT_MAX_ITEMS}")
+
+    def stop_script():
+        if state["script"] is not None:
+            state["script"] = None
+            set_status(f"Script stopped after {state['script_done']} ops", ERROR_COLOR,
+                       f"{state['script_rejected']} rejected")
+
+    def step_script():
+        """ Apply one batch; the frame drawn afterwards is the only one the batch gets """
+        try:
+            applied, rejected, finished = run_batch(state["script"], state["batch"], apply_op)
+        except (ValueError, OSError) as e:
+            state["script"] = None
+            set_status("Script error", ERROR_COLOR, str(e))
+            return
+        state["script_done"] += applied + rejected
+        state["script_rejected"] += rejected
+        size = state["dyn"].size if state["dynamic"] else len(state["stack"])
+        logic = f"{state['script_done']} ops | {state['script_rejected']} rejected | size {size}"
+        if finished:
+            state["script"] = None
+            set_status(f"Script finished: {state['script_done']} ops", SUCCESS_COLOR, logic)
+        else:
+            set_status(f"Script running: {state['script_done']} ops", SUCCESS_COLOR, logic)
+
+    def cycle_speed():
+        state["batch"] = SCRIPT_SPEEDS[(SCRIPT_SPEEDS.index(state["batch"]) + 1) % len(SCRIPT_SPEEDS)]
+        btn_speed.text = f"Batch: {state['batch']}"
+        set_status(f"Batch: {state['batch']} ops per frame", SUCCESS_COLOR, "Only the last frame of each batch is drawn")
 
     def go_back():
         return "back"
@@ -191,15 +309,112 @@ def run(screen):
     btn_push = Button(200, 180, 100, 40, "Push", push_item)
     btn_pop = Button(50, 240, 120, 50, "Pop", pop_item)
     btn_top = Button(180, 240, 120, 50, "Top", top_item)
+    btn_mode = Button(50, 310, 150, 40, "Mode: Fixed", toggle_mode)
+    btn_growth = Button(210, 310, 130, 40, "Growth: 2x", toggle_growth)
+    btn_run = Button(250, 600, 90, 36, "Run", run_script)
+    btn_speed = Button(50, 645, 190, 36, f"Batch: {state['batch']}", cycle_speed)
+    btn_stop = Button(250, 645, 90, 36, "Stop", stop_script)
     btn_back = Button(900, 15, 80, 40, "← Back", go_back)
 
-    buttons = [btn_set_cap, btn_push, btn_pop, btn_top, btn_back]
-    input_boxes = [val_input, cap_input]
+    buttons = [btn_set_cap, btn_push, btn_pop, btn_top, btn_mode, btn_growth,
+               btn_run, btn_speed, btn_stop, btn_back]
+    input_boxes = [val_input, cap_input, script_input]
+    ui = widgets.WidgetIndex(buttons + input_boxes)
+
+    # --- Dynamic-Array Drawing ---
+    BUF_X, BUF_W = 360, 600
+    OLD_Y, NEW_Y, CELL_H = 160, 250, 40
+    CHART = pygame.Rect(360, 450, 600, 190)
+
+    def draw_buffer(items, cap, y, highlight=-1, faded=False):
+        cell_w = BUF_W / cap
+        if cell_w < 2:
+            # Too many slots to draw one by one (scripted runs): a fill bar of size / capacity
+            pygame.draw.rect(screen, CONTAINER_COLOR, (BUF_X, y, BUF_W, CELL_H), 1, border_radius=3)
+            fill_w = int(BUF_W * len(items) / cap)
+            pygame.draw.rect(screen, FADED_COLOR if faded else ELEMENT_COLOR, (BUF_X, y, fill_w, CELL_H), border_radius=3)
+            return cell_w
+        show_values = cell_w >= 28
+        for i in range(cap):
+            rect = pygame.Rect(BUF_X + i * cell_w + 1, y, max(1, cell_w - 2), CELL_H)
+            if i < len(items):
+                color = HIGHLIGHT_COLOR if i == highlight else ELEMENT_COLOR
+                if faded:
+                    color = FADED_COLOR
+                pygame.draw.rect(screen, color, rect, border_radius=3)
+                if show_values:
+                    txt_surf = font_logic.render(str(items[i])[:4], True, TEXT_COLOR)
+                    screen.blit(txt_surf, txt_surf.get_rect(center=rect.center))
+            else:
+                pygame.draw.rect(screen, CONTAINER_COLOR, rect, 1, border_radius=3)
+        return cell_w
+
+    def draw_dynamic(now):
+        dyn = state["dyn"]
+        items = dyn.items()
+
+        # Copy-on-grow: the old buffer above, its items copied one by one into the new buffer
+        anim = state["grow_anim"]
+        if anim is not None and now - anim[3] < GROW_ANIM_MS:
+            old_items, old_cap, new_cap, start = anim
+            screen.blit(font_ui.render(f"old buffer [{old_cap}]", True, Colors.LIGHT_GREY), (BUF_X, OLD_Y - 25))
+            old_w = draw_buffer(old_items, old_cap, OLD_Y, faded=True)
+            new_w = BUF_W / dyn.capacity
+            done = int(len(old_items) * min(1.0, (now - start) / (GROW_ANIM_MS * 0.8)))
+            for i in range(done):
+                pygame.draw.line(screen, HIGHLIGHT_COLOR,
+                                 (BUF_X + (i + 0.5) * old_w, OLD_Y + CELL_H),
+                                 (BUF_X + (i + 0.5) * new_w, NEW_Y), 1)
+            copied_lbl = font_logic.render(f"copy {done} / {len(old_items)}", True, HIGHLIGHT_COLOR)
+            screen.blit(copied_lbl, (BUF_X + BUF_W - copied_lbl.get_width(), OLD_Y - 22))
+        else:
+            state["grow_anim"] = None
+
+        screen.blit(font_ui.render(f"buffer [{dyn.capacity}]", True, Colors.LIGHT_GREY), (BUF_X, NEW_Y - 25))
+        cell_w = draw_buffer(items, dyn.capacity, NEW_Y, highlight=state["peek_highlight_idx"])
+
+        # size / capacity markers
+        if items:
+            top_x = BUF_X + (len(items) - 0.5) * cell_w
+            pygame.draw.polygon(screen, TEXT_COLOR, [(top_x, NEW_Y + CELL_H + 4), (top_x - 6, NEW_Y + CELL_H + 14),
+                                                     (top_x + 6, NEW_Y + CELL_H + 14)])
+            top_lbl = font_index.render("TOP", True, TEXT_COLOR)
+            screen.blit(top_lbl, top_lbl.get_rect(midtop=(top_x, NEW_Y + CELL_H + 16)))
+
+        # Counters
+        stats = [
+            f"size / capacity: {dyn.size} / {dyn.capacity}",
+            f"growth factor: {dyn.growth:g}x",
+            f"reallocations: {dyn.reallocs}",
+            f"items copied: {dyn.copies}",
+            f"pushes: {dyn.pushes}",
+            f"total cost: {dyn.total_cost} writes",
+            f"amortised / push: {dyn.amortised_cost():.2f}",
+            f"unused slots: {dyn.capacity - dyn.size}",
+        ]
+        for k, line in enumerate(stats):
+            screen.blit(font_logic.render(line, True, TEXT_COLOR), (50, 380 + k * 24))
+
+        # Cost of each recent push, with the running amortised cost as a line
+        pygame.draw.rect(screen, Colors.BLACK, CHART, border_radius=6)
+        screen.blit(font_ui.render("Cost per push (element writes)", True, TEXT_COLOR), (CHART.x, CHART.y - 25))
+        costs = list(state["costs"])
+        if costs:
+            peak = max(max(costs), dyn.amortised_cost(), 2)
+            usable = CHART.height - 30
+            bar_w = CHART.width / COST_HISTORY
+            for i, cost in enumerate(costs):
+                h = max(2, usable * cost / peak)
+                bar = pygame.Rect(CHART.x + i * bar_w + 1, CHART.bottom - 10 - h, max(1, bar_w - 2), h)
+                pygame.draw.rect(screen, HIGHLIGHT_COLOR if cost > 1 else ELEMENT_COLOR, bar)
+            avg_y = CHART.bottom - 10 - usable * dyn.amortised_cost() / peak
+            pygame.draw.line(screen, SUCCESS_COLOR, (CHART.x, avg_y), (CHART.right, avg_y), 2)
+            avg_lbl = font_index.render(f"amortised {dyn.amortised_cost():.2f}", True, SUCCESS_COLOR)
+            screen.blit(avg_lbl, (CHART.right - avg_lbl.get_width() - 6, avg_y - 14))
 
     # --- Main Loop ---
     running = True
     while running:
-        mouse_pos = pygame.mouse.get_pos()
         current_time = pygame.time.get_ticks()
 
         # Handle Peek Highlight Timer
@@ -209,22 +424,20 @@ def run(screen):
                 set_status("Ready", TEXT_COLOR, "Waiting...")
 
         # --- Events ---
-        for event in pygame.event.get():
+        for event in sched.events():
+            target = ui.dispatch(event)
             if event.type == pygame.QUIT:
                 return "quit"
             
             for box in input_boxes:
                 box.handle_event(event)
             
-            if event.type == pygame.MOUSEBUTTONDOWN:
-                for btn in buttons:
-                    result = btn.check_click(event.pos)
-                    # Handle return signal
-                    if result == "back":
-                        return "back"
+            if event.type == pygame.MOUSEBUTTONDOWN and target in buttons:
+                if target.click() == "back":
+                    return "back"
 
-        for btn in buttons:
-            btn.check_hover(mouse_pos)
+        if state["script"] is not None:
+            step_script()
 
         # --- Drawing ---
         screen.fill(BACKGROUND_COLOR)
@@ -241,57 +454,88 @@ def run(screen):
         logic_surf = font_logic.render(f"> {state['logic_message']}", True, Colors.TEAL_BRIGHT)
         screen.blit(logic_surf, (350, 85))
 
-        lbl_cap = font_ui.render(f"Capacity (Max {MAX_ALLOWED_CAPACITY}):", True, Colors.LIGHT_GREY)
+        max_cap = MAX_DYNAMIC_ITEMS if state["dynamic"] else MAX_ALLOWED_CAPACITY
+        lbl_cap = font_ui.render(f"Capacity (Max {max_cap}):", True, Colors.LIGHT_GREY)
         screen.blit(lbl_cap, (50, 65))
         lbl_val = font_ui.render("Value:", True, Colors.LIGHT_GREY)
         screen.blit(lbl_val, (50, 155))
+        lbl_script = font_ui.render("Script (file or ops):", True, Colors.LIGHT_GREY)
+        screen.blit(lbl_script, (50, 575))
+        lbl_script_cap = font_index.render(f"Scripts may hold up to {SCRIPT_MAX_ITEMS} items", True, Colors.LIGHT_GREY)
+        screen.blit(lbl_script_cap, (50, 555))
 
         for box in input_boxes: box.draw(screen)
         for btn in buttons: btn.draw(screen)
 
-        # 2. Visualization (Bucket)
-        bucket_center_x = 600
-        bucket_bottom_y = 650
-
-        wall_height = state["capacity"] * (ELEM_HEIGHT + SPACING) + 20
-
-        # Draw Bucket Walls
-        pygame.draw.line(screen, CONTAINER_COLOR,
-                        (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y),
-                        (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y - wall_height), 4)
-        pygame.draw.line(screen, CONTAINER_COLOR,
-                        (bucket_center_x + ELEM_WIDTH // 2 + 5, bucket_bottom_y),
-                        (bucket_center_x + ELEM_WIDTH // 2 + 5, bucket_bottom_y - wall_height), 4)
-        pygame.draw.line(screen, CONTAINER_COLOR,
-                        (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y),
-                        (bucket_center_x + ELEM_WIDTH // 2 + 5, bucket_bottom_y), 4)
-
-        # Draw Stack Elements (Bottom up)
-        for i, item in enumerate(state["stack"]):
-            y_pos = bucket_bottom_y - (i + 1) * (ELEM_HEIGHT + SPACING) + SPACING
-            x_pos = bucket_center_x - ELEM_WIDTH // 2
-            rect = pygame.Rect(x_pos, y_pos, ELEM_WIDTH, ELEM_HEIGHT)
-
-            bg_col = HIGHLIGHT_COLOR if i == state["peek_highlight_idx"] else ELEMENT_COLOR
-            pygame.draw.rect(screen, bg_col, rect, border_radius=6)
-
-            txt_surf = font_elem.render(str(item), True, TEXT_COLOR)
-            txt_rect = txt_surf.get_rect(center=rect.center)
-            screen.blit(txt_surf, txt_rect)
-
-            idx_surf = font_ui.render(f"[{i}]", True, Colors.LIGHT_GREY)
-            screen.blit(idx_surf, (x_pos - 35, y_pos + 8))
-
-        # Top Pointer
-        if state["stack"]:
-            top_y = bucket_bottom_y - (len(state["stack"])) * (ELEM_HEIGHT + SPACING) + SPACING + ELEM_HEIGHT // 2
-            top_x = bucket_center_x + ELEM_WIDTH // 2 + 10
-
-            pygame.draw.line(screen, TEXT_COLOR, (top_x, top_y), (top_x + 30, top_y), 2)
-            top_lbl = font_ui.render("TOP", True, TEXT_COLOR)
-            screen.blit(top_lbl, (top_x + 35, top_y - 10))
+        # 2. Visualization
+        if state["dynamic"]:
+            draw_dynamic(current_time)
+        else:
+            bucket_center_x = 600
+            bucket_bottom_y = 650
+
+            # A scripted run can leave more items than capacity; past what fits on screen
+            # the bottom and top few are drawn, with a summary cell for everything between
+            size = len(state["stack"])
+            summary = size > MAX_ALLOWED_CAPACITY
+            slots = min(max(state["capacity"], size), MAX_ALLOWED_CAPACITY)
+            if summary:
+                shown = [(i, state["stack"][i]) for i in range(SUMMARY_BOTTOM)]
+                shown.append((None, f"+{size - SUMMARY_BOTTOM - SUMMARY_TOP}"))
+                shown += [(i, state["stack"][i]) for i in range(size - SUMMARY_TOP, size)]
+            else:
+                shown = list(enumerate(state["stack"]))
+
+            wall_height = slots * (ELEM_HEIGHT + SPACING) + 20
+
+            # Draw Bucket Walls
+            pygame.draw.line(screen, CONTAINER_COLOR,
+                            (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y),
+                            (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y - wall_height), 4)
+            pygame.draw.line(screen, CONTAINER_COLOR,
+                            (bucket_center_x + ELEM_WIDTH // 2 + 5, bucket_bottom_y),
+                            (bucket_center_x + ELEM_WIDTH // 2 + 5, bucket_bottom_y - wall_height), 4)
+            pygame.draw.line(screen, CONTAINER_COLOR,
+                            (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y),
+                            (bucket_center_x + ELEM_WIDTH // 2 + 5, bucket_bottom_y), 4)
+
+            # Draw Stack Elements (Bottom up)
+            for row, (i, item) in enumerate(shown):
+                y_pos = bucket_bottom_y - (row + 1) * (ELEM_HEIGHT + SPACING) + SPACING
+                x_pos = bucket_center_x - ELEM_WIDTH // 2
+                rect = pygame.Rect(x_pos, y_pos, ELEM_WIDTH, ELEM_HEIGHT)
+
+                if i is None:
+                    # Summary cell: how many items are hidden between the two ends
+                    pygame.draw.rect(screen, CONTAINER_COLOR, rect, 2, border_radius=6)
+                    txt_surf = font_ui.render(item, True, TEXT_COLOR)
+                    screen.blit(txt_surf, txt_surf.get_rect(center=rect.center))
+                    continue
+
+                bg_col = HIGHLIGHT_COLOR if i == state["peek_highlight_idx"] else ELEMENT_COLOR
+                pygame.draw.rect(screen, bg_col, rect, border_radius=6)
+
+                txt_surf = font_elem.render(str(item), True, TEXT_COLOR)
+                txt_rect = txt_surf.get_rect(center=rect.center)
+                screen.blit(txt_surf, txt_rect)
+
+                idx_surf = font_ui.render(f"[{i}]", True, Colors.LIGHT_GREY)
+                screen.blit(idx_surf, (x_pos - 35, y_pos + 8))
+
+            if size > state["capacity"]:
+                size_surf = font_ui.render(f"size {size} > capacity {state['capacity']} (scripted run)", True, Colors.LIGHT_GREY)
+                screen.blit(size_surf, (bucket_center_x - ELEM_WIDTH // 2 - 5, bucket_bottom_y - wall_height - 30))
+
+            # Top Pointer
+            if shown:
+                top_y = bucket_bottom_y - len(shown) * (ELEM_HEIGHT + SPACING) + SPACING + ELEM_HEIGHT // 2
+                top_x = bucket_center_x + ELEM_WIDTH // 2 + 10
+
+                pygame.draw.line(screen, TEXT_COLOR, (top_x, top_y), (top_x + 30, top_y), 2)
+                top_lbl = font_ui.render("TOP", True, TEXT_COLOR)
+                screen.blit(top_lbl, (top_x + 35, top_y - 10))
 
         pygame.display.flip()
-        clock.tick(60)
+        sched.sleep(state["script"] is not None)
 
     return "back"
\ No newline at end of file
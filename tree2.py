@@ -1,6 +1,9 @@
 import pygame
 import sys
 import Colors
+import widgets
+from bst_core import BSTCore, get_balance, rotate_left, rotate_right
+from frame_scheduler import FrameScheduler
 
 # -----------------------------------------------------------------------------
 # 1) CONFIGURATION & CONSTANTS
@@ -39,22 +42,24 @@ ROTATION_MS = 1200  # Time allowed for rotation animation
 # 2) DATA STRUCTURES & FONTS
 # -----------------------------------------------------------------------------
 
-class Node:
-    def __init__(self, value, x=0, y=0):
-        self.value = value
-        self.left = None
-        self.right = None
+class NodeView:
+    # On-screen state of one BSTNode, kept apart from the logical node
+    __slots__ = ("x", "y", "target_x", "target_y")
+
+    def __init__(self, x=0, y=0):
         # Physics Coordinates
         self.x = float(x)
         self.y = float(y)
         self.target_x = float(x)
         self.target_y = float(y)
-        self.height = 1
 
     def update_physics(self):
-        # Smoothly interpolate towards target
-        self.x += (self.target_x - self.x) * 0.1
-        self.y += (self.target_y - self.y) * 0.1
+        # Smoothly interpolate towards target; True while still visibly moving
+        dx = self.target_x - self.x
+        dy = self.target_y - self.y
+        self.x += dx * 0.1
+        self.y += dy * 0.1
+        return abs(dx) > 0.5 or abs(dy) > 0.5
 
 
 def get_font(size, bold=False):
@@ -75,58 +80,17 @@ font_logic = get_font(16)
 # 3) UI CLASSES
 # -----------------------------------------------------------------------------
 
-class Button:
+class Button(widgets.Button):
     def __init__(self, x, y, w, h, text, action_code):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.text = text
-        self.action_code = action_code
-        self.is_hovered = False
-
-    def draw(self, surface):
-        color = TEAL_BRIGHT if self.is_hovered else TEAL
-        pygame.draw.rect(surface, color, self.rect, border_radius=8)
-
-        txt_surf = font_ui.render(self.text, True, LIGHT_GREY)
-        txt_rect = txt_surf.get_rect(center=self.rect.center)
-        surface.blit(txt_surf, txt_rect)
-
-    def check_hover(self, pos):
-        self.is_hovered = self.rect.collidepoint(pos)
-
-    def is_clicked(self, pos):
-        return self.rect.collidepoint(pos)
+        super().__init__(x, y, w, h, text, action_code, color=TEAL, hover_color=TEAL_BRIGHT,
+                         text_color=LIGHT_GREY, font=font_ui)
 
 
-class InputBox:
+class InputBox(widgets.InputBox):
     def __init__(self, x, y, w, h, text=''):
-        self.rect = pygame.Rect(x, y, w, h)
-        self.color = TEAL
-        self.text = text
-        self.txt_surface = font_ui.render(text, True, LIGHT_GREY)
-        self.active = False
-
-    def handle_event(self, event):
-        if event.type == pygame.MOUSEBUTTONDOWN:
-            if self.rect.collidepoint(event.pos):
-                self.active = not self.active
-            else:
-                self.active = False
-            self.color = WHITE if self.active else TEAL
-        if event.type == pygame.KEYDOWN:
-            if self.active:
-                if event.key == pygame.K_RETURN:
-                    pass
-                elif event.key == pygame.K_BACKSPACE:
-                    self.text = self.text[:-1]
-                else:
-                    if event.unicode.isnumeric():
-                        self.text += event.unicode
-                self.txt_surface = font_ui.render(self.text, True, LIGHT_GREY)
-
-    def draw(self, surface):
-        pygame.draw.rect(surface, BLACK, self.rect, border_radius=8)
-        pygame.draw.rect(surface, self.color, self.rect, 2, border_radius=8)
-        surface.blit(self.txt_surface, (self.rect.x + 10, self.rect.y + 10))
+        super().__init__(x, y, w, h, text, accept=str.isnumeric, font=font_ui, bg_color=BLACK,
+                         inactive_color=TEAL, active_color=WHITE, text_color=LIGHT_GREY, radius=8,
+                         pad=(10, 10), toggle=True)
 
 
 # -----------------------------------------------------------------------------
@@ -134,11 +98,11 @@ class InputBox:
 # -----------------------------------------------------------------------------
 
 def run(screen):
-    clock = pygame.time.Clock()
+    sched = FrameScheduler()
 
     # --- Local Logic State (Reset on every run) ---
     state = {
-        "root": None,
+        "tree": BSTCore(),
         "current_generator": None,
         "last_step_time": 0,
         "status_message": "Ready",
@@ -147,7 +111,8 @@ def run(screen):
         "traversal_path": [],
         "highlight_node": None,
         "final_highlight_node": None,
-        "inorder_list": []
+        "inorder_list": [],
+        "views": {}  # BSTNode -> NodeView
     }
 
     # UI Elements
@@ -162,6 +127,7 @@ def run(screen):
         Button(50, 480, 140, 40, "Clear Tree", "CLEAR"),
         Button(900, 20, 80, 40, "Back", "BACK")
     ]
+    ui = widgets.WidgetIndex(buttons + [input_box])
 
     # --- Helper Functions ---
 
@@ -170,125 +136,103 @@ def run(screen):
         state["status_color"] = color
         state["logic_message"] = "> " + logic if logic else ""
 
+    def show_node(node, x, y):
+        # View for a node the core just created, spawned at (x, y)
+        state["views"][node] = NodeView(x, y)
+
+    def view_of(node):
+        return state["views"][node]
+
+    def drop_view(node):
+        state["views"].pop(node, None)
+
     def update_targets(node, x_min, x_max, depth, y_base, level_gap):
         if not node: return
         mid_x = (x_min + x_max) // 2
         # Set Target position (Physics will glide node there)
-        node.target_x = mid_x
-        node.target_y = y_base + (depth * level_gap)
+        view = view_of(node)
+        view.target_x = mid_x
+        view.target_y = y_base + (depth * level_gap)
         update_targets(node.left, x_min, mid_x, depth + 1, y_base, level_gap)
         update_targets(node.right, mid_x, x_max, depth + 1, y_base, level_gap)
 
     def refresh_layout():
-        update_targets(state["root"], 250, WIDTH, 0, START_Y, LEVEL_GAP)
-
-    def update_physics(node):
-        if not node: return
-        node.update_physics()
-        update_physics(node.left)
-        update_physics(node.right)
+        update_targets(state["tree"].root, 250, WIDTH, 0, START_Y, LEVEL_GAP)
 
-    # AVL Helpers
-    def get_height(node):
-        if not node: return 0
-        return 1 + max(get_height(node.left), get_height(node.right))
-
-    def get_balance(node):
-        if not node: return 0
-        return get_height(node.left) - get_height(node.right)
+    def update_physics():
+        moving = False
+        for view in state["views"].values():
+            moving = view.update_physics() or moving
+        return moving
 
     # --- Generator Algorithms ---
 
     def gen_insert(val):
+        # Animate the core's insert: one pause per event
         state["traversal_path"] = []
+        for event in state["tree"].insert(val):
+            kind, node = event[0], event[1]
+            if kind == "visit":
+                state["highlight_node"] = node
+                state["traversal_path"].append(node)
+                if event[2] == "left":
+                    set_status(f"Visiting: {node.value}", TEAL_BRIGHT, f"{val} < {node.value}: Go Left")
+                else:
+                    set_status(f"Visiting: {node.value}", TEAL_BRIGHT, f"{val} > {node.value}: Go Right")
+                yield TRAVERSE_STEP_MS
 
-        if state["root"] is None:
-            # Spawn root at top center
-            state["root"] = Node(val, 600, START_Y)
-            refresh_layout()
-            state["final_highlight_node"] = state["root"]
-            set_status(f"Inserted: {val}", SUCCESS_COLOR, "root is None; root = newNode")
-            yield INSERT_HIGHLIGHT_MS
-            state["final_highlight_node"] = None
-            return
-
-        curr = state["root"]
-        while True:
-            state["highlight_node"] = curr
-            state["traversal_path"].append(curr)
-
-            if val == curr.value:
+            elif kind == "exists":
+                state["highlight_node"] = node
+                state["traversal_path"].append(node)
                 set_status(f"Duplicate: {val}", ERROR_COLOR, "Value exists. Ignore.")
                 yield 1000
                 state["highlight_node"] = None
-                state["traversal_path"] = []
-                return
-            elif val < curr.value:
-                set_status(f"Visiting: {curr.value}", TEAL_BRIGHT, f"{val} < {curr.value}: Go Left")
-                yield TRAVERSE_STEP_MS
-                if curr.left is None:
-                    # Spawn at parent location
-                    curr.left = Node(val, curr.x, curr.y)
-                    refresh_layout()  # Triggers physics movement to new spot
-                    state["final_highlight_node"] = curr.left
-                    set_status(f"Inserted: {val}", SUCCESS_COLOR, "curr.left = newNode")
-                    state["highlight_node"] = None
-                    yield INSERT_HIGHLIGHT_MS
-                    state["final_highlight_node"] = None
-                    break
-                else:
-                    curr = curr.left
-            else:
-                set_status(f"Visiting: {curr.value}", TEAL_BRIGHT, f"{val} > {curr.value}: Go Right")
-                yield TRAVERSE_STEP_MS
-                if curr.right is None:
-                    # Spawn at parent location
-                    curr.right = Node(val, curr.x, curr.y)
-                    refresh_layout()
-                    state["final_highlight_node"] = curr.right
-                    set_status(f"Inserted: {val}", SUCCESS_COLOR, "curr.right = newNode")
-                    state["highlight_node"] = None
-                    yield INSERT_HIGHLIGHT_MS
-                    state["final_highlight_node"] = None
-                    break
+
+            elif kind == "new":
+                parent, side = event[2], event[3]
+                if parent is None:
+                    # Spawn root at top center
+                    show_node(node, 600, START_Y)
+                    logic = "root is None; root = newNode"
                 else:
-                    curr = curr.right
+                    # Spawn at parent location; the layout glides it to its slot
+                    parent_view = view_of(parent)
+                    show_node(node, parent_view.x, parent_view.y)
+                    logic = f"curr.{side} = newNode"
+                refresh_layout()
+                state["final_highlight_node"] = node
+                state["highlight_node"] = None
+                set_status(f"Inserted: {val}", SUCCESS_COLOR, logic)
+                yield INSERT_HIGHLIGHT_MS
+                state["final_highlight_node"] = None
         state["traversal_path"] = []
 
     def gen_search(val):
         state["traversal_path"] = []
-        curr = state["root"]
-        found = False
-
-        while curr:
-            state["highlight_node"] = curr
-            state["traversal_path"].append(curr)
+        for event in state["tree"].search(val):
+            node = event[1]
+            if node is not None:
+                state["highlight_node"] = node
+                state["traversal_path"].append(node)
             path_str = " -> ".join([str(n.value) for n in state["traversal_path"]])
 
-            if val == curr.value:
+            if event[0] == "visit":
+                op = "<" if event[2] == "left" else ">"
+                direction = "Left" if event[2] == "left" else "Right"
+                set_status(f"Searching: {val}", TEAL_BRIGHT, f"{val} {op} {node.value}: Go {direction}")
+                state["logic_message"] = f"> Path: {path_str}"
+                yield TRAVERSE_STEP_MS
+            elif node is not None:
                 set_status(f"Found: {val}", SUCCESS_COLOR, "val == node.value: return node")
                 state["logic_message"] = f"> Path: {path_str}"
                 yield TRAVERSE_STEP_MS
                 state["highlight_node"] = None
-                state["final_highlight_node"] = curr
+                state["final_highlight_node"] = node
                 yield FOUND_HIGHLIGHT_MS
                 state["final_highlight_node"] = None
-                found = True
-                break
-            elif val < curr.value:
-                set_status(f"Searching: {val}", TEAL_BRIGHT, f"{val} < {curr.value}: Go Left")
-                state["logic_message"] = f"> Path: {path_str}"
-                yield TRAVERSE_STEP_MS
-                curr = curr.left
             else:
-                set_status(f"Searching: {val}", TEAL_BRIGHT, f"{val} > {curr.value}: Go Right")
-                state["logic_message"] = f"> Path: {path_str}"
-                yield TRAVERSE_STEP_MS
-                curr = curr.right
-
-        if not found:
-            set_status(f"Not Found: {val}", ERROR_COLOR, "Reached None (Leaf)")
-            yield 1000
+                set_status(f"Not Found: {val}", ERROR_COLOR, "Reached None (Leaf)")
+                yield 1000
         state["traversal_path"] = []
 
     def gen_inorder(node, visit_list):
@@ -305,161 +249,86 @@ def run(screen):
     def gen_traverse_wrapper():
         state["traversal_path"] = []
         state["inorder_list"] = []
-        if state["root"] is None:
+        if state["tree"].root is None:
             set_status("Tree is Empty", ORANGE, "root is None")
             yield 1000
             return
-        yield from gen_inorder(state["root"], state["inorder_list"])
+        yield from gen_inorder(state["tree"].root, state["inorder_list"])
         state["highlight_node"] = None
         final_str = ", ".join(map(str, state["inorder_list"]))
         set_status(f"Inorder: {final_str}", SUCCESS_COLOR, "Traversal Complete")
         yield POST_TRAVERSE_MS
         state["traversal_path"] = []
 
-    def gen_delete(val, parent=None, current=None, is_left_child=False):
-        if current is None:
-            if state["root"] is None:
-                set_status("Empty Tree", ERROR_COLOR, "Cannot delete from empty tree")
-                yield 1000
-                return
-            current = state["root"]
-            parent = None
-            state["traversal_path"] = []
-
-        found_target = False
-        while current:
-            state["highlight_node"] = current
-            state["traversal_path"].append(current)
-
-            if val == current.value:
-                set_status(f"Found: {val}", TEAL_BRIGHT, "Target node identified")
-                yield TRAVERSE_STEP_MS
-                found_target = True
-                break
-            elif val < current.value:
-                set_status(f"Finding: {val}", TEAL_BRIGHT, f"{val} < {current.value}: Go Left")
-                yield TRAVERSE_STEP_MS
-                parent = current
-                current = current.left
-                is_left_child = True
-            else:
-                set_status(f"Finding: {val}", TEAL_BRIGHT, f"{val} > {current.value}: Go Right")
-                yield TRAVERSE_STEP_MS
-                parent = current
-                current = current.right
-                is_left_child = False
-
-        if not found_target:
-            set_status("Value not found", ERROR_COLOR, "Traversal reached None")
+    def gen_delete(val):
+        if state["tree"].root is None:
+            set_status("Empty Tree", ERROR_COLOR, "Cannot delete from empty tree")
             yield 1000
-            state["traversal_path"] = []
             return
-
-        state["highlight_node"] = current
-        state["final_highlight_node"] = current
-
-        # Case 1: Leaf
-        if current.left is None and current.right is None:
-            set_status("Deleting Leaf", ORANGE, "Leaf node removed")
-            yield INSERT_HIGHLIGHT_MS
-            if parent is None:
-                state["root"] = None
-            elif is_left_child:
-                parent.left = None
-            else:
-                parent.right = None
-            refresh_layout()
-            set_status(f"Deleted: {val}", SUCCESS_COLOR, "Node removed")
-            state["final_highlight_node"] = None
-            state["highlight_node"] = None
-            yield 1000
-
-        # Case 2: One Child (Left)
-        elif current.right is None:
-            set_status("Deleting Node (1 Child)", ORANGE, "Replace node with left child")
-            yield INSERT_HIGHLIGHT_MS
-            if parent is None:
-                state["root"] = current.left
-            elif is_left_child:
-                parent.left = current.left
-            else:
-                parent.right = current.left
-            refresh_layout()
-            set_status(f"Deleted: {val}", SUCCESS_COLOR, "Structure updated")
-            state["final_highlight_node"] = None
-            state["highlight_node"] = None
-            yield 1000
-
-        # Case 2: One Child (Right)
-        elif current.left is None:
-            set_status("Deleting Node (1 Child)", ORANGE, "Replace node with right child")
-            yield INSERT_HIGHLIGHT_MS
-            if parent is None:
-                state["root"] = current.right
-            elif is_left_child:
-                parent.left = current.right
-            else:
-                parent.right = current.right
-            refresh_layout()
-            set_status(f"Deleted: {val}", SUCCESS_COLOR, "Structure updated")
-            state["final_highlight_node"] = None
-            state["highlight_node"] = None
-            yield 1000
-
-        # Case 3: Two Children
-        else:
-            set_status("Deleting Node (2 Children)", ORANGE, "Finding Inorder Successor")
-            yield INSERT_HIGHLIGHT_MS
-            succ_parent = current
-            successor = current.right
-            state["traversal_path"].append(successor)
-            state["highlight_node"] = successor
-            set_status("Visiting Right Child", TEAL_BRIGHT, "Start searching min in right subtree")
-            yield TRAVERSE_STEP_MS
-
-            while successor.left:
-                succ_parent = successor
-                successor = successor.left
-                state["traversal_path"].append(successor)
-                state["highlight_node"] = successor
-                set_status("Go Left", TEAL_BRIGHT, "Seeking minimum...")
+        state["traversal_path"] = []
+        cases = {
+            "leaf": ("Deleting Leaf", "Leaf node removed"),
+            "left": ("Deleting Node (1 Child)", "Replace node with left child"),
+            "right": ("Deleting Node (1 Child)", "Replace node with right child"),
+            "two": ("Deleting Node (2 Children)", "Finding Inorder Successor"),
+        }
+        target = None
+        for event in state["tree"].delete(val):
+            kind, node = event[0], event[1]
+            if kind == "visit":
+                state["highlight_node"] = node
+                state["traversal_path"].append(node)
+                op = "<" if event[2] == "left" else ">"
+                direction = "Left" if event[2] == "left" else "Right"
+                set_status(f"Finding: {val}", TEAL_BRIGHT, f"{val} {op} {node.value}: Go {direction}")
                 yield TRAVERSE_STEP_MS
 
-            set_status(f"Successor Found: {successor.value}", ORANGE, f"Copy {successor.value} to Node {current.value}")
-            state["final_highlight_node"] = successor
-            yield 1200
-
-            current.value = successor.value
-            set_status("Removing Successor", TEAL_BRIGHT, "delete(successor)")
-            yield 500
+            elif kind == "found":
+                set_status("Value not found", ERROR_COLOR, "Traversal reached None")
+                yield 1000
 
-            if succ_parent == current:
-                succ_parent.right = successor.right
-            else:
-                succ_parent.left = successor.right
+            elif kind == "target":
+                state["highlight_node"] = node
+                state["traversal_path"].append(node)
+                set_status(f"Found: {val}", TEAL_BRIGHT, "Target node identified")
+                yield TRAVERSE_STEP_MS
+                state["final_highlight_node"] = node
+                target = node if event[2] == "two" else None
+                set_status(cases[event[2]][0], ORANGE, cases[event[2]][1])
+                yield INSERT_HIGHLIGHT_MS
+
+            elif kind == "successor":
+                state["traversal_path"].append(node)
+                state["highlight_node"] = node
+                if node is target.right:
+                    set_status("Visiting Right Child", TEAL_BRIGHT, "Start searching min in right subtree")
+                else:
+                    set_status("Go Left", TEAL_BRIGHT, "Seeking minimum...")
+                yield TRAVERSE_STEP_MS
 
-            refresh_layout()
-            set_status(f"Deleted Original: {val}", SUCCESS_COLOR, "Copied val, removed successor")
-            state["final_highlight_node"] = None
-            state["highlight_node"] = None
-            yield 1000
+            elif kind == "copy":
+                succ, old = event[2], event[3]
+                set_status(f"Successor Found: {succ.value}", ORANGE, f"Copy {succ.value} to Node {old}")
+                state["final_highlight_node"] = succ
+                yield 1200
+                set_status("Removing Successor", TEAL_BRIGHT, "delete(successor)")
+                yield 500
+
+            elif kind == "unlink":
+                drop_view(node)
+                refresh_layout()
+                if target is not None:
+                    set_status(f"Deleted Original: {val}", SUCCESS_COLOR, "Copied val, removed successor")
+                elif event[2] is None:
+                    set_status(f"Deleted: {val}", SUCCESS_COLOR, "Node removed")
+                else:
+                    set_status(f"Deleted: {val}", SUCCESS_COLOR, "Structure updated")
+                state["final_highlight_node"] = None
+                state["highlight_node"] = None
+                yield 1000
         state["traversal_path"] = []
 
-    # --- AVL ROTATION LOGIC ---
-
-    def rotate_right(y):
-        x = y.left
-        T2 = x.right
-        x.right = y
-        y.left = T2
-        return x
-
-    def rotate_left(x):
-        y = x.right
-        T2 = y.left
-        y.left = x
-        x.right = T2
-        return y
+    # --- AVL ROTATION LOGIC (rotations live in bst_core) ---
 
     def gen_balance_recursive(node):
         if not node:
@@ -528,13 +397,13 @@ def run(screen):
         return node
 
     def gen_balance():
-        if state["root"] is None:
+        if state["tree"].root is None:
             set_status("Tree is Empty", ERROR_COLOR, "Nothing to balance")
             yield 1000
             return
 
         set_status("Balancing Tree...", TEAL_BRIGHT, "Bottom-up Check")
-        state["root"] = yield from gen_balance_recursive(state["root"])
+        state["tree"].root = yield from gen_balance_recursive(state["tree"].root)
 
         refresh_layout()
         state["highlight_node"] = None
@@ -545,12 +414,15 @@ def run(screen):
     # --- Drawing Functions ---
     def draw_edges(surface, node):
         if node is None: return
+        view = view_of(node)
         if node.left:
             # Draw actual current positions
-            pygame.draw.line(surface, WHITE, (node.x, node.y), (node.left.x, node.left.y), 2)
+            left = view_of(node.left)
+            pygame.draw.line(surface, WHITE, (view.x, view.y), (left.x, left.y), 2)
             draw_edges(surface, node.left)
         if node.right:
-            pygame.draw.line(surface, WHITE, (node.x, node.y), (node.right.x, node.right.y), 2)
+            right = view_of(node.right)
+            pygame.draw.line(surface, WHITE, (view.x, view.y), (right.x, right.y), 2)
             draw_edges(surface, node.right)
 
     def draw_nodes(surface, node):
@@ -570,12 +442,13 @@ def run(screen):
             fill_color = TEAL_DARK
 
         # Draw at current physics coordinates
-        pygame.draw.circle(surface, fill_color, (int(node.x), int(node.y)), NODE_RADIUS)
-        pygame.draw.circle(surface, border_color, (int(node.x), int(node.y)), NODE_RADIUS, NODE_BORDER_WIDTH)
+        view = view_of(node)
+        pygame.draw.circle(surface, fill_color, (int(view.x), int(view.y)), NODE_RADIUS)
+        pygame.draw.circle(surface, border_color, (int(view.x), int(view.y)), NODE_RADIUS, NODE_BORDER_WIDTH)
 
         text_color = WHITE if fill_color in [TEAL, TEAL_BRIGHT, TEAL_DARK, ORANGE] else BLACK
         val_surf = font_elem.render(str(node.value), True, text_color)
-        val_rect = val_surf.get_rect(center=(int(node.x), int(node.y)))
+        val_rect = val_surf.get_rect(center=(int(view.x), int(view.y)))
         surface.blit(val_surf, val_rect)
 
         draw_nodes(surface, node.left)
@@ -598,29 +471,31 @@ def run(screen):
         for btn in buttons:
             btn.draw(surface)
 
-        if state["root"] is None:
+        if state["tree"].root is None:
             ph_surf = font_ui.render("Tree is empty.", True, LIGHT_GREY)
             ph_rect = ph_surf.get_rect(center=(WIDTH // 2 + 100, HEIGHT // 2))
             surface.blit(ph_surf, ph_rect)
 
     def draw_tree(surface):
-        draw_edges(surface, state["root"])
-        draw_nodes(surface, state["root"])
+        draw_edges(surface, state["tree"].root)
+        draw_nodes(surface, state["tree"].root)
 
     # -------------------------------------------------------------------------
     # 5) RUN LOOP
     # -------------------------------------------------------------------------
 
     running = True
+    moving = False
     while running:
-        dt = clock.tick(60)
+        # Full frame rate while a node slides or a generator steps; otherwise wait for input
+        sched.sleep(moving or state["current_generator"] is not None)
         current_time = pygame.time.get_ticks()
-        mouse_pos = pygame.mouse.get_pos()
 
         # Update Physics every frame for smooth sliding
-        update_physics(state["root"])
+        moving = update_physics()
 
-        for event in pygame.event.get():
+        for event in sched.events():
+            target = ui.dispatch(event)
             if event.type == pygame.QUIT:
                 return "quit"
 
@@ -628,46 +503,42 @@ def run(screen):
 
             if event.type == pygame.MOUSEBUTTONDOWN:
                 if not state["current_generator"]:
-                    for btn in buttons:
-                        if btn.is_clicked(event.pos):
-                            if btn.action_code == "BACK":
-                                return "back"
-
-                            if btn.action_code == "CLEAR":
-                                state["root"] = None
-                                state["traversal_path"] = []
-                                state["highlight_node"] = None
-                                state["final_highlight_node"] = None
-                                set_status("Tree Cleared", SUCCESS_COLOR, "root = None")
+                    btn = target
+                    if btn in buttons:
+                        if btn.action_code == "BACK":
+                            return "back"
+
+                        if btn.action_code == "CLEAR":
+                            state["tree"].root = None
+                            state["views"].clear()
+                            state["traversal_path"] = []
+                            state["highlight_node"] = None
+                            state["final_highlight_node"] = None
+                            set_status("Tree Cleared", SUCCESS_COLOR, "root = None")
+                            continue
+
+                        val = None
+                        if btn.action_code in ["INSERT", "DELETE", "SEARCH"]:
+                            try:
+                                val = int(input_box.text)
+                            except ValueError:
+                                set_status("Error: Invalid Input", ERROR_COLOR, "Enter an integer")
                                 continue
 
-                            val = None
-                            if btn.action_code in ["INSERT", "DELETE", "SEARCH"]:
-                                try:
-                                    val = int(input_box.text)
-                                except ValueError:
-                                    set_status("Error: Invalid Input", ERROR_COLOR, "Enter an integer")
-                                    continue
-
-                            if btn.action_code == "INSERT":
-                                state["current_generator"] = gen_insert(val)
-                                input_box.text = ""
-                                input_box.txt_surface = font_ui.render("", True, LIGHT_GREY)
-                            elif btn.action_code == "DELETE":
-                                state["current_generator"] = gen_delete(val)
-                                input_box.text = ""
-                                input_box.txt_surface = font_ui.render("", True, LIGHT_GREY)
-                            elif btn.action_code == "SEARCH":
-                                state["current_generator"] = gen_search(val)
-                            elif btn.action_code == "TRAVERSE":
-                                state["current_generator"] = gen_traverse_wrapper()
-                            elif btn.action_code == "BALANCE":
-                                state["current_generator"] = gen_balance()
-
-                            state["last_step_time"] = current_time - 2000
-
-        for btn in buttons:
-            btn.check_hover(mouse_pos)
+                        if btn.action_code == "INSERT":
+                            state["current_generator"] = gen_insert(val)
+                            input_box.text = ""
+                        elif btn.action_code == "DELETE":
+                            state["current_generator"] = gen_delete(val)
+                            input_box.text = ""
+                        elif btn.action_code == "SEARCH":
+                            state["current_generator"] = gen_search(val)
+                        elif btn.action_code == "TRAVERSE":
+                            state["current_generator"] = gen_traverse_wrapper()
+                        elif btn.action_code == "BALANCE":
+                            state["current_generator"] = gen_balance()
+
+                        state["last_step_time"] = current_time - 2000
 
         if state["current_generator"]:
             if current_time - state["last_step_time"] >= 0:
@@ -0,0 +1,215 @@
+"""
+Shared UI widgets for the menu and every visualizer scene.
+
+Button and InputBox draw from cached text surfaces: a Button renders its
+label once per state (normal / hover) and again only when its text changes,
+and an InputBox renders its text only after an edit. Assigning .text (e.g.
+clearing a box after Insert) invalidates the cache; nothing else does.
+
+WidgetIndex buckets widgets into a coarse grid by their rects, so a mouse
+event is hit-tested once, against the few widgets in its cell, instead of
+every widget polling pygame.mouse.get_pos() on every draw. A scene feeds
+each event to index.dispatch(event) first; it updates hover flags and
+returns the widget under the pointer (or None). Widgets outside an index
+fall back to testing their own rect against event.pos.
+"""
+import pygame
+import Colors
+
+CELL = 64  # WidgetIndex grid cell, in px
+MOUSE_EVENTS = (pygame.MOUSEMOTION, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+
+FONTS = {}
+
+
+def get_font(size):
+    """ The UI font at size; each size is loaded once """
+    font = FONTS.get(size)
+    if font is None:
+        try:
+            font = pygame.font.Font("ScienceGothic-Regular.ttf", size)
+        except:
+            font = pygame.font.SysFont('Arial', size)
+        FONTS[size] = font
+    return font
+
+
+class Widget:
+    def __init__(self, x, y, w, h):
+        self.rect = pygame.Rect(x, y, w, h)
+        self.is_hovered = False
+        self.index = None
+
+    def hit(self, event):
+        """ Whether the mouse event landed on this widget """
+        if self.index is not None and self.index.event is event:
+            return self.index.target is self
+        return self.rect.collidepoint(event.pos)
+
+
+class WidgetIndex:
+    def __init__(self, widgets=(), cell=CELL):
+        self.cell = cell
+        self.cells = {}  # (col, row) -> widgets overlapping that cell, in draw order
+        self.event = None
+        self.target = None
+        self.hovered = None
+        for widget in widgets:
+            self.add(widget)
+
+    def add(self, widget):
+        widget.index = self
+        r, c = widget.rect, self.cell
+        for col in range(r.left // c, (r.right - 1) // c + 1):
+            for row in range(r.top // c, (r.bottom - 1) // c + 1):
+                self.cells.setdefault((col, row), []).append(widget)
+        return widget
+
+    def at(self, pos):
+        """ Topmost widget under pos, or None """
+        for widget in reversed(self.cells.get((pos[0] // self.cell, pos[1] // self.cell), ())):
+            if widget.rect.collidepoint(pos):
+                return widget
+        return None
+
+    def dispatch(self, event):
+        """ Hit-test a mouse event once; moves the hover flag and returns the widget under it """
+        self.event = event
+        if event.type not in MOUSE_EVENTS:
+            self.target = None
+            return None
+        self.target = self.at(event.pos)
+        if self.target is not self.hovered:
+            if self.hovered is not None:
+                self.hovered.is_hovered = False
+            if self.target is not None:
+                self.target.is_hovered = True
+            self.hovered = self.target
+        return self.target
+
+
+class Button(Widget):
+    def __init__(self, x, y, w, h, text, action_code=None, txt_size=18, color=Colors.TEAL,
+                 hover_color=Colors.TEAL_BRIGHT, text_color=Colors.LIGHT_GREY, font=None, radius=8):
+        super().__init__(x, y, w, h)
+        self.action_code = action_code
+        self.base_color = color
+        self.hover_color = hover_color
+        self.text_color = text_color
+        self.FONT = font or get_font(txt_size)
+        self.radius = radius
+        self.labels = {}  # is_hovered -> rendered text
+        self._text = text
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text != self._text:
+            self._text = text
+            self.labels.clear()
+
+    def label(self):
+        surf = self.labels.get(self.is_hovered)
+        if surf is None:
+            surf = self.labels[self.is_hovered] = self.FONT.render(self._text, True, self.text_color)
+        return surf
+
+    def draw(self, surface):
+        color = self.hover_color if self.is_hovered else self.base_color
+        pygame.draw.rect(surface, color, self.rect, border_radius=self.radius)
+        txt_surf = self.label()
+        surface.blit(txt_surf, txt_surf.get_rect(center=self.rect.center))
+
+    def check_hover(self, pos):
+        self.is_hovered = self.rect.collidepoint(pos)
+
+    def is_clicked(self, event):
+        return event.type == pygame.MOUSEBUTTONDOWN and self.hit(event)
+
+    def click(self):
+        """ Run the button's callback, if it has one; returns its result """
+        if callable(self.action_code):
+            return self.action_code()
+        return None
+
+
+class InputBox(Widget):
+    def __init__(self, x, y, w, h, text='', max_chars=None, accept=str.isprintable, txt_size=19,
+                 font=None, bg_color=Colors.BLACK, inactive_color=Colors.LIGHT_GREY,
+                 active_color=Colors.TEAL, text_color=Colors.LIGHT_GREY, radius=5, pad=(8, None),
+                 toggle=False, blur_on_return=False, scroll=False):
+        super().__init__(x, y, w, h)
+        self.max_chars = max_chars
+        self.accept = accept
+        self.font = font or get_font(txt_size)
+        self.bg_color = bg_color
+        self.inactive_color = inactive_color
+        self.active_color = active_color
+        self.text_color = text_color
+        self.radius = radius
+        self.pad = pad  # (x, y) offset of the text; y None centres it
+        self.toggle = toggle  # a click on an active box deactivates it
+        self.blur_on_return = blur_on_return
+        self.scroll = scroll  # long text shows only the tail that fits
+        self.active = False
+        self._text = text
+        self.rendered = None
+
+    @property
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, text):
+        if text != self._text:
+            self._text = text
+            self.rendered = None
+
+    @property
+    def color(self):
+        return self.active_color if self.active else self.inactive_color
+
+    def handle_event(self, event):
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            over = self.hit(event)
+            self.active = (not self.active) if over and self.toggle else over
+
+        if self.active and event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:
+                if self.blur_on_return:
+                    self.active = False
+            elif event.key == pygame.K_BACKSPACE:
+                self.text = self._text[:-1]
+            elif self.accept(event.unicode):
+                if self.max_chars is None or len(self._text) < self.max_chars:
+                    self.text = self._text + event.unicode
+
+    def draw(self, surface):
+        if self.rendered is None:
+            self.rendered = self.font.render(self._text, True, self.text_color)
+        pad_x, pad_y = self.pad
+        pos = (self.rect.x + pad_x, self.rect.y + (self.rect.height // 2 - 8 if pad_y is None else pad_y))
+        pygame.draw.rect(surface, self.bg_color, self.rect, border_radius=self.radius)
+        if self.scroll:
+            visible_w = self.rect.w - 2 * pad_x
+            offset = max(0, self.rendered.get_width() - visible_w)
+            surface.blit(self.rendered, pos, area=pygame.Rect(offset, 0, visible_w, self.rendered.get_height()))
+        else:
+            surface.blit(self.rendered, pos)
+        pygame.draw.rect(surface, self.color, self.rect, 2, border_radius=self.radius)
+
+
+class InputBar(InputBox):
+    """ The linked list scenes' input: printable characters, up to max_chars """
+    def __init__(self, x, y, width, height, bg_color, max_chars=1):
+        super().__init__(x, y, width, height, max_chars=max_chars, bg_color=bg_color, pad=(2, 5))
+
+    @property
+    def shape(self):
+        return self.rect
+
+    def handle_input(self, event):
+        self.handle_event(event)